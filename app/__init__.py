@@ -1,38 +1,91 @@
+import atexit
 import datetime
+import hmac
+import json
 import logging
+import math
 import os
-from flask import Flask, render_template, jsonify, redirect, request, abort
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from flask import Flask, Response, g, render_template, jsonify, redirect, request, abort, stream_with_context
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from werkzeug.middleware.dispatcher import DispatcherMiddleware
 
 from app.superops_client import SuperOpsClient
+from app.cache_manager import NamedCache
+from app.shared_snapshot import init_shared_snapshot
+from app.render_cache import RenderCache
+from app.history import HistorySampler, QueueHistory, TIERS as HISTORY_TIERS, section_counts as history_section_counts
+from app.search import TicketSearchIndex, SECTIONS as SEARCH_SECTIONS
+from app.tenants import SharedResources, tenant_configs
+from app.warmup import WarmUp
+from app.webhooks import WebhookAuth, parse_events
+from app import config_reload
+from app import export
+from app import field_profiles
+from app import profiler
+from app import tracing
 from app.ticket_mapper import (
-    map_tickets_to_sections,
-    filter_by_view,
+    SectionRouter,
+    section_views,
+    earliest_change,
+    partition_by_views,
     filter_by_agent,
     set_api_timezone,
+    compute_sla_fields,
+    _parse_datetime,
 )
 
 logger = logging.getLogger(__name__)
 
-# Module-level client reference (set during create_app)
-_client = None
+
+def _select_ticket_fields(config, section_router):
+    """SuperOps ticket fields the configured views and section rules need."""
+    return field_profiles.upstream_selection(
+        config, SuperOpsClient.TICKET_FIELDS.split(),
+        extra_upstream_fields=[
+            field_profiles.FIELD_SOURCES[f] for f in section_router.fields_used
+            if f in field_profiles.FIELD_SOURCES
+        ],
+    )
+
+
+def _app_name(dashboard_cfg):
+    company_name = dashboard_cfg.get('company_name', '')
+    if company_name:
+        return f"The {company_name} Beacon"
+    return dashboard_cfg.get('app_name', 'The Beacon')
+
+
+def _make_render_cache(dashboard_cfg):
+    if not dashboard_cfg.get('render_cache', True):
+        return None
+    return RenderCache(max_entries=dashboard_cfg.get('render_cache_max_entries', 64))
 
 
-def create_app(config):
+def create_app(config, resources=None):
     """Create and configure the Flask application.
 
+    With a `tenants` section, returns a root app that mounts one dashboard
+    app per tenant under /<tenant>/ (see create_multi_tenant_app).
+
     Args:
         config: Parsed config.yaml dictionary.
+        resources: Optional tenants.SharedResources shared with other
+            tenants' apps.
 
     Returns:
         Flask app instance.
     """
-    global _client
+    if config.get('tenants'):
+        return create_multi_tenant_app(config)
 
     # Set timezone for interpreting naive datetimes from SuperOps API
     tz_name = config.get('dashboard', {}).get('timezone', 'UTC')
     set_api_timezone(tz_name)
+    tracing.configure(config)
 
     app = Flask(__name__, static_folder='static')
     app.secret_key = os.environ.get('FLASK_SECRET_KEY', os.urandom(32))
@@ -52,8 +105,35 @@ def create_app(config):
         storage_uri="memory://"
     )
 
-    # Initialize SuperOps client
-    _client = SuperOpsClient(config)
+    # Compile status_mapping into the section routing program once
+    section_router = SectionRouter(config.get('status_mapping', {}))
+
+    # Initialize SuperOps client, selecting only the ticket fields views need
+    upstream = SuperOpsClient(config, ticket_fields=_select_ticket_fields(config, section_router), resources=resources)
+    _client = upstream
+
+    # Per-view queue size history, sampled on a timer (or by the elected poller in shared mode)
+    history_cfg = config.get('history', {})
+    queue_history = None
+    if history_cfg.get('enabled', True):
+        queue_history = QueueHistory(
+            persist_path=history_cfg.get('persist_path') or None,
+            persist_interval_seconds=history_cfg.get('persist_interval_seconds', 300),
+        )
+
+    # Multi-worker mode: workers read a shared snapshot written by one elected poller
+    snapshot_reader, snapshot_poller = init_shared_snapshot(config, upstream, section_router, history=queue_history)
+    if snapshot_reader is not None:
+        _client = snapshot_reader
+
+        @app.before_request
+        def start_snapshot_poller():
+            # Started lazily so each forked WSGI worker gets its own thread
+            snapshot_poller.ensure_started()
+
+    if queue_history is not None and queue_history.persist_path:
+        # In shared mode only the elected poller writes the history file
+        atexit.register(queue_history.save if snapshot_reader is None else snapshot_poller.save_history)
 
     # Security headers
     @app.after_request
@@ -63,13 +143,66 @@ def create_app(config):
         response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
         return response
 
+    # Request spans: the root of each request's trace (see /debug/traces)
+    @app.before_request
+    def start_request_span():
+        if request.path.startswith('/debug/'):
+            return
+        rule = request.url_rule.rule if request.url_rule is not None else request.path
+        g.trace_span = tracing.start_span(
+            f'{request.method} {request.script_root}{rule}', path=request.full_path.rstrip('?'),
+        )
+
+    @app.after_request
+    def tag_request_span(response):
+        tracing.annotate(status=response.status_code)
+        return response
+
+    @app.teardown_request
+    def end_request_span(error=None):
+        tracing.end_span(g.pop('trace_span', None), error=error)
+
     # Context processor for templates
     dashboard_cfg = config.get('dashboard', {})
-    company_name = dashboard_cfg.get('company_name', '')
-    if company_name:
-        app_name = f"The {company_name} Beacon"
+    app_name = _app_name(dashboard_cfg)
+
+    # Rendered dashboard pages, keyed by (view, agent, snapshot version) and
+    # expiring when the page's SLA or age fields next change
+    render_cache = _make_render_cache(dashboard_cfg)
+
+    # Request deadline: independent _build_views stages run concurrently on a
+    # shared pool, and stages that miss the deadline fall back to their last
+    # good result (kept in stage_results)
+    request_deadline = dashboard_cfg.get('request_deadline_seconds', 10)
+    reply_budget = config.get('superops', {}).get('reply_budget_seconds', 3) or request_deadline
+    if resources is not None:
+        stage_executor = resources.stage_executor
     else:
-        app_name = dashboard_cfg.get('app_name', 'The Beacon')
+        stage_executor = ThreadPoolExecutor(
+            max_workers=dashboard_cfg.get('stage_workers', 16), thread_name_prefix='build-views',
+        )
+    stage_results = NamedCache('stage_results', max_entries=256)
+    ticket_fetch = {'future': None}  # in-flight forced ticket fetch, shared by requests
+    ticket_fetch_lock = threading.Lock()
+
+    # Push-based updates: SuperOps webhook events patch the snapshot, polling
+    # drops to a slow reconciliation interval, and pages watch the snapshot
+    # version to refresh as soon as it changes
+    webhook_cfg = config.get('webhooks', {})
+    webhook_auth = None
+    if webhook_cfg.get('enabled', False):
+        webhook_auth = WebhookAuth(
+            webhook_cfg.get('secret'),
+            token_header=webhook_cfg.get('token_header', 'X-Webhook-Token'),
+            signature_header=webhook_cfg.get('signature_header', 'X-Webhook-Signature'),
+        )
+    webhook_max_bytes = webhook_cfg.get('max_body_bytes', 1024 * 1024)
+    # With webhooks, auto-refresh serves the pushed snapshot instead of forcing a fetch
+    force_api_refresh = webhook_auth is None
+    change_poll_seconds = dashboard_cfg.get('change_poll_seconds', 5 if webhook_auth else 0)
+
+    # Inverted index for /api/search, synced whenever every view is built
+    search_index = TicketSearchIndex()
 
     @app.context_processor
     def inject_globals():
@@ -96,84 +229,396 @@ def create_app(config):
         views = config.get('views', {})
         return next(iter(views), 'helpdesk')
 
-    def _get_tickets_for_view(view_slug, agent_id=None, force_refresh=False, force_all=False):
-        """Fetch, filter, and section tickets for a view.
+    def _submit_ticket_fetch(force):
+        """Start a ticket fetch, sharing one in-flight forced fetch between requests."""
+        if not force:
+            return tracing.submit(stage_executor, _client.fetch_tickets)
+        with ticket_fetch_lock:
+            future = ticket_fetch['future']
+            if future is None or future.done():
+                future = ticket_fetch['future'] = tracing.submit(stage_executor, _client.fetch_tickets, True)
+            return future
+
+    def _await_stage(cache_key, label, future, deadline, stale_parts, default, client_part=None):
+        """Wait for a stage until the deadline, falling back to its last good result.
+
+        A dict result marked 'stale' (the client served an expired value or
+        a default) counts as a fallback too, so it is reported in stale_parts
+        and never replaces the last good result.
+
+        Args:
+            cache_key: Key for the stage's last good result.
+            label: Name reported in stale_parts when falling back.
+            default: Returned if the stage has never succeeded.
+            client_part: Name in the client's stale_parts() for stages whose
+                failed fetch returns the client's last good result as is;
+                that result is served, reported in stale_parts.
+        """
+        try:
+            value = future.result(timeout=max(0, deadline - time.time()))
+            if client_part is not None and client_part in _client.stale_parts():
+                logger.info(f"Stage {label} returned the client's last good result")
+                stale_parts.append(label)
+                return value
+            if not (isinstance(value, dict) and value.get('stale')):
+                stage_results.put(cache_key, value)
+                return value
+            logger.info(f"Stage {label} returned a stale result")
+            # Still newer than the default if the stage never succeeded
+            default = value
+        except FutureTimeoutError:
+            logger.warning(f"Stage {label} missed the request deadline; serving last good result")
+        except Exception as e:
+            logger.warning(f"Stage {label} failed ({e}); serving last good result")
+        stale_parts.append(label)
+        value, _ = stage_results.peek(cache_key)
+        return default if value is None else value
+
+    def _published_sections(views, agent_id):
+        """Sections for views from the shared snapshot, or None to section locally."""
+        published = snapshot_reader.sections()
+        if published is None:
+            return None
+        all_tickets, all_sections = published
+        if any(slug not in all_sections for slug in views):
+            return None
+        agent_id_str = str(agent_id) if agent_id else None
+        tickets_by_key = {}
+        view_sections = {}
+        for slug in views:
+            view_keys = []
+            for keys in all_sections[slug]:
+                if agent_id_str is not None:
+                    keys = [key for key in keys if str(all_tickets[key].get('responder_id', '')) == agent_id_str]
+                for key in keys:
+                    tickets_by_key[key] = all_tickets[key]
+                view_keys.append(keys)
+            view_sections[slug] = tuple(view_keys)
+        return tickets_by_key, view_sections
+
+    def _section_tickets(all_tickets, views, agent_id, deadline, stale_parts, lookup_replies=True):
+        """Partition, reply-check and section tickets for views (the ticket part of _build_views).
+
+        Args:
+            views: {view_slug: view_config} to section for.
+            stale_parts: List 'replies' is appended to if lookups are still pending.
+            lookup_replies: If False, use only cached reply detection results.
 
         Returns:
-            tuple: (s1, s2, s3, s4, agent_mapping, closed_counts, monthly_avgs, error)
+            tuple: (tickets_by_key, {slug: (s1_keys, s2_keys, s3_keys, s4_keys)})
         """
+        if snapshot_reader is not None:
+            # Shared mode: use the poller's sections while they are still current
+            published = _published_sections(views, agent_id)
+            if published is not None:
+                return published
+
+        # Filter by view (tech group), one pass for all requested views
+        view_tickets, memberships = partition_by_views(all_tickets, views)
+
+        # Filter by agent if specified
+        if agent_id:
+            view_tickets = filter_by_agent(view_tickets, agent_id)
+
+        # Enrich tickets with requester reply detection
+        # (bounded by a time budget; unresolved lookups are flagged reply_pending)
+        budget = min(reply_budget, max(0.01, deadline - time.time()))
+        reply_ids, pending_ids = _client.check_requester_replies(
+            view_tickets, section_router.reply_skip_statuses, budget_seconds=budget, lookup=lookup_replies,
+        )
+        if pending_ids:
+            stale_parts.append('replies')
+        for ticket in view_tickets:
+            ticket['has_requester_reply'] = ticket.get('ticket_id') in reply_ids
+            ticket['reply_pending'] = ticket.get('ticket_id') in pending_ids
+
+        # Map to 4 sections, then distribute keys to each view
+        return section_views(view_tickets, memberships, views, config, router=section_router)
+
+    def _build_views(view_slugs, agent_id=None, force_refresh=False, force_all=False, deadline=None):
+        """Fetch, filter, and section tickets for one or more views in one pass.
+
+        Shared work (ticket fetch, reply detection, SLA fields, section routing,
+        technicians) runs once no matter how many views are requested; each
+        ticket is sectioned once and its key appended to every view it is in.
+
+        Technicians, closed counts and monthly averages run concurrently with
+        the ticket fetch and reply detection. Every stage is bounded by the
+        request deadline; a stage that misses it (or fails) falls back to its
+        last good result and is listed in 'stale_parts'.
+
+        Args:
+            deadline: Absolute time.time() by which to respond. Defaults to
+                now + dashboard.request_deadline_seconds.
+
+        Returns:
+            dict: {
+                'tickets': {ticket_key: ticket} for tickets in any requested view,
+                'views': {slug: {'sections': (s1_keys, s2_keys, s3_keys, s4_keys),
+                                 'closed_counts': dict, 'monthly_avgs': dict,
+                                 'valid_until': epoch seconds when a ticket's
+                                                computed fields next change, or None}},
+                'agent_mapping': dict,
+                'snapshot_version': version of the ticket snapshot used (absent on error),
+                'stale_parts': list of stage names served from fallbacks
+                               ('tickets', 'replies', 'technicians',
+                               'closed_counts:<view>', 'monthly_averages:<view>'),
+                'error': str|None,
+            }
+        """
+        if deadline is None:
+            deadline = time.time() + request_deadline
         views_config = config.get('views', {})
-        view_config = views_config.get(view_slug)
-        if not view_config:
-            return [], [], [], [], {}, {'today': None, 'this_week': None}, {'avg_response_mins': None, 'avg_close_hours': None}, f"Unknown view: {view_slug}"
+        requested = {slug: views_config[slug] for slug in view_slugs if slug in views_config}
+        result = {'tickets': {}, 'views': {}, 'agent_mapping': {}, 'stale_parts': [], 'error': None}
+        stale_parts = result['stale_parts']
+
+        # Independent stages start first so they overlap the ticket fetch
+        tickets_future = _submit_ticket_fetch(force_refresh)
+        technicians_future = None
+        if config.get('agents', {}).get('auto_fetch', True):
+            technicians_future = tracing.submit(stage_executor, _client.fetch_technicians)
+        avg_group_ids = config.get('monthly_averages', {}).get('tech_group_ids', [])
+        view_futures = {
+            slug: (
+                tracing.submit(
+                    stage_executor, _client.fetch_closed_counts, view_slug=slug, view_config=view_config,
+                    agent_id=agent_id, force=force_all,
+                ),
+                tracing.submit(
+                    stage_executor, _client.fetch_monthly_averages, view_slug=slug, tech_group_ids=avg_group_ids,
+                    force=force_all,
+                ),
+            )
+            for slug, view_config in requested.items()
+        }
 
         try:
-            # Fetch all tickets (force_refresh bypasses cache)
-            all_tickets = _client.fetch_tickets(force=force_refresh)
+            all_tickets = _await_stage(
+                'tickets', 'tickets', tickets_future, deadline, stale_parts, default=None, client_part='tickets',
+            )
+            if all_tickets is None:
+                raise RuntimeError("no ticket snapshot available")
+            result['snapshot_version'] = _client.snapshot_version()
 
-            # Filter by view (tech group)
-            view_tickets = filter_by_view(all_tickets, view_config)
+            result['tickets'], view_sections = _section_tickets(
+                all_tickets, requested, agent_id, deadline, stale_parts,
+            )
+        except Exception as e:
+            logger.error(f"Error getting tickets for views {', '.join(requested)}: {e}")
+            result['tickets'] = {}
+            result['error'] = "Failed to load ticket data. Check server logs for details."
+            view_sections = {slug: ([], [], [], []) for slug in requested}
 
-            # Filter by agent if specified
-            if agent_id:
-                view_tickets = filter_by_agent(view_tickets, agent_id)
+        # Get agent mapping for dropdown
+        if technicians_future is not None:
+            result['agent_mapping'] = _await_stage(
+                'technicians', 'technicians', technicians_future, deadline, stale_parts, default={},
+                client_part='technicians',
+            )
 
-            # Enrich tickets with requester reply detection
-            s2_statuses = set(
-                s.lower() for s in config.get('status_mapping', {})
-                .get('customer_replied', {}).get('statuses', [])
+        for slug, (closed_future, averages_future) in view_futures.items():
+            closed_counts = _await_stage(
+                f'closed_counts:{slug}:{agent_id or ""}', f'closed_counts:{slug}',
+                closed_future, deadline, stale_parts, default={'today': None, 'this_week': None},
+            )
+            monthly_avgs = _await_stage(
+                f'monthly_averages:{slug}', f'monthly_averages:{slug}',
+                averages_future, deadline, stale_parts,
+                default={'avg_response_mins': None, 'avg_close_hours': None},
             )
-            reply_ids = _client.check_requester_replies(view_tickets, s2_statuses)
-            for ticket in view_tickets:
-                ticket['has_requester_reply'] = ticket.get('ticket_id') in reply_ids
+            result['views'][slug] = {
+                'sections': view_sections[slug],
+                'valid_until': earliest_change(
+                    result['tickets'][key] for keys in view_sections[slug] for key in keys
+                ),
+                'closed_counts': closed_counts,
+                'monthly_avgs': monthly_avgs,
+            }
 
-            # Map to 4 sections
-            s1, s2, s3, s4 = map_tickets_to_sections(view_tickets, config)
+        if (agent_id is None and result['error'] is None and len(requested) == len(views_config)
+                and search_index.version != result['snapshot_version']):
+            search_index.sync(
+                result['tickets'], {slug: view['sections'] for slug, view in result['views'].items()},
+                result['snapshot_version'],
+            )
 
-            # Get agent mapping for dropdown
-            agent_mapping = {}
-            if config.get('agents', {}).get('auto_fetch', True):
-                agent_mapping = _client.fetch_technicians()
+        return result
 
-            # Fetch closed ticket counts (use 300s cache TTL unless force_all)
-            closed_counts = {'today': None, 'this_week': None}
-            try:
-                closed_counts = _client.fetch_closed_counts(
-                    view_slug=view_slug, view_config=view_config,
-                    agent_id=agent_id, force=force_all,
-                )
-            except Exception as e:
-                logger.warning(f"Failed to fetch closed counts: {e}")
+    def _sample_history():
+        """Section counts of every view for the history sampler, or None without a fresh snapshot.
 
-            # Fetch monthly averages (use 300s cache TTL unless force_all)
-            monthly_avgs = {'avg_response_mins': None, 'avg_close_hours': None}
-            avg_group_ids = config.get('monthly_averages', {}).get('tech_group_ids', [])
-            try:
-                monthly_avgs = _client.fetch_monthly_averages(
-                    view_slug=view_slug, tech_group_ids=avg_group_ids,
-                    force=force_all,
-                )
-            except Exception as e:
-                logger.warning(f"Failed to fetch monthly averages: {e}")
+        Reads only cached data (the ticket snapshot and reply detection
+        results), so sampling makes no SuperOps calls while no dashboard is open.
+        """
+        tickets = _client.cached_tickets()
+        if tickets is None:
+            return None
+        tickets_by_key, view_sections = _section_tickets(
+            tickets, config.get('views', {}), None, time.time() + request_deadline, [], lookup_replies=False,
+        )
+        return {slug: history_section_counts(sections, tickets_by_key) for slug, sections in view_sections.items()}
 
-            return s1, s2, s3, s4, agent_mapping, closed_counts, monthly_avgs, None
+    def _sync_search_index():
+        """Re-index the current ticket snapshot for every view.
+
+        Only sections tickets; unlike _build_views it runs no technician,
+        closed-count or monthly-average stages.
+
+        Returns:
+            str|None: Error message if the tickets could not be loaded.
+        """
+        try:
+            tickets = _client.fetch_tickets()
+            if not tickets and _client.snapshot_age() is None:
+                raise RuntimeError("no ticket snapshot available")
+            version = _client.snapshot_version()
+            tickets_by_key, view_sections = _section_tickets(
+                tickets, config.get('views', {}), None, time.time() + request_deadline, [],
+            )
         except Exception as e:
-            logger.error(f"Error getting tickets for view {view_slug}: {e}")
-            return [], [], [], [], {}, {'today': None, 'this_week': None}, {'avg_response_mins': None, 'avg_close_hours': None}, "Failed to load ticket data. Check server logs for details."
+            logger.error(f"Error indexing tickets for search: {e}")
+            return "Failed to load ticket data. Check server logs for details."
+        search_index.sync(tickets_by_key, view_sections, version)
+        return None
+
+    def _get_tickets_for_view(view_slug, agent_id=None, force_refresh=False, force_all=False):
+        """Fetch, filter, and section tickets for a view.
+
+        Returns:
+            tuple: (s1, s2, s3, s4, agent_mapping, closed_counts, monthly_avgs, stale_parts, error)
+        """
+        if view_slug not in config.get('views', {}):
+            return [], [], [], [], {}, {'today': None, 'this_week': None}, {'avg_response_mins': None, 'avg_close_hours': None}, [], f"Unknown view: {view_slug}"
+
+        result = _build_views([view_slug], agent_id=agent_id, force_refresh=force_refresh, force_all=force_all)
+        view = result['views'][view_slug]
+        tickets = result['tickets']
+        s1, s2, s3, s4 = ([tickets[key] for key in keys] for keys in view['sections'])
+        return (
+            s1, s2, s3, s4, result['agent_mapping'], view['closed_counts'],
+            view['monthly_avgs'], result['stale_parts'], result['error'],
+        )
+
+    def _payload_fields(view_slugs, fields_param=None):
+        """Fields to return for views: union of their profiles, narrowed by fields=."""
+        profile = frozenset()
+        for slug in view_slugs:
+            fields = field_profiles.profile_fields(config, slug)
+            if fields is None:
+                profile = None
+                break
+            profile |= fields
+        return field_profiles.combine(profile, fields_param)
+
+    def _build_warm_up_tasks(warm_cfg):
+        """Warm-up tasks for every configured view, run in parallel at boot.
+
+        Returns:
+            list: (name, callable) pairs. Callables raise if their data could
+            not be loaded, so /ready can report which parts failed.
+        """
+        views = config.get('views', {})
+        timeout = warm_cfg.get('timeout_seconds', 120)
+
+        def warm_views():
+            if snapshot_reader is not None:
+                # Shared mode: wait for the elected poller to publish
+                snapshot_poller.ensure_started()
+                deadline = time.time() + timeout
+                while _client.snapshot_age() is None:
+                    if time.time() > deadline:
+                        raise TimeoutError(f"no shared snapshot after {timeout}s")
+                    time.sleep(0.5)
+            else:
+                tickets = _client.fetch_tickets(force=True)
+                if not tickets and _client.snapshot_age() is None:
+                    raise RuntimeError("ticket fetch failed")
+                # Resolve every reply lookup now (no time budget) so the first pages are complete
+                _client.check_requester_replies(tickets, section_router.reply_skip_statuses, budget_seconds=0)
+
+            # Reply detection and sectioning for every view
+            result = _build_views(list(views))
+            if result['error']:
+                raise RuntimeError(result['error'])
+            if render_cache is not None and warm_cfg.get('render_pages', True):
+                for slug in views:
+                    with app.test_request_context(f'/{slug}'):
+                        _render_dashboard(slug, None)
+
+        def warm_closed_counts(slug, view_config):
+            counts = _client.fetch_closed_counts(view_slug=slug, view_config=view_config, force=True)
+            if counts.get('today') is None or counts.get('stale'):
+                raise RuntimeError("closed counts unavailable")
+
+        def warm_monthly_averages():
+            avg_group_ids = config.get('monthly_averages', {}).get('tech_group_ids', [])
+            averages = _client.fetch_monthly_averages(tech_group_ids=avg_group_ids, force=True)
+            if 'response_stats' not in averages or averages.get('stale'):
+                raise RuntimeError("monthly averages unavailable")
+
+        tasks = [('views', warm_views)]
+        if snapshot_reader is not None:
+            # Counts, averages and technicians arrive with the same shared snapshot
+            return tasks
+        if config.get('agents', {}).get('auto_fetch', True):
+            tasks.append(('technicians', lambda: _client.fetch_technicians(force=True)))
+        for slug, view_config in views.items():
+            tasks.append((f'closed_counts:{slug}', lambda s=slug, v=view_config: warm_closed_counts(s, v)))
+        tasks.append(('monthly_averages', warm_monthly_averages))
+        return tasks
+
+    def _iso_or_none(ts):
+        """UTC ISO string for an epoch time, or None."""
+        if ts is None:
+            return None
+        return datetime.datetime.fromtimestamp(ts, datetime.timezone.utc).isoformat()
 
     def _build_ticket_url_template():
         """Get the ticket URL template from config."""
         return config.get('ticket_url_template', '')
 
     def _render_dashboard(view_slug, agent_id):
-        """Render the dashboard template for a view."""
+        """Render the dashboard for a view, reusing a cached render when possible.
+
+        Pages are cached per view, agent and ticket snapshot version, so a
+        burst of kiosk reloads costs one template render per view. An entry
+        expires when any ticket's SLA state or age in days next changes (or
+        after the cache TTL, for closed counts and averages).
+        """
+        if render_cache is None:
+            return _render_dashboard_uncached(view_slug, agent_id)[0]
+
+        # Refresh the snapshot if its TTL expired so the version is current
+        _client.fetch_tickets()
+        key = (view_slug, agent_id, _client.snapshot_version())
+        return render_cache.get_or_render(key, lambda: _render_dashboard_uncached(view_slug, agent_id))
+
+    def _render_dashboard_uncached(view_slug, agent_id):
+        """Render the dashboard template for a view.
+
+        Returns:
+            tuple: (html, cacheable, expires_at) - error pages and pages with
+            stale or partial parts are not cacheable; expires_at is when a
+            ticket's computed fields next change.
+        """
         supported_views = _get_supported_views()
         view_info = supported_views.get(view_slug, {})
         current_view_display = view_info.get('display_name', view_slug) if isinstance(view_info, dict) else view_slug
 
-        s1, s2, s3, s4, agent_mapping, closed_counts, monthly_avgs, error = _get_tickets_for_view(
+        s1, s2, s3, s4, agent_mapping, closed_counts, monthly_avgs, stale_parts, error = _get_tickets_for_view(
             view_slug, agent_id=agent_id
         )
+        # Don't cache a page built from fallbacks, with reply lookups still
+        # running, or with closed counts or averages that are missing or stale
+        cacheable = (
+            error is None and not stale_parts
+            and closed_counts.get('today') is not None and not closed_counts.get('stale')
+            and not monthly_avgs.get('stale')
+        )
+        expires_at = earliest_change(s1 + s2 + s3 + s4)
+        fields = _payload_fields([view_slug])
+        s1, s2, s3, s4 = (field_profiles.project(items, fields) for items in (s1, s2, s3, s4))
 
         dashboard_time_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
         refresh_ms = config.get('dashboard', {}).get('refresh_interval_seconds', 60) * 1000
@@ -182,7 +627,7 @@ def create_app(config):
         thresholds = view_config.get('alert_thresholds', config.get('alert_thresholds', {}))
         auto_dim = config.get('auto_dim', {})
 
-        return render_template(
+        html = render_template(
             'index.html',
             s1_items=s1,
             s2_items=s2,
@@ -190,6 +635,8 @@ def create_app(config):
             s4_items=s4,
             dashboard_generated_time_iso=dashboard_time_iso,
             auto_refresh_ms=refresh_ms,
+            change_poll_ms=change_poll_seconds * 1000,
+            snapshot_version=_client.snapshot_version(),
             ticket_url_template=ticket_url_template,
             current_view_slug=view_slug,
             current_view_display=current_view_display,
@@ -208,7 +655,10 @@ def create_app(config):
             closed_this_week=closed_counts.get('this_week'),
             avg_response_mins=monthly_avgs.get('avg_response_mins'),
             avg_close_hours=monthly_avgs.get('avg_close_hours'),
+            p90_response_mins=monthly_avgs.get('p90_response_mins'),
+            upstream=_client.upstream_status(),
         )
+        return html, cacheable, expires_at
 
     # --- Routes ---
 
@@ -216,7 +666,7 @@ def create_app(config):
     @limiter.exempt
     def dashboard_default():
         """Redirect to default view."""
-        return redirect(f'/{_get_default_view()}')
+        return redirect(f'{request.script_root}/{_get_default_view()}')
 
     @app.route('/<view_slug>')
     def dashboard_view(view_slug):
@@ -238,10 +688,16 @@ def create_app(config):
         agent_id = request.args.get('agent_id', type=int)
         force_all = request.args.get('force_all', type=int, default=0)
         current_view_display = supported[view_slug]['display_name']
+        fields_param, unknown_fields = field_profiles.parse_fields_param(request.args.get('fields'))
+        if unknown_fields:
+            return jsonify({"error": f"Unknown field(s): {', '.join(unknown_fields)}"}), 400
 
-        s1, s2, s3, s4, agent_mapping, closed_counts, monthly_avgs, error = _get_tickets_for_view(
-            view_slug, agent_id=agent_id, force_refresh=True, force_all=bool(force_all)
+        s1, s2, s3, s4, agent_mapping, closed_counts, monthly_avgs, stale_parts, error = _get_tickets_for_view(
+            view_slug, agent_id=agent_id, force_refresh=force_api_refresh, force_all=bool(force_all)
         )
+        valid_until = earliest_change(s1 + s2 + s3 + s4)
+        fields = _payload_fields([view_slug], fields_param)
+        s1, s2, s3, s4 = (field_profiles.project(items, fields) for items in (s1, s2, s3, s4))
 
         return jsonify({
             's1_items': s1,
@@ -255,9 +711,272 @@ def create_app(config):
             'closed_this_week': closed_counts.get('this_week'),
             'avg_response_mins': monthly_avgs.get('avg_response_mins'),
             'avg_close_hours': monthly_avgs.get('avg_close_hours'),
+            'p90_response_mins': monthly_avgs.get('p90_response_mins'),
+            'valid_until_iso': _iso_or_none(valid_until),
+            'snapshot_version': _client.snapshot_version(),
+            'upstream': _client.upstream_status(),
+            'stale_parts': stale_parts,
+            'error': error,
+        })
+
+    @app.route('/api/tickets')
+    @limiter.limit("60 per minute")
+    def api_tickets_batch():
+        """JSON API for several views in one response (rotating wall displays).
+
+        Query: views=a,b,c (default: all views), agent_id, force_all, fields.
+        Ticket objects and the agent mapping are sent once; each view lists
+        ticket keys per section.
+        """
+        supported = _get_supported_views()
+        requested = [v for v in (request.args.get('views') or '').split(',') if v]
+        if not requested:
+            requested = list(supported)
+        unknown = [v for v in requested if v not in supported]
+        if unknown:
+            return jsonify({"error": f"Unknown view(s): {', '.join(unknown)}"}), 404
+
+        agent_id = request.args.get('agent_id', type=int)
+        force_all = request.args.get('force_all', type=int, default=0)
+        fields_param, unknown_fields = field_profiles.parse_fields_param(request.args.get('fields'))
+        if unknown_fields:
+            return jsonify({"error": f"Unknown field(s): {', '.join(unknown_fields)}"}), 400
+
+        result = _build_views(
+            requested, agent_id=agent_id, force_refresh=force_api_refresh, force_all=bool(force_all)
+        )
+
+        views = {}
+        for slug in requested:
+            view = result['views'][slug]
+            s1, s2, s3, s4 = view['sections']
+            views[slug] = {
+                'display_name': supported[slug]['display_name'],
+                's1_ids': s1,
+                's2_ids': s2,
+                's3_ids': s3,
+                's4_ids': s4,
+                'total_active_items': len(s1) + len(s2) + len(s3) + len(s4),
+                'closed_today': view['closed_counts'].get('today'),
+                'closed_this_week': view['closed_counts'].get('this_week'),
+                'avg_response_mins': view['monthly_avgs'].get('avg_response_mins'),
+                'avg_close_hours': view['monthly_avgs'].get('avg_close_hours'),
+                'p90_response_mins': view['monthly_avgs'].get('p90_response_mins'),
+                'valid_until_iso': _iso_or_none(view['valid_until']),
+            }
+
+        fields = _payload_fields(requested, fields_param)
+        tickets = result['tickets']
+        if fields is not None:
+            tickets = {key: {k: v for k, v in t.items() if k in fields} for key, t in tickets.items()}
+
+        return jsonify({
+            'tickets': tickets,
+            'views': views,
+            'dashboard_generated_time_iso': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'agent_mapping': result['agent_mapping'],
+            'snapshot_version': _client.snapshot_version(),
+            'upstream': _client.upstream_status(),
+            'stale_parts': result['stale_parts'],
+            'error': result['error'],
+        })
+
+    @app.route('/api/search')
+    @limiter.limit("120 per minute")
+    def api_search():
+        """Search active tickets by subject, requester, client, agent or ticket number.
+
+        Query: q (every word must match, as a prefix), view, section (s1-s4),
+        limit (default 50, max 200), fields.
+        """
+        query = (request.args.get('q') or '').strip()
+        if not query:
+            return jsonify({"error": "Missing q"}), 400
+        supported = _get_supported_views()
+        view = request.args.get('view') or None
+        if view is not None and view not in supported:
+            return jsonify({"error": "Unknown view"}), 404
+        section = request.args.get('section') or None
+        if section is not None and section not in SEARCH_SECTIONS:
+            return jsonify({"error": f"section must be one of {', '.join(SEARCH_SECTIONS)}"}), 400
+        limit = min(max(request.args.get('limit', type=int, default=50), 1), 200)
+        fields_param, unknown_fields = field_profiles.parse_fields_param(request.args.get('fields'))
+        if unknown_fields:
+            return jsonify({"error": f"Unknown field(s): {', '.join(unknown_fields)}"}), 400
+
+        # Bring the index up to date with the current snapshot (only changed tickets are re-indexed)
+        _client.fetch_tickets()
+        error = None
+        if search_index.version != _client.snapshot_version():
+            error = _sync_search_index()
+
+        started = time.perf_counter()
+        total, hits = search_index.search(query, view=view, section=section, limit=limit)
+        took_ms = (time.perf_counter() - started) * 1000
+
+        fields = _payload_fields([view] if view else list(supported), fields_param)
+        results = []
+        for ticket, memberships in hits:
+            item = dict(field_profiles.project([ticket], fields)[0])
+            item['views'] = memberships
+            results.append(item)
+        return jsonify({
+            'query': query,
+            'total': total,
+            'results': results,
+            'took_ms': round(took_ms, 3),
+            'snapshot_version': search_index.version,
             'error': error,
         })
 
+    @app.route('/api/export/<kind>')
+    @limiter.limit("10 per minute")
+    def api_export(kind):
+        """Stream active tickets or recently closed tickets as NDJSON or CSV.
+
+        Query: format (ndjson|csv, default ndjson), view, agent_id, since and
+        until (date or ISO datetime, bounding updated time). Rows are written
+        as they are produced; closed tickets are read page by page from
+        SuperOps (or the shared ledger), so nothing is held as one big list.
+        """
+        if kind not in ('active', 'closed'):
+            abort(404)
+        fmt = request.args.get('format', 'ndjson')
+        if fmt not in export.FORMATS:
+            return jsonify({"error": f"format must be one of {', '.join(export.FORMATS)}"}), 400
+        view = request.args.get('view') or None
+        if view is not None and view not in _get_supported_views():
+            return jsonify({"error": "Unknown view"}), 404
+        try:
+            since = export.parse_date_param(request.args.get('since'), _client.timezone)
+            until = export.parse_date_param(request.args.get('until'), _client.timezone)
+        except ValueError:
+            return jsonify({"error": "since/until must be a date (YYYY-MM-DD) or ISO datetime"}), 400
+        matches = export.ticket_filter(
+            _parse_datetime,
+            view_config=config.get('views', {}).get(view) if view else None,
+            agent_id=request.args.get('agent_id', type=int),
+            since=since,
+            until=until,
+        )
+
+        if kind == 'active':
+            columns = export.ACTIVE_COLUMNS
+            tickets = _client.fetch_tickets()
+
+            def rows():
+                now_ts = time.time()
+                for ticket in tickets:
+                    if matches(ticket):
+                        ticket = dict(ticket)
+                        compute_sla_fields(ticket, now_ts)
+                        yield ticket
+        else:
+            columns = export.CLOSED_COLUMNS
+
+            def rows():
+                for ticket in _client.iter_closed_tickets(since=since):
+                    if matches(ticket):
+                        yield ticket
+
+        encode = export.iter_csv if fmt == 'csv' else export.iter_ndjson
+
+        def generate():
+            try:
+                yield from encode(rows(), columns)
+            except Exception as e:
+                logger.error(f"Export of {kind} tickets failed mid-stream: {e}")
+                if fmt == 'ndjson':
+                    yield json.dumps({'error': 'Export interrupted. Check server logs for details.'}) + '\n'
+
+        filename = f"beacon-{kind}-{datetime.datetime.now(_client.timezone):%Y%m%d-%H%M}.{'csv' if fmt == 'csv' else 'ndjson'}"
+        return Response(
+            stream_with_context(generate()),
+            mimetype=export.FORMATS[fmt],
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+        )
+
+    @app.route('/api/history/<view_slug>')
+    @limiter.limit("60 per minute")
+    def api_history(view_slug):
+        """Queue size history for a view.
+
+        Query: hours (default 24), resolution (minute|hour|day, default: the
+        finest tier that covers the range).
+        """
+        if view_slug not in _get_supported_views():
+            return jsonify({"error": "Unknown view"}), 404
+        history = queue_history
+        if history is not None and snapshot_reader is not None:
+            # Served from the elected poller's history once it has published
+            history = snapshot_reader.history() or queue_history
+        if history is None:
+            return jsonify({"error": "History is disabled"}), 404
+
+        hours = request.args.get('hours', type=float, default=24)
+        resolution = request.args.get('resolution')
+        if resolution and resolution not in [name for name, _, _ in HISTORY_TIERS]:
+            return jsonify({"error": f"Unknown resolution: {resolution}"}), 400
+        if not hours or not math.isfinite(hours) or hours <= 0:
+            return jsonify({"error": "hours must be a positive number"}), 400
+
+        now = time.time()
+        points = history.query(view_slug, now - hours * 3600, now, resolution=resolution or None)
+        points['view'] = view_slug
+        return jsonify(points)
+
+    @app.route('/api/cache/stats')
+    def api_cache_stats():
+        """Hit, miss and eviction counters for the SuperOps client caches."""
+        return jsonify(_client.cache_stats())
+
+    @app.route('/api/snapshot')
+    @limiter.exempt
+    def api_snapshot():
+        """Current ticket snapshot version; pages poll this to refresh on change."""
+        return jsonify({
+            'version': _client.snapshot_version(),
+            'age_seconds': _client.snapshot_age(),
+        })
+
+    @app.route('/webhooks/superops', methods=['POST'])
+    @limiter.exempt
+    def superops_webhook():
+        """Apply SuperOps ticket create/update/close events to the snapshot."""
+        if webhook_auth is None:
+            abort(404)
+        if (request.content_length or 0) > webhook_max_bytes:
+            return jsonify({"error": "Payload too large"}), 413
+        # Read at most one byte past the limit (chunked bodies have no Content-Length)
+        body = b''
+        while len(body) <= webhook_max_bytes:
+            chunk = request.stream.read(webhook_max_bytes + 1 - len(body))
+            if not chunk:
+                break
+            body += chunk
+        if len(body) > webhook_max_bytes:
+            return jsonify({"error": "Payload too large"}), 413
+        if not webhook_auth.verify(request.headers, body):
+            logger.warning(f"Rejected webhook from {request.remote_addr}: bad credentials")
+            return jsonify({"error": "Unauthorized"}), 401
+        try:
+            payload = json.loads(body) if request.is_json else None
+        except ValueError:
+            payload = None
+        if payload is None:
+            return jsonify({"error": "Expected a JSON body"}), 400
+        try:
+            events = parse_events(payload)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        applied = 0
+        for event, ticket in events:
+            if _client.apply_ticket_event(event, ticket):
+                applied += 1
+        logger.info(f"Webhook: applied {applied}/{len(events)} ticket event(s)")
+        return jsonify({'received': len(events), 'applied': applied})
+
     @app.route('/health')
     @limiter.exempt
     def health():
@@ -268,4 +987,296 @@ def create_app(config):
             'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
         })
 
+    @app.route('/ready')
+    @limiter.exempt
+    def ready():
+        """Readiness check: 503 until warm-up has finished and a ticket snapshot exists."""
+        snapshot_age = _client.snapshot_age()
+        is_ready = warm_up is None or (warm_up.finished and snapshot_age is not None)
+        return jsonify({
+            'ready': is_ready,
+            'warm_up': warm_up.status() if warm_up is not None else None,
+            'snapshot_age_seconds': round(snapshot_age, 1) if snapshot_age is not None else None,
+            'upstream': _client.upstream_status(),
+        }), 200 if is_ready else 503
+
+    # --- Debug endpoints (off unless debug.token is set) ---
+
+    def _debug_authorized():
+        """True if the request's X-Debug-Token header matches debug.token."""
+        token = (config.get('debug') or {}).get('token')
+        supplied = request.headers.get('X-Debug-Token', '')
+        return bool(token) and hmac.compare_digest(str(token).encode(), supplied.encode())
+
+    @app.route('/debug/traces')
+    @limiter.exempt
+    def debug_traces():
+        """Recent traces from the span buffer (needs debug.tracing.enabled).
+
+        Query: trace_id (one trace as a span tree), limit (default 50),
+        min_ms (slowest only), name (root span name contains).
+        """
+        tracer = tracing.get_tracer()
+        if tracer is None or not (config.get('debug') or {}).get('token'):
+            abort(404)
+        if not _debug_authorized():
+            return jsonify({"error": "Unauthorized"}), 401
+
+        trace_id = request.args.get('trace_id')
+        if trace_id:
+            spans = tracer.trace(trace_id)
+            if spans is None:
+                return jsonify({"error": "Trace not in buffer"}), 404
+            return jsonify({'trace_id': trace_id, 'spans': spans})
+        limit = min(max(request.args.get('limit', type=int, default=50), 1), 1000)
+        return jsonify({
+            'traces': tracer.traces(
+                limit=limit,
+                min_ms=request.args.get('min_ms', type=float, default=0),
+                name=request.args.get('name') or None,
+            ),
+            'buffer': tracer.stats(),
+        })
+
+    @app.route('/debug/profile')
+    @limiter.limit("10 per minute")
+    def debug_profile():
+        """Sample every thread's stack for a while and report where time went.
+
+        Query: seconds (default 10, max debug.profile.max_seconds), interval_ms
+        (default 10), top (functions in the summary, default 25), idle=1 to
+        keep threads parked in known waits, format=collapsed for
+        flamegraph-style collapsed stacks instead of JSON. Needs
+        debug.profile.enabled.
+        """
+        debug_cfg = config.get('debug') or {}
+        profile_cfg = debug_cfg.get('profile') or {}
+        if not profile_cfg.get('enabled', False) or not debug_cfg.get('token'):
+            abort(404)
+        if not _debug_authorized():
+            return jsonify({"error": "Unauthorized"}), 401
+
+        max_seconds = profile_cfg.get('max_seconds', 60)
+        seconds = request.args.get('seconds', type=float, default=10)
+        if not math.isfinite(seconds) or seconds <= 0 or seconds > max_seconds:
+            return jsonify({"error": f"seconds must be between 0 and {max_seconds}"}), 400
+        interval_ms = request.args.get('interval_ms', type=float, default=10)
+        if not math.isfinite(interval_ms):
+            return jsonify({"error": "interval_ms must be a number"}), 400
+        interval_ms = min(max(interval_ms, 1), 1000)
+        sampler = profiler.SamplingProfiler(
+            interval_seconds=interval_ms / 1000, include_idle=bool(request.args.get('idle', type=int, default=0)),
+        )
+        logger.info(f"Profiling all threads for {seconds}s (requested by {request.remote_addr})")
+        try:
+            result = sampler.run(seconds)
+        except profiler.ProfilerBusy as e:
+            return jsonify({"error": str(e)}), 409
+
+        stacks = result.pop('stacks')
+        if request.args.get('format') == 'collapsed':
+            return Response(profiler.collapsed(stacks), mimetype='text/plain')
+        result.update(profiler.top_functions(
+            stacks, result['samples'], limit=min(max(request.args.get('top', type=int, default=25), 1), 500),
+        ))
+        return jsonify(result)
+
+    # --- Config reload ---
+
+    reload_lock = threading.Lock()
+
+    def apply_config(new_config):
+        """Swap in a reloaded config, rebuilding only what its changed sections feed.
+
+        Derived state (section router, client settings, render cache,
+        deadlines) is built from the new config first and then swapped in
+        together. Ticket, conversation and closed-ticket caches stay warm
+        unless the SuperOps credentials changed; caches whose contents depend
+        on a changed setting are expired and refresh on their next load.
+        Sections in config_reload.RESTART_SECTIONS keep their running values.
+
+        Returns:
+            set: Names of the changed sections that were applied.
+        """
+        nonlocal config, section_router, upstream, _client, app_name, render_cache
+        nonlocal request_deadline, reply_budget, change_poll_seconds
+        with reload_lock:
+            new_config = dict(new_config)
+            changed = config_reload.changed_sections(config, new_config)
+            restart = sorted(changed.intersection(config_reload.RESTART_SECTIONS))
+            if restart:
+                logger.warning(f"Config reload: restart to apply changes to {', '.join(restart)}")
+                for section in restart:
+                    if section in config:
+                        new_config[section] = config[section]
+                    else:
+                        new_config.pop(section, None)
+                changed.difference_update(restart)
+            if not changed:
+                return changed
+
+            new_router = section_router
+            if 'status_mapping' in changed:
+                new_router = SectionRouter(new_config.get('status_mapping', {}))
+            ticket_fields = _select_ticket_fields(new_config, new_router)
+            cold = config_reload.credentials_changed(config, new_config)
+            if cold:
+                logger.warning("Config reload: SuperOps credentials changed; starting a new client with empty caches")
+                new_upstream = SuperOpsClient(new_config, ticket_fields=ticket_fields, resources=resources)
+            else:
+                new_upstream = upstream
+                expired = upstream.reconfigure(new_config, ticket_fields=ticket_fields)
+                if expired:
+                    logger.info(f"Config reload: refreshing {', '.join(expired)} on next load")
+            views_changed = config_reload.changed_views(config, new_config)
+            if views_changed and not cold:
+                new_upstream.invalidate_views(views_changed)
+
+            new_dashboard_cfg = new_config.get('dashboard', {})
+            new_render_cache = render_cache
+            if 'debug' in changed:
+                # Tracing can be turned on by a reload; turning it off takes a restart
+                tracing.configure(new_config)
+            if 'dashboard' in changed:
+                set_api_timezone(new_dashboard_cfg.get('timezone', 'UTC'))
+                logging.getLogger().setLevel(getattr(logging, new_dashboard_cfg.get('log_level', 'INFO').upper(), logging.INFO))
+                old_dashboard_cfg = config.get('dashboard', {})
+                if any(old_dashboard_cfg.get(key) != new_dashboard_cfg.get(key)
+                       for key in ('render_cache', 'render_cache_max_entries')):
+                    new_render_cache = _make_render_cache(new_dashboard_cfg)
+            new_deadline = new_dashboard_cfg.get('request_deadline_seconds', 10)
+
+            # Stage fallbacks and pages built from the old settings
+            if cold:
+                stage_results.clear()
+            else:
+                drop_averages = 'monthly_averages' in changed
+                for key in stage_results.keys():
+                    kind, _, rest = key.partition(':')
+                    slug = rest.split(':', 1)[0]
+                    if slug in views_changed or (drop_averages and kind == 'monthly_averages'):
+                        stage_results.discard(key)
+            if render_cache is not None:
+                render_cache.clear()
+            search_index.version = None
+
+            if snapshot_reader is not None:
+                snapshot_poller.client = snapshot_reader.client = new_upstream
+                snapshot_poller.config = new_config
+                snapshot_poller.section_router = new_router
+                snapshot_reader.views = new_config.get('views', {})
+                snapshot_reader.timezone = new_upstream.timezone
+            else:
+                _client = new_upstream
+            upstream = new_upstream
+            section_router = new_router
+            app_name = _app_name(new_dashboard_cfg)
+            render_cache = new_render_cache
+            request_deadline = new_deadline
+            reply_budget = new_config.get('superops', {}).get('reply_budget_seconds', 3) or new_deadline
+            change_poll_seconds = new_dashboard_cfg.get('change_poll_seconds', 5 if webhook_auth else 0)
+            config = new_config
+        logger.info(f"Config reloaded: {', '.join(sorted(changed))} changed")
+        return changed
+
+    app.extensions[config_reload.EXTENSION_KEY] = apply_config
+
+    # --- Queue history sampling ---
+
+    if queue_history is not None and snapshot_reader is None:
+        history_sampler = HistorySampler(
+            queue_history, _sample_history, interval_seconds=history_cfg.get('sample_interval_seconds', 60),
+        )
+
+        @app.before_request
+        def start_history_sampler():
+            # Also started lazily so forked WSGI workers sample their own snapshot
+            history_sampler.ensure_started()
+
+        history_sampler.ensure_started()
+
+    # --- Warm-up ---
+
+    warm_up = None
+    warm_cfg = config.get('warm_up', {})
+    if warm_cfg.get('enabled', False):
+        warm_up = WarmUp(_build_warm_up_tasks(warm_cfg), max_workers=warm_cfg.get('max_workers', 4))
+
+        @app.before_request
+        def start_warm_up():
+            # Also started lazily so forked WSGI workers warm their own caches
+            warm_up.ensure_started()
+
+        warm_up.ensure_started()
+
     return app
+
+
+def create_multi_tenant_app(config):
+    """Create a root app serving one dashboard per tenant.
+
+    Each tenant's dashboard (views, APIs, webhooks) is a full app mounted at
+    /<tenant>/, with its own SuperOps client, caches and upstream rate limit.
+    All tenants share one HTTP connection pool, the worker thread pools and
+    the cache memory budget.
+
+    Args:
+        config: Parsed config.yaml dictionary with a `tenants` section.
+
+    Returns:
+        Flask app instance.
+    """
+    resources = SharedResources(config)
+    tenants = tenant_configs(config)
+    mounts = {}
+    for slug, tenant_config in tenants.items():
+        logger.info(f"Mounting tenant '{slug}' at /{slug}")
+        mounts[f'/{slug}'] = create_app(tenant_config, resources=resources)
+
+    root = Flask(__name__, static_folder='static')
+    default_tenant = next(iter(tenants))
+
+    @root.route('/')
+    def tenant_default():
+        """Redirect to the first tenant's dashboard."""
+        return redirect(f'{request.script_root}/{default_tenant}/')
+
+    @root.route('/api/tenants')
+    def api_tenants():
+        """List tenants and their dashboard paths."""
+        return jsonify({
+            'tenants': [
+                {
+                    'slug': slug,
+                    'name': tenant_config.get('dashboard', {}).get('company_name') or slug,
+                    'path': f'{request.script_root}/{slug}/',
+                }
+                for slug, tenant_config in tenants.items()
+            ],
+            'cache_budget': resources.cache_budget.stats() if resources.cache_budget is not None else None,
+        })
+
+    def apply_config(new_config):
+        """Hand each tenant its reloaded config; adding or removing tenants needs a restart."""
+        new_tenants = new_config.get('tenants') or {}
+        if set(new_tenants) != set(tenants):
+            logger.warning("Config reload: restart to add or remove tenants")
+        if new_config.get('shared_resources') != config.get('shared_resources'):
+            logger.warning("Config reload: restart to apply changes to shared_resources")
+        for slug in tenants:
+            if slug in new_tenants:
+                mounts[f'/{slug}'].extensions[config_reload.EXTENSION_KEY](new_tenants[slug])
+                tenants[slug] = new_tenants[slug]
+
+    root.extensions[config_reload.EXTENSION_KEY] = apply_config
+
+    @root.route('/health')
+    def tenant_health():
+        return jsonify({
+            'status': 'ok',
+            'tenants': list(tenants),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        })
+
+    root.wsgi_app = DispatcherMiddleware(root.wsgi_app, mounts)
+    return root
@@ -0,0 +1,414 @@
+import itertools
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from app import tracing
+
+logger = logging.getLogger(__name__)
+
+FRESH = 'fresh'
+STALE = 'stale'
+MISS = 'miss'
+
+# Process-wide use counter, so entries of different caches can be ordered by last use
+_use_clock = itertools.count()
+
+
+def approx_size(value, _depth=0):
+    """Rough size in bytes of a cached value (containers up to 3 levels deep)."""
+    size = sys.getsizeof(value)
+    if _depth >= 3:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += sys.getsizeof(k) + approx_size(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += approx_size(item, _depth + 1)
+    return size
+
+
+class CacheBudget:
+    """Byte budget shared by several caches (e.g. every tenant's caches in one process).
+
+    Usage is the approximate size of everything the registered caches hold.
+    When a put takes it over budget, entries are evicted across all of them
+    in least-recently-used order, whichever cache or tenant they belong to.
+    Caches are held weakly, so a discarded client's caches stop counting.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._caches = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def register(self, cache):
+        with self._lock:
+            self._caches.add(cache)
+
+    def _live_caches(self):
+        with self._lock:
+            return list(self._caches)
+
+    @property
+    def used(self):
+        return sum(cache.bytes for cache in self._live_caches())
+
+    @property
+    def exceeded(self):
+        return self.used > self.max_bytes
+
+    def reclaim(self, keep=None):
+        """Evict the least recently used entries of every cache until under budget.
+
+        Takes one cache lock at a time, so it must be called without holding any.
+
+        Args:
+            keep: (cache, key) of an entry to leave in place (the one just stored).
+
+        Returns:
+            int: Number of entries evicted.
+        """
+        evicted = 0
+        caches = self._live_caches()
+        used = sum(cache.bytes for cache in caches)
+        while used > self.max_bytes:
+            oldest = None
+            for cache in caches:
+                candidate = cache.lru_entry(skip=keep[1] if keep is not None and keep[0] is cache else None)
+                if candidate is not None and (oldest is None or candidate[1] < oldest[2]):
+                    oldest = (cache, candidate[0], candidate[1])
+            if oldest is None:
+                break
+            freed = oldest[0].evict(oldest[1])
+            if freed is not None:
+                used -= freed
+                evicted += 1
+        with self._lock:
+            self.evictions += evicted
+        return evicted
+
+    def stats(self):
+        return {'used_bytes': self.used, 'max_bytes': self.max_bytes, 'evictions': self.evictions}
+
+
+class NamedCache:
+    """One named cache: TTL, LRU bounds and stale-while-revalidate loading.
+
+    Entries are fresh for ttl_seconds, then stale for stale_seconds (None
+    keeps them until evicted, so a failed refresh can always fall back to
+    the last good value), then dropped. A cache is bounded by max_entries
+    and/or max_bytes; the least recently used entries are evicted first.
+    """
+
+    def __init__(self, name, ttl_seconds=None, stale_seconds=None, max_entries=None, max_bytes=None, budget=None):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # {key: (value, stored_at, size)}, least recently used first
+        self._used_at = {}  # {key: _use_clock tick of the last put or hit}
+        self._inflight = {}  # {key: Event} for loads in progress
+        self._bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.load_failures = 0
+        if budget is not None:
+            budget.register(self)
+
+    def _state(self, stored_at, now):
+        age = now - stored_at
+        if self.ttl_seconds is None or age < self.ttl_seconds:
+            return FRESH
+        if self.stale_seconds is None or age < self.ttl_seconds + self.stale_seconds:
+            return STALE
+        return MISS
+
+    def _lookup(self, key, count=True, serve_stale=True):
+        """Return (value, state, stored_at) and update LRU order and stats.
+
+        With serve_stale=False the caller won't use a stale value, so it is
+        counted as a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None, MISS, None
+            state = self._state(entry[1], time.time())
+            if state == MISS:
+                self._drop(key)
+                self.expirations += 1
+                if count:
+                    self.misses += 1
+                return None, MISS, None
+            self._entries.move_to_end(key)
+            self._used_at[key] = next(_use_clock)
+            if count:
+                if state == FRESH:
+                    self.hits += 1
+                elif serve_stale:
+                    self.stale_hits += 1
+                else:
+                    self.misses += 1
+            return entry[0], state, entry[1]
+
+    def get(self, key, default=None):
+        """Return the fresh value for key, or default."""
+        value, state, _ = self._lookup(key, serve_stale=False)
+        return value if state == FRESH else default
+
+    def peek(self, key):
+        """Return (value, stored_at) for a fresh or stale entry, else (None, None).
+
+        Used for falling back to the last good value; not counted in stats.
+        """
+        value, state, stored_at = self._lookup(key, count=False)
+        if state == MISS:
+            return None, None
+        return value, stored_at
+
+    def is_fresh(self, key):
+        """True if key has an entry within its TTL. Not counted in stats."""
+        _, state, _ = self._lookup(key, count=False)
+        return state == FRESH
+
+    def put(self, key, value, stored_at=None):
+        """Store value for key. Pass stored_at to keep an entry's age (e.g. when patching it)."""
+        size = approx_size(value) if self.max_bytes or self.budget else 0
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, time.time() if stored_at is None else stored_at, size)
+            self._used_at[key] = next(_use_clock)
+            self._bytes += size
+            self._evict()
+        # Outside the lock: reclaiming takes other caches' locks
+        if self.budget is not None and size and self.budget.exceeded:
+            self.budget.reclaim(keep=(self, key))
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._used_at.pop(key, None)
+        self._bytes -= entry[2]
+
+    def _evict(self):
+        while self._entries and (
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_bytes and self._bytes > self.max_bytes and len(self._entries) > 1)
+        ):
+            key = next(iter(self._entries))
+            self._drop(key)
+            self.evictions += 1
+
+    @property
+    def bytes(self):
+        """Approximate size of the cached values (0 unless max_bytes or a budget is set)."""
+        return self._bytes
+
+    def lru_entry(self, skip=None):
+        """Return (key, last use tick) of the least recently used entry, or None.
+
+        Args:
+            skip: Key to pass over (the next entry is returned instead).
+        """
+        with self._lock:
+            for key in self._entries:
+                if key != skip:
+                    return key, self._used_at.get(key, 0)
+            return None
+
+    def evict(self, key):
+        """Evict key for a cache budget. Returns the bytes freed, or None if it was gone."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._drop(key)
+            self.evictions += 1
+            return entry[2]
+
+    def discard(self, key):
+        """Drop key if present. Returns True if it was cached."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._drop(key)
+            return True
+
+    def keys(self):
+        """Return a list of the cached keys."""
+        with self._lock:
+            return list(self._entries)
+
+    def expire(self):
+        """Mark every fresh entry as past its TTL, so the next load refreshes it.
+
+        Entries stay available as stale values (unless stale_seconds is 0),
+        so background loads keep serving them while they refresh.
+        """
+        if self.ttl_seconds is None:
+            return
+        with self._lock:
+            cutoff = time.time() - self.ttl_seconds
+            for key, (value, stored_at, size) in list(self._entries.items()):
+                if stored_at > cutoff:
+                    self._entries[key] = (value, cutoff, size)
+
+    def retain(self, keys):
+        """Drop every entry whose key is not in `keys`. Returns the number dropped."""
+        with self._lock:
+            stale_keys = [key for key in self._entries if key not in keys]
+            for key in stale_keys:
+                self._drop(key)
+        return len(stale_keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._used_at.clear()
+            self._bytes = 0
+
+    def get_or_load(self, key, loader, force=False, background=False, default=None):
+        """Return a cached value, loading it with `loader` when needed.
+
+        Args:
+            key: Cache key.
+            loader: Callable returning the new value, or None on failure.
+            force: Load synchronously even if a fresh value is cached.
+            background: On a stale entry or miss, start a refresh in a
+                background thread and return the stale value (or default)
+                immediately instead of waiting.
+            default: Returned when there is nothing usable to serve.
+
+        Returns:
+            The fresh value, a stale value, or default. Only one load per key
+            runs at a time; concurrent synchronous callers wait for it.
+        """
+        # Only a background refresh serves the stale value to the caller
+        value, state, _ = self._lookup(key, serve_stale=background and not force)
+        if state == FRESH and not force:
+            return value
+        fallback = value if state != MISS else default
+
+        if background and not force:
+            with self._lock:
+                if key in self._inflight:
+                    return fallback
+                self._inflight[key] = threading.Event()
+            threading.Thread(
+                target=tracing.bind(self._run_load), args=(key, loader, True),
+                name=f'cache-refresh-{self.name}', daemon=True,
+            ).start()
+            return fallback
+
+        with self._lock:
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = self._inflight[key] = threading.Event()
+        if not owner:
+            event.wait()
+            value, _ = self.peek(key)
+            return fallback if value is None else value
+
+        result = self._run_load(key, loader)
+        return fallback if result is None else result
+
+    def _run_load(self, key, loader, background=False):
+        """Run loader for key (the caller has registered it as in flight)."""
+        try:
+            with tracing.span('cache_load', cache=self.name, key=str(key), background=background):
+                result = loader()
+        except Exception as e:
+            logger.error(f"Cache '{self.name}' failed to load {key!r}: {e}")
+            result = None
+        try:
+            if result is None:
+                with self._lock:
+                    self.load_failures += 1
+            else:
+                self.put(key, result)
+            return result
+        finally:
+            with self._lock:
+                event = self._inflight.pop(key, None)
+            if event is not None:
+                event.set()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes if self.max_bytes or self.budget else None,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.stale_hits) / lookups, 3) if lookups else None,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'load_failures': self.load_failures,
+            }
+
+
+class CacheManager:
+    """Registry of named caches with per-cache limits from config.
+
+    Limits come from code defaults, overridden by the `cache` config section:
+
+        cache:
+          conversations: {max_entries: 20000}
+          closed_counts: {max_entries: 256, max_bytes: 1048576}
+
+    An optional CacheBudget caps the bytes of every cache it is shared with.
+    """
+
+    def __init__(self, config=None, budget=None):
+        self._overrides = (config or {}).get('cache', {}) or {}
+        self.budget = budget
+        self._caches = {}
+
+    def register(self, name, ttl_seconds=None, stale_seconds=None, max_entries=None, max_bytes=None):
+        """Create a named cache. Config overrides take precedence over the arguments."""
+        overrides = self._overrides.get(name, {}) or {}
+        cache = NamedCache(
+            name,
+            ttl_seconds=overrides.get('ttl_seconds', ttl_seconds),
+            stale_seconds=overrides.get('stale_seconds', stale_seconds),
+            max_entries=overrides.get('max_entries', max_entries),
+            max_bytes=overrides.get('max_bytes', max_bytes),
+            budget=self.budget,
+        )
+        self._caches[name] = cache
+        return cache
+
+    def __getitem__(self, name):
+        return self._caches[name]
+
+    def set_ttl(self, name, ttl_seconds):
+        """Change a cache's TTL (e.g. on a config reload) unless config overrides it."""
+        overrides = self._overrides.get(name, {}) or {}
+        self._caches[name].ttl_seconds = overrides.get('ttl_seconds', ttl_seconds)
+
+    def clear(self):
+        for cache in self._caches.values():
+            cache.clear()
+
+    def stats(self):
+        """Return {cache_name: stats dict} for every registered cache."""
+        return {name: cache.stats() for name, cache in self._caches.items()}
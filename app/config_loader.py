@@ -2,6 +2,18 @@ import os
 import yaml
 import sys
 
+from app.ticket_mapper import SectionRouter
+from app.field_profiles import validate_field_profiles
+from app.tenants import tenant_configs
+
+
+def default_config_path():
+    """Path of config.yaml in the project root directory."""
+    return os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        'config.yaml'
+    )
+
 
 def load_config(config_path=None):
     """Load and validate config.yaml.
@@ -17,10 +29,7 @@ def load_config(config_path=None):
         SystemExit: If config file is missing or invalid.
     """
     if config_path is None:
-        config_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'config.yaml'
-        )
+        config_path = default_config_path()
 
     if not os.path.exists(config_path):
         print(f"ERROR: Configuration file not found: {config_path}")
@@ -38,10 +47,39 @@ def load_config(config_path=None):
         print("ERROR: config.yaml is empty")
         sys.exit(1)
 
-    _validate_config(config)
+    if config.get('tenants'):
+        _validate_tenants(config)
+    else:
+        _validate_config(config)
     return config
 
 
+def _validate_tenants(config):
+    """Validate each tenant's merged config and store it under config['tenants']."""
+    if not isinstance(config['tenants'], dict):
+        _exit_error("'tenants' must map tenant slugs to their settings")
+    for slug in config['tenants']:
+        if not str(slug).replace('-', '').replace('_', '').isalnum():
+            _exit_error(f"Tenant slug '{slug}' may only contain letters, digits, '-' and '_'")
+
+    tenants = tenant_configs(config)
+    for slug, tenant_config in tenants.items():
+        try:
+            _validate_config(tenant_config)
+        except SystemExit:
+            print(f"  (in tenant '{slug}')")
+            raise
+
+    # Naive SuperOps datetimes are interpreted in one process-wide timezone
+    timezones = {t.get('dashboard', {}).get('timezone', 'UTC') for t in tenants.values()}
+    if len(timezones) > 1:
+        _exit_error(f"All tenants must share one dashboard.timezone, got {sorted(timezones)}")
+
+    config['tenants'] = tenants
+    dashboard = config.setdefault('dashboard', {})
+    dashboard.setdefault('port', 5050)
+
+
 def _validate_config(config):
     """Validate required configuration sections and keys."""
     # Validate superops section
@@ -79,6 +117,15 @@ def _validate_config(config):
         'other_active': {'statuses': ['In Progress', 'On Hold']},
     })
 
+    # Compile status_mapping now so rule errors surface at startup
+    try:
+        SectionRouter(config['status_mapping'])
+    except (ValueError, TypeError, AttributeError) as e:
+        _exit_error(f"Invalid status_mapping: {e}")
+
+    for error in validate_field_profiles(config):
+        _exit_error(error)
+
     threshold_defaults = {'ghost_town': 30, 'zen': 40, 'calm': 50, 'good': 60, 'sweating': 80, 'warning': 90, 'danger': 100}
     thresholds = config.setdefault('alert_thresholds', {})
     for key, val in threshold_defaults.items():
@@ -0,0 +1,137 @@
+import logging
+import os
+import signal
+import threading
+
+from app.config_loader import default_config_path, load_config
+
+logger = logging.getLogger(__name__)
+
+# Key in app.extensions holding the app's apply-config hook
+EXTENSION_KEY = 'thebeacon.config_reload'
+
+# Sections read once at startup (pools, background threads, file paths,
+# webhook auth); a reload keeps their running values until a restart
+RESTART_SECTIONS = ('tenants', 'shared_resources', 'shared_snapshot', 'webhooks', 'warm_up', 'history', 'cache')
+
+CREDENTIAL_KEYS = ('api_url', 'api_key', 'customer_subdomain')
+
+
+def changed_sections(old, new):
+    """Return the set of top-level config sections that differ."""
+    return {key for key in set(old) | set(new) if old.get(key) != new.get(key)}
+
+
+def changed_views(old, new):
+    """Return slugs of views added, removed or edited between two configs."""
+    old_views = old.get('views', {}) or {}
+    new_views = new.get('views', {}) or {}
+    return {slug for slug in set(old_views) | set(new_views) if old_views.get(slug) != new_views.get(slug)}
+
+
+def credentials_changed(old, new):
+    """True if the SuperOps URL, API key or subdomain differ."""
+    old_superops = old.get('superops', {}) or {}
+    new_superops = new.get('superops', {}) or {}
+    return any(old_superops.get(key) != new_superops.get(key) for key in CREDENTIAL_KEYS)
+
+
+class ConfigReloader:
+    """Reloads config.yaml when it changes (or on SIGHUP) and hands it to the app.
+
+    The file's modification time is checked every poll_interval_seconds (0
+    disables polling, leaving only SIGHUP). A reloaded file is fully
+    validated first; if it is invalid, the running config is kept and the
+    error logged. Like WarmUp, the watcher restarts itself in a forked worker.
+    """
+
+    def __init__(self, path, apply, poll_interval_seconds=5):
+        """Args:
+            path: Path of the config file.
+            apply: Callable taking the validated new config dict.
+            poll_interval_seconds: How often to check the file's mtime.
+        """
+        self.path = path
+        self.apply = apply
+        self.poll_interval = poll_interval_seconds or None
+        self.reloads = 0
+        self.failures = 0
+        self._mtime = self._stat()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pid = None
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def ensure_started(self):
+        """Start the watcher thread in this process (safe after fork)."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            threading.Thread(target=self._run, name='config-reload', daemon=True).start()
+        if threading.current_thread() is threading.main_thread() and hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda signum, frame: self._wake.set())
+
+    def _run(self):
+        while True:
+            signalled = self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            try:
+                mtime = self._stat()
+                if signalled or (mtime is not None and mtime != self._mtime):
+                    self._mtime = mtime
+                    self.reload()
+            except Exception as e:
+                # Keep watching; the next change may be loadable
+                logger.error(f"Config reload: watcher error: {e}")
+
+    def reload(self):
+        """Load, validate and apply the config file. Returns True on success."""
+        try:
+            config = load_config(self.path)
+        except SystemExit:
+            self.failures += 1
+            logger.error(f"Config reload: {self.path} is invalid; keeping the running config")
+            return False
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Config reload: failed to load {self.path}: {e}; keeping the running config")
+            return False
+        try:
+            self.apply(config)
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Config reload: failed to apply {self.path}: {e}")
+            return False
+        self.reloads += 1
+        return True
+
+
+def install_config_reload(app, config, config_path=None):
+    """Watch the config file and apply changes to a running app.
+
+    Enabled by default; see `dashboard.config_reload` in config.example.yaml.
+
+    Returns:
+        ConfigReloader, or None if reloading is disabled.
+    """
+    reload_cfg = config.get('dashboard', {}).get('config_reload', {})
+    if not reload_cfg.get('enabled', True):
+        return None
+    reloader = ConfigReloader(
+        config_path or default_config_path(),
+        app.extensions[EXTENSION_KEY],
+        poll_interval_seconds=reload_cfg.get('poll_interval_seconds', 5),
+    )
+    # Also started lazily so forked WSGI workers watch the file themselves
+    app.before_request(reloader.ensure_started)
+    reloader.ensure_started()
+    return reloader
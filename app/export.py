@@ -0,0 +1,105 @@
+import csv
+import datetime
+import json
+
+from app.field_profiles import FIELD_SOURCES
+
+ACTIVE_COLUMNS = tuple(FIELD_SOURCES) + ('sla_text', 'sla_class')
+
+# Fields of SuperOpsClient._normalize_closed_ticket
+CLOSED_COLUMNS = (
+    'ticket_id', 'id', 'status_text', 'created_at_str', 'updated_at_str',
+    'first_response_time_str', 'resolution_time_str', 'responder_id', 'group_id',
+)
+
+FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+# Leading characters spreadsheets treat as a formula
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def parse_date_param(value, timezone):
+    """Parse a since/until query value: a date (local midnight) or an ISO datetime.
+
+    Returns:
+        datetime|None: Timezone-aware datetime, or None if value is empty.
+
+    Raises:
+        ValueError: If value can't be parsed.
+    """
+    if not value:
+        return None
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    parsed = datetime.datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone)
+    return parsed
+
+
+def ticket_filter(parse_datetime, view_config=None, agent_id=None, since=None, until=None):
+    """Build a predicate for export rows.
+
+    View and agent matching follow filter_by_view() and filter_by_agent();
+    since/until bound updated_at_str (inclusive start, exclusive end).
+    """
+    exclude_set = target_set = None
+    if view_config:
+        if view_config.get('exclude_tech_group_ids'):
+            exclude_set = set(view_config['exclude_tech_group_ids'])
+        elif view_config.get('tech_group_ids'):
+            target_set = set(view_config['tech_group_ids'])
+    agent_id_str = str(agent_id) if agent_id else None
+
+    def _matches(ticket):
+        group_id = ticket.get('group_id')
+        if exclude_set is not None and group_id in exclude_set:
+            return False
+        if target_set is not None and group_id not in target_set:
+            return False
+        if agent_id_str is not None and str(ticket.get('responder_id', '')) != agent_id_str:
+            return False
+        if since is not None or until is not None:
+            try:
+                updated = parse_datetime(ticket.get('updated_at_str'))
+            except (ValueError, TypeError):
+                return False
+            if since is not None and updated < since:
+                return False
+            if until is not None and updated >= until:
+                return False
+        return True
+
+    return _matches
+
+
+def iter_ndjson(rows, columns):
+    """Yield one JSON line per row, limited to columns."""
+    for row in rows:
+        yield json.dumps({column: row.get(column) for column in columns}, separators=(',', ':')) + '\n'
+
+
+class _Line:
+    """File-like object whose write() returns the line, so csv.writer can feed a generator."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows, columns):
+    """Yield a CSV header line, then one line per row."""
+    writer = csv.writer(_Line())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_csv_cell(row.get(column)) for column in columns])
+
+
+def _csv_cell(value):
+    if value is None:
+        return ''
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
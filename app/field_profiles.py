@@ -0,0 +1,125 @@
+# Normalized ticket field -> SuperOps field it is built from
+# (see SuperOpsClient._normalize_ticket)
+FIELD_SOURCES = {
+    'id': 'displayId',
+    'ticket_id': 'ticketId',
+    'subject': 'subject',
+    'status_text': 'status',
+    'priority_text': 'priority',
+    'priority_raw': 'priority',
+    'agent_name': 'technician',
+    'responder_id': 'technician',
+    'requester_name': 'requester',
+    'client_name': 'client',
+    'group_id': 'techGroup',
+    'group_name': 'techGroup',
+    'type': 'requestType',
+    'created_at_str': 'createdTime',
+    'updated_at_str': 'updatedTime',
+    'fr_due_by_str': 'firstResponseDueTime',
+    'first_responded_at_iso': 'firstResponseTime',
+    'first_response_violated': 'firstResponseViolated',
+    'due_by_str': 'resolutionDueTime',
+    'resolution_time': 'resolutionTime',
+    'resolution_violated': 'resolutionViolated',
+    'sla_name': 'sla',
+}
+
+# Fields computed server-side from the core fields below
+COMPUTED_FIELDS = (
+    'sla_text', 'sla_class', 'updated_friendly', 'created_days_old', 'has_requester_reply', 'reply_pending',
+    'next_change_ts',
+)
+
+ALL_FIELDS = frozenset(FIELD_SOURCES) | frozenset(COMPUTED_FIELDS)
+
+# SuperOps fields always fetched: view/agent filtering, section routing,
+# SLA computation, reply-cache keys, reply lookup ordering (priority and
+# resolution due time) and monthly averages depend on them.
+CORE_UPSTREAM_FIELDS = frozenset((
+    'ticketId', 'displayId', 'status', 'priority', 'technician', 'techGroup',
+    'createdTime', 'updatedTime', 'firstResponseDueTime', 'firstResponseTime',
+    'firstResponseViolated', 'resolutionDueTime', 'resolutionViolated',
+))
+
+# Always included in projected payloads (row keys, new/closed detection)
+KEY_FIELDS = frozenset(('id', 'ticket_id'))
+
+
+def profile_fields(config, view_slug):
+    """Return the field set for a view's profile, or None for all fields."""
+    view_config = config.get('views', {}).get(view_slug, {})
+    profile_name = view_config.get('field_profile')
+    if not profile_name:
+        return None
+    return frozenset(config.get('field_profiles', {}).get(profile_name, [])) | KEY_FIELDS
+
+
+def parse_fields_param(value):
+    """Parse a `fields=a,b,c` query parameter.
+
+    Returns:
+        tuple: (fields, unknown) - fields is a frozenset (or None when the
+        parameter is absent) and unknown lists names that are not ticket fields.
+    """
+    if not value:
+        return None, []
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in ALL_FIELDS]
+    return frozenset(names) | KEY_FIELDS, unknown
+
+
+def combine(*field_sets):
+    """Intersect field sets, treating None as "all fields"."""
+    result = None
+    for fields in field_sets:
+        if fields is None:
+            continue
+        result = fields if result is None else result & fields
+    return result
+
+
+def project(tickets, fields):
+    """Return tickets trimmed to `fields` (unchanged when fields is None)."""
+    if fields is None:
+        return tickets
+    return [{k: v for k, v in ticket.items() if k in fields} for ticket in tickets]
+
+
+def upstream_selection(config, all_upstream_fields, extra_upstream_fields=()):
+    """Compute the GraphQL ticket selection needed by every configured view.
+
+    The ticket snapshot is shared by all views, so the selection is the union
+    of every view's profile. Any view without a profile needs everything.
+
+    Args:
+        config: Parsed config dict.
+        all_upstream_fields: Ordered list of every SuperOps ticket field.
+        extra_upstream_fields: Upstream fields other features depend on
+            (e.g. priority when routing rules match on it).
+
+    Returns:
+        list: SuperOps field names, in the order of all_upstream_fields.
+    """
+    needed = set(CORE_UPSTREAM_FIELDS) | set(extra_upstream_fields)
+    for slug in config.get('views', {}):
+        fields = profile_fields(config, slug)
+        if fields is None:
+            return list(all_upstream_fields)
+        needed.update(FIELD_SOURCES[f] for f in fields if f in FIELD_SOURCES)
+    return [f for f in all_upstream_fields if f in needed]
+
+
+def validate_field_profiles(config):
+    """Return a list of error strings for invalid field profile config."""
+    errors = []
+    profiles = config.get('field_profiles', {}) or {}
+    for name, fields in profiles.items():
+        unknown = [f for f in (fields or []) if f not in ALL_FIELDS]
+        if unknown:
+            errors.append(f"field_profiles.{name} has unknown fields: {', '.join(unknown)}")
+    for slug, view_config in config.get('views', {}).items():
+        profile_name = (view_config or {}).get('field_profile')
+        if profile_name and profile_name not in profiles:
+            errors.append(f"views.{slug}.field_profile '{profile_name}' is not defined in field_profiles")
+    return errors
@@ -0,0 +1,287 @@
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+
+logger = logging.getLogger(__name__)
+
+# Recorded per view, in this order
+SERIES = ('s1', 's2', 's3', 's4', 'total', 'sla_violated')
+
+# (name, bucket seconds, retention seconds), finest first
+TIERS = (
+    ('minute', 60, 7 * 86400),
+    ('hour', 3600, 90 * 86400),
+    ('day', 86400, 730 * 86400),
+)
+
+_PERSIST_VERSION = 1
+
+
+def section_counts(sections, tickets):
+    """Series values for one view's sections.
+
+    Args:
+        sections: (s1_keys, s2_keys, s3_keys, s4_keys) for the view.
+        tickets: {ticket_key: ticket} the keys refer to.
+
+    Returns:
+        dict: {series_name: count} for the names in SERIES.
+    """
+    violated = sum(
+        1 for keys in sections for key in keys
+        if tickets[key].get('first_response_violated') or tickets[key].get('resolution_violated')
+    )
+    return {
+        's1': len(sections[0]),
+        's2': len(sections[1]),
+        's3': len(sections[2]),
+        's4': len(sections[3]),
+        'total': sum(len(keys) for keys in sections),
+        'sla_violated': violated,
+    }
+
+
+class _TierRing:
+    """Fixed-size ring of time buckets for one view at one resolution.
+
+    Each slot holds the bucket number it currently represents, a sample
+    count and the running mean of every series, in flat typed arrays so a
+    week of minutes for one view is a few hundred KB.
+    """
+
+    def __init__(self, step, slots):
+        self.step = step
+        self.slots = slots
+        self.buckets = array('q', [-1]) * slots
+        self.samples = array('I', [0]) * slots
+        self.values = array('f', [0.0]) * (slots * len(SERIES))
+
+    def record(self, ts, values):
+        bucket = int(ts // self.step)
+        slot = bucket % self.slots
+        base = slot * len(SERIES)
+        if self.buckets[slot] != bucket:
+            self.buckets[slot] = bucket
+            self.samples[slot] = 0
+        n = self.samples[slot] + 1
+        self.samples[slot] = n
+        # Running mean, so each bucket is the average of every sample in it
+        for i, value in enumerate(values):
+            self.values[base + i] += (value - self.values[base + i]) / n
+
+    def points(self, start_ts, end_ts):
+        """Yield (bucket_start_ts, [values]) for populated buckets in range."""
+        first = max(int(start_ts // self.step), int(end_ts // self.step) - self.slots + 1)
+        last = int(end_ts // self.step)
+        width = len(SERIES)
+        for bucket in range(first, last + 1):
+            slot = bucket % self.slots
+            if self.buckets[slot] != bucket:
+                continue
+            base = slot * width
+            yield bucket * self.step, [round(v, 2) for v in self.values[base:base + width]]
+
+    def dump(self):
+        return {
+            'buckets': base64.b64encode(self.buckets.tobytes()).decode('ascii'),
+            'samples': base64.b64encode(self.samples.tobytes()).decode('ascii'),
+            'values': base64.b64encode(self.values.tobytes()).decode('ascii'),
+        }
+
+    def load(self, data):
+        buckets = array('q')
+        buckets.frombytes(base64.b64decode(data['buckets']))
+        samples = array('I')
+        samples.frombytes(base64.b64decode(data['samples']))
+        values = array('f')
+        values.frombytes(base64.b64decode(data['values']))
+        if len(buckets) != self.slots or len(samples) != self.slots or len(values) != self.slots * len(SERIES):
+            raise ValueError("history ring size mismatch")
+        self.buckets, self.samples, self.values = buckets, samples, values
+
+
+class QueueHistory:
+    """In-memory time series of per-view section and SLA-violation counts.
+
+    Every record() updates the minute, hour and day rings at once, so older
+    data is already downsampled when the finer ring wraps. Optionally
+    persisted to a JSON file so history survives restarts.
+    """
+
+    def __init__(self, persist_path=None, persist_interval_seconds=300):
+        self.persist_path = persist_path or None
+        self.persist_interval = persist_interval_seconds
+        self._lock = threading.Lock()
+        self._views = {}  # {view_slug: {tier_name: _TierRing}}
+        self._last_persist = time.time()
+        if self.persist_path:
+            self._load()
+
+    def _rings(self, view_slug):
+        rings = self._views.get(view_slug)
+        if rings is None:
+            rings = {name: _TierRing(step, retention // step) for name, step, retention in TIERS}
+            self._views[view_slug] = rings
+        return rings
+
+    def record(self, view_slug, counts, ts=None):
+        """Record one sample for a view.
+
+        Args:
+            view_slug: View the counts belong to.
+            counts: {series_name: number} for the names in SERIES.
+            ts: Sample time (epoch seconds), defaults to now.
+        """
+        ts = time.time() if ts is None else ts
+        values = [float(counts.get(name) or 0) for name in SERIES]
+        with self._lock:
+            for ring in self._rings(view_slug).values():
+                ring.record(ts, values)
+        if self.persist_path and (ts - self._last_persist) >= self.persist_interval:
+            self._last_persist = ts
+            self.save()
+
+    def query(self, view_slug, start_ts, end_ts=None, resolution=None):
+        """Return points for a view between start_ts and end_ts.
+
+        Args:
+            resolution: 'minute', 'hour' or 'day'. Defaults to the finest
+                tier whose retention covers start_ts.
+
+        Returns:
+            dict: {'resolution', 'step_seconds', 'series', 'points': [[ts, *values]]}
+        """
+        end_ts = time.time() if end_ts is None else end_ts
+        if resolution is None:
+            resolution = TIERS[-1][0]
+            for name, _, retention in TIERS:
+                if start_ts >= end_ts - retention:
+                    resolution = name
+                    break
+        step = next(step for name, step, _ in TIERS if name == resolution)
+
+        with self._lock:
+            rings = self._views.get(view_slug)
+            points = [] if rings is None else [
+                [ts] + values for ts, values in rings[resolution].points(start_ts, end_ts)
+            ]
+        return {
+            'resolution': resolution,
+            'step_seconds': step,
+            'series': list(SERIES),
+            'points': points,
+        }
+
+    def dump(self):
+        """Return every ring as a JSON-serializable dict (see load_dump())."""
+        with self._lock:
+            return {
+                'version': _PERSIST_VERSION,
+                'views': {
+                    slug: {name: ring.dump() for name, ring in rings.items()}
+                    for slug, rings in self._views.items()
+                },
+            }
+
+    def load_dump(self, data):
+        """Replace the history with one returned by dump().
+
+        Raises:
+            ValueError: If the dump is from another format version or its
+                rings don't match TIERS.
+        """
+        if data.get('version') != _PERSIST_VERSION:
+            raise ValueError(f"unsupported history version {data.get('version')}")
+        views = {}
+        for slug, tiers in data.get('views', {}).items():
+            rings = views[slug] = {name: _TierRing(step, retention // step) for name, step, retention in TIERS}
+            for name, ring_data in tiers.items():
+                if name in rings:
+                    rings[name].load(ring_data)
+        with self._lock:
+            self._views = views
+
+    def save(self):
+        """Write history to persist_path atomically."""
+        if not self.persist_path:
+            return
+        data = self.dump()
+        tmp_path = f"{self.persist_path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.persist_path)
+        except OSError as e:
+            logger.warning(f"Failed to persist queue history to {self.persist_path}: {e}")
+
+    def _load(self):
+        if not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != _PERSIST_VERSION:
+                return
+            self.load_dump(data)
+            logger.info(f"Loaded queue history for {len(self._views)} views from {self.persist_path}")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable queue history {self.persist_path}: {e}")
+            self._views = {}
+
+
+class HistorySampler:
+    """Background thread recording a history sample for every view at a fixed interval.
+
+    Sampling on a timer rather than on page loads keeps the minute ring
+    free of gaps while nobody is watching. Used in single-process mode; with
+    a shared snapshot the elected poller records instead. Like WarmUp, the
+    thread restarts itself in a forked worker.
+    """
+
+    def __init__(self, history, sample, interval_seconds=60):
+        """Args:
+            history: QueueHistory to record into.
+            sample: Callable returning {view_slug: counts}, or None to skip
+                this tick (e.g. no ticket snapshot yet).
+            interval_seconds: Time between samples.
+        """
+        self.history = history
+        self.sample = sample
+        self.interval = interval_seconds
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start the sampling thread in this process (safe after fork)."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            threading.Thread(target=self._run, name='history-sampler', daemon=True).start()
+
+    def _run(self):
+        while True:
+            started = time.time()
+            self.sample_once()
+            time.sleep(max(1, self.interval - (time.time() - started)))
+
+    def sample_once(self):
+        """Take one sample and record it. Returns True if anything was recorded."""
+        try:
+            counts = self.sample()
+        except Exception as e:
+            logger.warning(f"Queue history sample failed: {e}")
+            return False
+        if not counts:
+            return False
+        ts = time.time()
+        for view_slug, view_counts in counts.items():
+            self.history.record(view_slug, view_counts, ts)
+        return True
@@ -0,0 +1,94 @@
+import codecs
+import json
+import re
+
+_SEPARATORS = re.compile(r'[\s,]*')
+_SCALAR_END = frozenset(' \t\r\n,]')
+
+
+class JSONArrayStream:
+    """Incrementally decodes the first array under `key` in a streamed JSON document.
+
+    Iterating yields the array's items one at a time as chunks arrive, so
+    only the current item (plus one chunk of text) is held in memory rather
+    than the whole body. Once iteration finishes, `envelope` holds the rest
+    of the document with the array replaced by [] (e.g. GraphQL listInfo
+    and errors). A document without the key is decoded whole into
+    `envelope` and yields nothing.
+    """
+
+    def __init__(self, chunks, key):
+        """Args:
+            chunks: Iterable of bytes (e.g. response.iter_content()).
+            key: Object key whose array value should be streamed.
+        """
+        self._chunks = iter(chunks)
+        self._key_re = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._decode = json.JSONDecoder().raw_decode
+        self.envelope = None
+        self.count = 0
+
+    def _read(self):
+        """Return the next chunk of decoded text, or None at end of stream."""
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk) if chunk else ''
+            if text:
+                return text
+        return self._utf8.decode(b'', final=True) or None
+
+    def __iter__(self):
+        buf = ''
+        # Read up to the opening bracket of the array
+        while True:
+            match = self._key_re.search(buf)
+            if match:
+                break
+            text = self._read()
+            if text is None:
+                self.envelope = json.loads(buf) if buf.strip() else {}
+                return
+            buf += text
+        prefix = buf[:match.end()]
+        buf = buf[match.end():]
+        pos = 0
+
+        while True:
+            pos = _SEPARATORS.match(buf, pos).end()
+            if pos < len(buf) and buf[pos] == ']':
+                pos += 1
+                break
+            item = end = None
+            if pos < len(buf):
+                try:
+                    item, end = self._decode(buf, pos)
+                except json.JSONDecodeError:
+                    pass
+            # Incomplete item, or a number/literal that may continue in the next chunk
+            if end is None or (
+                not isinstance(item, (dict, list, str))
+                and (end == len(buf) or buf[end] not in _SCALAR_END)
+            ):
+                text = self._read()
+                if text is None:
+                    if end is None:
+                        raise ValueError(f"Truncated JSON array after {self.count} items")
+                else:
+                    buf = buf[pos:] + text
+                    pos = 0
+                    continue
+            pos = end
+            self.count += 1
+            yield item
+            if pos > 65536:
+                buf = buf[pos:]
+                pos = 0
+
+        # Decode the remainder of the document around an empty array
+        rest = [buf[pos:]]
+        while True:
+            text = self._read()
+            if text is None:
+                break
+            rest.append(text)
+        self.envelope = json.loads(prefix + ']' + ''.join(rest))
@@ -0,0 +1,176 @@
+import datetime
+import math
+from array import array
+
+# 2001-01-01 was a Monday; business offsets count whole weeks from it
+_EPOCH_MONDAY = datetime.date(2001, 1, 1).toordinal()
+
+PERCENTILES = (50, 90, 99)
+
+
+class BusinessClock:
+    """Maps timestamps to cumulative business seconds since a fixed Monday.
+
+    The business time between two timestamps is then a single subtraction,
+    instead of walking the days in between. Business hours are Monday-Friday,
+    start_hour to end_hour in the configured timezone; timestamps outside
+    them clamp to the nearest boundary, matching the old day-by-day walk.
+    """
+
+    def __init__(self, timezone, start_hour, end_hour, parse_datetime):
+        self.timezone = timezone
+        self.day_start = start_hour * 3600
+        self.day_length = max(0, (end_hour - start_hour) * 3600)
+        self.parse_datetime = parse_datetime
+        self._memo = {}  # {timestamp string: (epoch, offset) or None}
+
+    def offset(self, dt):
+        """Business seconds between the epoch Monday and dt."""
+        local = dt.astimezone(self.timezone)
+        weeks, weekday = divmod(local.toordinal() - _EPOCH_MONDAY, 7)
+        total = (weeks * 5 + min(weekday, 5)) * self.day_length
+        if weekday < 5:
+            second_of_day = local.hour * 3600 + local.minute * 60 + local.second + local.microsecond / 1e6
+            total += min(max(second_of_day - self.day_start, 0), self.day_length)
+        return total
+
+    def lookup(self, dt_str):
+        """(epoch seconds, business offset) for a SuperOps timestamp string.
+
+        Memoized, since the same snapshot is summarized for every view and
+        refresh. Returns None if the string can't be parsed.
+        """
+        memo = self._memo
+        value = memo.get(dt_str)
+        if value is None and dt_str not in memo:
+            try:
+                dt = self.parse_datetime(dt_str)
+                value = (dt.timestamp(), self.offset(dt))
+            except (ValueError, TypeError):
+                value = None
+            if len(memo) >= 200000:
+                memo.clear()
+            memo[dt_str] = value
+        return value
+
+    def between(self, start_dt, end_dt):
+        """Business seconds from start_dt to end_dt (0 if end is not after start)."""
+        return max(0.0, self.offset(end_dt) - self.offset(start_dt))
+
+
+def summarize(durations):
+    """Return {'count', 'mean', 'p50', 'p90', 'p99'} for durations in seconds.
+
+    Durations must be sorted. Percentiles use the nearest-rank method.
+    """
+    count = len(durations)
+    stats = {'count': count, 'mean': None}
+    for pct in PERCENTILES:
+        stats[f'p{pct}'] = None
+    if not count:
+        return stats
+    stats['mean'] = sum(durations) / count
+    for pct in PERCENTILES:
+        stats[f'p{pct}'] = durations[max(0, math.ceil(pct / 100 * count) - 1)]
+    return stats
+
+
+class MetricsFrame:
+    """Columnar first-response and resolution durations for one snapshot.
+
+    Durations are grouped by tech group once when the frame is built, so
+    stats for any set of groups is a merge of already-sorted columns.
+    """
+
+    def __init__(self, response_by_group, close_by_group):
+        self.response_by_group = response_by_group  # {group_id: sorted array('d')}
+        self.close_by_group = close_by_group
+
+    @staticmethod
+    def _select(by_group, group_ids):
+        if not group_ids:
+            columns = by_group.values()
+        else:
+            columns = [by_group[g] for g in group_ids if g in by_group]
+        merged = array('d')
+        for column in columns:
+            merged.extend(column)
+        return sorted(merged)
+
+    def stats(self, group_ids=None):
+        """Response and close stats for tickets in group_ids (all groups if empty)."""
+        return {
+            'response': summarize(self._select(self.response_by_group, group_ids)),
+            'close': summarize(self._select(self.close_by_group, group_ids)),
+        }
+
+    def by_group(self):
+        """Response and close stats for every tech group."""
+        groups = set(self.response_by_group) | set(self.close_by_group)
+        return {
+            group_id: {
+                'response': summarize(self.response_by_group.get(group_id, ())),
+                'close': summarize(self.close_by_group.get(group_id, ())),
+            }
+            for group_id in groups
+        }
+
+
+def build_frame(clock, active_tickets, closed_tickets, cutoff):
+    """Build a MetricsFrame for the rolling window starting at cutoff.
+
+    First response covers every ticket (active or closed) created since the
+    cutoff; resolution covers closed tickets updated since the cutoff.
+
+    Args:
+        clock: BusinessClock.
+        active_tickets: Normalized active tickets.
+        closed_tickets: Normalized closed tickets (see _normalize_closed_ticket).
+        cutoff: Timezone-aware datetime for the start of the window.
+
+    Returns:
+        MetricsFrame
+    """
+    cutoff_ts = cutoff.timestamp()
+    lookup = clock.lookup
+    response = {}
+    close = {}
+
+    def add_response(group_id, created_str, fr_str):
+        if not created_str or not fr_str:
+            return
+        created = lookup(created_str)
+        first_response = lookup(fr_str)
+        if created is None or first_response is None or created[0] < cutoff_ts:
+            return
+        column = response.get(group_id)
+        if column is None:
+            column = response[group_id] = array('d')
+        column.append(max(0.0, first_response[1] - created[1]))
+
+    for t in active_tickets:
+        add_response(t.get('group_id'), t.get('created_at_str'), t.get('first_responded_at_iso'))
+
+    for t in closed_tickets:
+        group_id = t.get('group_id')
+        created_str = t.get('created_at_str')
+        add_response(group_id, created_str, t.get('first_response_time_str'))
+
+        updated_str = t.get('updated_at_str')
+        res_str = t.get('resolution_time_str')
+        if not updated_str or not created_str or not res_str:
+            continue
+        updated = lookup(updated_str)
+        created = lookup(created_str)
+        resolved = lookup(res_str)
+        if updated is None or created is None or resolved is None or updated[0] < cutoff_ts:
+            continue
+        column = close.get(group_id)
+        if column is None:
+            column = close[group_id] = array('d')
+        column.append(max(0.0, resolved[1] - created[1]))
+
+    return MetricsFrame(
+        {g: array('d', sorted(c)) for g, c in response.items()},
+        {g: array('d', sorted(c)) for g, c in close.items()},
+    )
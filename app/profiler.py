@@ -0,0 +1,169 @@
+import math
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+# Project root, for shortening file names in frame labels
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Leaf frames of threads parked waiting for work (lock and condition waits,
+# idle pool workers, selector loops); excluded unless idle samples are wanted
+IDLE_LEAVES = {
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('thread.py', '_worker'),
+    ('queue.py', 'get'),
+    ('selectors.py', 'select'),
+    ('socketserver.py', 'serve_forever'),
+    ('socket.py', 'accept'),
+    ('_base.py', 'wait'),
+    ('_base.py', 'result'),
+}
+
+# Numbered pool threads ("conversations_3", "Thread-7 (process_request_thread)")
+# are grouped under one name
+_THREAD_NUMBER_RE = re.compile(r'(_\d+|-\d+)(?= |$)')
+
+_lock = threading.Lock()
+
+
+class ProfilerBusy(Exception):
+    """Another profile is already running in this process."""
+
+
+def _thread_group(name):
+    return _THREAD_NUMBER_RE.sub('', name)
+
+
+class SamplingProfiler:
+    """Samples the Python stack of every thread at a fixed interval.
+
+    Uses sys._current_frames(), so nothing is installed in the profiled
+    threads and the overhead is one stack walk per thread per sample. This
+    is wall-clock sampling: a thread blocked in a call shows up in it for as
+    long as it waits, unless its leaf frame is a known idle wait.
+    """
+
+    def __init__(self, interval_seconds=0.01, max_depth=64, include_idle=False):
+        if not math.isfinite(interval_seconds) or interval_seconds <= 0:
+            raise ValueError("interval_seconds must be a positive number")
+        self.interval = interval_seconds
+        self.max_depth = max_depth
+        self.include_idle = include_idle
+        self._labels = {}  # {code object: (label, (file basename, function name))}
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            path = code.co_filename
+            if path.startswith(_ROOT + os.sep):
+                short = os.path.relpath(path, _ROOT)
+            else:
+                short = os.path.join(*path.split(os.sep)[-2:]) if os.sep in path else path
+            label = self._labels[code] = (
+                f"{code.co_name} ({short}:{code.co_firstlineno})", (os.path.basename(path), code.co_name),
+            )
+        return label
+
+    def _stack(self, frame):
+        """Return (labels root-first, idle) for a thread's current frame."""
+        labels = []
+        leaf = self._label(frame.f_code)
+        while frame is not None and len(labels) < self.max_depth:
+            labels.append(self._label(frame.f_code)[0])
+            frame = frame.f_back
+        labels.reverse()
+        return labels, leaf[1] in IDLE_LEAVES
+
+    def run(self, seconds):
+        """Sample for `seconds` and return the profile as a dict.
+
+        Raises:
+            ValueError: If seconds is not a positive finite number.
+            ProfilerBusy: If another profile is running in this process.
+        """
+        if not math.isfinite(seconds) or seconds <= 0:
+            raise ValueError("seconds must be a positive number")
+        if not _lock.acquire(blocking=False):
+            raise ProfilerBusy("a profile is already running")
+        try:
+            return self._run(seconds)
+        finally:
+            _lock.release()
+
+    def _run(self, seconds):
+        own = threading.get_ident()
+        stacks = Counter()  # {(thread group, labels...): samples}
+        samples = idle = 0
+        started = time.perf_counter()
+        deadline = started + seconds
+        next_sample = started
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now < next_sample:
+                time.sleep(next_sample - now)
+            next_sample += self.interval
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                labels, is_idle = self._stack(frame)
+                if is_idle and not self.include_idle:
+                    idle += 1
+                    continue
+                samples += 1
+                stacks[(_thread_group(names.get(ident, f'thread-{ident}')),) + tuple(labels)] += 1
+        return {
+            'seconds': round(time.perf_counter() - started, 3),
+            'interval_ms': self.interval * 1000,
+            'samples': samples,
+            'idle_samples_skipped': idle,
+            'stacks': stacks,
+        }
+
+
+def collapsed(stacks):
+    """Collapsed-stack text ("thread;outer;...;inner count" per line), as read by flamegraph.pl and speedscope."""
+    return ''.join(
+        f"{';'.join(stack)} {count}\n"
+        for stack, count in sorted(stacks.items(), key=lambda item: item[1], reverse=True)
+    )
+
+
+def top_functions(stacks, samples, limit=25):
+    """Functions by self samples (leaf) and total samples (anywhere on the stack).
+
+    Returns:
+        dict: {'self': [...], 'total': [...]}, each a list of
+        {'function', 'samples', 'percent'} sorted by samples, and 'threads':
+        samples per thread group.
+    """
+    own = Counter()
+    total = Counter()
+    for stack, count in stacks.items():
+        frames = stack[1:]
+        if not frames:
+            continue
+        own[frames[-1]] += count
+        for label in set(frames):
+            total[label] += count
+
+    def rows(counter):
+        return [
+            {'function': label, 'samples': count, 'percent': round(100 * count / samples, 1) if samples else 0}
+            for label, count in counter.most_common(limit)
+        ]
+
+    threads = Counter()
+    for stack, count in stacks.items():
+        threads[stack[0]] += count
+    return {
+        'self': rows(own),
+        'total': rows(total),
+        'threads': [{'thread': name, 'samples': count} for name, count in threads.most_common()],
+    }
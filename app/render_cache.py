@@ -0,0 +1,79 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class RenderCache:
+    """Bounded LRU cache for rendered dashboard pages with single-flight renders.
+
+    Keys carry the inputs that change the output (view, agent, snapshot
+    version), so entries never need explicit invalidation; they simply stop
+    being asked for. Output that changes with time alone (SLA state, age in
+    days) is bounded by the expiry each render reports. Concurrent misses on the same key wait
+    for the first render instead of each rendering the template.
+    """
+
+    def __init__(self, max_entries=64, ttl_seconds=60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # {key: (expires_at, html)}
+        self._key_locks = {}  # {key: Lock} for in-flight renders
+
+    def get_or_render(self, key, render):
+        """Return cached HTML for key, rendering it at most once per key.
+
+        Args:
+            key: Hashable cache key.
+            render: Callable returning (html, cacheable, expires_at).
+                Uncacheable results (e.g. error pages) are returned but not
+                stored; expires_at (epoch seconds or None) shortens the TTL.
+
+        Returns:
+            str: Rendered HTML.
+        """
+        html = self._get(key)
+        if html is not None:
+            return html
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another request may have rendered while we waited
+            html = self._get(key)
+            if html is not None:
+                return html
+            try:
+                html, cacheable, expires_at = render()
+                if cacheable:
+                    self._put(key, html, expires_at)
+                return html
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _put(self, key, html, expires_at=None):
+        expires = time.time() + self.ttl_seconds
+        if expires_at is not None:
+            expires = min(expires, expires_at)
+        with self._lock:
+            self._entries[key] = (expires, html)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,148 @@
+import math
+import random
+import threading
+import time
+from collections import deque
+
+# Circuit breaker states
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+class UpstreamUnavailable(Exception):
+    """Raised when the circuit breaker is open and a call is short-circuited."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for the SuperOps API.
+
+    Closed: calls flow normally. After `failure_threshold` consecutive
+    failures the breaker opens and calls fail immediately for
+    `reset_seconds`. It then goes half-open and lets a single probe through;
+    a successful probe closes it, a failed one re-opens it.
+    """
+
+    def __init__(self, failure_threshold=5, reset_seconds=60):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0
+        self._probe_in_flight = False
+        self._last_failure_time = None
+        self._last_success_time = None
+
+    def allow(self):
+        """Return True if a call may be attempted now."""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return True
+            if self._state == STATE_OPEN:
+                if (time.time() - self._opened_at) < self.reset_seconds:
+                    return False
+                self._state = STATE_HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: only one probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+            self._last_success_time = time.time()
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._last_failure_time = time.time()
+            self._probe_in_flight = False
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = STATE_OPEN
+                self._opened_at = time.time()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == STATE_OPEN and (time.time() - self._opened_at) >= self.reset_seconds:
+                return STATE_HALF_OPEN
+            return self._state
+
+    def snapshot(self):
+        """Return a JSON-friendly view of the breaker state."""
+        state = self.state
+        with self._lock:
+            retry_in = None
+            if state == STATE_OPEN:
+                retry_in = max(0, math.ceil(self.reset_seconds - (time.time() - self._opened_at)))
+            return {
+                'state': state,
+                'consecutive_failures': self._failures,
+                'retry_in_seconds': retry_in,
+                'last_failure_time': self._last_failure_time,
+                'last_success_time': self._last_success_time,
+            }
+
+
+class LatencyTracker:
+    """Rolling window of request durations per operation name."""
+
+    def __init__(self, window=200, min_samples=20):
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples = {}  # {operation: deque of seconds}
+
+    def record(self, operation, seconds):
+        with self._lock:
+            samples = self._samples.get(operation)
+            if samples is None:
+                samples = self._samples[operation] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, operation, pct):
+        """Return the pct-th percentile for an operation, or None if too few samples."""
+        with self._lock:
+            samples = self._samples.get(operation)
+            if not samples or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class RateLimiter:
+    """Token bucket limiting calls to `rate` per second, with bursts up to `burst`.
+
+    acquire() blocks until a token is available, so callers are paced
+    rather than failed.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst if burst is not None else rate))
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available. Returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+def backoff_delay(attempt, base=0.5, cap=8.0):
+    """Exponential backoff with full jitter for the given retry attempt (0-based)."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
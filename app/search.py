@@ -0,0 +1,171 @@
+import bisect
+import re
+import threading
+
+SEARCH_FIELDS = ('subject', 'requester_name', 'client_name', 'agent_name', 'id')
+SECTIONS = ('s1', 's2', 's3', 's4')
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """Lowercased word tokens of a string ('#1234' -> ['1234'])."""
+    return _TOKEN_RE.findall(str(text).casefold()) if text else []
+
+
+class TicketSearchIndex:
+    """Inverted index over active tickets, kept in step with the ticket snapshot.
+
+    Terms map to the keys of the tickets containing them, and a sorted term
+    list makes a prefix a bisect range, so a query touches only the
+    postings it matches. sync() re-tokenizes only tickets whose searchable
+    fields changed, and records which view sections each ticket is in.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.version = None
+        self._postings = {}  # {term: set(ticket_key)}
+        self._terms = []  # sorted terms
+        self._docs = {}  # {ticket_key: (field values, frozenset(terms))}
+        self._tickets = {}  # {ticket_key: ticket}
+        self._sections = {}  # {(view_slug, section): set(ticket_key)}
+        self._memberships = {}  # {ticket_key: {view_slug: section}}
+
+    def sync(self, tickets, view_sections, version):
+        """Update the index from the sectioned tickets of every view.
+
+        Args:
+            tickets: {ticket_key: ticket} for tickets in any view (unfiltered by agent).
+            view_sections: {view_slug: (s1_keys, s2_keys, s3_keys, s4_keys)}
+            version: Ticket snapshot version the tickets were sectioned from.
+        """
+        sections = {}
+        memberships = {}
+        for slug, view_keys in view_sections.items():
+            for section, keys in zip(SECTIONS, view_keys):
+                sections[(slug, section)] = set(keys)
+                for key in keys:
+                    memberships.setdefault(key, {})[slug] = section
+
+        with self._lock:
+            added_terms = []
+            removed_terms = []
+            for key, ticket in tickets.items():
+                values = tuple(ticket.get(field) for field in SEARCH_FIELDS)
+                doc = self._docs.get(key)
+                if doc is not None and doc[0] == values:
+                    continue
+                terms = frozenset(term for value in values for term in tokenize(value))
+                old_terms = doc[1] if doc is not None else frozenset()
+                for term in old_terms - terms:
+                    self._unpost(term, key, removed_terms)
+                for term in terms - old_terms:
+                    self._post(term, key, added_terms)
+                self._docs[key] = (values, terms)
+
+            for key in [key for key in self._docs if key not in tickets]:
+                for term in self._docs.pop(key)[1]:
+                    self._unpost(term, key, removed_terms)
+
+            self._update_terms(added_terms, removed_terms)
+            self._tickets = tickets
+            self._sections = sections
+            self._memberships = memberships
+            self.version = version
+
+    def _post(self, term, key, added_terms):
+        keys = self._postings.get(term)
+        if keys is None:
+            keys = self._postings[term] = set()
+            added_terms.append(term)
+        keys.add(key)
+
+    def _unpost(self, term, key, removed_terms):
+        keys = self._postings.get(term)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self._postings[term]
+            removed_terms.append(term)
+
+    def _update_terms(self, added_terms, removed_terms):
+        """Keep the sorted term list current: insort small changes, re-sort large ones."""
+        if len(added_terms) + len(removed_terms) > 256:
+            self._terms = sorted(self._postings)
+            return
+        terms = self._terms
+        for term in removed_terms:
+            if term in self._postings:
+                continue  # removed and re-added in the same sync
+            index = bisect.bisect_left(terms, term)
+            if index < len(terms) and terms[index] == term:
+                del terms[index]
+        for term in added_terms:
+            index = bisect.bisect_left(terms, term)
+            if index == len(terms) or terms[index] != term:
+                terms.insert(index, term)
+
+    def _prefix_matches(self, prefix):
+        """Return (keys with a term starting with prefix, keys with the exact term)."""
+        terms = self._terms
+        start = bisect.bisect_left(terms, prefix)
+        end = bisect.bisect_left(terms, prefix + '\U0010ffff', start)
+        matched = set()
+        for term in terms[start:end]:
+            matched |= self._postings[term]
+        return matched, self._postings.get(prefix, set())
+
+    def search(self, query, view=None, section=None, limit=50):
+        """Find tickets matching every word of query (each as a prefix).
+
+        Args:
+            query: Free text, e.g. "acme vpn".
+            view: Only tickets in this view.
+            section: Only tickets in this section ('s1'..'s4'); with view, in
+                that view's section, otherwise in that section of any view.
+            limit: Maximum number of results.
+
+        Returns:
+            tuple: (total matches, [(ticket, {view_slug: section})]) with the
+            best matches first: more exact (non-prefix) word matches, then
+            higher priority, then most recently updated.
+        """
+        words = tokenize(query)
+        if not words:
+            return 0, []
+        with self._lock:
+            candidates = None
+            exact_hits = {}
+            # Rarest word first keeps the intersections small
+            for matched, exact in sorted((self._prefix_matches(word) for word in words), key=lambda m: len(m[0])):
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return 0, []
+                for key in exact & candidates:
+                    exact_hits[key] = exact_hits.get(key, 0) + 1
+
+            if view is not None or section is not None:
+                filtered = set()
+                for (slug, sec), keys in self._sections.items():
+                    if (view is None or slug == view) and (section is None or sec == section):
+                        filtered |= candidates & keys
+                candidates = filtered
+
+            tickets = self._tickets
+            # Stable sorts: newest first, then by exact word matches and priority
+            ranked = sorted(candidates, key=lambda key: tickets[key].get('updated_at_str') or '', reverse=True)
+            ranked.sort(key=lambda key: (-exact_hits.get(key, 0), -(tickets[key].get('priority_raw') or 0)))
+            return len(candidates), [
+                (tickets[key], dict(self._memberships.get(key, {}))) for key in ranked[:limit]
+            ]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'version': self.version,
+                'tickets': len(self._docs),
+                'terms': len(self._terms),
+            }
+
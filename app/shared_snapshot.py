@@ -0,0 +1,581 @@
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+from app import tracing
+from app.history import QueueHistory, section_counts
+from app.superops_client import EMPTY_MONTHLY_AVERAGES, count_closed_tickets, _epoch_to_iso
+from app.ticket_mapper import SECTIONING_FIELDS, earliest_change, partition_by_views, section_views, ticket_key
+
+logger = logging.getLogger(__name__)
+
+POLLER_LEASE = 'poller'
+
+# Webhook events kept for the poller to replay over its next fetch; older
+# ones are dropped if no poller is running to clear them
+MAX_PENDING_EVENTS = 1000
+
+
+class SnapshotStore:
+    """Cross-process snapshot store backed by SQLite in WAL mode.
+
+    One elected poller process writes JSON payloads under string keys; every
+    worker reads them. WAL lets readers proceed while the poller writes, and
+    each reader keeps the decoded payload until the row's version changes, so
+    a request costs one indexed SELECT rather than a JSON decode.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._memo_lock = threading.Lock()
+        self._memo = {}  # {key: (version, updated_at, value)}
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS snapshot ('
+            'key TEXT PRIMARY KEY, version INTEGER NOT NULL, '
+            'updated_at REAL NOT NULL, payload TEXT NOT NULL)'
+        )
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS lease ('
+            'name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+
+    def _conn(self):
+        """Return this thread's connection (sqlite3 connections are per-thread)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def write(self, entries):
+        """Atomically replace several keys.
+
+        Args:
+            entries: {key: JSON-serializable value}
+        """
+        now = time.time()
+        rows = [(key, now, json.dumps(value, separators=(',', ':'))) for key, value in entries.items()]
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._upsert(conn, rows)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def update(self, keys, fn, touch=False):
+        """Atomically read several keys, let fn patch them, and write the result.
+
+        Patched keys keep their updated_at, so a patch doesn't make the
+        snapshot look freshly polled.
+
+        Args:
+            keys: Keys to read.
+            fn: Called with {key: value or None}; returns {key: new value}
+                to write, or None to write nothing.
+            touch: If True, written keys get a new updated_at (for
+                publishing a poll).
+
+        Returns:
+            bool: True if anything was written.
+        """
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            current = {}
+            updated_at = {}
+            for key in keys:
+                row = conn.execute('SELECT updated_at, payload FROM snapshot WHERE key = ?', (key,)).fetchone()
+                current[key] = json.loads(row[1]) if row else None
+                updated_at[key] = row[0] if row else time.time()
+            entries = fn(current)
+            if entries:
+                now = time.time()
+                self._upsert(conn, [
+                    (key, now if touch else updated_at.get(key) or now, json.dumps(value, separators=(',', ':')))
+                    for key, value in entries.items()
+                ])
+            conn.execute('COMMIT')
+            return bool(entries)
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    @staticmethod
+    def _upsert(conn, rows):
+        conn.executemany(
+            'INSERT INTO snapshot (key, version, updated_at, payload) VALUES (?, 1, ?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET version = version + 1, '
+            'updated_at = excluded.updated_at, payload = excluded.payload',
+            rows,
+        )
+
+    def read(self, key, default=None):
+        """Read a key, reusing the decoded value while its version is unchanged.
+
+        Returns:
+            tuple: (value, updated_at) or (default, None) if the key is missing.
+        """
+        conn = self._conn()
+        row = conn.execute('SELECT version, updated_at FROM snapshot WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return default, None
+        version, updated_at = row
+        with self._memo_lock:
+            memo = self._memo.get(key)
+        if memo and memo[0] == version:
+            return memo[2], memo[1]
+
+        row = conn.execute('SELECT version, updated_at, payload FROM snapshot WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return default, None
+        version, updated_at, payload = row
+        value = json.loads(payload)
+        with self._memo_lock:
+            self._memo[key] = (version, updated_at, value)
+        return value, updated_at
+
+    def read_many(self, keys):
+        """Read several keys from one consistent snapshot of the store.
+
+        Returns:
+            dict: {key: (value, version)}, (None, 0) for missing keys.
+        """
+        conn = self._conn()
+        conn.execute('BEGIN')
+        try:
+            values = {}
+            for key in keys:
+                row = conn.execute('SELECT version, updated_at FROM snapshot WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    values[key] = (None, 0)
+                    continue
+                version, updated_at = row
+                with self._memo_lock:
+                    memo = self._memo.get(key)
+                if not memo or memo[0] != version:
+                    payload = conn.execute('SELECT payload FROM snapshot WHERE key = ?', (key,)).fetchone()[0]
+                    memo = (version, updated_at, json.loads(payload))
+                    with self._memo_lock:
+                        self._memo[key] = memo
+                values[key] = (memo[2], version)
+            return values
+        finally:
+            conn.execute('COMMIT')
+
+    def version(self, key):
+        """Return the current version of a key (0 if missing)."""
+        row = self._conn().execute('SELECT version FROM snapshot WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else 0
+
+    def try_acquire_lease(self, name, owner, ttl_seconds):
+        """Acquire or renew a named lease. Returns True if `owner` holds it."""
+        now = time.time()
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT owner, expires_at FROM lease WHERE name = ?', (name,)).fetchone()
+            if row is None or row[0] == owner or row[1] < now:
+                conn.execute(
+                    'INSERT OR REPLACE INTO lease (name, owner, expires_at) VALUES (?, ?, ?)',
+                    (name, owner, now + ttl_seconds),
+                )
+                conn.execute('COMMIT')
+                return True
+            conn.execute('COMMIT')
+            return False
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+
+class SnapshotPoller:
+    """Background thread that, when elected, polls SuperOps and writes the store.
+
+    Every worker runs one; a SQLite lease makes sure only one of them talks to
+    SuperOps at a time. If the leader dies its lease expires and another
+    worker takes over on its next tick.
+
+    Webhook events that land while the leader is fetching are replayed onto
+    its results when they are published, so a poll never undoes a patch. If
+    the ticket fetch fails, only the upstream status is published, so the
+    snapshot keeps its age and workers can see it going stale.
+
+    Tickets are also sectioned once per poll: the leader publishes every
+    view's section keys and each ticket's computed SLA fields, which workers
+    use until a ticket's SLA state next changes (or a webhook patches the
+    snapshot).
+
+    The leader also owns the queue history: it records a sample after every
+    poll, publishes the history with the snapshot and is the only process
+    that writes history.persist_path. A new leader first adopts the
+    published history, so samples recorded by the previous one are kept.
+    """
+
+    def __init__(self, store, client, config, interval_seconds, section_router, history=None):
+        self.store = store
+        self.client = client
+        self.config = config
+        self.section_router = section_router
+        self.history = history
+        self.interval = interval_seconds
+        self.lease_ttl = interval_seconds * 3
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.leading = False
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start the polling thread in this process (safe after fork)."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            self.owner = f"{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:8]}"
+            threading.Thread(target=self._run, name='snapshot-poller', daemon=True).start()
+
+    def _run(self):
+        while True:
+            started = time.time()
+            try:
+                if self.store.try_acquire_lease(POLLER_LEASE, self.owner, self.lease_ttl):
+                    if not self.leading:
+                        self.leading = True
+                        self._adopt_history()
+                    self.poll_once()
+                else:
+                    self.leading = False
+            except Exception as e:
+                logger.error(f"Shared snapshot poll failed: {e}")
+            time.sleep(max(1, self.interval - (time.time() - started)))
+
+    def _adopt_history(self):
+        """Continue from the history published by the previous leader, if any."""
+        if self.history is None:
+            return
+        data, _ = self.store.read('history')
+        if data is None:
+            return
+        try:
+            self.history.load_dump(data)
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Shared snapshot: ignoring unreadable published history: {e}")
+
+    def _section(self, tickets):
+        """Section the tickets being published for every view.
+
+        Returns:
+            tuple: (tickets_by_key, view_sections, published sections payload)
+        """
+        views = self.config.get('views', {})
+        matched, memberships = partition_by_views(tickets, views)
+        tickets_by_key, view_sections = section_views(
+            matched, memberships, views, self.config, router=self.section_router,
+        )
+        payload = {
+            'valid_until': earliest_change(tickets_by_key.values()),
+            'views': view_sections,
+            'fields': {
+                key: {field: ticket.get(field) for field in SECTIONING_FIELDS}
+                for key, ticket in tickets_by_key.items()
+            },
+        }
+        return tickets_by_key, view_sections, payload
+
+    def _record_history(self, tickets_by_key, view_sections):
+        """Record one history sample per view from the sectioned tickets."""
+        now = time.time()
+        for slug, sections in view_sections.items():
+            self.history.record(slug, section_counts(sections, tickets_by_key), now)
+
+    def save_history(self):
+        """Persist the history if this process is the leader (for atexit)."""
+        if self.history is not None and self.leading:
+            self.history.save()
+
+    @tracing.traced('shared_snapshot.poll')
+    def poll_once(self):
+        """Fetch everything the dashboard needs once and publish it."""
+        client = self.client
+        pending, _ = self.store.read('events')
+        start_seq = pending['seq'] if pending else 0
+        version = client.snapshot_version()
+        tickets = client.fetch_tickets(force=True)
+        if client.snapshot_version() == version:
+            # The fetch failed and returned the last good snapshot (or none):
+            # keep the published snapshot and its age, and report the outage
+            self.store.write({'upstream': client.upstream_status()})
+            logger.warning("Shared snapshot: ticket fetch failed; keeping the published snapshot")
+            return
+
+        # Reply detection over the whole snapshot so workers never call SuperOps
+        reply_ids, _ = client.check_requester_replies(
+            tickets, self.section_router.reply_skip_statuses, budget_seconds=0,
+        )
+        published = []
+        for ticket in tickets:
+            ticket = dict(ticket)
+            ticket['has_requester_reply'] = ticket.get('ticket_id') in reply_ids
+            published.append(ticket)
+
+        tickets_by_key, view_sections, sections = self._section(published)
+        entries = {
+            'tickets': published,
+            'sections': sections,
+        }
+
+        if self.config.get('agents', {}).get('auto_fetch', True):
+            entries['technicians'] = client.fetch_technicians()
+        # After the technician fetch, so its stale_parts are current
+        entries['upstream'] = client.upstream_status()
+
+        try:
+            closed_tickets = client._fetch_closed_tickets_recent()
+            entries['closed_ledger'] = closed_tickets
+            entries['closed_counts'] = {
+                slug: count_closed_tickets(closed_tickets, client.timezone, view_config)
+                for slug, view_config in self.config.get('views', {}).items()
+            }
+        except Exception as e:
+            logger.warning(f"Shared snapshot: failed to fetch closed tickets: {e}")
+
+        avg_group_ids = self.config.get('monthly_averages', {}).get('tech_group_ids', [])
+        entries['monthly_averages'] = client.fetch_monthly_averages(
+            view_slug='shared', tech_group_ids=avg_group_ids, force=True,
+        )
+
+        if self.history is not None:
+            self._record_history(tickets_by_key, view_sections)
+            entries['history'] = self.history.dump()
+
+        def _publish(current):
+            pending = current['events'] or {'seq': 0, 'events': []}
+            state = {'tickets': entries['tickets'], 'closed_ledger': entries.get('closed_ledger', current['closed_ledger'])}
+            for item in pending['events']:
+                if item['seq'] > start_seq:
+                    patch = apply_event(client, self.config.get('views', {}), state, item['event'], item['ticket'])
+                    state.update(patch)
+                    entries.update(patch)
+            entries['events'] = {'seq': pending['seq'], 'events': []}
+            return entries
+
+        self.store.update(('events', 'closed_ledger'), _publish, touch=True)
+        logger.info(f"Published shared snapshot: {len(published)} tickets")
+
+
+class SharedSnapshotReader:
+    """Read-only stand-in for SuperOpsClient that serves from the shared store.
+
+    Implements the subset of the SuperOpsClient interface the routes use, so
+    `_get_tickets_for_view` works unchanged in every worker.
+    """
+
+    def __init__(self, store, timezone, interval_seconds, client=None, config=None):
+        self.store = store
+        self.timezone = timezone
+        self.stale_after = interval_seconds * 3
+        self.client = client  # for normalizing webhook events
+        self.views = (config or {}).get('views', {})
+        self._history = (None, None)  # (store version, QueueHistory)
+        self._sections = (None, None)  # ((tickets version, sections version), (tickets_by_key, view_sections, valid_until))
+
+    def fetch_tickets(self, force=False):
+        tickets, _ = self.store.read('tickets', [])
+        return tickets
+
+    def snapshot_version(self):
+        return self.store.version('tickets')
+
+    def snapshot_age(self):
+        _, updated_at = self.store.read('tickets')
+        return None if updated_at is None else time.time() - updated_at
+
+    def sections(self):
+        """Sections published with the current ticket snapshot.
+
+        Built once per published snapshot; each ticket is the published
+        ticket plus its computed SLA fields.
+
+        Returns:
+            tuple: (tickets_by_key, {view_slug: (s1_keys, s2_keys, s3_keys, s4_keys)}),
+            or None if there are no sections for the current tickets (a
+            webhook patched them since the last poll) or a ticket's SLA state
+            has changed since they were computed.
+        """
+        rows = self.store.read_many(('tickets', 'sections'))
+        tickets, tickets_version = rows['tickets']
+        sections, sections_version = rows['sections']
+        if tickets is None or sections is None:
+            return None
+        versions = (tickets_version, sections_version)
+        cached_versions, built = self._sections
+        if cached_versions != versions:
+            fields = sections['fields']
+            tickets_by_key = {}
+            for ticket in tickets:
+                key = ticket_key(ticket)
+                if key in fields:
+                    tickets_by_key[key] = dict(ticket, reply_pending=False, **fields[key])
+            built = None
+            # Keys only survive the JSON round trip if they are strings
+            if len(tickets_by_key) == len(fields):
+                view_sections = {slug: tuple(view_keys) for slug, view_keys in sections['views'].items()}
+                built = (tickets_by_key, view_sections, sections['valid_until'])
+            self._sections = (versions, built)
+        if built is None:
+            return None
+        tickets_by_key, view_sections, valid_until = built
+        if valid_until is not None and time.time() >= valid_until:
+            return None
+        return tickets_by_key, view_sections
+
+    def check_requester_replies(self, tickets, s2_statuses, budget_seconds=None):
+        # The poller resolves every lookup before publishing, so nothing is pending
+        return set(t.get('ticket_id') for t in tickets if t.get('has_requester_reply')), set()
+
+    def fetch_technicians(self, force=False):
+        technicians, _ = self.store.read('technicians', {})
+        return technicians
+
+    def fetch_closed_counts(self, view_slug='', view_config=None, agent_id=None, force=False):
+        if not agent_id:
+            counts, _ = self.store.read('closed_counts', {})
+            if view_slug in counts:
+                return counts[view_slug]
+        closed_tickets, updated_at = self.store.read('closed_ledger')
+        if updated_at is None:
+            return {'today': None, 'this_week': None, 'stale': True}
+        return count_closed_tickets(closed_tickets, self.timezone, view_config, agent_id)
+
+    def iter_closed_tickets(self, since=None):
+        closed_tickets, _ = self.store.read('closed_ledger', [])
+        return iter(closed_tickets)
+
+    def fetch_monthly_averages(self, view_slug='', tech_group_ids=None, force=False):
+        averages, _ = self.store.read('monthly_averages')
+        return averages or dict(EMPTY_MONTHLY_AVERAGES, stale=True)
+
+    def upstream_status(self):
+        """Leader's upstream status, marked stale if the snapshot stopped updating."""
+        status, _ = self.store.read('upstream')
+        status = dict(status or {'state': 'unknown', 'stale': False, 'stale_since_iso': None, 'retry_in_seconds': None})
+        _, updated_at = self.store.read('tickets')
+        if updated_at is not None and (time.time() - updated_at) > self.stale_after and not status.get('stale'):
+            status['stale'] = True
+            status['stale_since_iso'] = _epoch_to_iso(updated_at)
+        return status
+
+    def stale_parts(self):
+        """Results the leader served from fallbacks, plus 'tickets' if the snapshot stopped updating."""
+        status = self.upstream_status()
+        parts = list(status.get('stale_parts') or [])
+        if status['stale'] and 'tickets' not in parts:
+            parts.append('tickets')
+        return parts
+
+    def apply_ticket_event(self, event, ticket):
+        """Apply a webhook ticket event to the shared snapshot (any worker may receive it).
+
+        A closed ticket is also added to the closed-ticket ledger, and the
+        per-view closed counts are recomputed from it. The event is also
+        queued for the poller, which replays it if its fetch was already
+        running.
+        """
+        def _apply(current):
+            pending = current['events'] or {'seq': 0, 'events': []}
+            seq = pending['seq'] + 1
+            queued = pending['events'][-(MAX_PENDING_EVENTS - 1):] + [{'seq': seq, 'event': event, 'ticket': ticket}]
+            entries = {'events': {'seq': seq, 'events': queued}}
+            if current['tickets'] is not None:
+                entries.update(apply_event(self.client, self.views, current, event, ticket))
+            return entries
+
+        return self.store.update(('tickets', 'closed_ledger', 'events'), _apply)
+
+    def history(self):
+        """Queue history published by the elected poller, or None before its first poll."""
+        version = self.store.version('history')
+        if not version:
+            return None
+        cached_version, history = self._history
+        if cached_version != version:
+            data, _ = self.store.read('history')
+            history = QueueHistory()
+            history.load_dump(data)
+            self._history = (version, history)
+        return history
+
+    def cache_stats(self):
+        return {}
+
+    def invalidate_cache(self):
+        pass
+
+
+def apply_event(client, views, current, event, ticket):
+    """Return the store entries a webhook event changes.
+
+    Args:
+        client: SuperOpsClient, for normalizing the event's ticket.
+        views: Views config, for recomputing closed counts.
+        current: {'tickets': list, 'closed_ledger': list or None}
+        event: One of the webhooks.EVENT_* names.
+        ticket: Raw SuperOps ticket fields; updates may be partial.
+    """
+    updated, closed = client.apply_event_to_snapshot(current['tickets'], event, ticket)
+    if updated is current['tickets']:
+        return {}
+    # Published sections no longer match; workers section locally until the next poll
+    entries = {'tickets': updated, 'sections': None}
+    if closed and event != 'deleted' and current['closed_ledger'] is not None:
+        closed_ticket = client._normalize_closed_ticket(ticket)
+        if not closed_ticket['updated_at_str']:
+            closed_ticket['updated_at_str'] = _epoch_to_iso(time.time())
+        ledger = [t for t in current['closed_ledger'] if t.get('ticket_id') != closed_ticket['ticket_id']]
+        ledger.append(closed_ticket)
+        entries['closed_ledger'] = ledger
+        entries['closed_counts'] = {
+            slug: count_closed_tickets(ledger, client.timezone, view_config)
+            for slug, view_config in views.items()
+        }
+    return entries
+
+
+def init_shared_snapshot(config, client, section_router, history=None):
+    """Set up shared-snapshot mode if enabled in config.
+
+    Args:
+        config: Parsed config dict.
+        client: The real SuperOpsClient used by the elected poller.
+        section_router: Compiled SectionRouter (for reply detection and sectioning).
+        history: QueueHistory the elected poller records into, or None.
+
+    Returns:
+        tuple: (reader, poller) or (None, None) if shared mode is disabled.
+    """
+    shared_cfg = config.get('shared_snapshot', {})
+    if not shared_cfg.get('enabled', False):
+        return None, None
+
+    path = shared_cfg.get('path', 'beacon-snapshot.db')
+    # The client's ticket TTL is the reconciliation interval when webhooks are enabled
+    interval = shared_cfg.get('poll_interval_seconds', client.ticket_cache_ttl)
+    store = SnapshotStore(path)
+    poller = SnapshotPoller(store, client, config, interval, section_router, history=history)
+    reader = SharedSnapshotReader(store, client.timezone, interval, client=client, config=config)
+    logger.info(f"Shared snapshot mode enabled (store={path}, poll every {interval}s)")
+    return reader, poller
@@ -0,0 +1,146 @@
+/**
+ * TheBeacon Activity Governor
+ * Runs animation loops and particle spawners from one requestAnimationFrame
+ * loop with a per-frame time budget, and pauses all of them while the tab is
+ * hidden or the screen is dimmed, so an idle kiosk stays near idle.
+ */
+(function() {
+    'use strict';
+
+    // Work allowed per frame before remaining tasks wait for the next frame
+    var FRAME_BUDGET_MS = 8;
+    // Sleep with setTimeout instead of spinning frames when nothing is due soon
+    var IDLE_SLEEP_MS = 50;
+
+    var tasks = [];          // governed intervals: { fn, interval, last, cancelled }
+    var parkedFrames = [];   // requestFrame callbacks waiting for activity to resume
+    var listeners = [];
+    var dimmed = false;
+    var frameId = null;
+    var sleepId = null;
+    var cursor = 0;
+
+    function isActive() {
+        return !document.hidden && !dimmed;
+    }
+
+    function wake() {
+        if (frameId !== null || !tasks.length || !isActive()) return;
+        if (sleepId !== null) {
+            clearTimeout(sleepId);
+            sleepId = null;
+        }
+        frameId = requestAnimationFrame(runFrame);
+    }
+
+    function runFrame() {
+        frameId = null;
+        if (!isActive() || !tasks.length) return;
+
+        var start = performance.now();
+        var snapshot = tasks.slice();
+        var count = snapshot.length;
+        var ran = 0;
+        // Round-robin from where the last over-budget frame stopped
+        for (; ran < count; ran++) {
+            var task = snapshot[(cursor + ran) % count];
+            if (task.cancelled) continue;
+            var now = performance.now();
+            if (now - task.last < task.interval) continue;
+            // After a pause, resume the cadence instead of catching up
+            task.last = now - task.last > task.interval * 2 ? now : task.last + task.interval;
+            try {
+                task.fn();
+            } catch (e) {
+                console.error('Animation task failed:', e);
+            }
+            if (performance.now() - start > FRAME_BUDGET_MS) {
+                ran++;
+                break;
+            }
+        }
+        cursor = count ? (cursor + ran) % count : 0;
+
+        var nextDue = Infinity;
+        var frameNow = performance.now();
+        for (var i = 0; i < tasks.length; i++) {
+            nextDue = Math.min(nextDue, tasks[i].last + tasks[i].interval - frameNow);
+        }
+        if (!tasks.length) return;
+        if (nextDue > IDLE_SLEEP_MS) {
+            sleepId = setTimeout(function() {
+                sleepId = null;
+                wake();
+            }, nextDue - IDLE_SLEEP_MS / 2);
+        } else {
+            frameId = requestAnimationFrame(runFrame);
+        }
+    }
+
+    function notify() {
+        var active = isActive();
+        document.documentElement.classList.toggle('activity-paused', !active);
+        if (active) {
+            var frames = parkedFrames;
+            parkedFrames = [];
+            frames.forEach(function(cb) { requestAnimationFrame(cb); });
+            wake();
+        }
+        listeners.forEach(function(fn) {
+            try {
+                fn(active);
+            } catch (e) {
+                console.error('Activity listener failed:', e);
+            }
+        });
+    }
+
+    document.addEventListener('visibilitychange', notify);
+
+    window.BeaconActivity = {
+        isActive: isActive,
+
+        isDimmed: function() {
+            return dimmed;
+        },
+
+        // Called by auto-dim when the screen dims or wakes
+        setDimmed: function(on) {
+            on = !!on;
+            if (on === dimmed) return;
+            dimmed = on;
+            notify();
+        },
+
+        // fn(active) runs whenever the tab is hidden/shown or dimmed/undimmed
+        onChange: function(fn) {
+            listeners.push(fn);
+        },
+
+        // Governed replacement for setInterval: runs fn every intervalMs on
+        // an animation frame, only while active. Returns a handle for cancel().
+        every: function(fn, intervalMs) {
+            var task = { fn: fn, interval: intervalMs, last: performance.now(), cancelled: false };
+            tasks.push(task);
+            wake();
+            return task;
+        },
+
+        cancel: function(task) {
+            if (!task || task.cancelled) return;
+            task.cancelled = true;
+            var index = tasks.indexOf(task);
+            if (index !== -1) tasks.splice(index, 1);
+        },
+
+        // Governed replacement for requestAnimationFrame: while inactive the
+        // callback waits until activity resumes instead of running
+        requestFrame: function(cb) {
+            if (isActive()) {
+                requestAnimationFrame(cb);
+            } else {
+                parkedFrames.push(cb);
+            }
+        },
+    };
+})();
@@ -0,0 +1,87 @@
+/**
+ * TheBeacon Effect Loader
+ * Easter-egg themes, timed events and other rarely used effects live in
+ * static/js/effects/ and are fetched the first time they are needed, so the
+ * page only parses the dashboard code up front.
+ */
+(function() {
+    'use strict';
+
+    // Resolve effects/ next to this script, keeping its ?v= cache buster
+    var src = document.currentScript ? document.currentScript.src : '';
+    var baseUrl = src.replace(/effects\.js(\?.*)?$/, 'effects/');
+    var query = (src.match(/\?.*$/) || [''])[0];
+
+    var modules = {};   // name → exports, once defined
+    var pending = {};   // name → Promise of exports
+    var wanted = {};    // "name.fn" → last requested on/off state
+
+    function load(name) {
+        if (modules[name]) return Promise.resolve(modules[name]);
+        if (!pending[name]) {
+            pending[name] = new Promise(function(resolve, reject) {
+                var script = document.createElement('script');
+                script.src = baseUrl + name + '.js' + query;
+                script.async = true;
+                script.onload = function() {
+                    if (modules[name]) {
+                        resolve(modules[name]);
+                    } else {
+                        reject(new Error('Effect module did not define itself: ' + name));
+                    }
+                };
+                script.onerror = function() {
+                    delete pending[name];
+                    reject(new Error('Failed to load effect module: ' + name));
+                };
+                document.head.appendChild(script);
+            });
+        }
+        return pending[name];
+    }
+
+    window.BeaconEffects = {
+        // Theme Konami handler set by the active theme module (null = default pool)
+        konami: null,
+
+        // Called by each module file to register its exports
+        define: function(name, exports) {
+            modules[name] = exports;
+        },
+
+        load: load,
+
+        // Exports of a module if it has already loaded, else null
+        loaded: function(name) {
+            return modules[name] || null;
+        },
+
+        // Load a module and call one of its functions
+        call: function(name, fn) {
+            var args = Array.prototype.slice.call(arguments, 2);
+            return load(name).then(function(mod) {
+                return mod[fn].apply(null, args);
+            }).catch(function(e) {
+                console.error(e);
+            });
+        },
+
+        // For effects toggled on and off (themes, queue moods): turning on
+        // loads the module; turning off only touches an already loaded one.
+        // A late load is skipped if the effect was turned off meanwhile.
+        toggle: function(name, fn, active) {
+            var args = Array.prototype.slice.call(arguments, 3);
+            var key = name + '.' + fn;
+            wanted[key] = active;
+            if (!active) {
+                if (modules[name]) modules[name][fn].apply(null, [false].concat(args));
+                return;
+            }
+            load(name).then(function(mod) {
+                if (wanted[key]) mod[fn].apply(null, [true].concat(args));
+            }).catch(function(e) {
+                console.error(e);
+            });
+        },
+    };
+})();
@@ -0,0 +1,988 @@
+/**
+ * TheBeacon effect: bee theme (flying bees, flowers, swarms and their easter eggs).
+ * Loaded on demand by BeaconEffects (static/js/effects.js).
+ */
+(function() {
+    'use strict';
+
+    function playBeeSwarmBuzz() {
+        var audio = new Audio('/static/audio/bee-swarm.mp3');
+        var playCount = 0;
+        audio.addEventListener('ended', function() {
+            playCount++;
+            if (playCount < 3) {
+                audio.currentTime = 0;
+                audio.play().catch(function() {});
+            }
+        });
+        audio.play().catch(function() {});
+    }
+
+    // --- Bee Easter Egg (the full experience) ---
+    var beeTimers = [];
+    var beeMoveHandler = null;
+    var beeResizeHandler = null;
+
+    function handleBeeAnimation(active) {
+        var container = document.getElementById('bee-container');
+        if (!container) return;
+
+        if (!active) {
+            beeTimers.forEach(function(entry) {
+                if (typeof entry === 'function') { entry(); }
+                else { clearInterval(entry); clearTimeout(entry); }
+            });
+            beeTimers = [];
+            if (beeMoveHandler) {
+                document.removeEventListener('mousemove', beeMoveHandler);
+                beeMoveHandler = null;
+            }
+            if (beeResizeHandler) {
+                window.removeEventListener('resize', beeResizeHandler);
+                beeResizeHandler = null;
+            }
+            // Remove leftover easter egg elements
+            document.querySelectorAll('.bee-bear, .bee-landing, .honey-drip, .bee-procession, .bee-row-highlight').forEach(function(el) {
+                if (el.classList.contains('bee-row-highlight')) {
+                    el.classList.remove('bee-row-highlight');
+                } else {
+                    el.remove();
+                }
+            });
+            container.innerHTML = '';
+            return;
+        }
+
+        var W = window.innerWidth;
+        var H = window.innerHeight;
+        beeResizeHandler = function() { W = window.innerWidth; H = window.innerHeight; };
+        window.addEventListener('resize', beeResizeHandler);
+
+        // ========================
+        //  UTILITY
+        // ========================
+        function rand(min, max) { return min + Math.random() * (max - min); }
+        function randInt(min, max) { return Math.floor(rand(min, max + 1)); }
+        function pick(arr) { return arr[Math.floor(Math.random() * arr.length)]; }
+        function smoothstep(t) { return t * t * (3 - 2 * t); }
+        function clampY(y) { return Math.max(10, Math.min(H - 30, y)); }
+
+        // ========================
+        //  POLLEN PARTICLES
+        // ========================
+        function spawnPollen(x, y, rainbow) {
+            var dot = document.createElement('div');
+            dot.className = 'bee-pollen';
+            if (rainbow) dot.classList.add('bee-pollen--rainbow');
+            dot.style.left = x + 'px';
+            dot.style.top = y + 'px';
+            container.appendChild(dot);
+            // CSS animation handles fade + drift, remove after animation
+            setTimeout(function() { dot.remove(); }, 1200);
+        }
+
+        // ========================
+        //  FLOATING FLOWERS & HONEYCOMBS
+        // ========================
+        var flowerEmojis = ['\uD83C\uDF3B', '\uD83C\uDF3A', '\uD83C\uDF38', '\uD83C\uDF3C', '\uD83C\uDF37', '\uD83C\uDF39', '\uD83D\uDC90', '\uD83E\uDEBB', '\uD83E\uDEB7', '\uD83C\uDFF5\uFE0F', '\uD83D\uDCAE'];
+        // 🌻 🌺 🌸 🌼 🌷
+        var honeycombEmojis = ['\uD83C\uDF6F']; // 🍯
+        var activeFlowers = [];
+
+        function createFlower() {
+            if (activeFlowers.length >= 3) return; // Max on screen
+
+            var isHoneycomb = Math.random() < 0.35;
+            var flower = document.createElement('div');
+            flower.className = isHoneycomb ? 'bee-flower bee-flower--honeycomb' : 'bee-flower';
+            flower.textContent = isHoneycomb ? pick(honeycombEmojis) : pick(flowerEmojis);
+            var fx = rand(150, W - 100);
+            var fy = rand(100, H - 100);
+            flower.style.left = fx + 'px';
+            flower.style.top = fy + 'px';
+            flower.style.fontSize = rand(24, 40) + 'px';
+            container.appendChild(flower);
+
+            var flowerObj = { el: flower, x: fx, y: fy, fading: false };
+            activeFlowers.push(flowerObj);
+
+            // Flowers live for 60-120 seconds then fade away
+            var lifespan = rand(30000, 60000);
+            setTimeout(function() {
+                flowerObj.fading = true;
+                flower.classList.add('bee-flower--fading');
+                setTimeout(function() {
+                    flower.remove();
+                    var idx = activeFlowers.indexOf(flowerObj);
+                    if (idx > -1) activeFlowers.splice(idx, 1);
+                }, 1000);
+            }, lifespan);
+        }
+
+        // ========================
+        //  FLIGHT PATTERNS
+        // ========================
+        var patterns = {
+            // Gentle sine wave
+            wave: function(p, cfg) {
+                var x = cfg.startX + (cfg.endX - cfg.startX) * p;
+                var y = cfg.startY + Math.sin(p * Math.PI * cfg.waves) * cfg.amplitude;
+                var angle = Math.sin(p * Math.PI * cfg.waves * 2) * 12;
+                return { x: x, y: y, angle: angle };
+            },
+            // Loop-de-loops
+            loopy: function(p, cfg) {
+                var baseX = cfg.startX + (cfg.endX - cfg.startX) * p;
+                var baseY = cfg.startY + Math.sin(p * Math.PI * 2) * cfg.amplitude * 0.3;
+                var loopPhase = p * Math.PI * 2 * cfg.loops;
+                var r = cfg.loopRadius;
+                return {
+                    x: baseX + Math.sin(loopPhase) * r,
+                    y: baseY - Math.cos(loopPhase) * r + r,
+                    angle: Math.cos(loopPhase) * 35
+                };
+            },
+            // Zigzag
+            zigzag: function(p, cfg) {
+                var x = cfg.startX + (cfg.endX - cfg.startX) * p;
+                var segLen = 1 / cfg.zigs;
+                var seg = Math.floor(p / segLen);
+                var segP = (p % segLen) / segLen;
+                var yTarget = (seg % 2 === 0) ? cfg.startY - cfg.amplitude : cfg.startY + cfg.amplitude;
+                var yFrom = (seg % 2 === 0) ? cfg.startY + cfg.amplitude : cfg.startY - cfg.amplitude;
+                return { x: x, y: yFrom + (yTarget - yFrom) * segP, angle: (seg % 2 === 0) ? -25 : 25 };
+            },
+            // Hover then dart
+            hover: function(p, cfg) {
+                var phase = (p * cfg.darts) % 1;
+                var dartIdx = Math.floor(p * cfg.darts);
+                var spot = cfg.spots[Math.min(dartIdx, cfg.spots.length - 1)];
+                var nextSpot = cfg.spots[Math.min(dartIdx + 1, cfg.spots.length - 1)];
+                if (phase < 0.7) {
+                    var h = phase / 0.7;
+                    return {
+                        x: spot.x + Math.sin(h * Math.PI * 6) * 6,
+                        y: spot.y + Math.cos(h * Math.PI * 8) * 5,
+                        angle: Math.sin(h * Math.PI * 6) * 12
+                    };
+                } else {
+                    var d = smoothstep((phase - 0.7) / 0.3);
+                    return {
+                        x: spot.x + (nextSpot.x - spot.x) * d,
+                        y: spot.y + (nextSpot.y - spot.y) * d,
+                        angle: (nextSpot.x > spot.x) ? -18 : 18
+                    };
+                }
+            },
+            // Lazy spiral
+            spiral: function(p, cfg) {
+                var baseX = cfg.startX + (cfg.endX - cfg.startX) * p;
+                var phase = p * Math.PI * 2 * cfg.spirals;
+                var r = cfg.spiralRadius * (0.5 + Math.sin(p * Math.PI) * 0.5);
+                return {
+                    x: baseX + Math.cos(phase) * r,
+                    y: cfg.startY + Math.sin(phase) * r,
+                    angle: Math.cos(phase) * 25
+                };
+            },
+            // Waggle dance (figure-8) — bee communication!
+            waggle: function(p, cfg) {
+                var centerX = cfg.startX + (cfg.endX - cfg.startX) * p;
+                var t = p * Math.PI * 2 * cfg.waggleCount;
+                // Lemniscate of Bernoulli (figure-8)
+                var scale = cfg.waggleSize;
+                var denom = 1 + Math.sin(t) * Math.sin(t);
+                var lx = scale * Math.cos(t) / denom;
+                var ly = scale * Math.sin(t) * Math.cos(t) / denom;
+                return {
+                    x: centerX + lx,
+                    y: cfg.startY + ly,
+                    angle: Math.cos(t) * 30
+                };
+            },
+            // Drunken bumble — erratic, jerky movement
+            drunken: function(p, cfg) {
+                var x = cfg.startX + (cfg.endX - cfg.startX) * p;
+                var y = cfg.startY;
+                // Layer multiple sine waves at odd frequencies for chaos
+                for (var i = 0; i < cfg.freqs.length; i++) {
+                    y += Math.sin(p * Math.PI * cfg.freqs[i] + cfg.phases[i]) * cfg.amps[i];
+                }
+                var angle = Math.sin(p * Math.PI * 13) * 25 + Math.cos(p * Math.PI * 7) * 15;
+                return { x: x, y: y, angle: angle };
+            },
+            // Dive bomb — swoop down then back up
+            divebomb: function(p, cfg) {
+                var x = cfg.startX + (cfg.endX - cfg.startX) * p;
+                var y = cfg.startY;
+                // Dive at the dive point, recover after
+                var diveCenter = cfg.diveAt;
+                var diveWidth = 0.15;
+                var dist = Math.abs(p - diveCenter);
+                if (dist < diveWidth) {
+                    var diveP = 1 - dist / diveWidth;
+                    y += diveP * diveP * cfg.diveDepth;
+                }
+                // Gentle wave otherwise
+                y += Math.sin(p * Math.PI * 3) * 20;
+                var angle = (p > diveCenter - diveWidth && p < diveCenter) ? 35 :
+                            (p > diveCenter && p < diveCenter + diveWidth) ? -35 : Math.sin(p * 10) * 8;
+                return { x: x, y: y, angle: angle };
+            },
+            // Visit flowers — bee flies to each active flower then exits
+            pollinate: function(p, cfg) {
+                var numStops = cfg.flowerStops.length;
+                var segLen = 1 / (numStops + 1); // +1 for exit
+                var seg = Math.min(Math.floor(p / segLen), numStops);
+                var segP = (p - seg * segLen) / segLen;
+
+                var from, to;
+                if (seg === 0) {
+                    from = { x: cfg.startX, y: cfg.startY };
+                    to = cfg.flowerStops[0] || { x: cfg.endX, y: cfg.startY };
+                } else if (seg < numStops) {
+                    from = cfg.flowerStops[seg - 1];
+                    to = cfg.flowerStops[seg];
+                } else {
+                    from = cfg.flowerStops[numStops - 1] || { x: cfg.startX, y: cfg.startY };
+                    to = { x: cfg.endX, y: cfg.startY };
+                }
+
+                // Hover briefly at each stop (ease in/out)
+                var ease = smoothstep(segP);
+                var x = from.x + (to.x - from.x) * ease;
+                var y = from.y + (to.y - from.y) * ease;
+                // Arc upward between stops
+                var arc = Math.sin(segP * Math.PI) * -60;
+                y += arc;
+                var angle = Math.sin(segP * Math.PI * 4) * 10;
+                return { x: x, y: y, angle: angle };
+            }
+        };
+
+        var patternNames = ['wave', 'wave', 'loopy', 'zigzag', 'hover', 'spiral',
+                            'waggle', 'drunken', 'divebomb', 'pollinate'];
+
+        // ========================
+        //  CURSOR TRACKING (for flee behavior)
+        // ========================
+        var _beeCursorX = null;
+        var _beeCursorY = null;
+        var _beeFleeRadius = 120;
+        var _beeFleeForce = 8;
+
+        var lastPollenTrailTime = 0;
+
+        var isKiosk = document.documentElement.classList.contains('kiosk-mode');
+        if (!isKiosk) {
+            beeMoveHandler = function(e) {
+                _beeCursorX = e.clientX;
+                _beeCursorY = e.clientY;
+                // Pollen cursor trail
+                var now = Date.now();
+                if (now - lastPollenTrailTime > 100) {
+                    lastPollenTrailTime = now;
+                    spawnPollen(e.clientX + rand(-8, 8), e.clientY + rand(-5, 10));
+                }
+            };
+            document.addEventListener('mousemove', beeMoveHandler);
+        }
+
+        // ========================
+        //  BEE FACTORY
+        // ========================
+        // Rare visitor insects
+        var rareVisitors = [
+            { emoji: '\uD83E\uDD8B', cls: 'bee--butterfly' },  // 🦋
+            { emoji: '\uD83D\uDC1E', cls: 'bee--ladybug' },    // 🐞
+        ];
+
+        function createBee(opts) {
+            opts = opts || {};
+            // Cap concurrent bees to prevent DOM accumulation (bypass for konami swarm)
+            if (!opts.bypassCap && container.querySelectorAll('.bee').length >= 25) return;
+            var bee = document.createElement('div');
+            bee.className = 'bee bee--buzzing';
+            bee.textContent = '\uD83D\uDC1D';
+            bee.style.position = 'absolute';
+            bee.style.zIndex = '10000';
+
+            // 0.02% chance of rainbow bee (~2-3 per day)
+            var isRainbow = Math.random() < 0.0002;
+            // 0.04% chance of a rare visitor (butterfly or ladybug, ~5 per day)
+            var isVisitor = !isRainbow && Math.random() < 0.0004;
+
+            // Size variety: tiny worker, normal, or chonky queen
+            var sizeRoll = Math.random();
+            var size;
+            if (isVisitor) {
+                var visitor = pick(rareVisitors);
+                bee.textContent = visitor.emoji;
+                bee.classList.remove('bee--buzzing');
+                bee.classList.add(visitor.cls);
+                size = rand(22, 34);
+            } else if (isRainbow) {
+                size = rand(30, 38);  // slightly larger
+                bee.classList.remove('bee--buzzing');
+                bee.classList.add('bee--rainbow');
+            } else if (sizeRoll < 0.15) {
+                size = rand(14, 18);  // tiny baby bee
+                bee.classList.add('bee--tiny');
+            } else if (sizeRoll > 0.92) {
+                size = rand(36, 48);  // QUEEN
+                bee.classList.add('bee--queen');
+            } else {
+                size = rand(20, 32);  // normal worker
+            }
+            bee.style.fontSize = size + 'px';
+            container.appendChild(bee);
+
+            // Direction
+            var goingRight = opts.goingRight !== undefined ? opts.goingRight : (Math.random() > 0.4);
+            var margin = 60;
+            var startX = goingRight ? -margin : W + margin;
+            var endX = goingRight ? W + margin : -margin;
+            var startY = rand(50, H - 80);
+
+            // Pattern
+            var patName = opts.pattern || pick(patternNames);
+            var cfg = { startX: startX, endX: endX, startY: startY };
+
+            // Pattern-specific config
+            if (patName === 'wave') {
+                cfg.amplitude = rand(30, 100);
+                cfg.waves = rand(2, 6);
+            } else if (patName === 'loopy') {
+                cfg.amplitude = rand(40, 70);
+                cfg.loops = randInt(2, 4);
+                cfg.loopRadius = rand(25, 50);
+            } else if (patName === 'zigzag') {
+                cfg.amplitude = rand(40, 100);
+                cfg.zigs = randInt(4, 9);
+            } else if (patName === 'hover') {
+                cfg.darts = randInt(3, 6);
+                cfg.spots = [];
+                for (var s = 0; s <= cfg.darts; s++) {
+                    cfg.spots.push({ x: rand(margin, W - margin), y: rand(60, H - 80) });
+                }
+            } else if (patName === 'spiral') {
+                cfg.spirals = rand(2, 4);
+                cfg.spiralRadius = rand(30, 60);
+            } else if (patName === 'waggle') {
+                cfg.waggleCount = randInt(3, 6);
+                cfg.waggleSize = rand(50, 100);
+            } else if (patName === 'drunken') {
+                cfg.freqs = [rand(5, 9), rand(11, 17), rand(19, 27)];
+                cfg.phases = [rand(0, 6.28), rand(0, 6.28), rand(0, 6.28)];
+                cfg.amps = [rand(20, 50), rand(15, 35), rand(10, 20)];
+            } else if (patName === 'divebomb') {
+                cfg.diveAt = rand(0.3, 0.7);
+                cfg.diveDepth = rand(120, 250);
+            } else if (patName === 'pollinate') {
+                cfg.flowerStops = [];
+                // Visit up to 3 active flowers (skip fading ones)
+                var shuffled = activeFlowers.filter(function(f) { return !f.fading; }).sort(function() { return Math.random() - 0.5; });
+                for (var f = 0; f < Math.min(shuffled.length, 3); f++) {
+                    cfg.flowerStops.push({ x: shuffled[f].x, y: shuffled[f].y });
+                }
+                if (cfg.flowerStops.length === 0) {
+                    // No flowers? Just wave instead
+                    patName = 'wave';
+                    cfg.amplitude = rand(30, 80);
+                    cfg.waves = rand(2, 5);
+                }
+            }
+
+            var duration = rand(7000, 16000);
+            if (patName === 'hover') duration = rand(10000, 18000);
+            if (patName === 'pollinate') duration = rand(8000, 14000);
+            var startTime = Date.now();
+            var flipBase = goingRight ? 'scaleX(-1)' : 'scaleX(1)';
+            var pollenCounter = 0;
+            var lastPollenX = startX;
+            var lastPollenY = startY;
+
+            var staysOnScreen = (patName === 'hover' || patName === 'waggle' || patName === 'pollinate');
+
+            // For mid-screen patterns: when the pattern ends, fly off-screen
+            var exiting = false;
+            var exitStartTime = 0;
+            var exitStartX = 0;
+            var exitStartY = 0;
+            var exitGoingRight = Math.random() > 0.5;
+            var exitDuration = rand(2000, 3500);
+
+            function animateBee() {
+                var elapsed = Date.now() - startTime;
+                var p = Math.min(elapsed / duration, 1);
+                var x, y, angle, flip;
+
+                if (exiting) {
+                    // Exit phase: fly off the nearest edge in a gentle arc
+                    var exitElapsed = Date.now() - exitStartTime;
+                    var ep = Math.min(exitElapsed / exitDuration, 1);
+                    var ease = ep * ep; // accelerate out
+                    var exitTargetX = exitGoingRight ? W + 100 : -100;
+                    x = exitStartX + (exitTargetX - exitStartX) * ease;
+                    y = exitStartY + Math.sin(ep * Math.PI) * -40; // slight upward arc
+                    angle = (exitGoingRight ? -10 : 10) * ep;
+                    flip = exitGoingRight ? 'scaleX(-1)' : 'scaleX(1)';
+
+                    if (x < -100 || x > W + 100) {
+                        bee.remove();
+                        return;
+                    }
+                } else if (p >= 1 && staysOnScreen) {
+                    // Pattern finished — start exit phase
+                    exiting = true;
+                    exitStartTime = Date.now();
+                    exitStartX = parseFloat(bee.style.left) || W / 2;
+                    exitStartY = parseFloat(bee.style.top) || H / 2;
+                    // Fly toward whichever edge is closer
+                    exitGoingRight = exitStartX < W / 2 ? false : true;
+                    BeaconActivity.requestFrame(animateBee);
+                    return;
+                } else if (p >= 1) {
+                    // Cross-screen pattern done (safety fallback)
+                    bee.remove();
+                    return;
+                } else {
+                    // Normal pattern flight
+                    var pos = patterns[patName](p, cfg);
+                    y = clampY(pos.y);
+                    x = pos.x;
+                    angle = pos.angle || 0;
+
+                    // Cross-screen bees: remove when off-screen
+                    if (!staysOnScreen && p > 0.15 && (x < -80 || x > W + 80)) {
+                        bee.remove();
+                        return;
+                    }
+
+                    // Flip based on movement for mid-screen patterns
+                    flip = flipBase;
+                    if (staysOnScreen) {
+                        var dx = x - lastPollenX;
+                        if (Math.abs(dx) > 2) {
+                            flip = dx > 0 ? 'scaleX(-1)' : 'scaleX(1)';
+                        }
+                    }
+                }
+
+                // Cursor flee — repulsion within radius
+                if (_beeCursorX !== null && _beeCursorY !== null) {
+                    var cdx = x - _beeCursorX;
+                    var cdy = y - _beeCursorY;
+                    var cdist = Math.sqrt(cdx * cdx + cdy * cdy);
+                    if (cdist < _beeFleeRadius && cdist > 0) {
+                        var push = (_beeFleeRadius - cdist) / _beeFleeRadius * _beeFleeForce;
+                        x += (cdx / cdist) * push;
+                        y += (cdy / cdist) * push;
+                    }
+                }
+
+                bee.style.left = x + 'px';
+                bee.style.top = clampY(y) + 'px';
+                bee.style.transform = flip + ' rotate(' + (angle || 0) + 'deg)';
+
+                // Quick fade-in only (no fade-out — bees exit by leaving the screen)
+                var p2 = elapsed / duration;
+                if (p2 < 0.06) {
+                    bee.style.opacity = String((p2 / 0.06) * 0.9);
+                } else {
+                    bee.style.opacity = '0.9';
+                }
+
+                // Pollen trail — keep going until the bee is actually removed
+                pollenCounter++;
+                if (pollenCounter % 18 === 0) {
+                    var dist = Math.sqrt(Math.pow(x - lastPollenX, 2) + Math.pow(y - lastPollenY, 2));
+                    if (dist > 40 && x > -60 && x < W + 60) {
+                        spawnPollen(x + rand(-5, 5), y + rand(5, 15), isRainbow);
+                        lastPollenX = x;
+                        lastPollenY = y;
+                    }
+                }
+
+                BeaconActivity.requestFrame(animateBee);
+            }
+
+            BeaconActivity.requestFrame(animateBee);
+        }
+
+        // ========================
+        //  SWARM BURST
+        // ========================
+        function triggerSwarm() {
+            var count = randInt(5, 10);
+            var goingRight = Math.random() > 0.5;
+            for (var i = 0; i < count; i++) {
+                (function(delay) {
+                    var t = setTimeout(function() {
+                        createBee({ goingRight: goingRight, pattern: pick(['wave', 'drunken', 'zigzag']) });
+                    }, delay);
+                    beeTimers.push(t);
+                })(i * rand(80, 250));
+            }
+        }
+
+        // ========================
+        //  SCHEDULING
+        // ========================
+
+        // Regular bee spawning
+        var beeSpawnId = BeaconActivity.every(function() {
+            createBee();
+        }, rand(6000, 10000));
+        beeTimers.push(function() { BeaconActivity.cancel(beeSpawnId); });
+
+        // Flower spawning
+        var flowerSpawnId = BeaconActivity.every(function() {
+            createFlower();
+        }, rand(20000, 30000));
+        beeTimers.push(function() { BeaconActivity.cancel(flowerSpawnId); });
+
+        // Occasional swarm burst
+        var swarmId = BeaconActivity.every(function() {
+            if (Math.random() < 0.3) triggerSwarm();
+        }, 45000);
+        beeTimers.push(function() { BeaconActivity.cancel(swarmId); });
+
+        // Initial population
+        createBee();
+        setTimeout(function() { createFlower(); }, 1500);
+
+        // ========================
+        //  BEE EASTER EGGS
+        // ========================
+
+        // --- 5. Bear Peek ---
+        function maybeBearPeek() {
+            if (Math.random() > 0.005) return; // 0.5% chance each check (~2-3 per day)
+
+            var bear = document.createElement('div');
+            bear.className = 'bee-bear';
+            bear.textContent = '\uD83D\uDC3B'; // 🐻
+
+            var edges = ['left', 'right', 'bottom'];
+            var edge = edges[Math.floor(Math.random() * edges.length)];
+            bear.classList.add('bee-bear--' + edge);
+
+            // Random position along the chosen edge
+            if (edge === 'left' || edge === 'right') {
+                bear.style.top = (10 + Math.random() * 80) + '%';
+            } else {
+                bear.style.left = (10 + Math.random() * 80) + '%';
+            }
+
+            document.body.appendChild(bear);
+
+            // Slide in by shifting the position property (not transform, so sniff wobble works)
+            requestAnimationFrame(function() {
+                requestAnimationFrame(function() {
+                    if (edge === 'left') {
+                        bear.style.left = '-12px';
+                    } else if (edge === 'right') {
+                        bear.style.right = '-12px';
+                    } else {
+                        bear.style.bottom = '-12px';
+                    }
+                    bear.classList.add('bee-bear--sniff');
+                });
+            });
+
+            // Pause 2s then slide back out
+            var hideTimer = setTimeout(function() {
+                bear.classList.remove('bee-bear--sniff');
+                if (edge === 'left') {
+                    bear.style.left = '-60px';
+                } else if (edge === 'right') {
+                    bear.style.right = '-60px';
+                } else {
+                    bear.style.bottom = '-60px';
+                }
+                // Remove after transition
+                setTimeout(function() { bear.remove(); }, 1000);
+            }, 2800);
+            beeTimers.push(hideTimer);
+        }
+
+        // Check every 15-25s
+        var _bearPeekTimer = null;
+        function scheduleBearPeek() {
+            var delay = 15000 + Math.random() * 10000;
+            _bearPeekTimer = setTimeout(function() {
+                maybeBearPeek();
+                scheduleBearPeek();
+            }, delay);
+        }
+        scheduleBearPeek();
+        beeTimers.push(function() { clearTimeout(_bearPeekTimer); });
+
+        // --- 6. Bee Landing on Ticket Row ---
+        function doBeeLanding() {
+            var rows = document.querySelectorAll('tr');
+            if (rows.length === 0) return;
+
+            var row = rows[Math.floor(Math.random() * rows.length)];
+            var rect = row.getBoundingClientRect();
+            if (rect.width === 0 || rect.height === 0) return;
+
+            var bee = document.createElement('div');
+            bee.className = 'bee-landing';
+            bee.textContent = '\uD83D\uDC1D'; // 🐝
+
+            // Use absolute positioning so the bee scrolls with the page
+            var scrollX = window.scrollX || window.pageXOffset;
+            var scrollY = window.scrollY || window.pageYOffset;
+
+            // Start from random edge (document coords)
+            var startX = Math.random() > 0.5 ? -40 : W + 40;
+            var startY = scrollY + rand(50, H - 50);
+            bee.style.left = startX + 'px';
+            bee.style.top = startY + 'px';
+            document.body.appendChild(bee);
+
+            // Fly to the row (convert viewport rect to document coords)
+            var targetX = scrollX + rect.left + rand(20, rect.width - 20);
+            var targetY = scrollY + rect.top + rect.height / 2;
+
+            requestAnimationFrame(function() {
+                bee.classList.add('bee-landing--flying');
+                bee.style.left = targetX + 'px';
+                bee.style.top = targetY + 'px';
+            });
+
+            // Land after flight
+            var landTimer = setTimeout(function() {
+                bee.classList.remove('bee-landing--flying');
+                bee.classList.add('bee-landing--landed');
+                row.classList.add('bee-row-highlight');
+
+                // Sit for 3-5s then fly off
+                var restTime = 3000 + Math.random() * 2000;
+                var flyOffTimer = setTimeout(function() {
+                    bee.classList.remove('bee-landing--landed');
+                    row.classList.remove('bee-row-highlight');
+                    bee.classList.add('bee-landing--flying');
+                    var curScrollY = window.scrollY || window.pageYOffset;
+                    var exitX = Math.random() > 0.5 ? W + 60 : -60;
+                    var exitY = curScrollY + rand(50, H - 50);
+                    bee.style.left = exitX + 'px';
+                    bee.style.top = exitY + 'px';
+                    bee.style.transform = '';
+
+                    var removeTimer = setTimeout(function() { bee.remove(); }, 1600);
+                    beeTimers.push(removeTimer);
+                }, restTime);
+                beeTimers.push(flyOffTimer);
+            }, 1600);
+            beeTimers.push(landTimer);
+        }
+
+        function maybeBeeLanding() {
+            if (Math.random() > 0.008) return;
+            doBeeLanding();
+        }
+
+        // Check every 20-45s
+        var _beeLandingTimer = null;
+        function scheduleBeeLanding() {
+            var delay = 20000 + Math.random() * 25000;
+            _beeLandingTimer = setTimeout(function() {
+                maybeBeeLanding();
+                scheduleBeeLanding();
+            }, delay);
+        }
+        scheduleBeeLanding();
+        beeTimers.push(function() { clearTimeout(_beeLandingTimer); });
+
+        // --- 7. Honey Drip ---
+        function doHoneyDrip() {
+            var cards = document.querySelectorAll('.card');
+            if (cards.length === 0) return;
+
+            var card = cards[Math.floor(Math.random() * cards.length)];
+            // Card needs relative positioning for the drips
+            var origPosition = card.style.position;
+            if (getComputedStyle(card).position === 'static') {
+                card.style.position = 'relative';
+            }
+
+            var count = 3 + Math.floor(Math.random() * 4); // 3-6 drips
+            var drips = [];
+            for (var i = 0; i < count; i++) {
+                (function(idx) {
+                    var delay = idx * (150 + Math.random() * 300);
+                    var t = setTimeout(function() {
+                        var drip = document.createElement('div');
+                        drip.className = 'honey-drip';
+                        drip.style.left = (15 + Math.random() * (card.offsetWidth - 30)) + 'px';
+                        card.appendChild(drip);
+                        drips.push(drip);
+                    }, delay);
+                    beeTimers.push(t);
+                })(i);
+            }
+
+            // Clean up all drips after animation
+            var cleanupTimer = setTimeout(function() {
+                drips.forEach(function(d) { d.remove(); });
+                if (origPosition !== undefined) card.style.position = origPosition;
+            }, 4500);
+            beeTimers.push(cleanupTimer);
+        }
+
+        function maybeHoneyDrip() {
+            if (Math.random() > 0.003) return;
+            doHoneyDrip();
+        }
+
+        // Check every 30-60s
+        var _honeyDripTimer = null;
+        function scheduleHoneyDrip() {
+            var delay = 30000 + Math.random() * 30000;
+            _honeyDripTimer = setTimeout(function() {
+                maybeHoneyDrip();
+                scheduleHoneyDrip();
+            }, delay);
+        }
+        scheduleHoneyDrip();
+        beeTimers.push(function() { clearTimeout(_honeyDripTimer); });
+
+        // --- 8. Queen Bee Procession ---
+        function doQueenProcession() {
+            var procession = document.createElement('div');
+            procession.className = 'bee-procession';
+            document.body.appendChild(procession);
+
+            var goingRight = Math.random() > 0.5;
+            var startX = goingRight ? -80 : W + 80;
+            var endX = goingRight ? W + 80 : -80;
+            var baseY = rand(100, H - 150);
+            var duration = 6000 + Math.random() * 3000;
+            var startTime = Date.now();
+
+            // Queen element
+            var queen = document.createElement('div');
+            queen.className = 'bee-procession-queen';
+            queen.innerHTML = '\uD83D\uDC1D'; // 🐝
+            var crown = document.createElement('span');
+            crown.className = 'bee-crown';
+            crown.textContent = '\uD83D\uDC51'; // 👑
+            queen.appendChild(crown);
+            procession.appendChild(queen);
+
+            // Worker bees in V-formation (5-8)
+            var workerCount = 5 + Math.floor(Math.random() * 4);
+            var workers = [];
+            for (var i = 0; i < workerCount; i++) {
+                var w = document.createElement('div');
+                w.className = 'bee-procession-worker';
+                w.textContent = '\uD83D\uDC1D'; // 🐝
+                procession.appendChild(w);
+                // V-formation offsets: alternating sides, increasing distance
+                var row = Math.floor(i / 2) + 1;
+                var side = (i % 2 === 0) ? 1 : -1;
+                workers.push({
+                    el: w,
+                    offsetX: -row * 35 * (goingRight ? 1 : -1), // behind queen
+                    offsetY: side * row * 25,
+                    jitterPhase: Math.random() * Math.PI * 2,
+                    delay: row * 0.03 // slight lag behind queen
+                });
+            }
+
+            function animateProcession() {
+                var elapsed = Date.now() - startTime;
+                var p = Math.min(elapsed / duration, 1);
+
+                // Queen position with gentle wave
+                var qx = startX + (endX - startX) * p;
+                var qy = baseY + Math.sin(p * Math.PI * 4) * 20;
+                queen.style.left = qx + 'px';
+                queen.style.top = qy + 'px';
+                queen.style.transform = goingRight ? 'scaleX(-1)' : 'scaleX(1)';
+
+                // Workers follow
+                for (var i = 0; i < workers.length; i++) {
+                    var wk = workers[i];
+                    var wp = Math.max(0, Math.min(p - wk.delay, 1));
+                    var wx = startX + (endX - startX) * wp + wk.offsetX;
+                    var wy = baseY + Math.sin(wp * Math.PI * 4) * 20 + wk.offsetY;
+                    // Individual jitter
+                    wx += Math.sin(elapsed * 0.005 + wk.jitterPhase) * 4;
+                    wy += Math.cos(elapsed * 0.007 + wk.jitterPhase) * 3;
+                    wk.el.style.left = wx + 'px';
+                    wk.el.style.top = wy + 'px';
+                    wk.el.style.transform = goingRight ? 'scaleX(-1)' : 'scaleX(1)';
+                }
+
+                if (p < 1) {
+                    BeaconActivity.requestFrame(animateProcession);
+                } else {
+                    procession.remove();
+                }
+            }
+            BeaconActivity.requestFrame(animateProcession);
+        }
+
+        function maybeQueenProcession() {
+            if (Math.random() > 0.004) return;
+            doQueenProcession();
+        }
+
+        // Check every 40-80s
+        var _queenTimer = null;
+        function scheduleQueenProcession() {
+            var delay = 40000 + Math.random() * 40000;
+            _queenTimer = setTimeout(function() {
+                maybeQueenProcession();
+                scheduleQueenProcession();
+            }, delay);
+        }
+        scheduleQueenProcession();
+        beeTimers.push(function() { clearTimeout(_queenTimer); });
+
+        // Expose forced triggers for debug menu
+        window._debugEasterEggs = window._debugEasterEggs || {};
+        window._debugEasterEggs.beeLanding = doBeeLanding;
+        window._debugEasterEggs.honeyDrip = doHoneyDrip;
+        window._debugEasterEggs.queenProcession = doQueenProcession;
+        window._debugEasterEggs.bearPeek = function() {
+            // Force bear peek (bypassing probability)
+            var bear = document.createElement('div');
+            bear.className = 'bee-bear';
+            bear.textContent = '\uD83D\uDC3B';
+            var edges = ['left', 'right', 'bottom'];
+            var edge = edges[Math.floor(Math.random() * edges.length)];
+            bear.classList.add('bee-bear--' + edge);
+            if (edge === 'left' || edge === 'right') {
+                bear.style.top = (10 + Math.random() * 80) + '%';
+            } else {
+                bear.style.left = (10 + Math.random() * 80) + '%';
+            }
+            document.body.appendChild(bear);
+            requestAnimationFrame(function() {
+                requestAnimationFrame(function() {
+                    if (edge === 'left') bear.style.left = '-12px';
+                    else if (edge === 'right') bear.style.right = '-12px';
+                    else bear.style.bottom = '-12px';
+                    bear.classList.add('bee-bear--sniff');
+                });
+            });
+            var hideTimer = setTimeout(function() {
+                bear.classList.remove('bee-bear--sniff');
+                if (edge === 'left') bear.style.left = '-60px';
+                else if (edge === 'right') bear.style.right = '-60px';
+                else bear.style.bottom = '-60px';
+                setTimeout(function() { bear.remove(); }, 1000);
+            }, 2800);
+            beeTimers.push(hideTimer);
+        };
+        window._debugEasterEggs.beeSwarm = triggerSwarm;
+        window._debugEasterEggs.spawnButterfly = function() {
+            var bee = document.createElement('div');
+            bee.className = 'bee bee--butterfly';
+            bee.textContent = '\uD83E\uDD8B'; // 🦋
+            bee.style.position = 'absolute';
+            bee.style.zIndex = '10000';
+            bee.style.fontSize = rand(24, 34) + 'px';
+            container.appendChild(bee);
+            var goRight = Math.random() > 0.5;
+            var sx = goRight ? -60 : W + 60;
+            var ex = goRight ? W + 60 : -60;
+            var sy = rand(50, H - 80);
+            var dur = rand(8000, 14000);
+            var st = Date.now();
+            var flip = goRight ? 'scaleX(-1)' : 'scaleX(1)';
+            (function anim() {
+                var p = Math.min((Date.now() - st) / dur, 1);
+                var x = sx + (ex - sx) * p;
+                var y = sy + Math.sin(p * Math.PI * 5) * 70;
+                bee.style.left = x + 'px';
+                bee.style.top = y + 'px';
+                bee.style.transform = flip + ' rotate(' + (Math.sin(p * 20) * 10) + 'deg)';
+                bee.style.opacity = p < 0.05 ? String(p / 0.05) : (p > 0.92 ? String((1 - p) / 0.08) : '0.9');
+                if (p < 1) BeaconActivity.requestFrame(anim);
+                else bee.remove();
+            })();
+        };
+        window._debugEasterEggs.spawnLadybug = function() {
+            var bee = document.createElement('div');
+            bee.className = 'bee bee--ladybug';
+            bee.textContent = '\uD83D\uDC1E'; // 🐞
+            bee.style.position = 'absolute';
+            bee.style.zIndex = '10000';
+            bee.style.fontSize = rand(22, 32) + 'px';
+            container.appendChild(bee);
+            var goRight = Math.random() > 0.5;
+            var sx = goRight ? -60 : W + 60;
+            var ex = goRight ? W + 60 : -60;
+            var sy = rand(50, H - 80);
+            var dur = rand(8000, 14000);
+            var st = Date.now();
+            var flip = goRight ? 'scaleX(-1)' : 'scaleX(1)';
+            (function anim() {
+                var p = Math.min((Date.now() - st) / dur, 1);
+                var x = sx + (ex - sx) * p;
+                var y = sy + Math.sin(p * Math.PI * 3) * 50;
+                bee.style.left = x + 'px';
+                bee.style.top = y + 'px';
+                bee.style.transform = flip + ' rotate(' + (Math.sin(p * 15) * 8) + 'deg)';
+                bee.style.opacity = p < 0.05 ? String(p / 0.05) : (p > 0.92 ? String((1 - p) / 0.08) : '0.9');
+                if (p < 1) BeaconActivity.requestFrame(anim);
+                else bee.remove();
+            })();
+        };
+        window._debugEasterEggs.rainbowBee = function() {
+            // Spawn a single rainbow bee
+            var bee = document.createElement('div');
+            bee.className = 'bee bee--rainbow';
+            bee.textContent = '\uD83D\uDC1D';
+            bee.style.position = 'absolute';
+            bee.style.zIndex = '10000';
+            bee.style.fontSize = rand(30, 38) + 'px';
+            container.appendChild(bee);
+            var goRight = Math.random() > 0.5;
+            var sx = goRight ? -60 : W + 60;
+            var ex = goRight ? W + 60 : -60;
+            var sy = rand(50, H - 80);
+            var dur = rand(7000, 12000);
+            var st = Date.now();
+            var flip = goRight ? 'scaleX(-1)' : 'scaleX(1)';
+            (function anim() {
+                var p = Math.min((Date.now() - st) / dur, 1);
+                var x = sx + (ex - sx) * p;
+                var y = sy + Math.sin(p * Math.PI * 4) * 60;
+                bee.style.left = x + 'px';
+                bee.style.top = y + 'px';
+                bee.style.transform = flip + ' rotate(' + (Math.sin(p * 20) * 12) + 'deg)';
+                bee.style.opacity = p < 0.05 ? String(p / 0.05) : '0.9';
+                if (p < 1) BeaconActivity.requestFrame(anim);
+                else bee.remove();
+            })();
+        };
+
+        // --- Konami: Unleash the Swarm ---
+        BeaconEffects.konami = function() {
+            var swarmCount = 100 + Math.floor(Math.random() * 51);
+            playBeeSwarmBuzz();
+            for (var i = 0; i < swarmCount; i++) {
+                (function(delay) {
+                    var t = setTimeout(function() {
+                        createBee({
+                            goingRight: Math.random() > 0.5,
+                            pattern: pick(['wave', 'drunken', 'zigzag', 'divebomb', 'loopy']),
+                            bypassCap: true
+                        });
+                    }, delay);
+                    beeTimers.push(t);
+                })(i * rand(30, 120));
+            }
+        };
+
+    }
+
+    BeaconEffects.define('bee', { handle: handleBeeAnimation });
+})();
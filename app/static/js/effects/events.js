@@ -0,0 +1,126 @@
+/**
+ * TheBeacon effect: time-based events (4:04, 4:20 and 5:00 PM).
+ * Loaded on demand by BeaconEffects (static/js/effects.js).
+ */
+(function() {
+    'use strict';
+
+    function show404Event() {
+        var overlay = document.createElement('div');
+        overlay.className = 'event-404';
+        overlay.innerHTML =
+            '<div class="event-404-content">' +
+                '<div class="event-404-dino">\uD83E\uDD96</div>' +
+                '<div class="event-404-heading">Tickets Not Found</div>' +
+                '<div class="event-404-sub">The ticket you are looking for might have been resolved, had its name changed, or is temporarily unavailable.</div>' +
+                '<div class="event-404-code">ERR_TICKETS_NOT_FOUND</div>' +
+            '</div>';
+        document.body.appendChild(overlay);
+
+        // Dismiss on click or key press
+        var dismissed = false;
+        function dismiss() {
+            if (dismissed) return;
+            dismissed = true;
+            overlay.classList.add('event-404--fade-out');
+            setTimeout(function() { overlay.remove(); }, 500);
+            overlay.removeEventListener('click', dismiss);
+            document.removeEventListener('keydown', dismiss);
+        }
+        overlay.style.pointerEvents = 'auto';
+        overlay.addEventListener('click', dismiss);
+        document.addEventListener('keydown', dismiss);
+
+        // Auto-dismiss after 10s
+        setTimeout(dismiss, 10000);
+    }
+
+    function show420Event() {
+        // Haze overlay — layered translucent smoke filling the screen
+        var hazeOverlay = document.createElement('div');
+        hazeOverlay.className = 'event-420-haze';
+        document.body.appendChild(hazeOverlay);
+
+        // Continuous falling leaves for the full minute
+        var leafEmojis = ['\uD83C\uDF3F', '\uD83C\uDF43', '\u2618\uFE0F']; // 🌿🍃☘️
+        var leafInterval = BeaconActivity.every(function() {
+            var leaf = document.createElement('div');
+            leaf.className = 'event-420-leaf';
+            leaf.textContent = leafEmojis[Math.floor(Math.random() * leafEmojis.length)];
+            leaf.style.left = (Math.random() * 100) + 'vw';
+            leaf.style.animationDuration = (4 + Math.random() * 3) + 's';
+            document.body.appendChild(leaf);
+            setTimeout(function() { leaf.remove(); }, 8000);
+        }, 300);
+
+        // Continuous wispy smoke puffs rising
+        var smokeContainer = document.createElement('div');
+        smokeContainer.className = 'event-420-smoke-container';
+        document.body.appendChild(smokeContainer);
+
+        var smokeInterval = BeaconActivity.every(function() {
+            var puff = document.createElement('div');
+            puff.className = 'event-420-puff';
+            puff.style.left = (10 + Math.random() * 80) + 'vw';
+            puff.style.animationDuration = (6 + Math.random() * 5) + 's';
+            var size = 120 + Math.random() * 200;
+            puff.style.width = size + 'px';
+            puff.style.height = (size * 0.6) + 'px';
+            smokeContainer.appendChild(puff);
+            setTimeout(function() { puff.remove(); }, 12000);
+        }, 250);
+
+        // Badge
+        var badge = document.createElement('div');
+        badge.className = 'event-420-badge';
+        badge.textContent = '4:20';
+        document.body.appendChild(badge);
+
+        // Dismiss after 60s (full minute)
+        setTimeout(function() {
+            BeaconActivity.cancel(leafInterval);
+            BeaconActivity.cancel(smokeInterval);
+            hazeOverlay.classList.add('event-420-haze--fade-out');
+            smokeContainer.classList.add('event-420-smoke-container--fade-out');
+            badge.classList.add('event-420-badge--fade-out');
+            setTimeout(function() {
+                hazeOverlay.remove();
+                smokeContainer.remove();
+                badge.remove();
+            }, 2000);
+        }, 60000);
+    }
+
+    function showBeerEvent() {
+        var overlay = document.createElement('div');
+        overlay.className = 'event-beer';
+        overlay.innerHTML =
+            '<div class="event-beer-emoji">\uD83C\uDF7A</div>' +
+            '<div class="event-beer-title">It\'s 5 o\'clock somewhere!</div>' +
+            '<div class="event-beer-subtitle">Go home.</div>';
+        document.body.appendChild(overlay);
+
+        // Falling confetti
+        var confettiEmojis = ['\uD83C\uDF7A', '\uD83C\uDF7B', '\uD83E\uDD42', '\uD83C\uDF89']; // 🍺🍻🥂🎉
+        for (var i = 0; i < 12; i++) {
+            (function(idx) {
+                setTimeout(function() {
+                    var c = document.createElement('div');
+                    c.className = 'event-beer-confetti';
+                    c.textContent = confettiEmojis[idx % confettiEmojis.length];
+                    c.style.left = (Math.random() * 100) + 'vw';
+                    c.style.animationDuration = (4 + Math.random() * 2) + 's';
+                    document.body.appendChild(c);
+                    setTimeout(function() { c.remove(); }, 7000);
+                }, idx * 250);
+            })(i);
+        }
+
+        setTimeout(function() {
+            overlay.classList.add('event-beer--fade-out');
+            setTimeout(function() { overlay.remove(); }, 500);
+        }, 7000);
+    }
+
+    BeaconEffects.define('events', { show404: show404Event, show420: show420Event, showBeer: showBeerEvent });
+})();
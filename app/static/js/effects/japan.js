@@ -0,0 +1,171 @@
+/**
+ * TheBeacon effect: Japan theme (sakura petals, lucky cat, zen mode).
+ * Loaded on demand by BeaconEffects (static/js/effects.js).
+ */
+(function() {
+    'use strict';
+
+    // --- Japan Theme (Sakura) ---
+    var japanTimers = [];
+    var japanResizeHandler = null;
+
+    function handleJapanAnimation(active) {
+        var container = document.getElementById('japan-container');
+        if (!container) return;
+
+        if (!active) {
+            japanTimers.forEach(function(entry) {
+                if (typeof entry === 'function') { entry(); }
+                else { clearInterval(entry); clearTimeout(entry); }
+            });
+            japanTimers = [];
+            if (japanResizeHandler) {
+                window.removeEventListener('resize', japanResizeHandler);
+                japanResizeHandler = null;
+            }
+            document.querySelectorAll('.sakura-petal, .lucky-cat, .zen-overlay').forEach(function(el) { el.remove(); });
+            container.innerHTML = '';
+            return;
+        }
+
+        var W = window.innerWidth;
+        var H = window.innerHeight;
+        japanResizeHandler = function() { W = window.innerWidth; H = window.innerHeight; };
+        window.addEventListener('resize', japanResizeHandler);
+
+        function rand(min, max) { return min + Math.random() * (max - min); }
+
+        // --- Sakura Petal Fall ---
+        function spawnPetal() {
+            var petal = document.createElement('div');
+            petal.className = 'sakura-petal';
+            petal.textContent = '\uD83C\uDF38'; // 🌸
+            petal.style.fontSize = rand(14, 28) + 'px';
+            petal.style.left = rand(-20, W + 20) + 'px';
+            petal.style.top = '-30px';
+            petal.style.opacity = '0';
+            container.appendChild(petal);
+
+            var fallDuration = rand(5000, 9000);
+            var swayAmplitude = rand(30, 80);
+            var swaySpeed = rand(2, 4);
+            var startX = parseFloat(petal.style.left);
+            var startTime = Date.now();
+            var rotSpeed = rand(-180, 180);
+
+            function animatePetal() {
+                var elapsed = Date.now() - startTime;
+                var p = elapsed / fallDuration;
+                if (p >= 1) { petal.remove(); return; }
+
+                var y = -30 + (H + 60) * p;
+                var x = startX + Math.sin(p * Math.PI * swaySpeed) * swayAmplitude;
+                var rot = elapsed / 1000 * rotSpeed;
+
+                // Fade in/out
+                var opacity = 0.9;
+                if (p < 0.1) opacity = p / 0.1 * 0.9;
+                else if (p > 0.85) opacity = (1 - p) / 0.15 * 0.9;
+
+                petal.style.top = y + 'px';
+                petal.style.left = x + 'px';
+                petal.style.opacity = String(opacity);
+                petal.style.transform = 'rotate(' + rot + 'deg)';
+                BeaconActivity.requestFrame(animatePetal);
+            }
+            BeaconActivity.requestFrame(animatePetal);
+        }
+
+        // Initial burst
+        for (var i = 0; i < 5; i++) {
+            (function(delay) {
+                var t = setTimeout(function() { spawnPetal(); }, delay);
+                japanTimers.push(t);
+            })(i * 200);
+        }
+
+        // Continuous spawning
+        var petalSpawnId = BeaconActivity.every(function() {
+            spawnPetal();
+        }, 800 + Math.random() * 700);
+        japanTimers.push(function() { BeaconActivity.cancel(petalSpawnId); });
+
+        // --- Lucky Cat Peek ---
+        function doLuckyCat() {
+            var cat = document.createElement('div');
+            cat.className = 'lucky-cat';
+            cat.textContent = '\uD83D\uDC31'; // 🐱
+            document.body.appendChild(cat);
+
+            requestAnimationFrame(function() {
+                requestAnimationFrame(function() {
+                    cat.classList.add('lucky-cat--visible');
+                    cat.classList.add('lucky-cat--wave');
+                });
+            });
+
+            var hideTimer = setTimeout(function() {
+                cat.classList.remove('lucky-cat--visible');
+                cat.classList.remove('lucky-cat--wave');
+                setTimeout(function() { cat.remove(); }, 700);
+            }, 4000);
+            japanTimers.push(hideTimer);
+        }
+
+        function scheduleLuckyCat() {
+            var delay = 30000 + Math.random() * 30000;
+            var t = setTimeout(function() {
+                if (Math.random() < 0.008) doLuckyCat();
+                scheduleLuckyCat();
+            }, delay);
+            japanTimers.push(t);
+        }
+        scheduleLuckyCat();
+
+        // --- Zen Mode Overlay ---
+        function showZenMode() {
+            var overlay = document.createElement('div');
+            overlay.className = 'zen-overlay';
+            overlay.innerHTML = '<div class="zen-overlay__icon">\u26E9\uFE0F</div><div class="zen-overlay__text">Zen</div>';
+            document.body.appendChild(overlay);
+
+            requestAnimationFrame(function() {
+                overlay.classList.add('zen-overlay--visible');
+            });
+
+            function dismiss() {
+                overlay.classList.remove('zen-overlay--visible');
+                setTimeout(function() { overlay.remove(); }, 500);
+            }
+
+            overlay.addEventListener('click', dismiss);
+            var autoTimer = setTimeout(dismiss, 5000);
+            japanTimers.push(autoTimer);
+        }
+
+        // --- Sakura Burst (for debug/konami) ---
+        function sakuraBurst() {
+            for (var i = 0; i < 40; i++) {
+                (function(delay) {
+                    var t = setTimeout(function() { spawnPetal(); }, delay);
+                    japanTimers.push(t);
+                })(i * 50);
+            }
+        }
+
+        // --- Konami: sakura storm + zen ---
+        BeaconEffects.konami = function() {
+            sakuraBurst();
+            var zenTimer = setTimeout(showZenMode, 2000);
+            japanTimers.push(zenTimer);
+        };
+
+        // Expose for debug
+        window._debugEasterEggs = window._debugEasterEggs || {};
+        window._debugEasterEggs.sakuraBurst = sakuraBurst;
+        window._debugEasterEggs.luckyCat = doLuckyCat;
+        window._debugEasterEggs.zenMode = showZenMode;
+    }
+
+    BeaconEffects.define('japan', { handle: handleJapanAnimation });
+})();
@@ -0,0 +1,482 @@
+/**
+ * TheBeacon effect: default Konami pool (BSOD, retro CRT, nyan cat, alert cascade).
+ * Loaded on demand by BeaconEffects (static/js/effects.js).
+ */
+(function() {
+    'use strict';
+
+    // --- Retro CRT Mode (default Konami option) ---
+    function triggerRetro() {
+        var crtTimers = [];
+        var crtIntervals = [];
+
+        // === Phase 1: Power-on line (0-600ms) ===
+        var powerLine = document.createElement('div');
+        powerLine.style.cssText = 'position:fixed;top:50%;left:0;width:100%;height:2px;z-index:100000;pointer-events:none;background:white;box-shadow:0 0 30px 10px rgba(255,255,255,0.8);transform:translateY(-50%);transition:height 0.3s ease-out, opacity 0.2s;';
+        document.body.appendChild(powerLine);
+
+        // White flash overlay
+        var flashOverlay = document.createElement('div');
+        flashOverlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99999;pointer-events:none;background:white;opacity:0;transition:opacity 0.15s;';
+        document.body.appendChild(flashOverlay);
+
+        // Expand line + flash at 200ms
+        crtTimers.push(setTimeout(function() {
+            powerLine.style.height = '100vh';
+            flashOverlay.style.opacity = '0.7';
+        }, 200));
+
+        // Fade flash, remove power-on elements at 600ms
+        crtTimers.push(setTimeout(function() {
+            flashOverlay.style.opacity = '0';
+            powerLine.style.opacity = '0';
+            setTimeout(function() {
+                powerLine.remove();
+                flashOverlay.remove();
+            }, 200);
+        }, 500));
+
+        // === Phase 2: CRT effect (from 600ms, lasts ~9.4s) ===
+        // Heavy scanlines
+        var overlay = document.createElement('div');
+        overlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99998;pointer-events:none;opacity:0;transition:opacity 0.3s;';
+        overlay.style.background = 'repeating-linear-gradient(0deg, rgba(0,255,65,0.15) 0px, rgba(0,255,65,0.15) 2px, transparent 2px, transparent 5px)';
+        document.body.appendChild(overlay);
+
+        // Strong green tint
+        var tint = document.createElement('div');
+        tint.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99997;pointer-events:none;background:rgba(0,255,65,0.12);opacity:0;transition:opacity 0.3s;mix-blend-mode:overlay;';
+        document.body.appendChild(tint);
+
+        // Content styling: curvature + phosphor glow + desaturation
+        var content = document.querySelector('.thebeacon-content');
+        var origStyles = {};
+        if (content) {
+            origStyles.filter = content.style.filter || '';
+            origStyles.borderRadius = content.style.borderRadius || '';
+            origStyles.overflow = content.style.overflow || '';
+            origStyles.boxShadow = content.style.boxShadow || '';
+            origStyles.transition = content.style.transition || '';
+            origStyles.transform = content.style.transform || '';
+        }
+
+        crtTimers.push(setTimeout(function() {
+            overlay.style.opacity = '1';
+            tint.style.opacity = '1';
+            if (content) {
+                content.style.transition = 'all 0.3s';
+                content.style.filter = 'saturate(0) brightness(1.1) contrast(1.2)';
+                content.style.borderRadius = '12px';
+                content.style.overflow = 'hidden';
+                content.style.boxShadow = 'inset 0 0 60px rgba(0,255,65,0.15), inset 0 0 120px rgba(0,255,65,0.05)';
+            }
+        }, 600));
+
+        // Aggressive flicker: scanline opacity varies 0.08-0.20
+        var flickerTimer = setInterval(function() {
+            var intensity = 0.08 + Math.random() * 0.12;
+            overlay.style.background = 'repeating-linear-gradient(0deg, rgba(0,255,65,' + intensity + ') 0px, rgba(0,255,65,' + intensity + ') 2px, transparent 2px, transparent 5px)';
+        }, 150);
+        crtIntervals.push(flickerTimer);
+
+        // Horizontal jitter: every 2-4s, content shifts 2-4px for 100ms
+        var jitterTimer = setInterval(function() {
+            if (!content) return;
+            var shift = (2 + Math.random() * 2) * (Math.random() > 0.5 ? 1 : -1);
+            content.style.transform = 'translateX(' + shift + 'px)';
+            setTimeout(function() {
+                if (content) content.style.transform = '';
+            }, 100);
+        }, 2000 + Math.random() * 2000);
+        crtIntervals.push(jitterTimer);
+
+        // Static bursts: every 3-6s, random-height white-noise band for 80ms
+        var staticBurst = document.createElement('div');
+        staticBurst.style.cssText = 'position:fixed;left:0;width:100%;z-index:99999;pointer-events:none;opacity:0;';
+        document.body.appendChild(staticBurst);
+
+        var staticTimer = setInterval(function() {
+            var bandHeight = 20 + Math.random() * 80;
+            var bandTop = Math.random() * (window.innerHeight - bandHeight);
+            staticBurst.style.top = bandTop + 'px';
+            staticBurst.style.height = bandHeight + 'px';
+            staticBurst.style.background = 'repeating-linear-gradient(90deg, rgba(255,255,255,' + (0.05 + Math.random() * 0.1) + ') 0px, transparent 2px, rgba(255,255,255,' + (0.03 + Math.random() * 0.08) + ') 4px)';
+            staticBurst.style.opacity = '1';
+            setTimeout(function() {
+                staticBurst.style.opacity = '0';
+            }, 80);
+        }, 3000 + Math.random() * 3000);
+        crtIntervals.push(staticTimer);
+
+        // === Phase 3: CRT power-off at 10s ===
+        crtTimers.push(setTimeout(function() {
+            // Stop all CRT intervals
+            crtIntervals.forEach(function(id) { clearInterval(id); });
+
+            // Fade out scanlines and tint
+            overlay.style.opacity = '0';
+            tint.style.opacity = '0';
+            staticBurst.style.opacity = '0';
+
+            // Restore content styles
+            if (content) {
+                content.style.transition = 'all 0.3s';
+                content.style.filter = origStyles.filter;
+                content.style.borderRadius = origStyles.borderRadius;
+                content.style.overflow = origStyles.overflow;
+                content.style.boxShadow = origStyles.boxShadow;
+                content.style.transform = '';
+            }
+
+            // Power-off: shrink to horizontal line then fade
+            var powerOff = document.createElement('div');
+            powerOff.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:100000;pointer-events:none;background:white;opacity:0.6;transition:height 0.4s ease-in, top 0.4s ease-in, opacity 0.3s;';
+            document.body.appendChild(powerOff);
+
+            requestAnimationFrame(function() {
+                powerOff.style.height = '2px';
+                powerOff.style.top = '50%';
+            });
+
+            setTimeout(function() {
+                powerOff.style.opacity = '0';
+                setTimeout(function() {
+                    powerOff.remove();
+                    overlay.remove();
+                    tint.remove();
+                    staticBurst.remove();
+                    if (content) content.style.transition = origStyles.transition;
+                }, 300);
+            }, 500);
+        }, 10000));
+    }
+
+    // --- Nyan Cat (default Konami option) ---
+    function triggerNyanCat() {
+        var W = window.innerWidth;
+        var H = window.innerHeight;
+        var rainbowColors = ['#ff0000', '#ff8800', '#ffff00', '#33ff00', '#0099ff', '#6633ff'];
+        var catCount = 8 + Math.floor(Math.random() * 7); // 8-14 cats
+
+        // Shared trail container
+        var trailContainer = document.createElement('div');
+        trailContainer.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99998;pointer-events:none;overflow:hidden;';
+        document.body.appendChild(trailContainer);
+
+        var activeCats = 0;
+
+        function spawnNyan(delay) {
+            setTimeout(function() {
+                activeCats++;
+                var cat = document.createElement('img');
+                cat.src = '/static/img/nyancat.png';
+                var size = 40 + Math.random() * 60; // 40-100px
+                cat.style.cssText = 'position:fixed;z-index:99999;width:' + size + 'px;height:auto;pointer-events:none;image-rendering:pixelated;';
+                var startY = 30 + Math.random() * (H - 80);
+                cat.style.left = '-' + (size + 20) + 'px';
+                cat.style.top = startY + 'px';
+                document.body.appendChild(cat);
+
+                var startTime = Date.now();
+                var duration = 3000 + Math.random() * 3000; // 3-6s
+                var waveAmp = 20 + Math.random() * 50;
+                var waveFreq = 3 + Math.random() * 6;
+                var lastTrailX = -(size + 20);
+                var segH = Math.max(4, Math.round(size / 12));
+
+                function animateNyan() {
+                    var elapsed = Date.now() - startTime;
+                    var p = elapsed / duration;
+                    if (p >= 1) {
+                        cat.remove();
+                        activeCats--;
+                        if (activeCats <= 0) {
+                            trailContainer.style.transition = 'opacity 0.8s';
+                            trailContainer.style.opacity = '0';
+                            setTimeout(function() { trailContainer.remove(); }, 900);
+                        }
+                        return;
+                    }
+
+                    var x = -(size + 20) + (W + size + 40) * p;
+                    var y = startY + Math.sin(p * Math.PI * waveFreq) * waveAmp;
+                    cat.style.left = x + 'px';
+                    cat.style.top = y + 'px';
+
+                    if (x - lastTrailX > 8) {
+                        lastTrailX = x;
+                        for (var i = 0; i < rainbowColors.length; i++) {
+                            var seg = document.createElement('div');
+                            seg.style.cssText = 'position:absolute;width:' + (segH * 2) + 'px;height:' + segH + 'px;border-radius:1px;opacity:0.85;';
+                            seg.style.backgroundColor = rainbowColors[i];
+                            seg.style.left = x + 'px';
+                            seg.style.top = (y + size * 0.2 + i * (segH + 1)) + 'px';
+                            trailContainer.appendChild(seg);
+                            (function(s) {
+                                setTimeout(function() {
+                                    s.style.transition = 'opacity 1.5s';
+                                    s.style.opacity = '0';
+                                }, 200);
+                            })(seg);
+                        }
+                    }
+
+                    BeaconActivity.requestFrame(animateNyan);
+                }
+                BeaconActivity.requestFrame(animateNyan);
+            }, delay);
+        }
+
+        for (var i = 0; i < catCount; i++) {
+            spawnNyan(i * (100 + Math.random() * 200));
+        }
+    }
+
+    // --- Fake Alert Cascade (default Konami option) — Hydra Mode ---
+    function triggerAlertCascade() {
+        var messages = [
+            { title: 'System Error', body: 'Keyboard not found. Press F1 to continue.' },
+            { title: 'Warning', body: 'Your free trial of existence has expired.' },
+            { title: 'Critical Error', body: 'Task failed successfully.' },
+            { title: 'Alert', body: 'Something happened. Or maybe it didn\'t. Who knows.' },
+            { title: 'Error 418', body: 'I\'m a teapot. I refuse to brew coffee.' },
+            { title: 'Fatal Exception', body: 'An error occurred while displaying the previous error.' },
+            { title: 'Notice', body: 'This incident will be reported. To no one in particular.' },
+            { title: 'Segfault', body: 'The code is haunted. Try burning sage on the server.' },
+            { title: 'PC LOAD LETTER', body: 'What does that even mean?' },
+            { title: 'Helpful Tip', body: 'Have you tried turning it off and on again?' },
+            { title: 'Error: Success', body: 'The operation completed successfully. But at what cost?' },
+            { title: 'Existential Error', body: 'Error: Success.' },
+        ];
+
+        var activeAlerts = [];
+        var alertZIndex = 100000;
+        var totalSpawned = 0;
+        var finalBossShown = false;
+        var cascadeTimers = [];
+
+        // Play BSOD sound on first dialog
+        var bsodAudio = new Audio('/static/audio/windows-bsod.mp3');
+        bsodAudio.volume = 0.3;
+        bsodAudio.play().catch(function() {});
+
+        function getRandomMsg() {
+            return messages[Math.floor(Math.random() * messages.length)];
+        }
+
+        function shakeBox(box) {
+            var orig = box.style.transform || '';
+            var shakeCount = 0;
+            var shakeTimer = setInterval(function() {
+                var dx = (Math.random() - 0.5) * 8;
+                box.style.transform = 'translateX(' + dx + 'px)';
+                shakeCount++;
+                if (shakeCount > 6) {
+                    clearInterval(shakeTimer);
+                    box.style.transform = orig;
+                }
+            }, 30);
+            cascadeTimers.push(shakeTimer);
+        }
+
+        function dismissBox(box) {
+            box.style.transition = 'opacity 0.15s, transform 0.15s';
+            box.style.opacity = '0';
+            box.style.transform = 'scale(0.9)';
+            setTimeout(function() { box.remove(); }, 200);
+            var idx = activeAlerts.indexOf(box);
+            if (idx > -1) activeAlerts.splice(idx, 1);
+        }
+
+        function dismissAll() {
+            // Cascade close animation — staggered removal
+            var remaining = activeAlerts.slice();
+            remaining.forEach(function(box, i) {
+                setTimeout(function() {
+                    dismissBox(box);
+                }, i * 60);
+            });
+            activeAlerts = [];
+        }
+
+        function checkFinalBoss() {
+            if (finalBossShown) return;
+            if (totalSpawned >= 15 || Date.now() - cascadeStartTime > 12000) {
+                finalBossShown = true;
+                showFinalBoss();
+            }
+        }
+
+        function showFinalBoss() {
+            var box = document.createElement('div');
+            alertZIndex++;
+            box.style.cssText = 'position:fixed;z-index:' + alertZIndex + ';background:#c0c0c0;border:3px outset #dfdfdf;' +
+                'box-shadow:4px 4px 0 rgba(0,0,0,0.4);font-family:Tahoma,Arial,sans-serif;font-size:14px;color:#000;width:420px;cursor:default;user-select:none;';
+            box.style.left = Math.max(40, (window.innerWidth / 2 - 210)) + 'px';
+            box.style.top = Math.max(40, (window.innerHeight / 2 - 100)) + 'px';
+
+            var titleBar = document.createElement('div');
+            titleBar.style.cssText = 'background:linear-gradient(90deg,#800000,#d01010);color:white;padding:4px 6px;font-weight:bold;font-size:13px;display:flex;justify-content:space-between;align-items:center;';
+            var titleText = document.createElement('span');
+            titleText.textContent = '\u2620\uFE0F FINAL WARNING';
+            titleBar.appendChild(titleText);
+            box.appendChild(titleBar);
+
+            var body = document.createElement('div');
+            body.style.cssText = 'padding:20px 16px;display:flex;align-items:flex-start;gap:12px;background:#c0c0c0;';
+            body.innerHTML = '<span style="font-size:36px;">\u2622\uFE0F</span><span style="padding-top:8px;font-size:14px;font-weight:bold;">FORMAT C:\\ ?</span>';
+            box.appendChild(body);
+
+            var btnRow = document.createElement('div');
+            btnRow.style.cssText = 'text-align:center;padding:8px 12px 12px;background:#c0c0c0;display:flex;justify-content:center;gap:16px;';
+            var btnStyle = 'background:#c0c0c0;border:2px outset #dfdfdf;padding:4px 20px;font-size:12px;font-family:Tahoma,Arial,sans-serif;cursor:pointer;font-weight:bold;';
+
+            var yesBtn = document.createElement('button');
+            yesBtn.textContent = 'YES';
+            yesBtn.style.cssText = btnStyle;
+            var defYesBtn = document.createElement('button');
+            defYesBtn.textContent = 'DEFINITELY YES';
+            defYesBtn.style.cssText = btnStyle;
+
+            btnRow.appendChild(yesBtn);
+            btnRow.appendChild(defYesBtn);
+            box.appendChild(btnRow);
+
+            document.body.appendChild(box);
+            activeAlerts.push(box);
+            shakeBox(box);
+
+            function handleFinalDismiss() {
+                dismissAll();
+            }
+            yesBtn.addEventListener('click', handleFinalDismiss);
+            defYesBtn.addEventListener('click', handleFinalDismiss);
+        }
+
+        function createAlert(msg) {
+            if (activeAlerts.length >= 20) return;
+            totalSpawned++;
+            alertZIndex++;
+            var box = document.createElement('div');
+            box.style.cssText = 'position:fixed;z-index:' + alertZIndex + ';background:#c0c0c0;border:2px outset #dfdfdf;' +
+                'box-shadow:2px 2px 0 rgba(0,0,0,0.3);font-family:Tahoma,Arial,sans-serif;font-size:12px;color:#000;width:320px;cursor:default;user-select:none;';
+            // Random position across screen
+            var maxLeft = Math.max(100, window.innerWidth - 360);
+            var maxTop = Math.max(60, window.innerHeight - 200);
+            box.style.left = (40 + Math.random() * maxLeft) + 'px';
+            box.style.top = (30 + Math.random() * maxTop) + 'px';
+
+            // Title bar
+            var titleBar = document.createElement('div');
+            titleBar.style.cssText = 'background:linear-gradient(90deg,#000080,#1084d0);color:white;padding:3px 5px;font-weight:bold;font-size:12px;display:flex;justify-content:space-between;align-items:center;';
+            var titleText = document.createElement('span');
+            titleText.textContent = msg.title;
+            var closeBtn = document.createElement('button');
+            closeBtn.textContent = '\u2715';
+            closeBtn.style.cssText = 'background:#c0c0c0;border:1px outset #dfdfdf;font-size:10px;width:16px;height:16px;cursor:pointer;padding:0;line-height:1;';
+            titleBar.appendChild(titleText);
+            titleBar.appendChild(closeBtn);
+            box.appendChild(titleBar);
+
+            // Body
+            var body = document.createElement('div');
+            body.style.cssText = 'padding:16px 12px;display:flex;align-items:flex-start;gap:10px;background:#c0c0c0;';
+            body.innerHTML = '<span style="font-size:28px;">\u26A0\uFE0F</span><span style="padding-top:6px;">' + msg.body + '</span>';
+            box.appendChild(body);
+
+            // OK button
+            var btnRow = document.createElement('div');
+            btnRow.style.cssText = 'text-align:center;padding:6px 12px 10px;background:#c0c0c0;';
+            var okBtn = document.createElement('button');
+            okBtn.textContent = 'OK';
+            okBtn.style.cssText = 'background:#c0c0c0;border:2px outset #dfdfdf;padding:2px 24px;font-size:12px;font-family:Tahoma,Arial,sans-serif;cursor:pointer;';
+            btnRow.appendChild(okBtn);
+            box.appendChild(btnRow);
+
+            document.body.appendChild(box);
+            activeAlerts.push(box);
+
+            // Entrance shake
+            shakeBox(box);
+
+            // X button: dismiss normally (no spawn)
+            closeBtn.addEventListener('click', function() {
+                dismissBox(box);
+            });
+
+            // OK button: HYDRA — spawn 2 new dialogs
+            okBtn.addEventListener('click', function() {
+                dismissBox(box);
+                if (activeAlerts.length < 20 && !finalBossShown) {
+                    cascadeTimers.push(setTimeout(function() { createAlert(getRandomMsg()); }, 80));
+                    cascadeTimers.push(setTimeout(function() { createAlert(getRandomMsg()); }, 200));
+                }
+                checkFinalBoss();
+            });
+        }
+
+        // Initial burst: 6-8 dialogs at 150ms stagger
+        var cascadeStartTime = Date.now();
+        var initialCount = 6 + Math.floor(Math.random() * 3);
+        for (var i = 0; i < initialCount; i++) {
+            (function(idx) {
+                cascadeTimers.push(setTimeout(function() {
+                    createAlert(getRandomMsg());
+                }, idx * 150));
+            })(i);
+        }
+
+        // Final boss trigger check (time-based fallback)
+        cascadeTimers.push(setTimeout(function() {
+            checkFinalBoss();
+        }, 12000));
+
+        // Auto-dismiss safety net at 20s
+        cascadeTimers.push(setTimeout(function() {
+            dismissAll();
+            cascadeTimers.forEach(function(id) { clearTimeout(id); clearInterval(id); });
+        }, 20000));
+    }
+
+    function triggerBSOD() {
+        var bsodAudio = new Audio('/static/audio/windows-bsod.mp3');
+        bsodAudio.play().catch(function() {});
+        var overlay = document.createElement('div');
+        overlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;background:#0078D7;z-index:999999;display:flex;flex-direction:column;justify-content:center;padding-left:10%;font-family:Segoe UI,sans-serif;color:white;cursor:default;';
+        overlay.innerHTML =
+            '<div style="font-size:7rem;margin-bottom:2rem;">:(</div>' +
+            '<div style="font-size:1.5rem;max-width:700px;line-height:1.8;margin-bottom:2rem;">' +
+            'Your device ran into a problem and needs to restart. We\'re just collecting some error info, and then we\'ll restart for you.</div>' +
+            '<div style="font-size:1.1rem;max-width:700px;margin-bottom:2.5rem;"><span id="bsod-pct">0</span>% complete</div>' +
+            '<div style="display:flex;align-items:flex-start;gap:1.2rem;max-width:700px;">' +
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 29 29" width="80" height="80" style="flex-shrink:0;"><rect width="29" height="29" fill="white"/><path d="M0,0h1v1h-1zM1,0h1v1h-1zM2,0h1v1h-1zM3,0h1v1h-1zM4,0h1v1h-1zM5,0h1v1h-1zM6,0h1v1h-1zM10,0h1v1h-1zM15,0h1v1h-1zM17,0h1v1h-1zM18,0h1v1h-1zM19,0h1v1h-1zM22,0h1v1h-1zM23,0h1v1h-1zM24,0h1v1h-1zM25,0h1v1h-1zM26,0h1v1h-1zM27,0h1v1h-1zM28,0h1v1h-1zM0,1h1v1h-1zM6,1h1v1h-1zM8,1h1v1h-1zM9,1h1v1h-1zM10,1h1v1h-1zM13,1h1v1h-1zM14,1h1v1h-1zM15,1h1v1h-1zM16,1h1v1h-1zM17,1h1v1h-1zM18,1h1v1h-1zM20,1h1v1h-1zM22,1h1v1h-1zM28,1h1v1h-1zM0,2h1v1h-1zM2,2h1v1h-1zM3,2h1v1h-1zM4,2h1v1h-1zM6,2h1v1h-1zM8,2h1v1h-1zM14,2h1v1h-1zM17,2h1v1h-1zM19,2h1v1h-1zM20,2h1v1h-1zM22,2h1v1h-1zM24,2h1v1h-1zM25,2h1v1h-1zM26,2h1v1h-1zM28,2h1v1h-1zM0,3h1v1h-1zM2,3h1v1h-1zM3,3h1v1h-1zM4,3h1v1h-1zM6,3h1v1h-1zM9,3h1v1h-1zM12,3h1v1h-1zM15,3h1v1h-1zM16,3h1v1h-1zM22,3h1v1h-1zM24,3h1v1h-1zM25,3h1v1h-1zM26,3h1v1h-1zM28,3h1v1h-1zM0,4h1v1h-1zM2,4h1v1h-1zM3,4h1v1h-1zM4,4h1v1h-1zM6,4h1v1h-1zM8,4h1v1h-1zM9,4h1v1h-1zM10,4h1v1h-1zM12,4h1v1h-1zM15,4h1v1h-1zM17,4h1v1h-1zM18,4h1v1h-1zM22,4h1v1h-1zM24,4h1v1h-1zM25,4h1v1h-1zM26,4h1v1h-1zM28,4h1v1h-1zM0,5h1v1h-1zM6,5h1v1h-1zM8,5h1v1h-1zM10,5h1v1h-1zM12,5h1v1h-1zM13,5h1v1h-1zM14,5h1v1h-1zM15,5h1v1h-1zM16,5h1v1h-1zM17,5h1v1h-1zM18,5h1v1h-1zM19,5h1v1h-1zM22,5h1v1h-1zM28,5h1v1h-1zM0,6h1v1h-1zM1,6h1v1h-1zM2,6h1v1h-1zM3,6h1v1h-1zM4,6h1v1h-1zM5,6h1v1h-1zM6,6h1v1h-1zM8,6h1v1h-1zM10,6h1v1h-1zM12,6h1v1h-1zM14,6h1v1h-1zM16,6h1v1h-1zM18,6h1v1h-1zM20,6h1v1h-1zM22,6h1v1h-1zM23,6h1v1h-1zM24,6h1v1h-1zM25,6h1v1h-1zM26,6h1v1h-1zM27,6h1v1h-1zM28,6h1v1h-1zM8,7h1v1h-1zM10,7h1v1h-1zM11,7h1v1h-1zM14,7h1v1h-1zM17,7h1v1h-1zM18,7h1v1h-1zM19,7h1v1h-1zM0,8h1v1h-1zM1,8h1v1h-1zM3,8h1v1h-1zM6,8h1v1h-1zM7,8h1v1h-1zM11,8h1v1h-1zM12,8h1v1h-1zM14,8h1v1h-1zM22,8h1v1h-1zM23,8h1v1h-1zM24,8h1v1h-1zM26,8h1v1h-1zM27,8h1v1h-1zM0,9h1v1h-1zM1,9h1v1h-1zM2,9h1v1h-1zM4,9h1v1h-1zM9,9h1v1h-1zM11,9h1v1h-1zM12,9h1v1h-1zM13,9h1v1h-1zM14,9h1v1h-1zM16,9h1v1h-1zM17,9h1v1h-1zM18,9h1v1h-1zM20,9h1v1h-1zM22,9h1v1h-1zM25,9h1v1h-1zM28,9h1v1h-1zM2,10h1v1h-1zM3,10h1v1h-1zM4,10h1v1h-1zM5,10h1v1h-1zM6,10h1v1h-1zM7,10h1v1h-1zM8,10h1v1h-1zM11,10h1v1h-1zM12,10h1v1h-1zM16,10h1v1h-1zM17,10h1v1h-1zM19,10h1v1h-1zM20,10h1v1h-1zM22,10h1v1h-1zM25,10h1v1h-1zM26,10h1v1h-1zM27,10h1v1h-1zM1,11h1v1h-1zM2,11h1v1h-1zM7,11h1v1h-1zM8,11h1v1h-1zM9,11h1v1h-1zM10,11h1v1h-1zM11,11h1v1h-1zM12,11h1v1h-1zM13,11h1v1h-1zM15,11h1v1h-1zM18,11h1v1h-1zM23,11h1v1h-1zM24,11h1v1h-1zM26,11h1v1h-1zM27,11h1v1h-1zM1,12h1v1h-1zM4,12h1v1h-1zM5,12h1v1h-1zM6,12h1v1h-1zM8,12h1v1h-1zM10,12h1v1h-1zM11,12h1v1h-1zM13,12h1v1h-1zM17,12h1v1h-1zM19,12h1v1h-1zM20,12h1v1h-1zM21,12h1v1h-1zM22,12h1v1h-1zM25,12h1v1h-1zM27,12h1v1h-1zM28,12h1v1h-1zM0,13h1v1h-1zM1,13h1v1h-1zM2,13h1v1h-1zM5,13h1v1h-1zM9,13h1v1h-1zM11,13h1v1h-1zM15,13h1v1h-1zM17,13h1v1h-1zM19,13h1v1h-1zM21,13h1v1h-1zM23,13h1v1h-1zM1,14h1v1h-1zM2,14h1v1h-1zM4,14h1v1h-1zM6,14h1v1h-1zM7,14h1v1h-1zM9,14h1v1h-1zM10,14h1v1h-1zM11,14h1v1h-1zM13,14h1v1h-1zM14,14h1v1h-1zM16,14h1v1h-1zM17,14h1v1h-1zM18,14h1v1h-1zM20,14h1v1h-1zM21,14h1v1h-1zM25,14h1v1h-1zM26,14h1v1h-1zM27,14h1v1h-1zM28,14h1v1h-1zM3,15h1v1h-1zM4,15h1v1h-1zM5,15h1v1h-1zM7,15h1v1h-1zM8,15h1v1h-1zM11,15h1v1h-1zM13,15h1v1h-1zM14,15h1v1h-1zM15,15h1v1h-1zM16,15h1v1h-1zM17,15h1v1h-1zM18,15h1v1h-1zM19,15h1v1h-1zM20,15h1v1h-1zM22,15h1v1h-1zM25,15h1v1h-1zM27,15h1v1h-1zM1,16h1v1h-1zM2,16h1v1h-1zM3,16h1v1h-1zM4,16h1v1h-1zM5,16h1v1h-1zM6,16h1v1h-1zM7,16h1v1h-1zM10,16h1v1h-1zM12,16h1v1h-1zM13,16h1v1h-1zM17,16h1v1h-1zM19,16h1v1h-1zM20,16h1v1h-1zM21,16h1v1h-1zM23,16h1v1h-1zM27,16h1v1h-1zM1,17h1v1h-1zM3,17h1v1h-1zM7,17h1v1h-1zM10,17h1v1h-1zM12,17h1v1h-1zM16,17h1v1h-1zM18,17h1v1h-1zM22,17h1v1h-1zM23,17h1v1h-1zM25,17h1v1h-1zM28,17h1v1h-1zM0,18h1v1h-1zM2,18h1v1h-1zM4,18h1v1h-1zM6,18h1v1h-1zM11,18h1v1h-1zM12,18h1v1h-1zM14,18h1v1h-1zM20,18h1v1h-1zM21,18h1v1h-1zM22,18h1v1h-1zM23,18h1v1h-1zM27,18h1v1h-1zM28,18h1v1h-1zM5,19h1v1h-1zM8,19h1v1h-1zM9,19h1v1h-1zM10,19h1v1h-1zM12,19h1v1h-1zM15,19h1v1h-1zM17,19h1v1h-1zM19,19h1v1h-1zM22,19h1v1h-1zM27,19h1v1h-1zM28,19h1v1h-1zM0,20h1v1h-1zM3,20h1v1h-1zM5,20h1v1h-1zM6,20h1v1h-1zM8,20h1v1h-1zM9,20h1v1h-1zM10,20h1v1h-1zM13,20h1v1h-1zM14,20h1v1h-1zM15,20h1v1h-1zM20,20h1v1h-1zM21,20h1v1h-1zM22,20h1v1h-1zM23,20h1v1h-1zM24,20h1v1h-1zM26,20h1v1h-1zM8,21h1v1h-1zM9,21h1v1h-1zM10,21h1v1h-1zM11,21h1v1h-1zM13,21h1v1h-1zM17,21h1v1h-1zM19,21h1v1h-1zM20,21h1v1h-1zM24,21h1v1h-1zM26,21h1v1h-1zM27,21h1v1h-1zM28,21h1v1h-1zM0,22h1v1h-1zM1,22h1v1h-1zM2,22h1v1h-1zM3,22h1v1h-1zM4,22h1v1h-1zM5,22h1v1h-1zM6,22h1v1h-1zM8,22h1v1h-1zM9,22h1v1h-1zM10,22h1v1h-1zM14,22h1v1h-1zM17,22h1v1h-1zM18,22h1v1h-1zM20,22h1v1h-1zM22,22h1v1h-1zM24,22h1v1h-1zM27,22h1v1h-1zM0,23h1v1h-1zM6,23h1v1h-1zM10,23h1v1h-1zM13,23h1v1h-1zM16,23h1v1h-1zM18,23h1v1h-1zM20,23h1v1h-1zM24,23h1v1h-1zM25,23h1v1h-1zM26,23h1v1h-1zM28,23h1v1h-1zM0,24h1v1h-1zM2,24h1v1h-1zM3,24h1v1h-1zM4,24h1v1h-1zM6,24h1v1h-1zM9,24h1v1h-1zM12,24h1v1h-1zM17,24h1v1h-1zM20,24h1v1h-1zM21,24h1v1h-1zM22,24h1v1h-1zM23,24h1v1h-1zM24,24h1v1h-1zM0,25h1v1h-1zM2,25h1v1h-1zM3,25h1v1h-1zM4,25h1v1h-1zM6,25h1v1h-1zM8,25h1v1h-1zM9,25h1v1h-1zM10,25h1v1h-1zM11,25h1v1h-1zM12,25h1v1h-1zM14,25h1v1h-1zM19,25h1v1h-1zM22,25h1v1h-1zM24,25h1v1h-1zM25,25h1v1h-1zM26,25h1v1h-1zM27,25h1v1h-1zM0,26h1v1h-1zM2,26h1v1h-1zM3,26h1v1h-1zM4,26h1v1h-1zM6,26h1v1h-1zM10,26h1v1h-1zM12,26h1v1h-1zM17,26h1v1h-1zM18,26h1v1h-1zM19,26h1v1h-1zM21,26h1v1h-1zM24,26h1v1h-1zM25,26h1v1h-1zM26,26h1v1h-1zM28,26h1v1h-1zM0,27h1v1h-1zM6,27h1v1h-1zM8,27h1v1h-1zM12,27h1v1h-1zM13,27h1v1h-1zM14,27h1v1h-1zM16,27h1v1h-1zM17,27h1v1h-1zM20,27h1v1h-1zM24,27h1v1h-1zM27,27h1v1h-1zM0,28h1v1h-1zM1,28h1v1h-1zM2,28h1v1h-1zM3,28h1v1h-1zM4,28h1v1h-1zM5,28h1v1h-1zM6,28h1v1h-1zM8,28h1v1h-1zM11,28h1v1h-1zM12,28h1v1h-1zM13,28h1v1h-1zM14,28h1v1h-1zM15,28h1v1h-1zM16,28h1v1h-1zM17,28h1v1h-1zM18,28h1v1h-1zM20,28h1v1h-1zM23,28h1v1h-1zM24,28h1v1h-1zM27,28h1v1h-1z" fill="black"/></svg>' +
+            '<div style="font-size:0.85rem;line-height:1.6;opacity:0.9;">' +
+            'For more information about this issue and possible fixes, visit<br>https://www.windows.com/stopcode<br><br>' +
+            'If you call a support person, give them this info:<br>Stop code: HAVE_YOU_TRIED_TURNING_IT_OFF_AND_ON_AGAIN</div></div>';
+        document.body.appendChild(overlay);
+
+        var pct = 0;
+        var pctEl = overlay.querySelector('#bsod-pct');
+        var bsodTimer = setInterval(function() {
+            pct += Math.floor(Math.random() * 12) + 3;
+            if (pct > 100) pct = 100;
+            pctEl.textContent = pct;
+            if (pct >= 100) {
+                clearInterval(bsodTimer);
+                setTimeout(function() { overlay.remove(); }, 1500);
+            }
+        }, 500);
+    }
+
+    var pool = [triggerBSOD, triggerRetro, triggerNyanCat, triggerAlertCascade];
+
+    BeaconEffects.define('konami', {
+        bsod: triggerBSOD,
+        retro: triggerRetro,
+        nyanCat: triggerNyanCat,
+        alertCascade: triggerAlertCascade,
+        random: function() {
+            pool[Math.floor(Math.random() * pool.length)]();
+        },
+    });
+})();
@@ -0,0 +1,421 @@
+/**
+ * TheBeacon effect: Matrix rain theme and its easter eggs.
+ * Loaded on demand by BeaconEffects (static/js/effects.js).
+ */
+(function() {
+    'use strict';
+
+    // --- Matrix Rain Easter Egg ---
+    var matrixTimerId = null;
+    var matrixResizeHandler = null;
+    var matrixEasterEggTimers = [];
+    var matrixClickHandler = null;
+    var matrixMoveHandler = null;
+    var matrixSpoonHandler = null;
+
+    function handleMatrixRain(active) {
+        var canvas = document.getElementById('matrix-rain');
+        if (!canvas) return;
+
+        if (!active) {
+            if (matrixTimerId) {
+                BeaconActivity.cancel(matrixTimerId);
+                matrixTimerId = null;
+            }
+            if (matrixResizeHandler) {
+                window.removeEventListener('resize', matrixResizeHandler);
+                matrixResizeHandler = null;
+            }
+            // Clean up easter egg timers
+            matrixEasterEggTimers.forEach(function(id) { clearInterval(id); clearTimeout(id); });
+            matrixEasterEggTimers = [];
+            // Clean up event listeners
+            if (matrixClickHandler) {
+                document.removeEventListener('click', matrixClickHandler);
+                matrixClickHandler = null;
+            }
+            if (matrixMoveHandler) {
+                document.removeEventListener('mousemove', matrixMoveHandler);
+                matrixMoveHandler = null;
+            }
+            if (matrixSpoonHandler) {
+                document.removeEventListener('keypress', matrixSpoonHandler);
+                matrixSpoonHandler = null;
+            }
+            // Remove leftover easter egg elements
+            document.querySelectorAll('.matrix-quote, .matrix-click-char, .matrix-trail-char, .matrix-click-overlay, .matrix-rabbit').forEach(function(el) { el.remove(); });
+            var clearCtx = canvas.getContext('2d');
+            clearCtx.clearRect(0, 0, canvas.width, canvas.height);
+            return;
+        }
+
+        var ctx = canvas.getContext('2d');
+        var fontSize = 18;
+        var colWidth = fontSize;
+
+        // Half-width Katakana + digits + some Latin (classic Matrix look)
+        var katakana = '\uff66\uff67\uff68\uff69\uff6a\uff6b\uff6c\uff6d\uff6e\uff6f\uff70\uff71\uff72\uff73\uff74\uff75\uff76\uff77\uff78\uff79\uff7a\uff7b\uff7c\uff7d\uff7e\uff7f\uff80\uff81\uff82\uff83\uff84\uff85\uff86\uff87\uff88\uff89\uff8a\uff8b\uff8c\uff8d\uff8e\uff8f\uff90\uff91\uff92\uff93\uff94\uff95\uff96';
+        var digits = '0123456789';
+        var latin = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ';
+        var chars = katakana + digits + latin;
+
+        function initCanvas() {
+            canvas.width = window.innerWidth;
+            canvas.height = window.innerHeight;
+            ctx.fillStyle = '#000000';
+            ctx.fillRect(0, 0, canvas.width, canvas.height);
+        }
+
+        initCanvas();
+        var numCols = Math.floor(canvas.width / colWidth);
+
+        // Each column tracks its drop position, speed, and last drawn cell
+        var columns = [];
+
+        function buildColumns(count) {
+            var cols = [];
+            for (var i = 0; i < count; i++) {
+                var startY = Math.random() * -50;
+                cols.push({
+                    y: startY,
+                    speed: 0.4 + Math.random() * 0.6,
+                    trailLen: 8 + Math.floor(Math.random() * 20),
+                    lastCell: Math.floor(startY),
+                });
+            }
+            return cols;
+        }
+        columns = buildColumns(numCols);
+
+        function draw() {
+            // Semi-transparent black overlay creates the fade trail
+            ctx.fillStyle = 'rgba(0, 0, 0, 0.06)';
+            ctx.fillRect(0, 0, canvas.width, canvas.height);
+
+            ctx.font = fontSize + 'px monospace';
+
+            for (var i = 0; i < columns.length; i++) {
+                var col = columns[i];
+                var cell = Math.floor(col.y);
+
+                // Only draw when the drop has moved to a new cell
+                if (cell !== col.lastCell) {
+                    col.lastCell = cell;
+                    var x = i * colWidth;
+                    var yPos = cell * fontSize;
+                    var ch = chars[Math.floor(Math.random() * chars.length)];
+
+                    // Single bright head character — the trail comes from
+                    // previous heads fading via the black overlay, not from
+                    // drawing extra characters behind
+                    ctx.fillStyle = '#aaffaa';
+                    ctx.fillText(ch, x, yPos);
+                }
+
+                // Advance the drop
+                col.y += col.speed;
+
+                // Reset when the column falls off screen (bottom or top)
+                var maxY = canvas.height / fontSize + col.trailLen;
+                if (col.speed > 0 && col.y > maxY) {
+                    col.y = Math.random() * -20;
+                    col.speed = 0.4 + Math.random() * 0.6;
+                    col.trailLen = 8 + Math.floor(Math.random() * 20);
+                    col.lastCell = Math.floor(col.y);
+                } else if (col.speed < 0 && col.y < -col.trailLen) {
+                    col.y = canvas.height / fontSize + Math.random() * 20;
+                    col.speed = -(0.4 + Math.random() * 0.6);
+                    col.trailLen = 8 + Math.floor(Math.random() * 20);
+                    col.lastCell = Math.floor(col.y);
+                }
+            }
+        }
+
+        // Run at ~20fps for the classic slow cascade feel (paused while hidden or dimmed)
+        matrixTimerId = BeaconActivity.every(draw, 50);
+
+        // Handle resize — rebuild columns for new width
+        matrixResizeHandler = function() {
+            if (matrixTimerId) {
+                initCanvas();
+                var newNumCols = Math.floor(canvas.width / colWidth);
+                if (newNumCols > numCols) {
+                    // Add new columns for the extra width
+                    var extra = buildColumns(newNumCols - numCols);
+                    columns = columns.concat(extra);
+                } else if (newNumCols < numCols) {
+                    columns.length = newNumCols;
+                }
+                numCols = newNumCols;
+            }
+        };
+        window.addEventListener('resize', matrixResizeHandler);
+
+        // ========================
+        //  MATRIX EASTER EGGS
+        // ========================
+
+        // --- 1. "Wake up, Neo..." Typewriter Quotes ---
+        var matrixQuotes = [
+            'Wake up, Neo...',
+            'Follow the white rabbit',
+            'There is no spoon',
+            'The Matrix has you...',
+            'Knock, knock, Neo.'
+        ];
+
+        function showMatrixQuote() {
+            var quote = matrixQuotes[Math.floor(Math.random() * matrixQuotes.length)];
+            var el = document.createElement('div');
+            el.className = 'matrix-quote';
+            el.textContent = '';
+            document.body.appendChild(el);
+
+            var charIdx = 0;
+            var typeTimer = setInterval(function() {
+                if (charIdx < quote.length) {
+                    el.textContent += quote[charIdx];
+                    charIdx++;
+                } else {
+                    clearInterval(typeTimer);
+                    // Hold for 2s then fade out
+                    setTimeout(function() {
+                        el.classList.add('matrix-quote--fade');
+                        setTimeout(function() { el.remove(); }, 1000);
+                    }, 2000);
+                }
+            }, 80);
+            matrixEasterEggTimers.push(typeTimer);
+        }
+
+        // Trigger every 90-180s
+        function scheduleNextQuote() {
+            var delay = 90000 + Math.random() * 90000;
+            var t = setTimeout(function() {
+                showMatrixQuote();
+                scheduleNextQuote();
+            }, delay);
+            matrixEasterEggTimers.push(t);
+        }
+        scheduleNextQuote();
+
+        // --- 2. Click Cascade ---
+        var matrixCharsPool = '\uff66\uff71\uff72\uff73\uff74\uff75\uff76\uff77\uff78\uff79\uff7a0123456789ABCDEF';
+        var clickOverlay = document.createElement('div');
+        clickOverlay.className = 'matrix-click-overlay';
+        clickOverlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;pointer-events:none;z-index:6;overflow:hidden;';
+        document.body.appendChild(clickOverlay);
+
+        matrixClickHandler = function(e) {
+            var count = 8 + Math.floor(Math.random() * 5); // 8-12
+            for (var i = 0; i < count; i++) {
+                var span = document.createElement('span');
+                span.className = 'matrix-click-char';
+                span.textContent = matrixCharsPool[Math.floor(Math.random() * matrixCharsPool.length)];
+                span.style.left = (e.clientX + (Math.random() - 0.5) * 60) + 'px';
+                span.style.top = (e.clientY + (Math.random() - 0.5) * 20) + 'px';
+                span.style.fontSize = (12 + Math.random() * 10) + 'px';
+                span.style.animationDuration = (0.7 + Math.random() * 0.5) + 's';
+                clickOverlay.appendChild(span);
+                (function(s) {
+                    setTimeout(function() { s.remove(); }, 1200);
+                })(span);
+            }
+        };
+        document.addEventListener('click', matrixClickHandler);
+
+        // --- 4. Cursor Trail ---
+        var trailElements = [];
+        var lastTrailTime = 0;
+
+        matrixMoveHandler = function(e) {
+            var now = Date.now();
+            if (now - lastTrailTime < 60) return; // throttle ~60ms
+            if (trailElements.length >= 15) return; // max 15 trail elements
+            lastTrailTime = now;
+
+            var span = document.createElement('span');
+            span.className = 'matrix-trail-char';
+            span.textContent = matrixCharsPool[Math.floor(Math.random() * matrixCharsPool.length)];
+            span.style.left = e.clientX + 'px';
+            span.style.top = e.clientY + 'px';
+            document.body.appendChild(span);
+            trailElements.push(span);
+
+            setTimeout(function() {
+                span.remove();
+                var idx = trailElements.indexOf(span);
+                if (idx > -1) trailElements.splice(idx, 1);
+            }, 800);
+        };
+        if (!document.documentElement.classList.contains('kiosk-mode')) {
+            document.addEventListener('mousemove', matrixMoveHandler);
+        }
+
+        // --- Konami: "System Failure" ---
+        BeaconEffects.konami = function() {
+            // Phase 1: Green flash (0-200ms) — two pulses
+            var flash = document.createElement('div');
+            flash.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:100010;pointer-events:none;background:#00ff41;opacity:0;';
+            document.body.appendChild(flash);
+
+            // Pulse 1: 0→0.5→0
+            flash.style.transition = 'opacity 0.05s';
+            requestAnimationFrame(function() { flash.style.opacity = '0.5'; });
+            setTimeout(function() { flash.style.opacity = '0'; }, 60);
+            // Pulse 2: 0→0.3→0
+            setTimeout(function() {
+                flash.style.opacity = '0.3';
+                setTimeout(function() {
+                    flash.style.opacity = '0';
+                    setTimeout(function() { flash.remove(); }, 100);
+                }, 60);
+            }, 120);
+
+            // Phase 2: Glitch slice (200-800ms)
+            var content = document.querySelector('.thebeacon-content');
+            if (content) {
+                var glitchSteps = [
+                    { delay: 200, clip: 'inset(20% 0 60% 0)', tx: '8px' },
+                    { delay: 350, clip: 'inset(50% 0 20% 0)', tx: '-12px' },
+                    { delay: 500, clip: 'inset(10% 0 70% 0)', tx: '15px' },
+                    { delay: 650, clip: 'inset(40% 0 30% 0)', tx: '-6px' },
+                ];
+                var origClip = content.style.clipPath || '';
+                var origTransform = content.style.transform || '';
+                glitchSteps.forEach(function(step) {
+                    var t1 = setTimeout(function() {
+                        content.style.clipPath = step.clip;
+                        content.style.transform = 'translateX(' + step.tx + ')';
+                    }, step.delay);
+                    var t2 = setTimeout(function() {
+                        content.style.clipPath = origClip;
+                        content.style.transform = origTransform;
+                    }, step.delay + 100);
+                    matrixEasterEggTimers.push(t1, t2);
+                });
+                var t3 = setTimeout(function() {
+                    content.style.clipPath = origClip;
+                    content.style.transform = origTransform;
+                }, 800);
+                matrixEasterEggTimers.push(t3);
+            }
+
+            // Phase 3: "SYSTEM FAILURE" text (400-2500ms)
+            var failText = document.createElement('div');
+            failText.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:100009;pointer-events:none;display:flex;justify-content:center;align-items:center;opacity:0;transition:opacity 0.3s;';
+            failText.innerHTML = '<div style="font-family:Courier New,monospace;font-size:4rem;color:#00ff41;text-shadow:0 0 30px #00ff41,0 0 60px rgba(0,255,65,0.4);letter-spacing:0.3em;text-align:center;">SYSTEM FAILURE</div>';
+            document.body.appendChild(failText);
+            var t4 = setTimeout(function() { failText.style.opacity = '1'; }, 400);
+            var t5 = setTimeout(function() {
+                failText.style.opacity = '0';
+                setTimeout(function() { failText.remove(); }, 400);
+            }, 2200);
+            matrixEasterEggTimers.push(t4, t5);
+
+            // Phase 4: Rain reversal with x-offset scatter (from 800ms)
+            var t6 = setTimeout(function() {
+                for (var i = 0; i < columns.length; i++) {
+                    columns[i].speed = -(0.4 + Math.random() * 0.6);
+                    // Brief x-offset scatter: shift column position randomly
+                    columns[i].y += (Math.random() - 0.5) * 8;
+                }
+            }, 800);
+            matrixEasterEggTimers.push(t6);
+
+            // Revert rain after 30s
+            var revertTimer = setTimeout(function() {
+                for (var i = 0; i < columns.length; i++) {
+                    columns[i].speed = 0.4 + Math.random() * 0.6;
+                }
+            }, 30000);
+            matrixEasterEggTimers.push(revertTimer);
+        };
+
+        // --- Type "spoon": There Is No Spoon ---
+        function doSpoonOverlay() {
+            var overlay = document.createElement('div');
+            overlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99999;background:rgba(0,0,0,0.85);display:flex;justify-content:center;align-items:center;pointer-events:none;opacity:0;transition:opacity 0.3s;';
+            overlay.innerHTML = '<div style="font-family:Courier New,monospace;font-size:3rem;color:#00ff41;text-shadow:0 0 20px #00ff41,0 0 40px rgba(0,255,65,0.3);text-align:center;line-height:1.6;">There is no spoon</div>';
+            document.body.appendChild(overlay);
+            var spoonAudio = new Audio('/static/audio/there-is-no-spoon.mp3');
+            spoonAudio.play().catch(function() {});
+            requestAnimationFrame(function() { overlay.style.opacity = '1'; });
+            var revertTimer = setTimeout(function() {
+                overlay.style.opacity = '0';
+                setTimeout(function() { overlay.remove(); }, 300);
+            }, 3000);
+            matrixEasterEggTimers.push(revertTimer);
+        }
+
+        var spoonBuffer = '';
+        matrixSpoonHandler = function(e) {
+            spoonBuffer += e.key.toLowerCase();
+            if (spoonBuffer.length > 10) spoonBuffer = spoonBuffer.slice(-10);
+            if (spoonBuffer.indexOf('spoon') !== -1) {
+                spoonBuffer = '';
+                doSpoonOverlay();
+            }
+        };
+        document.addEventListener('keypress', matrixSpoonHandler);
+
+        // --- White Rabbit ---
+        function doWhiteRabbit() {
+            var rabbit = document.createElement('div');
+            rabbit.className = 'matrix-rabbit';
+            rabbit.textContent = '\uD83D\uDC07'; // 🐇
+
+            var goingRight = Math.random() > 0.5;
+            var startX = goingRight ? -60 : window.innerWidth + 60;
+            var endX = goingRight ? window.innerWidth + 60 : -60;
+            var rabbitY = 100 + Math.random() * (window.innerHeight - 200);
+            var crossDuration = 1800 + Math.random() * 1200; // 1.8-3s
+
+            rabbit.style.left = startX + 'px';
+            rabbit.style.top = rabbitY + 'px';
+            rabbit.style.transform = goingRight ? 'scaleX(-1)' : 'scaleX(1)';
+            document.body.appendChild(rabbit);
+
+            var startTime = Date.now();
+
+            function animateRabbit() {
+                var elapsed = Date.now() - startTime;
+                var p = Math.min(elapsed / crossDuration, 1);
+                var x = startX + (endX - startX) * p;
+                rabbit.style.left = x + 'px';
+
+                if (p < 1) {
+                    BeaconActivity.requestFrame(animateRabbit);
+                } else {
+                    rabbit.remove();
+                }
+            }
+            BeaconActivity.requestFrame(animateRabbit);
+        }
+
+        function maybeWhiteRabbit() {
+            if (Math.random() > 0.005) return;
+            doWhiteRabbit();
+        }
+
+        // Expose for debug menu
+        window._debugEasterEggs = window._debugEasterEggs || {};
+        window._debugEasterEggs.whiteRabbit = doWhiteRabbit;
+        window._debugEasterEggs.matrixQuote = showMatrixQuote;
+        window._debugEasterEggs.matrixSpoon = doSpoonOverlay;
+        window._debugEasterEggs.matrixGravity = BeaconEffects.konami;
+
+        // Check every 45-120s
+        function scheduleWhiteRabbit() {
+            var delay = 45000 + Math.random() * 75000;
+            var t = setTimeout(function() {
+                maybeWhiteRabbit();
+                scheduleWhiteRabbit();
+            }, delay);
+            matrixEasterEggTimers.push(t);
+        }
+        scheduleWhiteRabbit();
+    }
+
+    BeaconEffects.define('matrix', { handle: handleMatrixRain });
+})();
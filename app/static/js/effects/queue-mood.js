@@ -0,0 +1,107 @@
+/**
+ * TheBeacon effect: queue mood (zen emojis, persistent "This is Fine" dog).
+ * Loaded on demand by BeaconEffects (static/js/effects.js).
+ */
+(function() {
+    'use strict';
+
+    // ========================
+    //  Zen Garden — floating emojis while in zen state
+    // ========================
+    var _zenEmojiInterval = null;
+
+    function showZenEmojis(show, wrapper) {
+        if (show && wrapper) {
+            if (_zenEmojiInterval) return; // already running
+            var zenEmojis = ['\uD83E\uDDD8', '\u2638\uFE0F', '\uD83C\uDF38', '\u2728', '\uD83C\uDF3F', '\u262F\uFE0F', '\uD83E\uDD4B', '\uD83C\uDF3A']; // 🧘☸️🌸✨🌿☯️🥋🌺
+            wrapper.style.position = 'relative';
+            _zenEmojiInterval = BeaconActivity.every(function() {
+                var emoji = document.createElement('span');
+                emoji.className = 'zen-float-emoji';
+                emoji.textContent = zenEmojis[Math.floor(Math.random() * zenEmojis.length)];
+                emoji.style.fontSize = (14 + Math.random() * 12) + 'px';
+                emoji.style.left = (Math.random() * 100) + '%';
+                emoji.style.bottom = '0';
+                wrapper.appendChild(emoji);
+                setTimeout(function() { emoji.remove(); }, 4500);
+            }, 800);
+        } else {
+            if (_zenEmojiInterval) {
+                BeaconActivity.cancel(_zenEmojiInterval);
+                _zenEmojiInterval = null;
+            }
+        }
+    }
+
+    // ========================
+    //  "This is Fine" Dog — persistent at danger threshold
+    // ========================
+    var _persistentDogEl = null;
+    var _fireParticleInterval = null;
+    var _fireGlowEl = null;
+
+    function showPersistentDog(show) {
+        if (show) {
+            // Create persistent dog if not already present
+            if (!_persistentDogEl) {
+                _persistentDogEl = document.createElement('div');
+                _persistentDogEl.className = 'this-is-fine-persistent';
+                var img = document.createElement('img');
+                img.src = '/static/img/this-is-fine.png';
+                img.alt = 'This is fine';
+                img.className = 'this-is-fine-persistent__img';
+                _persistentDogEl.appendChild(img);
+                document.body.appendChild(_persistentDogEl);
+                // Slide in on next frame
+                requestAnimationFrame(function() {
+                    requestAnimationFrame(function() {
+                        if (_persistentDogEl) _persistentDogEl.classList.add('this-is-fine-persistent--visible');
+                    });
+                });
+            }
+            // Red glow vignette
+            if (!_fireGlowEl) {
+                _fireGlowEl = document.createElement('div');
+                _fireGlowEl.className = 'this-is-fine-glow';
+                document.body.appendChild(_fireGlowEl);
+                requestAnimationFrame(function() {
+                    requestAnimationFrame(function() {
+                        if (_fireGlowEl) _fireGlowEl.classList.add('this-is-fine-glow--visible');
+                    });
+                });
+            }
+            // Start fire particles if not already running
+            if (!_fireParticleInterval) {
+                _fireParticleInterval = BeaconActivity.every(function() {
+                    var flame = document.createElement('div');
+                    flame.className = 'this-is-fine-fire-particle';
+                    flame.textContent = '\uD83D\uDD25'; // 🔥
+                    flame.style.left = (Math.random() * 100) + 'vw';
+                    flame.style.fontSize = (20 + Math.random() * 25) + 'px';
+                    document.body.appendChild(flame);
+                    setTimeout(function() { flame.remove(); }, 3500);
+                }, 400);
+            }
+        } else {
+            // Remove persistent dog, fire particles, and glow
+            if (_persistentDogEl) {
+                _persistentDogEl.classList.remove('this-is-fine-persistent--visible');
+                var el = _persistentDogEl;
+                _persistentDogEl = null;
+                setTimeout(function() { el.remove(); }, 1000);
+            }
+            if (_fireGlowEl) {
+                _fireGlowEl.classList.remove('this-is-fine-glow--visible');
+                var glow = _fireGlowEl;
+                _fireGlowEl = null;
+                setTimeout(function() { glow.remove(); }, 1500);
+            }
+            if (_fireParticleInterval) {
+                BeaconActivity.cancel(_fireParticleInterval);
+                _fireParticleInterval = null;
+            }
+        }
+    }
+
+    BeaconEffects.define('queue-mood', { zen: showZenEmojis, thisIsFine: showPersistentDog });
+})();
@@ -1,5 +1,7 @@
 document.addEventListener('DOMContentLoaded', () => {
     const agentFilter = document.getElementById('agent-filter');
+    // URL prefix of this dashboard ('' or '/<tenant>' in multi-tenant mode)
+    const BASE_PATH = window.BASE_PATH || '';
 
     // --- Notification Sounds (Web Audio API) ---
     let audioCtx = null;
@@ -7,10 +9,11 @@ document.addEventListener('DOMContentLoaded', () => {
         if (!audioCtx) audioCtx = new (window.AudioContext || window.webkitAudioContext)();
     }, { once: true });
 
-    var newTicketAudio = new Audio('/static/audio/new-ticket.mp3');
-    newTicketAudio.preload = 'auto';
+    // Created on first play so page load doesn't fetch the MP3
+    var newTicketAudio = null;
 
     function playNewTicketSound() {
+        if (!newTicketAudio) newTicketAudio = new Audio('/static/audio/new-ticket.mp3');
         newTicketAudio.currentTime = 0;
         newTicketAudio.play().catch(function() {});
     }
@@ -144,6 +147,25 @@ document.addEventListener('DOMContentLoaded', () => {
         return prefix + date.toLocaleString(undefined, Noptions);
     }
 
+    // Relative "5m ago" text computed in the browser, so cached pages and
+    // payloads stay accurate between refreshes. Mirrors _friendly_timedelta().
+    function friendlySince(utcDateString) {
+        if (!utcDateString) return null;
+        let parsable = String(utcDateString).trim().replace(' ', 'T');
+        if (!parsable.endsWith('Z') && !parsable.match(/[+-]\d{2}:\d{2}$/)) parsable += 'Z';
+        const date = new Date(parsable);
+        if (isNaN(date.getTime())) return null;
+        const totalSeconds = Math.floor((Date.now() - date.getTime()) / 1000);
+        if (totalSeconds < 0) return 'Just now';
+        const minutes = Math.floor(totalSeconds / 60);
+        const hours = Math.floor(minutes / 60);
+        const days = Math.floor(hours / 24);
+        if (days > 0) return days <= 30 ? days + 'd ago' : Math.floor(days / 30) + 'mo ago';
+        if (hours > 0) return hours + 'h ago';
+        if (minutes > 0) return minutes + 'm ago';
+        return 'Just now';
+    }
+
     function convertAllUTCToLocal(isoTimestamp) {
         const dashboardTimeLocalEl = document.getElementById('dashboard-generated-time');
         if (dashboardTimeLocalEl && isoTimestamp) {
@@ -166,6 +188,8 @@ document.addEventListener('DOMContentLoaded', () => {
     const _rawTicketUrl = window.TICKET_URL_TEMPLATE || '';
     const TICKET_URL_TEMPLATE = /^https?:\/\//.test(_rawTicketUrl) ? _rawTicketUrl : '';
     const AUTO_REFRESH_INTERVAL_MS = window.AUTO_REFRESH_MS || 0;
+    const CHANGE_POLL_MS = window.CHANGE_POLL_MS || 0;
+    var lastSnapshotVersion = window.SNAPSHOT_VERSION;
     const CURRENT_TICKET_TYPE_SLUG = window.CURRENT_TICKET_TYPE_SLUG || 'helpdesk';
     const THRESHOLDS = window.ALERT_THRESHOLDS || { ghost_town: 30, zen: 40, calm: 50, sweating: 80, warning: 90, danger: 100 };
 
@@ -189,7 +213,7 @@ document.addEventListener('DOMContentLoaded', () => {
         var oldSw = wrapper.querySelector('.sweat-droplet-emoji');
         if (oldSw) oldSw.remove();
         wrapper.querySelectorAll('.zen-float-emoji').forEach(function(e) { e.remove(); });
-        showZenEmojis(false);
+        BeaconEffects.toggle('queue-mood', 'zen', false);
 
         // Apply new state
         if (cls) el.classList.add(cls);
@@ -213,7 +237,7 @@ document.addEventListener('DOMContentLoaded', () => {
             wrapper.appendChild(tw);
         }
         if (cls === 'count-zen') {
-            showZenEmojis(true, wrapper);
+            BeaconEffects.toggle('queue-mood', 'zen', true, wrapper);
         }
         if (cls === 'count-sweating') {
             var sw = document.createElement('span');
@@ -221,7 +245,24 @@ document.addEventListener('DOMContentLoaded', () => {
             sw.textContent = '\uD83D\uDCA6'; // 💦
             wrapper.appendChild(sw);
         }
-        showPersistentDog(!!options.persistentDog);
+        BeaconEffects.toggle('queue-mood', 'thisIsFine', !!options.persistentDog);
+    }
+
+    // Show "Stale since HH:MM" when the server is serving its last good snapshot
+    function updateStaleIndicator(upstream) {
+        var el = document.getElementById('stale-indicator');
+        if (!el) return;
+        if (!upstream || !upstream.stale || !upstream.stale_since_iso) {
+            el.style.display = 'none';
+            el.title = '';
+            return;
+        }
+        var since = new Date(upstream.stale_since_iso);
+        var hh = String(since.getHours()).padStart(2, '0');
+        var mm = String(since.getMinutes()).padStart(2, '0');
+        el.textContent = 'Stale since ' + hh + ':' + mm;
+        el.title = 'SuperOps is unreachable (' + (upstream.state || 'unknown') + '). Showing last good data.';
+        el.style.display = '';
     }
 
     window.currentApiData = {};
@@ -232,7 +273,9 @@ document.addEventListener('DOMContentLoaded', () => {
         's4-item-table': { key: 'updated_at_str', direction: 'desc' }
     };
 
-    function renderItemRow(item, sectionPrefix) {
+    // Row model: the class, tooltip and cell HTML of one ticket row. Rows are
+    // patched by comparing models, so unchanged tickets cost no DOM work.
+    function buildRowModel(item, sectionPrefix) {
         const itemId = escapeHtml(item.id || 'N/A');
         const subjectRaw = item.subject ? item.subject.substring(0, 60) + (item.subject.length > 60 ? '...' : '') : 'No Subject';
         const subjectText = escapeHtml(subjectRaw);
@@ -240,9 +283,8 @@ document.addEventListener('DOMContentLoaded', () => {
         const agentFull = item.agent_name || 'Unassigned';
         const agentName = escapeHtml(agentFull.split(' ')[0]);
         const statusText = escapeHtml(item.status_text || 'Unknown');
-        const slaText = escapeHtml(item.sla_text || 'N/A');
         const slaClass = (item.sla_class || 'sla-none').replace(/[^a-zA-Z0-9_-]/g, '');
-        const updatedFriendly = escapeHtml(item.updated_friendly || 'N/A');
+        const updatedFriendly = escapeHtml(friendlySince(item.updated_at_str) || item.updated_friendly || 'N/A');
         const createdDaysOld = escapeHtml(item.created_days_old || 'N/A');
         const ticketId = escapeHtml(item.ticket_id || '');
 
@@ -258,32 +300,167 @@ document.addEventListener('DOMContentLoaded', () => {
         else if (slaClass === 'sla-critical') rowClass = 'row-sla-critical';
         else if (slaClass === 'sla-warning') rowClass = 'row-sla-warning';
 
-        // Build SLA tooltip for the row
+        // Build SLA tooltip for the row (plain text, set as the title property)
         let rowTitle = '';
         if (slaAtRisk) {
-            let slaTooltip = slaText;
+            rowTitle = item.sla_text || 'N/A';
             if (needsFR && item.fr_due_by_str) {
-                slaTooltip += ' — FR Due: ' + item.fr_due_by_str;
+                rowTitle += ' — FR Due: ' + item.fr_due_by_str;
             } else if (item.type === 'SERVICE_REQUEST' && item.due_by_str && !item.first_responded_at_iso) {
-                slaTooltip += ' — Due: ' + item.due_by_str;
+                rowTitle += ' — Due: ' + item.due_by_str;
+            }
+        }
+
+        const cells = [
+            `<a href="${TICKET_URL_TEMPLATE.replace('{ticket_id}', ticketId)}" target="_blank" class="ticket-id ticket-id--${prioritySlug}">#${itemId}</a>`,
+            subjectText,
+            requesterName,
+            agentName,
+            statusText,
+        ];
+        if (sectionPrefix === 's1') {
+            cells.push(needsFR ? escapeHtml(formatToLocal(item.fr_due_by_str, {}, false, '')) : (item.first_responded_at_iso ? 'Responded' : 'N/A'));
+        }
+        cells.push(updatedFriendly, createdDaysOld);
+
+        return { key: String(item.ticket_id || item.id), className: rowClass, title: rowTitle, cells: cells };
+    }
+
+    function createRow(model) {
+        const tr = document.createElement('tr');
+        tr._cells = [];
+        model.cells.forEach(function() {
+            tr._cells.push(tr.appendChild(document.createElement('td')));
+        });
+        return tr;
+    }
+
+    // Apply a row model, touching only the attributes and cells that differ
+    function patchRow(tr, model) {
+        const previous = tr._model;
+        if (previous === model) return;
+        if (!previous || previous.className !== model.className) tr.className = model.className;
+        if (!previous || previous.title !== model.title) tr.title = model.title;
+        for (let i = 0; i < model.cells.length; i++) {
+            if (!previous || previous.cells[i] !== model.cells[i]) tr._cells[i].innerHTML = model.cells[i];
+        }
+        tr._model = model;
+    }
+
+    // --- Section rendering: keyed rows, virtualized when taller than the viewport ---
+    const VIRTUAL_OVERSCAN_ROWS = 10;
+    const sectionViews = {}; // section prefix → { rows: Map(key → tr), models, rowHeight, spacers }
+
+    function getSectionView(sectionIdPrefix, tableBody) {
+        let view = sectionViews[sectionIdPrefix];
+        if (!view) {
+            view = sectionViews[sectionIdPrefix] = { tableBody: tableBody, rows: new Map(), models: [], rowHeight: 0, topSpacer: null, bottomSpacer: null };
+        }
+        return view;
+    }
+
+    function createSpacer(tableBody) {
+        const tr = document.createElement('tr');
+        tr.className = 'virtual-spacer';
+        tr.setAttribute('aria-hidden', 'true');
+        const td = document.createElement('td');
+        const table = tableBody.closest('table');
+        td.colSpan = table ? table.querySelectorAll('thead th').length || 1 : 1;
+        tr.appendChild(td);
+        return tr;
+    }
+
+    function setSpacerHeight(spacer, height) {
+        const value = height + 'px';
+        if (spacer.style.height !== value) spacer.style.height = value;
+    }
+
+    // The slice of models to keep in the DOM: all of them, or the rows near the
+    // viewport when the section is taller than the window
+    function visibleRange(view) {
+        const total = view.models.length;
+        if (!view.rowHeight || total * view.rowHeight <= window.innerHeight) {
+            return [0, total];
+        }
+        const top = view.tableBody.getBoundingClientRect().top;
+        const first = Math.floor(-top / view.rowHeight) - VIRTUAL_OVERSCAN_ROWS;
+        const last = Math.ceil((window.innerHeight - top) / view.rowHeight) + VIRTUAL_OVERSCAN_ROWS;
+        return [Math.max(0, Math.min(total, first)), Math.max(0, Math.min(total, last))];
+    }
+
+    function renderSectionRows(view) {
+        const tableBody = view.tableBody;
+        const range = visibleRange(view);
+        const virtual = range[0] > 0 || range[1] < view.models.length;
+        if (virtual && !view.topSpacer) {
+            view.topSpacer = createSpacer(tableBody);
+            view.bottomSpacer = createSpacer(tableBody);
+        }
+        if (view.topSpacer) {
+            if (tableBody.firstChild !== view.topSpacer) tableBody.insertBefore(view.topSpacer, tableBody.firstChild);
+            setSpacerHeight(view.topSpacer, range[0] * view.rowHeight);
+        }
+
+        // Walk the wanted rows in order, reusing existing rows by ticket key and
+        // moving a row only when it is not already in place
+        const wanted = new Set();
+        let cursor = view.topSpacer ? view.topSpacer.nextSibling : tableBody.firstChild;
+        for (let i = range[0]; i < range[1]; i++) {
+            const model = view.models[i];
+            let tr = view.rows.get(model.key);
+            if (!tr || tr._cells.length !== model.cells.length) {
+                if (tr) tr.remove();
+                tr = createRow(model);
+                view.rows.set(model.key, tr);
+            }
+            patchRow(tr, model);
+            wanted.add(model.key);
+            if (tr === cursor) {
+                cursor = cursor.nextSibling;
+            } else {
+                tableBody.insertBefore(tr, cursor);
+            }
+        }
+        view.rows.forEach(function(tr, key) {
+            if (!wanted.has(key)) {
+                tr.remove();
+                view.rows.delete(key);
             }
-            rowTitle = ` title="${escapeHtml(slaTooltip)}"`;
+        });
+
+        if (view.bottomSpacer) {
+            if (tableBody.lastChild !== view.bottomSpacer) tableBody.appendChild(view.bottomSpacer);
+            setSpacerHeight(view.bottomSpacer, (view.models.length - range[1]) * view.rowHeight);
         }
 
-        const rowAttrs = (rowClass ? ` class="${rowClass}"` : '') + rowTitle;
+        // Measure once per layout; rows vary a little, so use the average
+        if (!view.rowHeight && view.rows.size > 0) {
+            const firstRow = view.rows.get(view.models[range[0]].key);
+            const lastRow = view.rows.get(view.models[range[1] - 1].key);
+            const height = lastRow.getBoundingClientRect().bottom - firstRow.getBoundingClientRect().top;
+            if (height > 0) {
+                view.rowHeight = height / (range[1] - range[0]);
+                if (view.models.length * view.rowHeight > window.innerHeight) renderSectionRows(view);
+            }
+        }
+    }
 
-        return `
-        <tr${rowAttrs}>
-            <td><a href="${TICKET_URL_TEMPLATE.replace('{ticket_id}', ticketId)}" target="_blank" class="ticket-id ticket-id--${prioritySlug}">#${itemId}</a></td>
-            <td>${subjectText}</td>
-            <td>${requesterName}</td>
-            <td>${agentName}</td>
-            <td>${statusText}</td>${sectionPrefix === 's1' ? `
-            <td>${needsFR ? formatToLocal(item.fr_due_by_str, {}, false, '') : (item.first_responded_at_iso ? 'Responded' : 'N/A')}</td>` : ''}
-            <td>${updatedFriendly}</td>
-            <td>${createdDaysOld}</td>
-        </tr>`;
+    let virtualFrame = null;
+    function scheduleVirtualRender(remeasure) {
+        if (remeasure) {
+            Object.keys(sectionViews).forEach(function(prefix) { sectionViews[prefix].rowHeight = 0; });
+        }
+        if (virtualFrame) return;
+        virtualFrame = requestAnimationFrame(function() {
+            virtualFrame = null;
+            Object.keys(sectionViews).forEach(function(prefix) {
+                const view = sectionViews[prefix];
+                if (view.models.length && (view.topSpacer || !view.rowHeight)) renderSectionRows(view);
+            });
+        });
     }
+    window.addEventListener('scroll', function() { scheduleVirtualRender(false); }, { passive: true });
+    window.addEventListener('resize', function() { scheduleVirtualRender(true); });
 
     function updateItemSection(sectionIdPrefix, items) {
         const tableBody = document.getElementById(`${sectionIdPrefix}-items-body`);
@@ -295,23 +472,32 @@ document.addEventListener('DOMContentLoaded', () => {
 
         if (!tableBody || !noItemsMessageElement || !sectionItemCountElement) return;
 
-        sectionItemCountElement.textContent = items.length;
+        const countText = String(items.length);
+        if (sectionItemCountElement.textContent !== countText) sectionItemCountElement.textContent = countText;
+
+        const view = getSectionView(sectionIdPrefix, tableBody);
+        view.models = items.map(item => buildRowModel(item, sectionIdPrefix));
 
         if (items && items.length > 0) {
-            const html = items.map(item => renderItemRow(item, sectionIdPrefix)).join('');
-            tableBody.innerHTML = html;
-            noItemsMessageElement.style.display = 'none';
-            if (tableWrapper) tableWrapper.style.display = '';
+            renderSectionRows(view);
+            if (noItemsMessageElement.style.display !== 'none') noItemsMessageElement.style.display = 'none';
+            if (tableWrapper && tableWrapper.style.display) tableWrapper.style.display = '';
             // Expand section
             if (cardBody && cardBody.classList.contains('card__body--collapsed')) {
                 cardBody.classList.remove('card__body--collapsed');
                 cardBody.style.height = cardBody.scrollHeight + 'px';
                 setTimeout(function() { cardBody.style.height = ''; }, 300);
+                view.rowHeight = 0;
+                scheduleVirtualRender(false);
             }
         } else {
-            tableBody.innerHTML = '';
-            noItemsMessageElement.style.display = 'none';
-            if (tableWrapper) tableWrapper.style.display = 'none';
+            if (view.rows.size) {
+                tableBody.textContent = '';
+                view.rows.clear();
+                view.topSpacer = view.bottomSpacer = null;
+            }
+            if (noItemsMessageElement.style.display !== 'none') noItemsMessageElement.style.display = 'none';
+            if (tableWrapper && tableWrapper.style.display !== 'none') tableWrapper.style.display = 'none';
             // Collapse section
             if (cardBody && !cardBody.classList.contains('card__body--collapsed')) {
                 cardBody.style.height = cardBody.scrollHeight + 'px';
@@ -370,22 +556,26 @@ document.addEventListener('DOMContentLoaded', () => {
         // Update monthly averages
         var avgResponseEl = document.getElementById('avg-response-mins');
         var avgCloseEl = document.getElementById('avg-close-hours');
+        var p90ResponseEl = document.getElementById('p90-response-mins');
         if (avgResponseEl) {
             avgResponseEl.textContent = data.avg_response_mins || 'N/A';
         }
+        if (p90ResponseEl) {
+            p90ResponseEl.textContent = data.p90_response_mins || 'N/A';
+        }
         if (avgCloseEl) {
             avgCloseEl.textContent = data.avg_close_hours || 'N/A';
         }
 
-        let s1Data = data.s1_items || [];
-        let s2Data = data.s2_items || [];
-        let s3Data = data.s3_items || [];
-        let s4Data = data.s4_items || [];
+        const s1Data = data.s1_items || [];
+        const s2Data = data.s2_items || [];
+        const s3Data = data.s3_items || [];
+        const s4Data = data.s4_items || [];
 
-        if (sortState['s1-item-table'].key) s1Data = sortData([...s1Data], sortState['s1-item-table'].key, sortState['s1-item-table'].direction);
-        if (sortState['s2-item-table'].key) s2Data = sortData([...s2Data], sortState['s2-item-table'].key, sortState['s2-item-table'].direction);
-        if (sortState['s3-item-table'].key) s3Data = sortData([...s3Data], sortState['s3-item-table'].key, sortState['s3-item-table'].direction);
-        if (sortState['s4-item-table'].key) s4Data = sortData([...s4Data], sortState['s4-item-table'].key, sortState['s4-item-table'].direction);
+        if (sortState['s1-item-table'].key) sortData(s1Data, sortState['s1-item-table'].key, sortState['s1-item-table'].direction);
+        if (sortState['s2-item-table'].key) sortData(s2Data, sortState['s2-item-table'].key, sortState['s2-item-table'].direction);
+        if (sortState['s3-item-table'].key) sortData(s3Data, sortState['s3-item-table'].key, sortState['s3-item-table'].direction);
+        if (sortState['s4-item-table'].key) sortData(s4Data, sortState['s4-item-table'].key, sortState['s4-item-table'].direction);
 
         updateItemSection('s1', s1Data);
         updateItemSection('s2', s2Data);
@@ -396,6 +586,7 @@ document.addEventListener('DOMContentLoaded', () => {
         if (data.dashboard_generated_time_iso) {
             convertAllUTCToLocal(data.dashboard_generated_time_iso);
         }
+        updateStaleIndicator(data.upstream);
 
     }
 
@@ -404,7 +595,7 @@ document.addEventListener('DOMContentLoaded', () => {
         const apiErrorMessage = document.getElementById('api-error-message');
 
         try {
-            const url = new URL(`/api/tickets/${CURRENT_TICKET_TYPE_SLUG}`, window.location.origin);
+            const url = new URL(`${BASE_PATH}/api/tickets/${CURRENT_TICKET_TYPE_SLUG}`, window.location.origin);
             const selectedAgentId = (agentFilter && agentFilter.value) || new URLSearchParams(window.location.search).get('agent_id');
             if (selectedAgentId) {
                 url.searchParams.set('agent_id', selectedAgentId);
@@ -422,6 +613,9 @@ document.addEventListener('DOMContentLoaded', () => {
                 return;
             }
             const data = await response.json();
+            if (data.snapshot_version != null) {
+                lastSnapshotVersion = data.snapshot_version;
+            }
 
             // Handle API-level errors
             if (data.error) {
@@ -523,20 +717,26 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // Sorts dataArray in place. Sort values are computed once per item rather
+    // than per comparison (dates are parsed up front).
     function sortData(dataArray, key, direction) {
         if (!dataArray) return [];
+        const isDate = key.endsWith('_at_str') || key.endsWith('_by_str');
+        const sign = direction === 'asc' ? 1 : -1;
+        const values = new Map();
+        dataArray.forEach(item => {
+            const value = item[key];
+            values.set(item, value == null ? null : (isDate ? new Date(value).getTime() : value));
+        });
         dataArray.sort((a, b) => {
-            let valA = a[key];
-            let valB = b[key];
+            const valA = values.get(a);
+            const valB = values.get(b);
             if (valA == null) return 1;
             if (valB == null) return -1;
-            if (key.endsWith('_at_str') || key.endsWith('_by_str')) {
-                return direction === 'asc' ? new Date(valA) - new Date(valB) : new Date(valB) - new Date(valA);
-            } else if (typeof valA === 'number') {
-                return direction === 'asc' ? valA - valB : valB - valA;
-            } else {
-                return direction === 'asc' ? String(valA).localeCompare(String(valB)) : String(valB).localeCompare(String(valA));
+            if (typeof valA === 'number') {
+                return sign * (valA - valB);
             }
+            return sign * String(valA).localeCompare(String(valB));
         });
         return dataArray;
     }
@@ -571,7 +771,6 @@ document.addEventListener('DOMContentLoaded', () => {
             let currentDataForTable = window.currentApiData[`${sectionPrefix}_items`];
             if (!currentDataForTable) return;
 
-            let dataToSort = [...currentDataForTable];
 
             if (sortState[tableId].key === sortKey) {
                 sortState[tableId].direction = sortState[tableId].direction === 'asc' ? 'desc' : 'asc';
@@ -580,8 +779,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 sortState[tableId].direction = 'asc';
             }
 
-            const sortedData = sortData(dataToSort, sortKey, sortState[tableId].direction);
-            updateItemSection(sectionPrefix, sortedData);
+            updateItemSection(sectionPrefix, sortData(currentDataForTable, sortKey, sortState[tableId].direction));
             updateSortIndicators(tableElement, sortKey, sortState[tableId].direction);
             convertAllUTCToLocal();
         });
@@ -601,18 +799,61 @@ document.addEventListener('DOMContentLoaded', () => {
         setTimeout(refreshTicketData, 100);
     }
 
-    // Periodic auto-refresh synced to the clock (fires at the top of each minute)
+    // Periodic auto-refresh synced to the clock (fires at the top of each minute).
+    // While dimmed it slows to auto_dim.dimmed_refresh_interval_seconds; while
+    // the tab is hidden it skips refreshes and catches up when shown.
+    var DIMMED_REFRESH_MS = ((window.AUTO_DIM || {}).dimmed_refresh_interval_seconds || 300) * 1000;
+    var lastAutoRefresh = Date.now();
     function scheduleRefresh() {
         if (AUTO_REFRESH_INTERVAL_MS <= 0) return;
+        var interval = BeaconActivity.isDimmed() ? Math.max(AUTO_REFRESH_INTERVAL_MS, DIMMED_REFRESH_MS) : AUTO_REFRESH_INTERVAL_MS;
         var now = Date.now();
-        var msUntilNextMinute = AUTO_REFRESH_INTERVAL_MS - (now % AUTO_REFRESH_INTERVAL_MS);
+        var msUntilNext = interval - (now % interval);
         setTimeout(async function() {
-            await refreshTicketData();
+            if (!document.hidden) {
+                lastAutoRefresh = Date.now();
+                await refreshTicketData();
+            }
             scheduleRefresh();
-        }, msUntilNextMinute);
+        }, msUntilNext);
     }
     scheduleRefresh();
 
+    BeaconActivity.onChange(function(active) {
+        if (active && AUTO_REFRESH_INTERVAL_MS > 0 && Date.now() - lastAutoRefresh > AUTO_REFRESH_INTERVAL_MS) {
+            lastAutoRefresh = Date.now();
+            refreshTicketData();
+        }
+    });
+
+    // Webhook mode: watch the snapshot version and refresh as soon as it changes
+    function pollSnapshotVersion() {
+        if (CHANGE_POLL_MS <= 0) return;
+        setTimeout(async function() {
+            // Hidden or dimmed pages rely on the (slower) auto-refresh instead
+            if (!BeaconActivity.isActive()) {
+                pollSnapshotVersion();
+                return;
+            }
+            try {
+                const response = await fetch(`${BASE_PATH}/api/snapshot`, { credentials: 'same-origin', signal: AbortSignal.timeout(10000) });
+                if (response.ok) {
+                    const snapshot = await response.json();
+                    if (lastSnapshotVersion == null) {
+                        lastSnapshotVersion = snapshot.version;
+                    } else if (snapshot.version !== lastSnapshotVersion) {
+                        // refreshTicketData records the version it rendered
+                        await refreshTicketData();
+                    }
+                }
+            } catch (e) {
+                console.warn('Snapshot version check failed:', e);
+            }
+            pollSnapshotVersion();
+        }, CHANGE_POLL_MS);
+    }
+    pollSnapshotVersion();
+
     // Manual refresh button
     var manualRefreshBtn = document.getElementById('manual-refresh-btn');
     if (manualRefreshBtn) {
@@ -627,104 +868,6 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
 
-    // ========================
-    //  Zen Garden — floating emojis while in zen state
-    // ========================
-    var _zenEmojiInterval = null;
-
-    function showZenEmojis(show, wrapper) {
-        if (show && wrapper) {
-            if (_zenEmojiInterval) return; // already running
-            var zenEmojis = ['\uD83E\uDDD8', '\u2638\uFE0F', '\uD83C\uDF38', '\u2728', '\uD83C\uDF3F', '\u262F\uFE0F', '\uD83E\uDD4B', '\uD83C\uDF3A']; // 🧘☸️🌸✨🌿☯️🥋🌺
-            wrapper.style.position = 'relative';
-            _zenEmojiInterval = setInterval(function() {
-                var emoji = document.createElement('span');
-                emoji.className = 'zen-float-emoji';
-                emoji.textContent = zenEmojis[Math.floor(Math.random() * zenEmojis.length)];
-                emoji.style.fontSize = (14 + Math.random() * 12) + 'px';
-                emoji.style.left = (Math.random() * 100) + '%';
-                emoji.style.bottom = '0';
-                wrapper.appendChild(emoji);
-                setTimeout(function() { emoji.remove(); }, 4500);
-            }, 800);
-        } else {
-            if (_zenEmojiInterval) {
-                clearInterval(_zenEmojiInterval);
-                _zenEmojiInterval = null;
-            }
-        }
-    }
-
-    // ========================
-    //  "This is Fine" Dog — persistent at danger threshold
-    // ========================
-    var _persistentDogEl = null;
-    var _fireParticleInterval = null;
-    var _fireGlowEl = null;
-
-    function showPersistentDog(show) {
-        if (show) {
-            // Create persistent dog if not already present
-            if (!_persistentDogEl) {
-                _persistentDogEl = document.createElement('div');
-                _persistentDogEl.className = 'this-is-fine-persistent';
-                var img = document.createElement('img');
-                img.src = '/static/img/this-is-fine.png';
-                img.alt = 'This is fine';
-                img.className = 'this-is-fine-persistent__img';
-                _persistentDogEl.appendChild(img);
-                document.body.appendChild(_persistentDogEl);
-                // Slide in on next frame
-                requestAnimationFrame(function() {
-                    requestAnimationFrame(function() {
-                        if (_persistentDogEl) _persistentDogEl.classList.add('this-is-fine-persistent--visible');
-                    });
-                });
-            }
-            // Red glow vignette
-            if (!_fireGlowEl) {
-                _fireGlowEl = document.createElement('div');
-                _fireGlowEl.className = 'this-is-fine-glow';
-                document.body.appendChild(_fireGlowEl);
-                requestAnimationFrame(function() {
-                    requestAnimationFrame(function() {
-                        if (_fireGlowEl) _fireGlowEl.classList.add('this-is-fine-glow--visible');
-                    });
-                });
-            }
-            // Start fire particles if not already running
-            if (!_fireParticleInterval) {
-                _fireParticleInterval = setInterval(function() {
-                    var flame = document.createElement('div');
-                    flame.className = 'this-is-fine-fire-particle';
-                    flame.textContent = '\uD83D\uDD25'; // 🔥
-                    flame.style.left = (Math.random() * 100) + 'vw';
-                    flame.style.fontSize = (20 + Math.random() * 25) + 'px';
-                    document.body.appendChild(flame);
-                    setTimeout(function() { flame.remove(); }, 3500);
-                }, 400);
-            }
-        } else {
-            // Remove persistent dog, fire particles, and glow
-            if (_persistentDogEl) {
-                _persistentDogEl.classList.remove('this-is-fine-persistent--visible');
-                var el = _persistentDogEl;
-                _persistentDogEl = null;
-                setTimeout(function() { el.remove(); }, 1000);
-            }
-            if (_fireGlowEl) {
-                _fireGlowEl.classList.remove('this-is-fine-glow--visible');
-                var glow = _fireGlowEl;
-                _fireGlowEl = null;
-                setTimeout(function() { glow.remove(); }, 1500);
-            }
-            if (_fireParticleInterval) {
-                clearInterval(_fireParticleInterval);
-                _fireParticleInterval = null;
-            }
-        }
-    }
-
     // ========================
     //  TIME-BASED EASTER EGGS
     // ========================
@@ -743,137 +886,20 @@ document.addEventListener('DOMContentLoaded', () => {
         // 4:04 PM — "Tickets Not Found"
         if (hour === 16 && minute === 4) {
             _lastTimeEventMinute = currentMinuteKey;
-            show404Event();
+            BeaconEffects.call('events', 'show404');
         }
 
         // 4:20 PM — Leaf rain
         if (hour === 16 && minute === 20) {
             _lastTimeEventMinute = currentMinuteKey;
-            show420Event();
+            BeaconEffects.call('events', 'show420');
         }
 
         // 5:00 PM — Beer o'clock
         if (hour === 17 && minute === 0) {
             _lastTimeEventMinute = currentMinuteKey;
-            showBeerEvent();
-        }
-    }
-
-    function show404Event() {
-        var overlay = document.createElement('div');
-        overlay.className = 'event-404';
-        overlay.innerHTML =
-            '<div class="event-404-content">' +
-                '<div class="event-404-dino">\uD83E\uDD96</div>' +
-                '<div class="event-404-heading">Tickets Not Found</div>' +
-                '<div class="event-404-sub">The ticket you are looking for might have been resolved, had its name changed, or is temporarily unavailable.</div>' +
-                '<div class="event-404-code">ERR_TICKETS_NOT_FOUND</div>' +
-            '</div>';
-        document.body.appendChild(overlay);
-
-        // Dismiss on click or key press
-        var dismissed = false;
-        function dismiss() {
-            if (dismissed) return;
-            dismissed = true;
-            overlay.classList.add('event-404--fade-out');
-            setTimeout(function() { overlay.remove(); }, 500);
-            overlay.removeEventListener('click', dismiss);
-            document.removeEventListener('keydown', dismiss);
-        }
-        overlay.style.pointerEvents = 'auto';
-        overlay.addEventListener('click', dismiss);
-        document.addEventListener('keydown', dismiss);
-
-        // Auto-dismiss after 10s
-        setTimeout(dismiss, 10000);
-    }
-
-    function show420Event() {
-        // Haze overlay — layered translucent smoke filling the screen
-        var hazeOverlay = document.createElement('div');
-        hazeOverlay.className = 'event-420-haze';
-        document.body.appendChild(hazeOverlay);
-
-        // Continuous falling leaves for the full minute
-        var leafEmojis = ['\uD83C\uDF3F', '\uD83C\uDF43', '\u2618\uFE0F']; // 🌿🍃☘️
-        var leafInterval = setInterval(function() {
-            var leaf = document.createElement('div');
-            leaf.className = 'event-420-leaf';
-            leaf.textContent = leafEmojis[Math.floor(Math.random() * leafEmojis.length)];
-            leaf.style.left = (Math.random() * 100) + 'vw';
-            leaf.style.animationDuration = (4 + Math.random() * 3) + 's';
-            document.body.appendChild(leaf);
-            setTimeout(function() { leaf.remove(); }, 8000);
-        }, 300);
-
-        // Continuous wispy smoke puffs rising
-        var smokeContainer = document.createElement('div');
-        smokeContainer.className = 'event-420-smoke-container';
-        document.body.appendChild(smokeContainer);
-
-        var smokeInterval = setInterval(function() {
-            var puff = document.createElement('div');
-            puff.className = 'event-420-puff';
-            puff.style.left = (10 + Math.random() * 80) + 'vw';
-            puff.style.animationDuration = (6 + Math.random() * 5) + 's';
-            var size = 120 + Math.random() * 200;
-            puff.style.width = size + 'px';
-            puff.style.height = (size * 0.6) + 'px';
-            smokeContainer.appendChild(puff);
-            setTimeout(function() { puff.remove(); }, 12000);
-        }, 250);
-
-        // Badge
-        var badge = document.createElement('div');
-        badge.className = 'event-420-badge';
-        badge.textContent = '4:20';
-        document.body.appendChild(badge);
-
-        // Dismiss after 60s (full minute)
-        setTimeout(function() {
-            clearInterval(leafInterval);
-            clearInterval(smokeInterval);
-            hazeOverlay.classList.add('event-420-haze--fade-out');
-            smokeContainer.classList.add('event-420-smoke-container--fade-out');
-            badge.classList.add('event-420-badge--fade-out');
-            setTimeout(function() {
-                hazeOverlay.remove();
-                smokeContainer.remove();
-                badge.remove();
-            }, 2000);
-        }, 60000);
-    }
-
-    function showBeerEvent() {
-        var overlay = document.createElement('div');
-        overlay.className = 'event-beer';
-        overlay.innerHTML =
-            '<div class="event-beer-emoji">\uD83C\uDF7A</div>' +
-            '<div class="event-beer-title">It\'s 5 o\'clock somewhere!</div>' +
-            '<div class="event-beer-subtitle">Go home.</div>';
-        document.body.appendChild(overlay);
-
-        // Falling confetti
-        var confettiEmojis = ['\uD83C\uDF7A', '\uD83C\uDF7B', '\uD83E\uDD42', '\uD83C\uDF89']; // 🍺🍻🥂🎉
-        for (var i = 0; i < 12; i++) {
-            (function(idx) {
-                setTimeout(function() {
-                    var c = document.createElement('div');
-                    c.className = 'event-beer-confetti';
-                    c.textContent = confettiEmojis[idx % confettiEmojis.length];
-                    c.style.left = (Math.random() * 100) + 'vw';
-                    c.style.animationDuration = (4 + Math.random() * 2) + 's';
-                    document.body.appendChild(c);
-                    setTimeout(function() { c.remove(); }, 7000);
-                }, idx * 250);
-            })(i);
+            BeaconEffects.call('events', 'showBeer');
         }
-
-        setTimeout(function() {
-            overlay.classList.add('event-beer--fade-out');
-            setTimeout(function() { overlay.remove(); }, 500);
-        }, 7000);
     }
 
     // Schedule next time-based event instead of polling every 15s
@@ -908,9 +934,9 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Expose forced triggers for debug menu
     window._debugEasterEggs = window._debugEasterEggs || {};
-    window._debugEasterEggs.event404 = show404Event;
-    window._debugEasterEggs.event420 = show420Event;
-    window._debugEasterEggs.eventBeer = showBeerEvent;
+    window._debugEasterEggs.event404 = function() { BeaconEffects.call('events', 'show404'); };
+    window._debugEasterEggs.event420 = function() { BeaconEffects.call('events', 'show420'); };
+    window._debugEasterEggs.eventBeer = function() { BeaconEffects.call('events', 'showBeer'); };
 
     // Debug: preview threshold visual states — delegates to shared applyCountState
     window._debugEasterEggs.stateGhostTown = function() { applyCountState('count-ghost-town'); };
@@ -964,6 +990,8 @@ document.addEventListener('DOMContentLoaded', () => {
 
         function setDim(on) {
             dimOverlay.style.opacity = on ? String((100 - brightnessPct) / 100) : '0';
+            // Pauses animations and particle spawners, and slows auto-refresh
+            BeaconActivity.setDimmed(on);
         }
 
         function updateDim() {
@@ -1,7 +1,8 @@
 /**
  * TheBeacon Theme System
  * Handles dark/light toggle, color theme picker, sidebar collapse,
- * and Easter egg animations (matrix rain, flying bees).
+ * and switching Easter egg themes, whose animations (matrix rain, flying
+ * bees, sakura) load on demand from static/js/effects/.
  */
 (function() {
     'use strict';
@@ -13,19 +14,6 @@
         easterEggsUnlocked: 'thebeacon-easter-eggs-unlocked',
     };
 
-    function playBeeSwarmBuzz() {
-        var audio = new Audio('/static/audio/bee-swarm.mp3');
-        var playCount = 0;
-        audio.addEventListener('ended', function() {
-            playCount++;
-            if (playCount < 3) {
-                audio.currentTime = 0;
-                audio.play().catch(function() {});
-            }
-        });
-        audio.play().catch(function() {});
-    }
-
     // --- Easter Egg Unlock (tap title 69 times) ---
     (function() {
         var picker = document.getElementById('color-theme-picker');
@@ -107,7 +95,6 @@
     })();
 
     // --- Konami Code Listener ---
-    var konamiCallback = null;
     (function() {
         var konamiSeq = ['ArrowUp','ArrowUp','ArrowDown','ArrowDown','ArrowLeft','ArrowRight','ArrowLeft','ArrowRight','b','a'];
         var konamiPos = 0;
@@ -116,12 +103,11 @@
                 konamiPos++;
                 if (konamiPos === konamiSeq.length) {
                     konamiPos = 0;
-                    if (konamiCallback) {
-                        konamiCallback();
+                    if (BeaconEffects.konami) {
+                        BeaconEffects.konami();
                     } else {
                         // Default/non-themed: randomly pick from pool
-                        var defaultKonamis = [triggerBSOD, triggerRetro, triggerNyanCat, triggerAlertCascade];
-                        defaultKonamis[Math.floor(Math.random() * defaultKonamis.length)]();
+                        BeaconEffects.call('konami', 'random');
                     }
                 }
             } else {
@@ -130,439 +116,6 @@
         });
     })();
 
-    // --- Retro CRT Mode (default Konami option) ---
-    function triggerRetro() {
-        var crtTimers = [];
-        var crtIntervals = [];
-
-        // === Phase 1: Power-on line (0-600ms) ===
-        var powerLine = document.createElement('div');
-        powerLine.style.cssText = 'position:fixed;top:50%;left:0;width:100%;height:2px;z-index:100000;pointer-events:none;background:white;box-shadow:0 0 30px 10px rgba(255,255,255,0.8);transform:translateY(-50%);transition:height 0.3s ease-out, opacity 0.2s;';
-        document.body.appendChild(powerLine);
-
-        // White flash overlay
-        var flashOverlay = document.createElement('div');
-        flashOverlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99999;pointer-events:none;background:white;opacity:0;transition:opacity 0.15s;';
-        document.body.appendChild(flashOverlay);
-
-        // Expand line + flash at 200ms
-        crtTimers.push(setTimeout(function() {
-            powerLine.style.height = '100vh';
-            flashOverlay.style.opacity = '0.7';
-        }, 200));
-
-        // Fade flash, remove power-on elements at 600ms
-        crtTimers.push(setTimeout(function() {
-            flashOverlay.style.opacity = '0';
-            powerLine.style.opacity = '0';
-            setTimeout(function() {
-                powerLine.remove();
-                flashOverlay.remove();
-            }, 200);
-        }, 500));
-
-        // === Phase 2: CRT effect (from 600ms, lasts ~9.4s) ===
-        // Heavy scanlines
-        var overlay = document.createElement('div');
-        overlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99998;pointer-events:none;opacity:0;transition:opacity 0.3s;';
-        overlay.style.background = 'repeating-linear-gradient(0deg, rgba(0,255,65,0.15) 0px, rgba(0,255,65,0.15) 2px, transparent 2px, transparent 5px)';
-        document.body.appendChild(overlay);
-
-        // Strong green tint
-        var tint = document.createElement('div');
-        tint.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99997;pointer-events:none;background:rgba(0,255,65,0.12);opacity:0;transition:opacity 0.3s;mix-blend-mode:overlay;';
-        document.body.appendChild(tint);
-
-        // Content styling: curvature + phosphor glow + desaturation
-        var content = document.querySelector('.thebeacon-content');
-        var origStyles = {};
-        if (content) {
-            origStyles.filter = content.style.filter || '';
-            origStyles.borderRadius = content.style.borderRadius || '';
-            origStyles.overflow = content.style.overflow || '';
-            origStyles.boxShadow = content.style.boxShadow || '';
-            origStyles.transition = content.style.transition || '';
-            origStyles.transform = content.style.transform || '';
-        }
-
-        crtTimers.push(setTimeout(function() {
-            overlay.style.opacity = '1';
-            tint.style.opacity = '1';
-            if (content) {
-                content.style.transition = 'all 0.3s';
-                content.style.filter = 'saturate(0) brightness(1.1) contrast(1.2)';
-                content.style.borderRadius = '12px';
-                content.style.overflow = 'hidden';
-                content.style.boxShadow = 'inset 0 0 60px rgba(0,255,65,0.15), inset 0 0 120px rgba(0,255,65,0.05)';
-            }
-        }, 600));
-
-        // Aggressive flicker: scanline opacity varies 0.08-0.20
-        var flickerTimer = setInterval(function() {
-            var intensity = 0.08 + Math.random() * 0.12;
-            overlay.style.background = 'repeating-linear-gradient(0deg, rgba(0,255,65,' + intensity + ') 0px, rgba(0,255,65,' + intensity + ') 2px, transparent 2px, transparent 5px)';
-        }, 150);
-        crtIntervals.push(flickerTimer);
-
-        // Horizontal jitter: every 2-4s, content shifts 2-4px for 100ms
-        var jitterTimer = setInterval(function() {
-            if (!content) return;
-            var shift = (2 + Math.random() * 2) * (Math.random() > 0.5 ? 1 : -1);
-            content.style.transform = 'translateX(' + shift + 'px)';
-            setTimeout(function() {
-                if (content) content.style.transform = '';
-            }, 100);
-        }, 2000 + Math.random() * 2000);
-        crtIntervals.push(jitterTimer);
-
-        // Static bursts: every 3-6s, random-height white-noise band for 80ms
-        var staticBurst = document.createElement('div');
-        staticBurst.style.cssText = 'position:fixed;left:0;width:100%;z-index:99999;pointer-events:none;opacity:0;';
-        document.body.appendChild(staticBurst);
-
-        var staticTimer = setInterval(function() {
-            var bandHeight = 20 + Math.random() * 80;
-            var bandTop = Math.random() * (window.innerHeight - bandHeight);
-            staticBurst.style.top = bandTop + 'px';
-            staticBurst.style.height = bandHeight + 'px';
-            staticBurst.style.background = 'repeating-linear-gradient(90deg, rgba(255,255,255,' + (0.05 + Math.random() * 0.1) + ') 0px, transparent 2px, rgba(255,255,255,' + (0.03 + Math.random() * 0.08) + ') 4px)';
-            staticBurst.style.opacity = '1';
-            setTimeout(function() {
-                staticBurst.style.opacity = '0';
-            }, 80);
-        }, 3000 + Math.random() * 3000);
-        crtIntervals.push(staticTimer);
-
-        // === Phase 3: CRT power-off at 10s ===
-        crtTimers.push(setTimeout(function() {
-            // Stop all CRT intervals
-            crtIntervals.forEach(function(id) { clearInterval(id); });
-
-            // Fade out scanlines and tint
-            overlay.style.opacity = '0';
-            tint.style.opacity = '0';
-            staticBurst.style.opacity = '0';
-
-            // Restore content styles
-            if (content) {
-                content.style.transition = 'all 0.3s';
-                content.style.filter = origStyles.filter;
-                content.style.borderRadius = origStyles.borderRadius;
-                content.style.overflow = origStyles.overflow;
-                content.style.boxShadow = origStyles.boxShadow;
-                content.style.transform = '';
-            }
-
-            // Power-off: shrink to horizontal line then fade
-            var powerOff = document.createElement('div');
-            powerOff.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:100000;pointer-events:none;background:white;opacity:0.6;transition:height 0.4s ease-in, top 0.4s ease-in, opacity 0.3s;';
-            document.body.appendChild(powerOff);
-
-            requestAnimationFrame(function() {
-                powerOff.style.height = '2px';
-                powerOff.style.top = '50%';
-            });
-
-            setTimeout(function() {
-                powerOff.style.opacity = '0';
-                setTimeout(function() {
-                    powerOff.remove();
-                    overlay.remove();
-                    tint.remove();
-                    staticBurst.remove();
-                    if (content) content.style.transition = origStyles.transition;
-                }, 300);
-            }, 500);
-        }, 10000));
-    }
-
-    // --- Nyan Cat (default Konami option) ---
-    function triggerNyanCat() {
-        var W = window.innerWidth;
-        var H = window.innerHeight;
-        var rainbowColors = ['#ff0000', '#ff8800', '#ffff00', '#33ff00', '#0099ff', '#6633ff'];
-        var catCount = 8 + Math.floor(Math.random() * 7); // 8-14 cats
-
-        // Shared trail container
-        var trailContainer = document.createElement('div');
-        trailContainer.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99998;pointer-events:none;overflow:hidden;';
-        document.body.appendChild(trailContainer);
-
-        var activeCats = 0;
-
-        function spawnNyan(delay) {
-            setTimeout(function() {
-                activeCats++;
-                var cat = document.createElement('img');
-                cat.src = '/static/img/nyancat.png';
-                var size = 40 + Math.random() * 60; // 40-100px
-                cat.style.cssText = 'position:fixed;z-index:99999;width:' + size + 'px;height:auto;pointer-events:none;image-rendering:pixelated;';
-                var startY = 30 + Math.random() * (H - 80);
-                cat.style.left = '-' + (size + 20) + 'px';
-                cat.style.top = startY + 'px';
-                document.body.appendChild(cat);
-
-                var startTime = Date.now();
-                var duration = 3000 + Math.random() * 3000; // 3-6s
-                var waveAmp = 20 + Math.random() * 50;
-                var waveFreq = 3 + Math.random() * 6;
-                var lastTrailX = -(size + 20);
-                var segH = Math.max(4, Math.round(size / 12));
-
-                function animateNyan() {
-                    var elapsed = Date.now() - startTime;
-                    var p = elapsed / duration;
-                    if (p >= 1) {
-                        cat.remove();
-                        activeCats--;
-                        if (activeCats <= 0) {
-                            trailContainer.style.transition = 'opacity 0.8s';
-                            trailContainer.style.opacity = '0';
-                            setTimeout(function() { trailContainer.remove(); }, 900);
-                        }
-                        return;
-                    }
-
-                    var x = -(size + 20) + (W + size + 40) * p;
-                    var y = startY + Math.sin(p * Math.PI * waveFreq) * waveAmp;
-                    cat.style.left = x + 'px';
-                    cat.style.top = y + 'px';
-
-                    if (x - lastTrailX > 8) {
-                        lastTrailX = x;
-                        for (var i = 0; i < rainbowColors.length; i++) {
-                            var seg = document.createElement('div');
-                            seg.style.cssText = 'position:absolute;width:' + (segH * 2) + 'px;height:' + segH + 'px;border-radius:1px;opacity:0.85;';
-                            seg.style.backgroundColor = rainbowColors[i];
-                            seg.style.left = x + 'px';
-                            seg.style.top = (y + size * 0.2 + i * (segH + 1)) + 'px';
-                            trailContainer.appendChild(seg);
-                            (function(s) {
-                                setTimeout(function() {
-                                    s.style.transition = 'opacity 1.5s';
-                                    s.style.opacity = '0';
-                                }, 200);
-                            })(seg);
-                        }
-                    }
-
-                    requestAnimationFrame(animateNyan);
-                }
-                requestAnimationFrame(animateNyan);
-            }, delay);
-        }
-
-        for (var i = 0; i < catCount; i++) {
-            spawnNyan(i * (100 + Math.random() * 200));
-        }
-    }
-
-    // --- Fake Alert Cascade (default Konami option) — Hydra Mode ---
-    function triggerAlertCascade() {
-        var messages = [
-            { title: 'System Error', body: 'Keyboard not found. Press F1 to continue.' },
-            { title: 'Warning', body: 'Your free trial of existence has expired.' },
-            { title: 'Critical Error', body: 'Task failed successfully.' },
-            { title: 'Alert', body: 'Something happened. Or maybe it didn\'t. Who knows.' },
-            { title: 'Error 418', body: 'I\'m a teapot. I refuse to brew coffee.' },
-            { title: 'Fatal Exception', body: 'An error occurred while displaying the previous error.' },
-            { title: 'Notice', body: 'This incident will be reported. To no one in particular.' },
-            { title: 'Segfault', body: 'The code is haunted. Try burning sage on the server.' },
-            { title: 'PC LOAD LETTER', body: 'What does that even mean?' },
-            { title: 'Helpful Tip', body: 'Have you tried turning it off and on again?' },
-            { title: 'Error: Success', body: 'The operation completed successfully. But at what cost?' },
-            { title: 'Existential Error', body: 'Error: Success.' },
-        ];
-
-        var activeAlerts = [];
-        var alertZIndex = 100000;
-        var totalSpawned = 0;
-        var finalBossShown = false;
-        var cascadeTimers = [];
-
-        // Play BSOD sound on first dialog
-        var bsodAudio = new Audio('/static/audio/windows-bsod.mp3');
-        bsodAudio.volume = 0.3;
-        bsodAudio.play().catch(function() {});
-
-        function getRandomMsg() {
-            return messages[Math.floor(Math.random() * messages.length)];
-        }
-
-        function shakeBox(box) {
-            var orig = box.style.transform || '';
-            var shakeCount = 0;
-            var shakeTimer = setInterval(function() {
-                var dx = (Math.random() - 0.5) * 8;
-                box.style.transform = 'translateX(' + dx + 'px)';
-                shakeCount++;
-                if (shakeCount > 6) {
-                    clearInterval(shakeTimer);
-                    box.style.transform = orig;
-                }
-            }, 30);
-            cascadeTimers.push(shakeTimer);
-        }
-
-        function dismissBox(box) {
-            box.style.transition = 'opacity 0.15s, transform 0.15s';
-            box.style.opacity = '0';
-            box.style.transform = 'scale(0.9)';
-            setTimeout(function() { box.remove(); }, 200);
-            var idx = activeAlerts.indexOf(box);
-            if (idx > -1) activeAlerts.splice(idx, 1);
-        }
-
-        function dismissAll() {
-            // Cascade close animation — staggered removal
-            var remaining = activeAlerts.slice();
-            remaining.forEach(function(box, i) {
-                setTimeout(function() {
-                    dismissBox(box);
-                }, i * 60);
-            });
-            activeAlerts = [];
-        }
-
-        function checkFinalBoss() {
-            if (finalBossShown) return;
-            if (totalSpawned >= 15 || Date.now() - cascadeStartTime > 12000) {
-                finalBossShown = true;
-                showFinalBoss();
-            }
-        }
-
-        function showFinalBoss() {
-            var box = document.createElement('div');
-            alertZIndex++;
-            box.style.cssText = 'position:fixed;z-index:' + alertZIndex + ';background:#c0c0c0;border:3px outset #dfdfdf;' +
-                'box-shadow:4px 4px 0 rgba(0,0,0,0.4);font-family:Tahoma,Arial,sans-serif;font-size:14px;color:#000;width:420px;cursor:default;user-select:none;';
-            box.style.left = Math.max(40, (window.innerWidth / 2 - 210)) + 'px';
-            box.style.top = Math.max(40, (window.innerHeight / 2 - 100)) + 'px';
-
-            var titleBar = document.createElement('div');
-            titleBar.style.cssText = 'background:linear-gradient(90deg,#800000,#d01010);color:white;padding:4px 6px;font-weight:bold;font-size:13px;display:flex;justify-content:space-between;align-items:center;';
-            var titleText = document.createElement('span');
-            titleText.textContent = '\u2620\uFE0F FINAL WARNING';
-            titleBar.appendChild(titleText);
-            box.appendChild(titleBar);
-
-            var body = document.createElement('div');
-            body.style.cssText = 'padding:20px 16px;display:flex;align-items:flex-start;gap:12px;background:#c0c0c0;';
-            body.innerHTML = '<span style="font-size:36px;">\u2622\uFE0F</span><span style="padding-top:8px;font-size:14px;font-weight:bold;">FORMAT C:\\ ?</span>';
-            box.appendChild(body);
-
-            var btnRow = document.createElement('div');
-            btnRow.style.cssText = 'text-align:center;padding:8px 12px 12px;background:#c0c0c0;display:flex;justify-content:center;gap:16px;';
-            var btnStyle = 'background:#c0c0c0;border:2px outset #dfdfdf;padding:4px 20px;font-size:12px;font-family:Tahoma,Arial,sans-serif;cursor:pointer;font-weight:bold;';
-
-            var yesBtn = document.createElement('button');
-            yesBtn.textContent = 'YES';
-            yesBtn.style.cssText = btnStyle;
-            var defYesBtn = document.createElement('button');
-            defYesBtn.textContent = 'DEFINITELY YES';
-            defYesBtn.style.cssText = btnStyle;
-
-            btnRow.appendChild(yesBtn);
-            btnRow.appendChild(defYesBtn);
-            box.appendChild(btnRow);
-
-            document.body.appendChild(box);
-            activeAlerts.push(box);
-            shakeBox(box);
-
-            function handleFinalDismiss() {
-                dismissAll();
-            }
-            yesBtn.addEventListener('click', handleFinalDismiss);
-            defYesBtn.addEventListener('click', handleFinalDismiss);
-        }
-
-        function createAlert(msg) {
-            if (activeAlerts.length >= 20) return;
-            totalSpawned++;
-            alertZIndex++;
-            var box = document.createElement('div');
-            box.style.cssText = 'position:fixed;z-index:' + alertZIndex + ';background:#c0c0c0;border:2px outset #dfdfdf;' +
-                'box-shadow:2px 2px 0 rgba(0,0,0,0.3);font-family:Tahoma,Arial,sans-serif;font-size:12px;color:#000;width:320px;cursor:default;user-select:none;';
-            // Random position across screen
-            var maxLeft = Math.max(100, window.innerWidth - 360);
-            var maxTop = Math.max(60, window.innerHeight - 200);
-            box.style.left = (40 + Math.random() * maxLeft) + 'px';
-            box.style.top = (30 + Math.random() * maxTop) + 'px';
-
-            // Title bar
-            var titleBar = document.createElement('div');
-            titleBar.style.cssText = 'background:linear-gradient(90deg,#000080,#1084d0);color:white;padding:3px 5px;font-weight:bold;font-size:12px;display:flex;justify-content:space-between;align-items:center;';
-            var titleText = document.createElement('span');
-            titleText.textContent = msg.title;
-            var closeBtn = document.createElement('button');
-            closeBtn.textContent = '\u2715';
-            closeBtn.style.cssText = 'background:#c0c0c0;border:1px outset #dfdfdf;font-size:10px;width:16px;height:16px;cursor:pointer;padding:0;line-height:1;';
-            titleBar.appendChild(titleText);
-            titleBar.appendChild(closeBtn);
-            box.appendChild(titleBar);
-
-            // Body
-            var body = document.createElement('div');
-            body.style.cssText = 'padding:16px 12px;display:flex;align-items:flex-start;gap:10px;background:#c0c0c0;';
-            body.innerHTML = '<span style="font-size:28px;">\u26A0\uFE0F</span><span style="padding-top:6px;">' + msg.body + '</span>';
-            box.appendChild(body);
-
-            // OK button
-            var btnRow = document.createElement('div');
-            btnRow.style.cssText = 'text-align:center;padding:6px 12px 10px;background:#c0c0c0;';
-            var okBtn = document.createElement('button');
-            okBtn.textContent = 'OK';
-            okBtn.style.cssText = 'background:#c0c0c0;border:2px outset #dfdfdf;padding:2px 24px;font-size:12px;font-family:Tahoma,Arial,sans-serif;cursor:pointer;';
-            btnRow.appendChild(okBtn);
-            box.appendChild(btnRow);
-
-            document.body.appendChild(box);
-            activeAlerts.push(box);
-
-            // Entrance shake
-            shakeBox(box);
-
-            // X button: dismiss normally (no spawn)
-            closeBtn.addEventListener('click', function() {
-                dismissBox(box);
-            });
-
-            // OK button: HYDRA — spawn 2 new dialogs
-            okBtn.addEventListener('click', function() {
-                dismissBox(box);
-                if (activeAlerts.length < 20 && !finalBossShown) {
-                    cascadeTimers.push(setTimeout(function() { createAlert(getRandomMsg()); }, 80));
-                    cascadeTimers.push(setTimeout(function() { createAlert(getRandomMsg()); }, 200));
-                }
-                checkFinalBoss();
-            });
-        }
-
-        // Initial burst: 6-8 dialogs at 150ms stagger
-        var cascadeStartTime = Date.now();
-        var initialCount = 6 + Math.floor(Math.random() * 3);
-        for (var i = 0; i < initialCount; i++) {
-            (function(idx) {
-                cascadeTimers.push(setTimeout(function() {
-                    createAlert(getRandomMsg());
-                }, idx * 150));
-            })(i);
-        }
-
-        // Final boss trigger check (time-based fallback)
-        cascadeTimers.push(setTimeout(function() {
-            checkFinalBoss();
-        }, 12000));
-
-        // Auto-dismiss safety net at 20s
-        cascadeTimers.push(setTimeout(function() {
-            dismissAll();
-            cascadeTimers.forEach(function(id) { clearTimeout(id); clearInterval(id); });
-        }, 20000));
-    }
-
     // --- Ticket Count Spin (click 10 times) ---
     (function() {
         var countEl = document.getElementById('total-active-items-count');
@@ -589,418 +142,6 @@
         });
     })();
 
-    // --- Matrix Rain Easter Egg ---
-    var matrixTimerId = null;
-    var matrixResizeHandler = null;
-    var matrixEasterEggTimers = [];
-    var matrixClickHandler = null;
-    var matrixMoveHandler = null;
-    var matrixSpoonHandler = null;
-
-    function handleMatrixRain(active) {
-        var canvas = document.getElementById('matrix-rain');
-        if (!canvas) return;
-
-        if (!active) {
-            if (matrixTimerId) {
-                clearInterval(matrixTimerId);
-                matrixTimerId = null;
-            }
-            if (matrixResizeHandler) {
-                window.removeEventListener('resize', matrixResizeHandler);
-                matrixResizeHandler = null;
-            }
-            // Clean up easter egg timers
-            matrixEasterEggTimers.forEach(function(id) { clearInterval(id); clearTimeout(id); });
-            matrixEasterEggTimers = [];
-            // Clean up event listeners
-            if (matrixClickHandler) {
-                document.removeEventListener('click', matrixClickHandler);
-                matrixClickHandler = null;
-            }
-            if (matrixMoveHandler) {
-                document.removeEventListener('mousemove', matrixMoveHandler);
-                matrixMoveHandler = null;
-            }
-            if (matrixSpoonHandler) {
-                document.removeEventListener('keypress', matrixSpoonHandler);
-                matrixSpoonHandler = null;
-            }
-            // Remove leftover easter egg elements
-            document.querySelectorAll('.matrix-quote, .matrix-click-char, .matrix-trail-char, .matrix-click-overlay, .matrix-rabbit').forEach(function(el) { el.remove(); });
-            var clearCtx = canvas.getContext('2d');
-            clearCtx.clearRect(0, 0, canvas.width, canvas.height);
-            return;
-        }
-
-        var ctx = canvas.getContext('2d');
-        var fontSize = 18;
-        var colWidth = fontSize;
-
-        // Half-width Katakana + digits + some Latin (classic Matrix look)
-        var katakana = '\uff66\uff67\uff68\uff69\uff6a\uff6b\uff6c\uff6d\uff6e\uff6f\uff70\uff71\uff72\uff73\uff74\uff75\uff76\uff77\uff78\uff79\uff7a\uff7b\uff7c\uff7d\uff7e\uff7f\uff80\uff81\uff82\uff83\uff84\uff85\uff86\uff87\uff88\uff89\uff8a\uff8b\uff8c\uff8d\uff8e\uff8f\uff90\uff91\uff92\uff93\uff94\uff95\uff96';
-        var digits = '0123456789';
-        var latin = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ';
-        var chars = katakana + digits + latin;
-
-        function initCanvas() {
-            canvas.width = window.innerWidth;
-            canvas.height = window.innerHeight;
-            ctx.fillStyle = '#000000';
-            ctx.fillRect(0, 0, canvas.width, canvas.height);
-        }
-
-        initCanvas();
-        var numCols = Math.floor(canvas.width / colWidth);
-
-        // Each column tracks its drop position, speed, and last drawn cell
-        var columns = [];
-
-        function buildColumns(count) {
-            var cols = [];
-            for (var i = 0; i < count; i++) {
-                var startY = Math.random() * -50;
-                cols.push({
-                    y: startY,
-                    speed: 0.4 + Math.random() * 0.6,
-                    trailLen: 8 + Math.floor(Math.random() * 20),
-                    lastCell: Math.floor(startY),
-                });
-            }
-            return cols;
-        }
-        columns = buildColumns(numCols);
-
-        function draw() {
-            // Semi-transparent black overlay creates the fade trail
-            ctx.fillStyle = 'rgba(0, 0, 0, 0.06)';
-            ctx.fillRect(0, 0, canvas.width, canvas.height);
-
-            ctx.font = fontSize + 'px monospace';
-
-            for (var i = 0; i < columns.length; i++) {
-                var col = columns[i];
-                var cell = Math.floor(col.y);
-
-                // Only draw when the drop has moved to a new cell
-                if (cell !== col.lastCell) {
-                    col.lastCell = cell;
-                    var x = i * colWidth;
-                    var yPos = cell * fontSize;
-                    var ch = chars[Math.floor(Math.random() * chars.length)];
-
-                    // Single bright head character — the trail comes from
-                    // previous heads fading via the black overlay, not from
-                    // drawing extra characters behind
-                    ctx.fillStyle = '#aaffaa';
-                    ctx.fillText(ch, x, yPos);
-                }
-
-                // Advance the drop
-                col.y += col.speed;
-
-                // Reset when the column falls off screen (bottom or top)
-                var maxY = canvas.height / fontSize + col.trailLen;
-                if (col.speed > 0 && col.y > maxY) {
-                    col.y = Math.random() * -20;
-                    col.speed = 0.4 + Math.random() * 0.6;
-                    col.trailLen = 8 + Math.floor(Math.random() * 20);
-                    col.lastCell = Math.floor(col.y);
-                } else if (col.speed < 0 && col.y < -col.trailLen) {
-                    col.y = canvas.height / fontSize + Math.random() * 20;
-                    col.speed = -(0.4 + Math.random() * 0.6);
-                    col.trailLen = 8 + Math.floor(Math.random() * 20);
-                    col.lastCell = Math.floor(col.y);
-                }
-            }
-        }
-
-        // Run at ~20fps for the classic slow cascade feel
-        matrixTimerId = setInterval(draw, 50);
-
-        // Handle resize — rebuild columns for new width
-        matrixResizeHandler = function() {
-            if (matrixTimerId) {
-                initCanvas();
-                var newNumCols = Math.floor(canvas.width / colWidth);
-                if (newNumCols > numCols) {
-                    // Add new columns for the extra width
-                    var extra = buildColumns(newNumCols - numCols);
-                    columns = columns.concat(extra);
-                } else if (newNumCols < numCols) {
-                    columns.length = newNumCols;
-                }
-                numCols = newNumCols;
-            }
-        };
-        window.addEventListener('resize', matrixResizeHandler);
-
-        // ========================
-        //  MATRIX EASTER EGGS
-        // ========================
-
-        // --- 1. "Wake up, Neo..." Typewriter Quotes ---
-        var matrixQuotes = [
-            'Wake up, Neo...',
-            'Follow the white rabbit',
-            'There is no spoon',
-            'The Matrix has you...',
-            'Knock, knock, Neo.'
-        ];
-
-        function showMatrixQuote() {
-            var quote = matrixQuotes[Math.floor(Math.random() * matrixQuotes.length)];
-            var el = document.createElement('div');
-            el.className = 'matrix-quote';
-            el.textContent = '';
-            document.body.appendChild(el);
-
-            var charIdx = 0;
-            var typeTimer = setInterval(function() {
-                if (charIdx < quote.length) {
-                    el.textContent += quote[charIdx];
-                    charIdx++;
-                } else {
-                    clearInterval(typeTimer);
-                    // Hold for 2s then fade out
-                    setTimeout(function() {
-                        el.classList.add('matrix-quote--fade');
-                        setTimeout(function() { el.remove(); }, 1000);
-                    }, 2000);
-                }
-            }, 80);
-            matrixEasterEggTimers.push(typeTimer);
-        }
-
-        // Trigger every 90-180s
-        function scheduleNextQuote() {
-            var delay = 90000 + Math.random() * 90000;
-            var t = setTimeout(function() {
-                showMatrixQuote();
-                scheduleNextQuote();
-            }, delay);
-            matrixEasterEggTimers.push(t);
-        }
-        scheduleNextQuote();
-
-        // --- 2. Click Cascade ---
-        var matrixCharsPool = '\uff66\uff71\uff72\uff73\uff74\uff75\uff76\uff77\uff78\uff79\uff7a0123456789ABCDEF';
-        var clickOverlay = document.createElement('div');
-        clickOverlay.className = 'matrix-click-overlay';
-        clickOverlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;pointer-events:none;z-index:6;overflow:hidden;';
-        document.body.appendChild(clickOverlay);
-
-        matrixClickHandler = function(e) {
-            var count = 8 + Math.floor(Math.random() * 5); // 8-12
-            for (var i = 0; i < count; i++) {
-                var span = document.createElement('span');
-                span.className = 'matrix-click-char';
-                span.textContent = matrixCharsPool[Math.floor(Math.random() * matrixCharsPool.length)];
-                span.style.left = (e.clientX + (Math.random() - 0.5) * 60) + 'px';
-                span.style.top = (e.clientY + (Math.random() - 0.5) * 20) + 'px';
-                span.style.fontSize = (12 + Math.random() * 10) + 'px';
-                span.style.animationDuration = (0.7 + Math.random() * 0.5) + 's';
-                clickOverlay.appendChild(span);
-                (function(s) {
-                    setTimeout(function() { s.remove(); }, 1200);
-                })(span);
-            }
-        };
-        document.addEventListener('click', matrixClickHandler);
-
-        // --- 4. Cursor Trail ---
-        var trailElements = [];
-        var lastTrailTime = 0;
-
-        matrixMoveHandler = function(e) {
-            var now = Date.now();
-            if (now - lastTrailTime < 60) return; // throttle ~60ms
-            if (trailElements.length >= 15) return; // max 15 trail elements
-            lastTrailTime = now;
-
-            var span = document.createElement('span');
-            span.className = 'matrix-trail-char';
-            span.textContent = matrixCharsPool[Math.floor(Math.random() * matrixCharsPool.length)];
-            span.style.left = e.clientX + 'px';
-            span.style.top = e.clientY + 'px';
-            document.body.appendChild(span);
-            trailElements.push(span);
-
-            setTimeout(function() {
-                span.remove();
-                var idx = trailElements.indexOf(span);
-                if (idx > -1) trailElements.splice(idx, 1);
-            }, 800);
-        };
-        if (!document.documentElement.classList.contains('kiosk-mode')) {
-            document.addEventListener('mousemove', matrixMoveHandler);
-        }
-
-        // --- Konami: "System Failure" ---
-        konamiCallback = function() {
-            // Phase 1: Green flash (0-200ms) — two pulses
-            var flash = document.createElement('div');
-            flash.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:100010;pointer-events:none;background:#00ff41;opacity:0;';
-            document.body.appendChild(flash);
-
-            // Pulse 1: 0→0.5→0
-            flash.style.transition = 'opacity 0.05s';
-            requestAnimationFrame(function() { flash.style.opacity = '0.5'; });
-            setTimeout(function() { flash.style.opacity = '0'; }, 60);
-            // Pulse 2: 0→0.3→0
-            setTimeout(function() {
-                flash.style.opacity = '0.3';
-                setTimeout(function() {
-                    flash.style.opacity = '0';
-                    setTimeout(function() { flash.remove(); }, 100);
-                }, 60);
-            }, 120);
-
-            // Phase 2: Glitch slice (200-800ms)
-            var content = document.querySelector('.thebeacon-content');
-            if (content) {
-                var glitchSteps = [
-                    { delay: 200, clip: 'inset(20% 0 60% 0)', tx: '8px' },
-                    { delay: 350, clip: 'inset(50% 0 20% 0)', tx: '-12px' },
-                    { delay: 500, clip: 'inset(10% 0 70% 0)', tx: '15px' },
-                    { delay: 650, clip: 'inset(40% 0 30% 0)', tx: '-6px' },
-                ];
-                var origClip = content.style.clipPath || '';
-                var origTransform = content.style.transform || '';
-                glitchSteps.forEach(function(step) {
-                    var t1 = setTimeout(function() {
-                        content.style.clipPath = step.clip;
-                        content.style.transform = 'translateX(' + step.tx + ')';
-                    }, step.delay);
-                    var t2 = setTimeout(function() {
-                        content.style.clipPath = origClip;
-                        content.style.transform = origTransform;
-                    }, step.delay + 100);
-                    matrixEasterEggTimers.push(t1, t2);
-                });
-                var t3 = setTimeout(function() {
-                    content.style.clipPath = origClip;
-                    content.style.transform = origTransform;
-                }, 800);
-                matrixEasterEggTimers.push(t3);
-            }
-
-            // Phase 3: "SYSTEM FAILURE" text (400-2500ms)
-            var failText = document.createElement('div');
-            failText.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:100009;pointer-events:none;display:flex;justify-content:center;align-items:center;opacity:0;transition:opacity 0.3s;';
-            failText.innerHTML = '<div style="font-family:Courier New,monospace;font-size:4rem;color:#00ff41;text-shadow:0 0 30px #00ff41,0 0 60px rgba(0,255,65,0.4);letter-spacing:0.3em;text-align:center;">SYSTEM FAILURE</div>';
-            document.body.appendChild(failText);
-            var t4 = setTimeout(function() { failText.style.opacity = '1'; }, 400);
-            var t5 = setTimeout(function() {
-                failText.style.opacity = '0';
-                setTimeout(function() { failText.remove(); }, 400);
-            }, 2200);
-            matrixEasterEggTimers.push(t4, t5);
-
-            // Phase 4: Rain reversal with x-offset scatter (from 800ms)
-            var t6 = setTimeout(function() {
-                for (var i = 0; i < columns.length; i++) {
-                    columns[i].speed = -(0.4 + Math.random() * 0.6);
-                    // Brief x-offset scatter: shift column position randomly
-                    columns[i].y += (Math.random() - 0.5) * 8;
-                }
-            }, 800);
-            matrixEasterEggTimers.push(t6);
-
-            // Revert rain after 30s
-            var revertTimer = setTimeout(function() {
-                for (var i = 0; i < columns.length; i++) {
-                    columns[i].speed = 0.4 + Math.random() * 0.6;
-                }
-            }, 30000);
-            matrixEasterEggTimers.push(revertTimer);
-        };
-
-        // --- Type "spoon": There Is No Spoon ---
-        function doSpoonOverlay() {
-            var overlay = document.createElement('div');
-            overlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;z-index:99999;background:rgba(0,0,0,0.85);display:flex;justify-content:center;align-items:center;pointer-events:none;opacity:0;transition:opacity 0.3s;';
-            overlay.innerHTML = '<div style="font-family:Courier New,monospace;font-size:3rem;color:#00ff41;text-shadow:0 0 20px #00ff41,0 0 40px rgba(0,255,65,0.3);text-align:center;line-height:1.6;">There is no spoon</div>';
-            document.body.appendChild(overlay);
-            var spoonAudio = new Audio('/static/audio/there-is-no-spoon.mp3');
-            spoonAudio.play().catch(function() {});
-            requestAnimationFrame(function() { overlay.style.opacity = '1'; });
-            var revertTimer = setTimeout(function() {
-                overlay.style.opacity = '0';
-                setTimeout(function() { overlay.remove(); }, 300);
-            }, 3000);
-            matrixEasterEggTimers.push(revertTimer);
-        }
-
-        var spoonBuffer = '';
-        matrixSpoonHandler = function(e) {
-            spoonBuffer += e.key.toLowerCase();
-            if (spoonBuffer.length > 10) spoonBuffer = spoonBuffer.slice(-10);
-            if (spoonBuffer.indexOf('spoon') !== -1) {
-                spoonBuffer = '';
-                doSpoonOverlay();
-            }
-        };
-        document.addEventListener('keypress', matrixSpoonHandler);
-
-        // --- White Rabbit ---
-        function doWhiteRabbit() {
-            var rabbit = document.createElement('div');
-            rabbit.className = 'matrix-rabbit';
-            rabbit.textContent = '\uD83D\uDC07'; // 🐇
-
-            var goingRight = Math.random() > 0.5;
-            var startX = goingRight ? -60 : window.innerWidth + 60;
-            var endX = goingRight ? window.innerWidth + 60 : -60;
-            var rabbitY = 100 + Math.random() * (window.innerHeight - 200);
-            var crossDuration = 1800 + Math.random() * 1200; // 1.8-3s
-
-            rabbit.style.left = startX + 'px';
-            rabbit.style.top = rabbitY + 'px';
-            rabbit.style.transform = goingRight ? 'scaleX(-1)' : 'scaleX(1)';
-            document.body.appendChild(rabbit);
-
-            var startTime = Date.now();
-
-            function animateRabbit() {
-                var elapsed = Date.now() - startTime;
-                var p = Math.min(elapsed / crossDuration, 1);
-                var x = startX + (endX - startX) * p;
-                rabbit.style.left = x + 'px';
-
-                if (p < 1) {
-                    requestAnimationFrame(animateRabbit);
-                } else {
-                    rabbit.remove();
-                }
-            }
-            requestAnimationFrame(animateRabbit);
-        }
-
-        function maybeWhiteRabbit() {
-            if (Math.random() > 0.005) return;
-            doWhiteRabbit();
-        }
-
-        // Expose for debug menu
-        window._debugEasterEggs = window._debugEasterEggs || {};
-        window._debugEasterEggs.whiteRabbit = doWhiteRabbit;
-        window._debugEasterEggs.matrixQuote = showMatrixQuote;
-        window._debugEasterEggs.matrixSpoon = doSpoonOverlay;
-        window._debugEasterEggs.matrixGravity = konamiCallback;
-
-        // Check every 45-120s
-        function scheduleWhiteRabbit() {
-            var delay = 45000 + Math.random() * 75000;
-            var t = setTimeout(function() {
-                maybeWhiteRabbit();
-                scheduleWhiteRabbit();
-            }, delay);
-            matrixEasterEggTimers.push(t);
-        }
-        scheduleWhiteRabbit();
-    }
-
     // --- Bee-con Name Swap ---
     var defaultAppName = '';
 
@@ -1025,1162 +166,16 @@
         }
     }
 
-    // --- Bee Easter Egg (the full experience) ---
-    var beeTimers = [];
-    var beeMoveHandler = null;
-    var beeResizeHandler = null;
-
-    function handleBeeAnimation(active) {
-        var container = document.getElementById('bee-container');
-        if (!container) return;
-
-        if (!active) {
-            beeTimers.forEach(function(entry) {
-                if (typeof entry === 'function') { entry(); }
-                else { clearInterval(entry); clearTimeout(entry); }
-            });
-            beeTimers = [];
-            if (beeMoveHandler) {
-                document.removeEventListener('mousemove', beeMoveHandler);
-                beeMoveHandler = null;
-            }
-            if (beeResizeHandler) {
-                window.removeEventListener('resize', beeResizeHandler);
-                beeResizeHandler = null;
-            }
-            // Remove leftover easter egg elements
-            document.querySelectorAll('.bee-bear, .bee-landing, .honey-drip, .bee-procession, .bee-row-highlight').forEach(function(el) {
-                if (el.classList.contains('bee-row-highlight')) {
-                    el.classList.remove('bee-row-highlight');
-                } else {
-                    el.remove();
-                }
-            });
-            container.innerHTML = '';
-            return;
-        }
-
-        var W = window.innerWidth;
-        var H = window.innerHeight;
-        beeResizeHandler = function() { W = window.innerWidth; H = window.innerHeight; };
-        window.addEventListener('resize', beeResizeHandler);
-
-        // ========================
-        //  UTILITY
-        // ========================
-        function rand(min, max) { return min + Math.random() * (max - min); }
-        function randInt(min, max) { return Math.floor(rand(min, max + 1)); }
-        function pick(arr) { return arr[Math.floor(Math.random() * arr.length)]; }
-        function smoothstep(t) { return t * t * (3 - 2 * t); }
-        function clampY(y) { return Math.max(10, Math.min(H - 30, y)); }
-
-        // ========================
-        //  POLLEN PARTICLES
-        // ========================
-        function spawnPollen(x, y, rainbow) {
-            var dot = document.createElement('div');
-            dot.className = 'bee-pollen';
-            if (rainbow) dot.classList.add('bee-pollen--rainbow');
-            dot.style.left = x + 'px';
-            dot.style.top = y + 'px';
-            container.appendChild(dot);
-            // CSS animation handles fade + drift, remove after animation
-            setTimeout(function() { dot.remove(); }, 1200);
-        }
-
-        // ========================
-        //  FLOATING FLOWERS & HONEYCOMBS
-        // ========================
-        var flowerEmojis = ['\uD83C\uDF3B', '\uD83C\uDF3A', '\uD83C\uDF38', '\uD83C\uDF3C', '\uD83C\uDF37', '\uD83C\uDF39', '\uD83D\uDC90', '\uD83E\uDEBB', '\uD83E\uDEB7', '\uD83C\uDFF5\uFE0F', '\uD83D\uDCAE'];
-        // 🌻 🌺 🌸 🌼 🌷
-        var honeycombEmojis = ['\uD83C\uDF6F']; // 🍯
-        var activeFlowers = [];
-
-        function createFlower() {
-            if (activeFlowers.length >= 3) return; // Max on screen
-
-            var isHoneycomb = Math.random() < 0.35;
-            var flower = document.createElement('div');
-            flower.className = isHoneycomb ? 'bee-flower bee-flower--honeycomb' : 'bee-flower';
-            flower.textContent = isHoneycomb ? pick(honeycombEmojis) : pick(flowerEmojis);
-            var fx = rand(150, W - 100);
-            var fy = rand(100, H - 100);
-            flower.style.left = fx + 'px';
-            flower.style.top = fy + 'px';
-            flower.style.fontSize = rand(24, 40) + 'px';
-            container.appendChild(flower);
-
-            var flowerObj = { el: flower, x: fx, y: fy, fading: false };
-            activeFlowers.push(flowerObj);
-
-            // Flowers live for 60-120 seconds then fade away
-            var lifespan = rand(30000, 60000);
-            setTimeout(function() {
-                flowerObj.fading = true;
-                flower.classList.add('bee-flower--fading');
-                setTimeout(function() {
-                    flower.remove();
-                    var idx = activeFlowers.indexOf(flowerObj);
-                    if (idx > -1) activeFlowers.splice(idx, 1);
-                }, 1000);
-            }, lifespan);
-        }
-
-        // ========================
-        //  FLIGHT PATTERNS
-        // ========================
-        var patterns = {
-            // Gentle sine wave
-            wave: function(p, cfg) {
-                var x = cfg.startX + (cfg.endX - cfg.startX) * p;
-                var y = cfg.startY + Math.sin(p * Math.PI * cfg.waves) * cfg.amplitude;
-                var angle = Math.sin(p * Math.PI * cfg.waves * 2) * 12;
-                return { x: x, y: y, angle: angle };
-            },
-            // Loop-de-loops
-            loopy: function(p, cfg) {
-                var baseX = cfg.startX + (cfg.endX - cfg.startX) * p;
-                var baseY = cfg.startY + Math.sin(p * Math.PI * 2) * cfg.amplitude * 0.3;
-                var loopPhase = p * Math.PI * 2 * cfg.loops;
-                var r = cfg.loopRadius;
-                return {
-                    x: baseX + Math.sin(loopPhase) * r,
-                    y: baseY - Math.cos(loopPhase) * r + r,
-                    angle: Math.cos(loopPhase) * 35
-                };
-            },
-            // Zigzag
-            zigzag: function(p, cfg) {
-                var x = cfg.startX + (cfg.endX - cfg.startX) * p;
-                var segLen = 1 / cfg.zigs;
-                var seg = Math.floor(p / segLen);
-                var segP = (p % segLen) / segLen;
-                var yTarget = (seg % 2 === 0) ? cfg.startY - cfg.amplitude : cfg.startY + cfg.amplitude;
-                var yFrom = (seg % 2 === 0) ? cfg.startY + cfg.amplitude : cfg.startY - cfg.amplitude;
-                return { x: x, y: yFrom + (yTarget - yFrom) * segP, angle: (seg % 2 === 0) ? -25 : 25 };
-            },
-            // Hover then dart
-            hover: function(p, cfg) {
-                var phase = (p * cfg.darts) % 1;
-                var dartIdx = Math.floor(p * cfg.darts);
-                var spot = cfg.spots[Math.min(dartIdx, cfg.spots.length - 1)];
-                var nextSpot = cfg.spots[Math.min(dartIdx + 1, cfg.spots.length - 1)];
-                if (phase < 0.7) {
-                    var h = phase / 0.7;
-                    return {
-                        x: spot.x + Math.sin(h * Math.PI * 6) * 6,
-                        y: spot.y + Math.cos(h * Math.PI * 8) * 5,
-                        angle: Math.sin(h * Math.PI * 6) * 12
-                    };
-                } else {
-                    var d = smoothstep((phase - 0.7) / 0.3);
-                    return {
-                        x: spot.x + (nextSpot.x - spot.x) * d,
-                        y: spot.y + (nextSpot.y - spot.y) * d,
-                        angle: (nextSpot.x > spot.x) ? -18 : 18
-                    };
-                }
-            },
-            // Lazy spiral
-            spiral: function(p, cfg) {
-                var baseX = cfg.startX + (cfg.endX - cfg.startX) * p;
-                var phase = p * Math.PI * 2 * cfg.spirals;
-                var r = cfg.spiralRadius * (0.5 + Math.sin(p * Math.PI) * 0.5);
-                return {
-                    x: baseX + Math.cos(phase) * r,
-                    y: cfg.startY + Math.sin(phase) * r,
-                    angle: Math.cos(phase) * 25
-                };
-            },
-            // Waggle dance (figure-8) — bee communication!
-            waggle: function(p, cfg) {
-                var centerX = cfg.startX + (cfg.endX - cfg.startX) * p;
-                var t = p * Math.PI * 2 * cfg.waggleCount;
-                // Lemniscate of Bernoulli (figure-8)
-                var scale = cfg.waggleSize;
-                var denom = 1 + Math.sin(t) * Math.sin(t);
-                var lx = scale * Math.cos(t) / denom;
-                var ly = scale * Math.sin(t) * Math.cos(t) / denom;
-                return {
-                    x: centerX + lx,
-                    y: cfg.startY + ly,
-                    angle: Math.cos(t) * 30
-                };
-            },
-            // Drunken bumble — erratic, jerky movement
-            drunken: function(p, cfg) {
-                var x = cfg.startX + (cfg.endX - cfg.startX) * p;
-                var y = cfg.startY;
-                // Layer multiple sine waves at odd frequencies for chaos
-                for (var i = 0; i < cfg.freqs.length; i++) {
-                    y += Math.sin(p * Math.PI * cfg.freqs[i] + cfg.phases[i]) * cfg.amps[i];
-                }
-                var angle = Math.sin(p * Math.PI * 13) * 25 + Math.cos(p * Math.PI * 7) * 15;
-                return { x: x, y: y, angle: angle };
-            },
-            // Dive bomb — swoop down then back up
-            divebomb: function(p, cfg) {
-                var x = cfg.startX + (cfg.endX - cfg.startX) * p;
-                var y = cfg.startY;
-                // Dive at the dive point, recover after
-                var diveCenter = cfg.diveAt;
-                var diveWidth = 0.15;
-                var dist = Math.abs(p - diveCenter);
-                if (dist < diveWidth) {
-                    var diveP = 1 - dist / diveWidth;
-                    y += diveP * diveP * cfg.diveDepth;
-                }
-                // Gentle wave otherwise
-                y += Math.sin(p * Math.PI * 3) * 20;
-                var angle = (p > diveCenter - diveWidth && p < diveCenter) ? 35 :
-                            (p > diveCenter && p < diveCenter + diveWidth) ? -35 : Math.sin(p * 10) * 8;
-                return { x: x, y: y, angle: angle };
-            },
-            // Visit flowers — bee flies to each active flower then exits
-            pollinate: function(p, cfg) {
-                var numStops = cfg.flowerStops.length;
-                var segLen = 1 / (numStops + 1); // +1 for exit
-                var seg = Math.min(Math.floor(p / segLen), numStops);
-                var segP = (p - seg * segLen) / segLen;
-
-                var from, to;
-                if (seg === 0) {
-                    from = { x: cfg.startX, y: cfg.startY };
-                    to = cfg.flowerStops[0] || { x: cfg.endX, y: cfg.startY };
-                } else if (seg < numStops) {
-                    from = cfg.flowerStops[seg - 1];
-                    to = cfg.flowerStops[seg];
-                } else {
-                    from = cfg.flowerStops[numStops - 1] || { x: cfg.startX, y: cfg.startY };
-                    to = { x: cfg.endX, y: cfg.startY };
-                }
-
-                // Hover briefly at each stop (ease in/out)
-                var ease = smoothstep(segP);
-                var x = from.x + (to.x - from.x) * ease;
-                var y = from.y + (to.y - from.y) * ease;
-                // Arc upward between stops
-                var arc = Math.sin(segP * Math.PI) * -60;
-                y += arc;
-                var angle = Math.sin(segP * Math.PI * 4) * 10;
-                return { x: x, y: y, angle: angle };
-            }
-        };
-
-        var patternNames = ['wave', 'wave', 'loopy', 'zigzag', 'hover', 'spiral',
-                            'waggle', 'drunken', 'divebomb', 'pollinate'];
-
-        // ========================
-        //  CURSOR TRACKING (for flee behavior)
-        // ========================
-        var _beeCursorX = null;
-        var _beeCursorY = null;
-        var _beeFleeRadius = 120;
-        var _beeFleeForce = 8;
-
-        var lastPollenTrailTime = 0;
-
-        var isKiosk = document.documentElement.classList.contains('kiosk-mode');
-        if (!isKiosk) {
-            beeMoveHandler = function(e) {
-                _beeCursorX = e.clientX;
-                _beeCursorY = e.clientY;
-                // Pollen cursor trail
-                var now = Date.now();
-                if (now - lastPollenTrailTime > 100) {
-                    lastPollenTrailTime = now;
-                    spawnPollen(e.clientX + rand(-8, 8), e.clientY + rand(-5, 10));
-                }
-            };
-            document.addEventListener('mousemove', beeMoveHandler);
-        }
-
-        // ========================
-        //  BEE FACTORY
-        // ========================
-        // Rare visitor insects
-        var rareVisitors = [
-            { emoji: '\uD83E\uDD8B', cls: 'bee--butterfly' },  // 🦋
-            { emoji: '\uD83D\uDC1E', cls: 'bee--ladybug' },    // 🐞
-        ];
-
-        function createBee(opts) {
-            opts = opts || {};
-            // Cap concurrent bees to prevent DOM accumulation (bypass for konami swarm)
-            if (!opts.bypassCap && container.querySelectorAll('.bee').length >= 25) return;
-            var bee = document.createElement('div');
-            bee.className = 'bee bee--buzzing';
-            bee.textContent = '\uD83D\uDC1D';
-            bee.style.position = 'absolute';
-            bee.style.zIndex = '10000';
-
-            // 0.02% chance of rainbow bee (~2-3 per day)
-            var isRainbow = Math.random() < 0.0002;
-            // 0.04% chance of a rare visitor (butterfly or ladybug, ~5 per day)
-            var isVisitor = !isRainbow && Math.random() < 0.0004;
-
-            // Size variety: tiny worker, normal, or chonky queen
-            var sizeRoll = Math.random();
-            var size;
-            if (isVisitor) {
-                var visitor = pick(rareVisitors);
-                bee.textContent = visitor.emoji;
-                bee.classList.remove('bee--buzzing');
-                bee.classList.add(visitor.cls);
-                size = rand(22, 34);
-            } else if (isRainbow) {
-                size = rand(30, 38);  // slightly larger
-                bee.classList.remove('bee--buzzing');
-                bee.classList.add('bee--rainbow');
-            } else if (sizeRoll < 0.15) {
-                size = rand(14, 18);  // tiny baby bee
-                bee.classList.add('bee--tiny');
-            } else if (sizeRoll > 0.92) {
-                size = rand(36, 48);  // QUEEN
-                bee.classList.add('bee--queen');
-            } else {
-                size = rand(20, 32);  // normal worker
-            }
-            bee.style.fontSize = size + 'px';
-            container.appendChild(bee);
-
-            // Direction
-            var goingRight = opts.goingRight !== undefined ? opts.goingRight : (Math.random() > 0.4);
-            var margin = 60;
-            var startX = goingRight ? -margin : W + margin;
-            var endX = goingRight ? W + margin : -margin;
-            var startY = rand(50, H - 80);
-
-            // Pattern
-            var patName = opts.pattern || pick(patternNames);
-            var cfg = { startX: startX, endX: endX, startY: startY };
-
-            // Pattern-specific config
-            if (patName === 'wave') {
-                cfg.amplitude = rand(30, 100);
-                cfg.waves = rand(2, 6);
-            } else if (patName === 'loopy') {
-                cfg.amplitude = rand(40, 70);
-                cfg.loops = randInt(2, 4);
-                cfg.loopRadius = rand(25, 50);
-            } else if (patName === 'zigzag') {
-                cfg.amplitude = rand(40, 100);
-                cfg.zigs = randInt(4, 9);
-            } else if (patName === 'hover') {
-                cfg.darts = randInt(3, 6);
-                cfg.spots = [];
-                for (var s = 0; s <= cfg.darts; s++) {
-                    cfg.spots.push({ x: rand(margin, W - margin), y: rand(60, H - 80) });
-                }
-            } else if (patName === 'spiral') {
-                cfg.spirals = rand(2, 4);
-                cfg.spiralRadius = rand(30, 60);
-            } else if (patName === 'waggle') {
-                cfg.waggleCount = randInt(3, 6);
-                cfg.waggleSize = rand(50, 100);
-            } else if (patName === 'drunken') {
-                cfg.freqs = [rand(5, 9), rand(11, 17), rand(19, 27)];
-                cfg.phases = [rand(0, 6.28), rand(0, 6.28), rand(0, 6.28)];
-                cfg.amps = [rand(20, 50), rand(15, 35), rand(10, 20)];
-            } else if (patName === 'divebomb') {
-                cfg.diveAt = rand(0.3, 0.7);
-                cfg.diveDepth = rand(120, 250);
-            } else if (patName === 'pollinate') {
-                cfg.flowerStops = [];
-                // Visit up to 3 active flowers (skip fading ones)
-                var shuffled = activeFlowers.filter(function(f) { return !f.fading; }).sort(function() { return Math.random() - 0.5; });
-                for (var f = 0; f < Math.min(shuffled.length, 3); f++) {
-                    cfg.flowerStops.push({ x: shuffled[f].x, y: shuffled[f].y });
-                }
-                if (cfg.flowerStops.length === 0) {
-                    // No flowers? Just wave instead
-                    patName = 'wave';
-                    cfg.amplitude = rand(30, 80);
-                    cfg.waves = rand(2, 5);
-                }
-            }
-
-            var duration = rand(7000, 16000);
-            if (patName === 'hover') duration = rand(10000, 18000);
-            if (patName === 'pollinate') duration = rand(8000, 14000);
-            var startTime = Date.now();
-            var flipBase = goingRight ? 'scaleX(-1)' : 'scaleX(1)';
-            var pollenCounter = 0;
-            var lastPollenX = startX;
-            var lastPollenY = startY;
-
-            var staysOnScreen = (patName === 'hover' || patName === 'waggle' || patName === 'pollinate');
-
-            // For mid-screen patterns: when the pattern ends, fly off-screen
-            var exiting = false;
-            var exitStartTime = 0;
-            var exitStartX = 0;
-            var exitStartY = 0;
-            var exitGoingRight = Math.random() > 0.5;
-            var exitDuration = rand(2000, 3500);
-
-            function animateBee() {
-                var elapsed = Date.now() - startTime;
-                var p = Math.min(elapsed / duration, 1);
-                var x, y, angle, flip;
-
-                if (exiting) {
-                    // Exit phase: fly off the nearest edge in a gentle arc
-                    var exitElapsed = Date.now() - exitStartTime;
-                    var ep = Math.min(exitElapsed / exitDuration, 1);
-                    var ease = ep * ep; // accelerate out
-                    var exitTargetX = exitGoingRight ? W + 100 : -100;
-                    x = exitStartX + (exitTargetX - exitStartX) * ease;
-                    y = exitStartY + Math.sin(ep * Math.PI) * -40; // slight upward arc
-                    angle = (exitGoingRight ? -10 : 10) * ep;
-                    flip = exitGoingRight ? 'scaleX(-1)' : 'scaleX(1)';
-
-                    if (x < -100 || x > W + 100) {
-                        bee.remove();
-                        return;
-                    }
-                } else if (p >= 1 && staysOnScreen) {
-                    // Pattern finished — start exit phase
-                    exiting = true;
-                    exitStartTime = Date.now();
-                    exitStartX = parseFloat(bee.style.left) || W / 2;
-                    exitStartY = parseFloat(bee.style.top) || H / 2;
-                    // Fly toward whichever edge is closer
-                    exitGoingRight = exitStartX < W / 2 ? false : true;
-                    requestAnimationFrame(animateBee);
-                    return;
-                } else if (p >= 1) {
-                    // Cross-screen pattern done (safety fallback)
-                    bee.remove();
-                    return;
-                } else {
-                    // Normal pattern flight
-                    var pos = patterns[patName](p, cfg);
-                    y = clampY(pos.y);
-                    x = pos.x;
-                    angle = pos.angle || 0;
-
-                    // Cross-screen bees: remove when off-screen
-                    if (!staysOnScreen && p > 0.15 && (x < -80 || x > W + 80)) {
-                        bee.remove();
-                        return;
-                    }
-
-                    // Flip based on movement for mid-screen patterns
-                    flip = flipBase;
-                    if (staysOnScreen) {
-                        var dx = x - lastPollenX;
-                        if (Math.abs(dx) > 2) {
-                            flip = dx > 0 ? 'scaleX(-1)' : 'scaleX(1)';
-                        }
-                    }
-                }
-
-                // Cursor flee — repulsion within radius
-                if (_beeCursorX !== null && _beeCursorY !== null) {
-                    var cdx = x - _beeCursorX;
-                    var cdy = y - _beeCursorY;
-                    var cdist = Math.sqrt(cdx * cdx + cdy * cdy);
-                    if (cdist < _beeFleeRadius && cdist > 0) {
-                        var push = (_beeFleeRadius - cdist) / _beeFleeRadius * _beeFleeForce;
-                        x += (cdx / cdist) * push;
-                        y += (cdy / cdist) * push;
-                    }
-                }
-
-                bee.style.left = x + 'px';
-                bee.style.top = clampY(y) + 'px';
-                bee.style.transform = flip + ' rotate(' + (angle || 0) + 'deg)';
-
-                // Quick fade-in only (no fade-out — bees exit by leaving the screen)
-                var p2 = elapsed / duration;
-                if (p2 < 0.06) {
-                    bee.style.opacity = String((p2 / 0.06) * 0.9);
-                } else {
-                    bee.style.opacity = '0.9';
-                }
-
-                // Pollen trail — keep going until the bee is actually removed
-                pollenCounter++;
-                if (pollenCounter % 18 === 0) {
-                    var dist = Math.sqrt(Math.pow(x - lastPollenX, 2) + Math.pow(y - lastPollenY, 2));
-                    if (dist > 40 && x > -60 && x < W + 60) {
-                        spawnPollen(x + rand(-5, 5), y + rand(5, 15), isRainbow);
-                        lastPollenX = x;
-                        lastPollenY = y;
-                    }
-                }
-
-                requestAnimationFrame(animateBee);
-            }
-
-            requestAnimationFrame(animateBee);
-        }
-
-        // ========================
-        //  SWARM BURST
-        // ========================
-        function triggerSwarm() {
-            var count = randInt(5, 10);
-            var goingRight = Math.random() > 0.5;
-            for (var i = 0; i < count; i++) {
-                (function(delay) {
-                    var t = setTimeout(function() {
-                        createBee({ goingRight: goingRight, pattern: pick(['wave', 'drunken', 'zigzag']) });
-                    }, delay);
-                    beeTimers.push(t);
-                })(i * rand(80, 250));
-            }
-        }
-
-        // ========================
-        //  SCHEDULING
-        // ========================
-
-        // Regular bee spawning
-        var beeSpawnId = setInterval(function() {
-            createBee();
-        }, rand(6000, 10000));
-        beeTimers.push(beeSpawnId);
-
-        // Flower spawning
-        var flowerSpawnId = setInterval(function() {
-            createFlower();
-        }, rand(20000, 30000));
-        beeTimers.push(flowerSpawnId);
-
-        // Occasional swarm burst
-        var swarmId = setInterval(function() {
-            if (Math.random() < 0.3) triggerSwarm();
-        }, 45000);
-        beeTimers.push(swarmId);
-
-        // Initial population
-        createBee();
-        setTimeout(function() { createFlower(); }, 1500);
-
-        // ========================
-        //  BEE EASTER EGGS
-        // ========================
-
-        // --- 5. Bear Peek ---
-        function maybeBearPeek() {
-            if (Math.random() > 0.005) return; // 0.5% chance each check (~2-3 per day)
-
-            var bear = document.createElement('div');
-            bear.className = 'bee-bear';
-            bear.textContent = '\uD83D\uDC3B'; // 🐻
-
-            var edges = ['left', 'right', 'bottom'];
-            var edge = edges[Math.floor(Math.random() * edges.length)];
-            bear.classList.add('bee-bear--' + edge);
-
-            // Random position along the chosen edge
-            if (edge === 'left' || edge === 'right') {
-                bear.style.top = (10 + Math.random() * 80) + '%';
-            } else {
-                bear.style.left = (10 + Math.random() * 80) + '%';
-            }
-
-            document.body.appendChild(bear);
-
-            // Slide in by shifting the position property (not transform, so sniff wobble works)
-            requestAnimationFrame(function() {
-                requestAnimationFrame(function() {
-                    if (edge === 'left') {
-                        bear.style.left = '-12px';
-                    } else if (edge === 'right') {
-                        bear.style.right = '-12px';
-                    } else {
-                        bear.style.bottom = '-12px';
-                    }
-                    bear.classList.add('bee-bear--sniff');
-                });
-            });
-
-            // Pause 2s then slide back out
-            var hideTimer = setTimeout(function() {
-                bear.classList.remove('bee-bear--sniff');
-                if (edge === 'left') {
-                    bear.style.left = '-60px';
-                } else if (edge === 'right') {
-                    bear.style.right = '-60px';
-                } else {
-                    bear.style.bottom = '-60px';
-                }
-                // Remove after transition
-                setTimeout(function() { bear.remove(); }, 1000);
-            }, 2800);
-            beeTimers.push(hideTimer);
-        }
-
-        // Check every 15-25s
-        var _bearPeekTimer = null;
-        function scheduleBearPeek() {
-            var delay = 15000 + Math.random() * 10000;
-            _bearPeekTimer = setTimeout(function() {
-                maybeBearPeek();
-                scheduleBearPeek();
-            }, delay);
-        }
-        scheduleBearPeek();
-        beeTimers.push(function() { clearTimeout(_bearPeekTimer); });
-
-        // --- 6. Bee Landing on Ticket Row ---
-        function doBeeLanding() {
-            var rows = document.querySelectorAll('tr');
-            if (rows.length === 0) return;
-
-            var row = rows[Math.floor(Math.random() * rows.length)];
-            var rect = row.getBoundingClientRect();
-            if (rect.width === 0 || rect.height === 0) return;
-
-            var bee = document.createElement('div');
-            bee.className = 'bee-landing';
-            bee.textContent = '\uD83D\uDC1D'; // 🐝
-
-            // Use absolute positioning so the bee scrolls with the page
-            var scrollX = window.scrollX || window.pageXOffset;
-            var scrollY = window.scrollY || window.pageYOffset;
-
-            // Start from random edge (document coords)
-            var startX = Math.random() > 0.5 ? -40 : W + 40;
-            var startY = scrollY + rand(50, H - 50);
-            bee.style.left = startX + 'px';
-            bee.style.top = startY + 'px';
-            document.body.appendChild(bee);
-
-            // Fly to the row (convert viewport rect to document coords)
-            var targetX = scrollX + rect.left + rand(20, rect.width - 20);
-            var targetY = scrollY + rect.top + rect.height / 2;
-
-            requestAnimationFrame(function() {
-                bee.classList.add('bee-landing--flying');
-                bee.style.left = targetX + 'px';
-                bee.style.top = targetY + 'px';
-            });
-
-            // Land after flight
-            var landTimer = setTimeout(function() {
-                bee.classList.remove('bee-landing--flying');
-                bee.classList.add('bee-landing--landed');
-                row.classList.add('bee-row-highlight');
-
-                // Sit for 3-5s then fly off
-                var restTime = 3000 + Math.random() * 2000;
-                var flyOffTimer = setTimeout(function() {
-                    bee.classList.remove('bee-landing--landed');
-                    row.classList.remove('bee-row-highlight');
-                    bee.classList.add('bee-landing--flying');
-                    var curScrollY = window.scrollY || window.pageYOffset;
-                    var exitX = Math.random() > 0.5 ? W + 60 : -60;
-                    var exitY = curScrollY + rand(50, H - 50);
-                    bee.style.left = exitX + 'px';
-                    bee.style.top = exitY + 'px';
-                    bee.style.transform = '';
-
-                    var removeTimer = setTimeout(function() { bee.remove(); }, 1600);
-                    beeTimers.push(removeTimer);
-                }, restTime);
-                beeTimers.push(flyOffTimer);
-            }, 1600);
-            beeTimers.push(landTimer);
-        }
-
-        function maybeBeeLanding() {
-            if (Math.random() > 0.008) return;
-            doBeeLanding();
-        }
-
-        // Check every 20-45s
-        var _beeLandingTimer = null;
-        function scheduleBeeLanding() {
-            var delay = 20000 + Math.random() * 25000;
-            _beeLandingTimer = setTimeout(function() {
-                maybeBeeLanding();
-                scheduleBeeLanding();
-            }, delay);
-        }
-        scheduleBeeLanding();
-        beeTimers.push(function() { clearTimeout(_beeLandingTimer); });
-
-        // --- 7. Honey Drip ---
-        function doHoneyDrip() {
-            var cards = document.querySelectorAll('.card');
-            if (cards.length === 0) return;
-
-            var card = cards[Math.floor(Math.random() * cards.length)];
-            // Card needs relative positioning for the drips
-            var origPosition = card.style.position;
-            if (getComputedStyle(card).position === 'static') {
-                card.style.position = 'relative';
-            }
-
-            var count = 3 + Math.floor(Math.random() * 4); // 3-6 drips
-            var drips = [];
-            for (var i = 0; i < count; i++) {
-                (function(idx) {
-                    var delay = idx * (150 + Math.random() * 300);
-                    var t = setTimeout(function() {
-                        var drip = document.createElement('div');
-                        drip.className = 'honey-drip';
-                        drip.style.left = (15 + Math.random() * (card.offsetWidth - 30)) + 'px';
-                        card.appendChild(drip);
-                        drips.push(drip);
-                    }, delay);
-                    beeTimers.push(t);
-                })(i);
-            }
-
-            // Clean up all drips after animation
-            var cleanupTimer = setTimeout(function() {
-                drips.forEach(function(d) { d.remove(); });
-                if (origPosition !== undefined) card.style.position = origPosition;
-            }, 4500);
-            beeTimers.push(cleanupTimer);
-        }
-
-        function maybeHoneyDrip() {
-            if (Math.random() > 0.003) return;
-            doHoneyDrip();
-        }
-
-        // Check every 30-60s
-        var _honeyDripTimer = null;
-        function scheduleHoneyDrip() {
-            var delay = 30000 + Math.random() * 30000;
-            _honeyDripTimer = setTimeout(function() {
-                maybeHoneyDrip();
-                scheduleHoneyDrip();
-            }, delay);
-        }
-        scheduleHoneyDrip();
-        beeTimers.push(function() { clearTimeout(_honeyDripTimer); });
-
-        // --- 8. Queen Bee Procession ---
-        function doQueenProcession() {
-            var procession = document.createElement('div');
-            procession.className = 'bee-procession';
-            document.body.appendChild(procession);
-
-            var goingRight = Math.random() > 0.5;
-            var startX = goingRight ? -80 : W + 80;
-            var endX = goingRight ? W + 80 : -80;
-            var baseY = rand(100, H - 150);
-            var duration = 6000 + Math.random() * 3000;
-            var startTime = Date.now();
-
-            // Queen element
-            var queen = document.createElement('div');
-            queen.className = 'bee-procession-queen';
-            queen.innerHTML = '\uD83D\uDC1D'; // 🐝
-            var crown = document.createElement('span');
-            crown.className = 'bee-crown';
-            crown.textContent = '\uD83D\uDC51'; // 👑
-            queen.appendChild(crown);
-            procession.appendChild(queen);
-
-            // Worker bees in V-formation (5-8)
-            var workerCount = 5 + Math.floor(Math.random() * 4);
-            var workers = [];
-            for (var i = 0; i < workerCount; i++) {
-                var w = document.createElement('div');
-                w.className = 'bee-procession-worker';
-                w.textContent = '\uD83D\uDC1D'; // 🐝
-                procession.appendChild(w);
-                // V-formation offsets: alternating sides, increasing distance
-                var row = Math.floor(i / 2) + 1;
-                var side = (i % 2 === 0) ? 1 : -1;
-                workers.push({
-                    el: w,
-                    offsetX: -row * 35 * (goingRight ? 1 : -1), // behind queen
-                    offsetY: side * row * 25,
-                    jitterPhase: Math.random() * Math.PI * 2,
-                    delay: row * 0.03 // slight lag behind queen
-                });
-            }
-
-            function animateProcession() {
-                var elapsed = Date.now() - startTime;
-                var p = Math.min(elapsed / duration, 1);
-
-                // Queen position with gentle wave
-                var qx = startX + (endX - startX) * p;
-                var qy = baseY + Math.sin(p * Math.PI * 4) * 20;
-                queen.style.left = qx + 'px';
-                queen.style.top = qy + 'px';
-                queen.style.transform = goingRight ? 'scaleX(-1)' : 'scaleX(1)';
-
-                // Workers follow
-                for (var i = 0; i < workers.length; i++) {
-                    var wk = workers[i];
-                    var wp = Math.max(0, Math.min(p - wk.delay, 1));
-                    var wx = startX + (endX - startX) * wp + wk.offsetX;
-                    var wy = baseY + Math.sin(wp * Math.PI * 4) * 20 + wk.offsetY;
-                    // Individual jitter
-                    wx += Math.sin(elapsed * 0.005 + wk.jitterPhase) * 4;
-                    wy += Math.cos(elapsed * 0.007 + wk.jitterPhase) * 3;
-                    wk.el.style.left = wx + 'px';
-                    wk.el.style.top = wy + 'px';
-                    wk.el.style.transform = goingRight ? 'scaleX(-1)' : 'scaleX(1)';
-                }
-
-                if (p < 1) {
-                    requestAnimationFrame(animateProcession);
-                } else {
-                    procession.remove();
-                }
-            }
-            requestAnimationFrame(animateProcession);
-        }
-
-        function maybeQueenProcession() {
-            if (Math.random() > 0.004) return;
-            doQueenProcession();
-        }
-
-        // Check every 40-80s
-        var _queenTimer = null;
-        function scheduleQueenProcession() {
-            var delay = 40000 + Math.random() * 40000;
-            _queenTimer = setTimeout(function() {
-                maybeQueenProcession();
-                scheduleQueenProcession();
-            }, delay);
-        }
-        scheduleQueenProcession();
-        beeTimers.push(function() { clearTimeout(_queenTimer); });
-
-        // Expose forced triggers for debug menu
-        window._debugEasterEggs = window._debugEasterEggs || {};
-        window._debugEasterEggs.beeLanding = doBeeLanding;
-        window._debugEasterEggs.honeyDrip = doHoneyDrip;
-        window._debugEasterEggs.queenProcession = doQueenProcession;
-        window._debugEasterEggs.bearPeek = function() {
-            // Force bear peek (bypassing probability)
-            var bear = document.createElement('div');
-            bear.className = 'bee-bear';
-            bear.textContent = '\uD83D\uDC3B';
-            var edges = ['left', 'right', 'bottom'];
-            var edge = edges[Math.floor(Math.random() * edges.length)];
-            bear.classList.add('bee-bear--' + edge);
-            if (edge === 'left' || edge === 'right') {
-                bear.style.top = (10 + Math.random() * 80) + '%';
-            } else {
-                bear.style.left = (10 + Math.random() * 80) + '%';
-            }
-            document.body.appendChild(bear);
-            requestAnimationFrame(function() {
-                requestAnimationFrame(function() {
-                    if (edge === 'left') bear.style.left = '-12px';
-                    else if (edge === 'right') bear.style.right = '-12px';
-                    else bear.style.bottom = '-12px';
-                    bear.classList.add('bee-bear--sniff');
-                });
-            });
-            var hideTimer = setTimeout(function() {
-                bear.classList.remove('bee-bear--sniff');
-                if (edge === 'left') bear.style.left = '-60px';
-                else if (edge === 'right') bear.style.right = '-60px';
-                else bear.style.bottom = '-60px';
-                setTimeout(function() { bear.remove(); }, 1000);
-            }, 2800);
-            beeTimers.push(hideTimer);
-        };
-        window._debugEasterEggs.beeSwarm = triggerSwarm;
-        window._debugEasterEggs.spawnButterfly = function() {
-            var bee = document.createElement('div');
-            bee.className = 'bee bee--butterfly';
-            bee.textContent = '\uD83E\uDD8B'; // 🦋
-            bee.style.position = 'absolute';
-            bee.style.zIndex = '10000';
-            bee.style.fontSize = rand(24, 34) + 'px';
-            container.appendChild(bee);
-            var goRight = Math.random() > 0.5;
-            var sx = goRight ? -60 : W + 60;
-            var ex = goRight ? W + 60 : -60;
-            var sy = rand(50, H - 80);
-            var dur = rand(8000, 14000);
-            var st = Date.now();
-            var flip = goRight ? 'scaleX(-1)' : 'scaleX(1)';
-            (function anim() {
-                var p = Math.min((Date.now() - st) / dur, 1);
-                var x = sx + (ex - sx) * p;
-                var y = sy + Math.sin(p * Math.PI * 5) * 70;
-                bee.style.left = x + 'px';
-                bee.style.top = y + 'px';
-                bee.style.transform = flip + ' rotate(' + (Math.sin(p * 20) * 10) + 'deg)';
-                bee.style.opacity = p < 0.05 ? String(p / 0.05) : (p > 0.92 ? String((1 - p) / 0.08) : '0.9');
-                if (p < 1) requestAnimationFrame(anim);
-                else bee.remove();
-            })();
-        };
-        window._debugEasterEggs.spawnLadybug = function() {
-            var bee = document.createElement('div');
-            bee.className = 'bee bee--ladybug';
-            bee.textContent = '\uD83D\uDC1E'; // 🐞
-            bee.style.position = 'absolute';
-            bee.style.zIndex = '10000';
-            bee.style.fontSize = rand(22, 32) + 'px';
-            container.appendChild(bee);
-            var goRight = Math.random() > 0.5;
-            var sx = goRight ? -60 : W + 60;
-            var ex = goRight ? W + 60 : -60;
-            var sy = rand(50, H - 80);
-            var dur = rand(8000, 14000);
-            var st = Date.now();
-            var flip = goRight ? 'scaleX(-1)' : 'scaleX(1)';
-            (function anim() {
-                var p = Math.min((Date.now() - st) / dur, 1);
-                var x = sx + (ex - sx) * p;
-                var y = sy + Math.sin(p * Math.PI * 3) * 50;
-                bee.style.left = x + 'px';
-                bee.style.top = y + 'px';
-                bee.style.transform = flip + ' rotate(' + (Math.sin(p * 15) * 8) + 'deg)';
-                bee.style.opacity = p < 0.05 ? String(p / 0.05) : (p > 0.92 ? String((1 - p) / 0.08) : '0.9');
-                if (p < 1) requestAnimationFrame(anim);
-                else bee.remove();
-            })();
-        };
-        window._debugEasterEggs.rainbowBee = function() {
-            // Spawn a single rainbow bee
-            var bee = document.createElement('div');
-            bee.className = 'bee bee--rainbow';
-            bee.textContent = '\uD83D\uDC1D';
-            bee.style.position = 'absolute';
-            bee.style.zIndex = '10000';
-            bee.style.fontSize = rand(30, 38) + 'px';
-            container.appendChild(bee);
-            var goRight = Math.random() > 0.5;
-            var sx = goRight ? -60 : W + 60;
-            var ex = goRight ? W + 60 : -60;
-            var sy = rand(50, H - 80);
-            var dur = rand(7000, 12000);
-            var st = Date.now();
-            var flip = goRight ? 'scaleX(-1)' : 'scaleX(1)';
-            (function anim() {
-                var p = Math.min((Date.now() - st) / dur, 1);
-                var x = sx + (ex - sx) * p;
-                var y = sy + Math.sin(p * Math.PI * 4) * 60;
-                bee.style.left = x + 'px';
-                bee.style.top = y + 'px';
-                bee.style.transform = flip + ' rotate(' + (Math.sin(p * 20) * 12) + 'deg)';
-                bee.style.opacity = p < 0.05 ? String(p / 0.05) : '0.9';
-                if (p < 1) requestAnimationFrame(anim);
-                else bee.remove();
-            })();
-        };
-
-        // --- Konami: Unleash the Swarm ---
-        konamiCallback = function() {
-            var swarmCount = 100 + Math.floor(Math.random() * 51);
-            playBeeSwarmBuzz();
-            for (var i = 0; i < swarmCount; i++) {
-                (function(delay) {
-                    var t = setTimeout(function() {
-                        createBee({
-                            goingRight: Math.random() > 0.5,
-                            pattern: pick(['wave', 'drunken', 'zigzag', 'divebomb', 'loopy']),
-                            bypassCap: true
-                        });
-                    }, delay);
-                    beeTimers.push(t);
-                })(i * rand(30, 120));
-            }
-        };
-
-    }
-
-    // --- Japan Theme (Sakura) ---
-    var japanTimers = [];
-    var japanResizeHandler = null;
-
-    function handleJapanAnimation(active) {
-        var container = document.getElementById('japan-container');
-        if (!container) return;
-
-        if (!active) {
-            japanTimers.forEach(function(id) { clearInterval(id); clearTimeout(id); });
-            japanTimers = [];
-            if (japanResizeHandler) {
-                window.removeEventListener('resize', japanResizeHandler);
-                japanResizeHandler = null;
-            }
-            document.querySelectorAll('.sakura-petal, .lucky-cat, .zen-overlay').forEach(function(el) { el.remove(); });
-            container.innerHTML = '';
-            return;
-        }
-
-        var W = window.innerWidth;
-        var H = window.innerHeight;
-        japanResizeHandler = function() { W = window.innerWidth; H = window.innerHeight; };
-        window.addEventListener('resize', japanResizeHandler);
-
-        function rand(min, max) { return min + Math.random() * (max - min); }
-
-        // --- Sakura Petal Fall ---
-        function spawnPetal() {
-            var petal = document.createElement('div');
-            petal.className = 'sakura-petal';
-            petal.textContent = '\uD83C\uDF38'; // 🌸
-            petal.style.fontSize = rand(14, 28) + 'px';
-            petal.style.left = rand(-20, W + 20) + 'px';
-            petal.style.top = '-30px';
-            petal.style.opacity = '0';
-            container.appendChild(petal);
-
-            var fallDuration = rand(5000, 9000);
-            var swayAmplitude = rand(30, 80);
-            var swaySpeed = rand(2, 4);
-            var startX = parseFloat(petal.style.left);
-            var startTime = Date.now();
-            var rotSpeed = rand(-180, 180);
-
-            function animatePetal() {
-                var elapsed = Date.now() - startTime;
-                var p = elapsed / fallDuration;
-                if (p >= 1) { petal.remove(); return; }
-
-                var y = -30 + (H + 60) * p;
-                var x = startX + Math.sin(p * Math.PI * swaySpeed) * swayAmplitude;
-                var rot = elapsed / 1000 * rotSpeed;
-
-                // Fade in/out
-                var opacity = 0.9;
-                if (p < 0.1) opacity = p / 0.1 * 0.9;
-                else if (p > 0.85) opacity = (1 - p) / 0.15 * 0.9;
-
-                petal.style.top = y + 'px';
-                petal.style.left = x + 'px';
-                petal.style.opacity = String(opacity);
-                petal.style.transform = 'rotate(' + rot + 'deg)';
-                requestAnimationFrame(animatePetal);
-            }
-            requestAnimationFrame(animatePetal);
-        }
-
-        // Initial burst
-        for (var i = 0; i < 5; i++) {
-            (function(delay) {
-                var t = setTimeout(function() { spawnPetal(); }, delay);
-                japanTimers.push(t);
-            })(i * 200);
-        }
-
-        // Continuous spawning
-        var petalSpawnId = setInterval(function() {
-            spawnPetal();
-        }, 800 + Math.random() * 700);
-        japanTimers.push(petalSpawnId);
-
-        // --- Lucky Cat Peek ---
-        function doLuckyCat() {
-            var cat = document.createElement('div');
-            cat.className = 'lucky-cat';
-            cat.textContent = '\uD83D\uDC31'; // 🐱
-            document.body.appendChild(cat);
-
-            requestAnimationFrame(function() {
-                requestAnimationFrame(function() {
-                    cat.classList.add('lucky-cat--visible');
-                    cat.classList.add('lucky-cat--wave');
-                });
-            });
-
-            var hideTimer = setTimeout(function() {
-                cat.classList.remove('lucky-cat--visible');
-                cat.classList.remove('lucky-cat--wave');
-                setTimeout(function() { cat.remove(); }, 700);
-            }, 4000);
-            japanTimers.push(hideTimer);
-        }
-
-        function scheduleLuckyCat() {
-            var delay = 30000 + Math.random() * 30000;
-            var t = setTimeout(function() {
-                if (Math.random() < 0.008) doLuckyCat();
-                scheduleLuckyCat();
-            }, delay);
-            japanTimers.push(t);
-        }
-        scheduleLuckyCat();
-
-        // --- Zen Mode Overlay ---
-        function showZenMode() {
-            var overlay = document.createElement('div');
-            overlay.className = 'zen-overlay';
-            overlay.innerHTML = '<div class="zen-overlay__icon">\u26E9\uFE0F</div><div class="zen-overlay__text">Zen</div>';
-            document.body.appendChild(overlay);
-
-            requestAnimationFrame(function() {
-                overlay.classList.add('zen-overlay--visible');
-            });
-
-            function dismiss() {
-                overlay.classList.remove('zen-overlay--visible');
-                setTimeout(function() { overlay.remove(); }, 500);
-            }
-
-            overlay.addEventListener('click', dismiss);
-            var autoTimer = setTimeout(dismiss, 5000);
-            japanTimers.push(autoTimer);
-        }
-
-        // --- Sakura Burst (for debug/konami) ---
-        function sakuraBurst() {
-            for (var i = 0; i < 40; i++) {
-                (function(delay) {
-                    var t = setTimeout(function() { spawnPetal(); }, delay);
-                    japanTimers.push(t);
-                })(i * 50);
-            }
-        }
-
-        // --- Konami: sakura storm + zen ---
-        konamiCallback = function() {
-            sakuraBurst();
-            var zenTimer = setTimeout(showZenMode, 2000);
-            japanTimers.push(zenTimer);
-        };
-
-        // Expose for debug
-        window._debugEasterEggs = window._debugEasterEggs || {};
-        window._debugEasterEggs.sakuraBurst = sakuraBurst;
-        window._debugEasterEggs.luckyCat = doLuckyCat;
-        window._debugEasterEggs.zenMode = showZenMode;
-    }
-
     // handleGoldKonami removed — gold uses the default random pool,
-    // and konamiCallback is now reset centrally before handler calls.
-
-    function triggerBSOD() {
-        var bsodAudio = new Audio('/static/audio/windows-bsod.mp3');
-        bsodAudio.play().catch(function() {});
-        var overlay = document.createElement('div');
-        overlay.style.cssText = 'position:fixed;top:0;left:0;width:100%;height:100%;background:#0078D7;z-index:999999;display:flex;flex-direction:column;justify-content:center;padding-left:10%;font-family:Segoe UI,sans-serif;color:white;cursor:default;';
-        overlay.innerHTML =
-            '<div style="font-size:7rem;margin-bottom:2rem;">:(</div>' +
-            '<div style="font-size:1.5rem;max-width:700px;line-height:1.8;margin-bottom:2rem;">' +
-            'Your device ran into a problem and needs to restart. We\'re just collecting some error info, and then we\'ll restart for you.</div>' +
-            '<div style="font-size:1.1rem;max-width:700px;margin-bottom:2.5rem;"><span id="bsod-pct">0</span>% complete</div>' +
-            '<div style="display:flex;align-items:flex-start;gap:1.2rem;max-width:700px;">' +
-            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 29 29" width="80" height="80" style="flex-shrink:0;"><rect width="29" height="29" fill="white"/><path d="M0,0h1v1h-1zM1,0h1v1h-1zM2,0h1v1h-1zM3,0h1v1h-1zM4,0h1v1h-1zM5,0h1v1h-1zM6,0h1v1h-1zM10,0h1v1h-1zM15,0h1v1h-1zM17,0h1v1h-1zM18,0h1v1h-1zM19,0h1v1h-1zM22,0h1v1h-1zM23,0h1v1h-1zM24,0h1v1h-1zM25,0h1v1h-1zM26,0h1v1h-1zM27,0h1v1h-1zM28,0h1v1h-1zM0,1h1v1h-1zM6,1h1v1h-1zM8,1h1v1h-1zM9,1h1v1h-1zM10,1h1v1h-1zM13,1h1v1h-1zM14,1h1v1h-1zM15,1h1v1h-1zM16,1h1v1h-1zM17,1h1v1h-1zM18,1h1v1h-1zM20,1h1v1h-1zM22,1h1v1h-1zM28,1h1v1h-1zM0,2h1v1h-1zM2,2h1v1h-1zM3,2h1v1h-1zM4,2h1v1h-1zM6,2h1v1h-1zM8,2h1v1h-1zM14,2h1v1h-1zM17,2h1v1h-1zM19,2h1v1h-1zM20,2h1v1h-1zM22,2h1v1h-1zM24,2h1v1h-1zM25,2h1v1h-1zM26,2h1v1h-1zM28,2h1v1h-1zM0,3h1v1h-1zM2,3h1v1h-1zM3,3h1v1h-1zM4,3h1v1h-1zM6,3h1v1h-1zM9,3h1v1h-1zM12,3h1v1h-1zM15,3h1v1h-1zM16,3h1v1h-1zM22,3h1v1h-1zM24,3h1v1h-1zM25,3h1v1h-1zM26,3h1v1h-1zM28,3h1v1h-1zM0,4h1v1h-1zM2,4h1v1h-1zM3,4h1v1h-1zM4,4h1v1h-1zM6,4h1v1h-1zM8,4h1v1h-1zM9,4h1v1h-1zM10,4h1v1h-1zM12,4h1v1h-1zM15,4h1v1h-1zM17,4h1v1h-1zM18,4h1v1h-1zM22,4h1v1h-1zM24,4h1v1h-1zM25,4h1v1h-1zM26,4h1v1h-1zM28,4h1v1h-1zM0,5h1v1h-1zM6,5h1v1h-1zM8,5h1v1h-1zM10,5h1v1h-1zM12,5h1v1h-1zM13,5h1v1h-1zM14,5h1v1h-1zM15,5h1v1h-1zM16,5h1v1h-1zM17,5h1v1h-1zM18,5h1v1h-1zM19,5h1v1h-1zM22,5h1v1h-1zM28,5h1v1h-1zM0,6h1v1h-1zM1,6h1v1h-1zM2,6h1v1h-1zM3,6h1v1h-1zM4,6h1v1h-1zM5,6h1v1h-1zM6,6h1v1h-1zM8,6h1v1h-1zM10,6h1v1h-1zM12,6h1v1h-1zM14,6h1v1h-1zM16,6h1v1h-1zM18,6h1v1h-1zM20,6h1v1h-1zM22,6h1v1h-1zM23,6h1v1h-1zM24,6h1v1h-1zM25,6h1v1h-1zM26,6h1v1h-1zM27,6h1v1h-1zM28,6h1v1h-1zM8,7h1v1h-1zM10,7h1v1h-1zM11,7h1v1h-1zM14,7h1v1h-1zM17,7h1v1h-1zM18,7h1v1h-1zM19,7h1v1h-1zM0,8h1v1h-1zM1,8h1v1h-1zM3,8h1v1h-1zM6,8h1v1h-1zM7,8h1v1h-1zM11,8h1v1h-1zM12,8h1v1h-1zM14,8h1v1h-1zM22,8h1v1h-1zM23,8h1v1h-1zM24,8h1v1h-1zM26,8h1v1h-1zM27,8h1v1h-1zM0,9h1v1h-1zM1,9h1v1h-1zM2,9h1v1h-1zM4,9h1v1h-1zM9,9h1v1h-1zM11,9h1v1h-1zM12,9h1v1h-1zM13,9h1v1h-1zM14,9h1v1h-1zM16,9h1v1h-1zM17,9h1v1h-1zM18,9h1v1h-1zM20,9h1v1h-1zM22,9h1v1h-1zM25,9h1v1h-1zM28,9h1v1h-1zM2,10h1v1h-1zM3,10h1v1h-1zM4,10h1v1h-1zM5,10h1v1h-1zM6,10h1v1h-1zM7,10h1v1h-1zM8,10h1v1h-1zM11,10h1v1h-1zM12,10h1v1h-1zM16,10h1v1h-1zM17,10h1v1h-1zM19,10h1v1h-1zM20,10h1v1h-1zM22,10h1v1h-1zM25,10h1v1h-1zM26,10h1v1h-1zM27,10h1v1h-1zM1,11h1v1h-1zM2,11h1v1h-1zM7,11h1v1h-1zM8,11h1v1h-1zM9,11h1v1h-1zM10,11h1v1h-1zM11,11h1v1h-1zM12,11h1v1h-1zM13,11h1v1h-1zM15,11h1v1h-1zM18,11h1v1h-1zM23,11h1v1h-1zM24,11h1v1h-1zM26,11h1v1h-1zM27,11h1v1h-1zM1,12h1v1h-1zM4,12h1v1h-1zM5,12h1v1h-1zM6,12h1v1h-1zM8,12h1v1h-1zM10,12h1v1h-1zM11,12h1v1h-1zM13,12h1v1h-1zM17,12h1v1h-1zM19,12h1v1h-1zM20,12h1v1h-1zM21,12h1v1h-1zM22,12h1v1h-1zM25,12h1v1h-1zM27,12h1v1h-1zM28,12h1v1h-1zM0,13h1v1h-1zM1,13h1v1h-1zM2,13h1v1h-1zM5,13h1v1h-1zM9,13h1v1h-1zM11,13h1v1h-1zM15,13h1v1h-1zM17,13h1v1h-1zM19,13h1v1h-1zM21,13h1v1h-1zM23,13h1v1h-1zM1,14h1v1h-1zM2,14h1v1h-1zM4,14h1v1h-1zM6,14h1v1h-1zM7,14h1v1h-1zM9,14h1v1h-1zM10,14h1v1h-1zM11,14h1v1h-1zM13,14h1v1h-1zM14,14h1v1h-1zM16,14h1v1h-1zM17,14h1v1h-1zM18,14h1v1h-1zM20,14h1v1h-1zM21,14h1v1h-1zM25,14h1v1h-1zM26,14h1v1h-1zM27,14h1v1h-1zM28,14h1v1h-1zM3,15h1v1h-1zM4,15h1v1h-1zM5,15h1v1h-1zM7,15h1v1h-1zM8,15h1v1h-1zM11,15h1v1h-1zM13,15h1v1h-1zM14,15h1v1h-1zM15,15h1v1h-1zM16,15h1v1h-1zM17,15h1v1h-1zM18,15h1v1h-1zM19,15h1v1h-1zM20,15h1v1h-1zM22,15h1v1h-1zM25,15h1v1h-1zM27,15h1v1h-1zM1,16h1v1h-1zM2,16h1v1h-1zM3,16h1v1h-1zM4,16h1v1h-1zM5,16h1v1h-1zM6,16h1v1h-1zM7,16h1v1h-1zM10,16h1v1h-1zM12,16h1v1h-1zM13,16h1v1h-1zM17,16h1v1h-1zM19,16h1v1h-1zM20,16h1v1h-1zM21,16h1v1h-1zM23,16h1v1h-1zM27,16h1v1h-1zM1,17h1v1h-1zM3,17h1v1h-1zM7,17h1v1h-1zM10,17h1v1h-1zM12,17h1v1h-1zM16,17h1v1h-1zM18,17h1v1h-1zM22,17h1v1h-1zM23,17h1v1h-1zM25,17h1v1h-1zM28,17h1v1h-1zM0,18h1v1h-1zM2,18h1v1h-1zM4,18h1v1h-1zM6,18h1v1h-1zM11,18h1v1h-1zM12,18h1v1h-1zM14,18h1v1h-1zM20,18h1v1h-1zM21,18h1v1h-1zM22,18h1v1h-1zM23,18h1v1h-1zM27,18h1v1h-1zM28,18h1v1h-1zM5,19h1v1h-1zM8,19h1v1h-1zM9,19h1v1h-1zM10,19h1v1h-1zM12,19h1v1h-1zM15,19h1v1h-1zM17,19h1v1h-1zM19,19h1v1h-1zM22,19h1v1h-1zM27,19h1v1h-1zM28,19h1v1h-1zM0,20h1v1h-1zM3,20h1v1h-1zM5,20h1v1h-1zM6,20h1v1h-1zM8,20h1v1h-1zM9,20h1v1h-1zM10,20h1v1h-1zM13,20h1v1h-1zM14,20h1v1h-1zM15,20h1v1h-1zM20,20h1v1h-1zM21,20h1v1h-1zM22,20h1v1h-1zM23,20h1v1h-1zM24,20h1v1h-1zM26,20h1v1h-1zM8,21h1v1h-1zM9,21h1v1h-1zM10,21h1v1h-1zM11,21h1v1h-1zM13,21h1v1h-1zM17,21h1v1h-1zM19,21h1v1h-1zM20,21h1v1h-1zM24,21h1v1h-1zM26,21h1v1h-1zM27,21h1v1h-1zM28,21h1v1h-1zM0,22h1v1h-1zM1,22h1v1h-1zM2,22h1v1h-1zM3,22h1v1h-1zM4,22h1v1h-1zM5,22h1v1h-1zM6,22h1v1h-1zM8,22h1v1h-1zM9,22h1v1h-1zM10,22h1v1h-1zM14,22h1v1h-1zM17,22h1v1h-1zM18,22h1v1h-1zM20,22h1v1h-1zM22,22h1v1h-1zM24,22h1v1h-1zM27,22h1v1h-1zM0,23h1v1h-1zM6,23h1v1h-1zM10,23h1v1h-1zM13,23h1v1h-1zM16,23h1v1h-1zM18,23h1v1h-1zM20,23h1v1h-1zM24,23h1v1h-1zM25,23h1v1h-1zM26,23h1v1h-1zM28,23h1v1h-1zM0,24h1v1h-1zM2,24h1v1h-1zM3,24h1v1h-1zM4,24h1v1h-1zM6,24h1v1h-1zM9,24h1v1h-1zM12,24h1v1h-1zM17,24h1v1h-1zM20,24h1v1h-1zM21,24h1v1h-1zM22,24h1v1h-1zM23,24h1v1h-1zM24,24h1v1h-1zM0,25h1v1h-1zM2,25h1v1h-1zM3,25h1v1h-1zM4,25h1v1h-1zM6,25h1v1h-1zM8,25h1v1h-1zM9,25h1v1h-1zM10,25h1v1h-1zM11,25h1v1h-1zM12,25h1v1h-1zM14,25h1v1h-1zM19,25h1v1h-1zM22,25h1v1h-1zM24,25h1v1h-1zM25,25h1v1h-1zM26,25h1v1h-1zM27,25h1v1h-1zM0,26h1v1h-1zM2,26h1v1h-1zM3,26h1v1h-1zM4,26h1v1h-1zM6,26h1v1h-1zM10,26h1v1h-1zM12,26h1v1h-1zM17,26h1v1h-1zM18,26h1v1h-1zM19,26h1v1h-1zM21,26h1v1h-1zM24,26h1v1h-1zM25,26h1v1h-1zM26,26h1v1h-1zM28,26h1v1h-1zM0,27h1v1h-1zM6,27h1v1h-1zM8,27h1v1h-1zM12,27h1v1h-1zM13,27h1v1h-1zM14,27h1v1h-1zM16,27h1v1h-1zM17,27h1v1h-1zM20,27h1v1h-1zM24,27h1v1h-1zM27,27h1v1h-1zM0,28h1v1h-1zM1,28h1v1h-1zM2,28h1v1h-1zM3,28h1v1h-1zM4,28h1v1h-1zM5,28h1v1h-1zM6,28h1v1h-1zM8,28h1v1h-1zM11,28h1v1h-1zM12,28h1v1h-1zM13,28h1v1h-1zM14,28h1v1h-1zM15,28h1v1h-1zM16,28h1v1h-1zM17,28h1v1h-1zM18,28h1v1h-1zM20,28h1v1h-1zM23,28h1v1h-1zM24,28h1v1h-1zM27,28h1v1h-1z" fill="black"/></svg>' +
-            '<div style="font-size:0.85rem;line-height:1.6;opacity:0.9;">' +
-            'For more information about this issue and possible fixes, visit<br>https://www.windows.com/stopcode<br><br>' +
-            'If you call a support person, give them this info:<br>Stop code: HAVE_YOU_TRIED_TURNING_IT_OFF_AND_ON_AGAIN</div></div>';
-        document.body.appendChild(overlay);
-
-        var pct = 0;
-        var pctEl = overlay.querySelector('#bsod-pct');
-        var bsodTimer = setInterval(function() {
-            pct += Math.floor(Math.random() * 12) + 3;
-            if (pct > 100) pct = 100;
-            pctEl.textContent = pct;
-            if (pct >= 100) {
-                clearInterval(bsodTimer);
-                setTimeout(function() { overlay.remove(); }, 1500);
-            }
-        }, 500);
+    // and the Konami handler is now reset centrally before theme switches.
+
+    // Theme animations load with their theme and stop when it changes
+    function applyThemeEffects(color) {
+        BeaconEffects.konami = null;
+        BeaconEffects.toggle('matrix', 'handle', color === 'matrix');
+        BeaconEffects.toggle('bee', 'handle', color === 'bee');
+        handleBeeconName(color === 'bee');
+        BeaconEffects.toggle('japan', 'handle', color === 'japan');
     }
 
     // --- Dark/Light Toggle ---
@@ -2226,19 +221,11 @@
             localStorage.setItem(STORAGE_KEYS.colorTheme, color);
 
             // Toggle Easter eggs
-            konamiCallback = null;
-            handleMatrixRain(color === 'matrix');
-            handleBeeAnimation(color === 'bee');
-            handleBeeconName(color === 'bee');
-            handleJapanAnimation(color === 'japan');
+            applyThemeEffects(color);
         });
 
         // Initialize Easter eggs on page load
-        konamiCallback = null;
-        handleMatrixRain(currentColor === 'matrix');
-        handleBeeAnimation(currentColor === 'bee');
-        handleBeeconName(currentColor === 'bee');
-        handleJapanAnimation(currentColor === 'japan');
+        applyThemeEffects(currentColor);
     }
 
     // --- Kiosk Mode: duplicate theme controls ---
@@ -2281,26 +268,18 @@
             }
             localStorage.setItem(STORAGE_KEYS.colorTheme, color);
 
-            konamiCallback = null;
-            handleMatrixRain(color === 'matrix');
-            handleBeeAnimation(color === 'bee');
-            handleBeeconName(color === 'bee');
-            handleJapanAnimation(color === 'japan');
+            applyThemeEffects(color);
         });
     }
 
     // Expose IIFE-level easter eggs for debug menu
     window._debugEasterEggs = window._debugEasterEggs || {};
-    window._debugEasterEggs.bsod = triggerBSOD;
-    window._debugEasterEggs.retroCRT = triggerRetro;
-    window._debugEasterEggs.nyanCat = triggerNyanCat;
-    window._debugEasterEggs.alertCascade = triggerAlertCascade;
+    window._debugEasterEggs.bsod = function() { BeaconEffects.call('konami', 'bsod'); };
+    window._debugEasterEggs.retroCRT = function() { BeaconEffects.call('konami', 'retro'); };
+    window._debugEasterEggs.nyanCat = function() { BeaconEffects.call('konami', 'nyanCat'); };
+    window._debugEasterEggs.alertCascade = function() { BeaconEffects.call('konami', 'alertCascade'); };
     function disableAllThemes() {
-        konamiCallback = null;
-        handleMatrixRain(false);
-        handleBeeAnimation(false);
-        handleBeeconName(false);
-        handleJapanAnimation(false);
+        applyThemeEffects('');
     }
 
     window._debugEasterEggs.lockThemes = function() {
@@ -2346,322 +325,10 @@
     }
 })();
 
-// === DEBUG EASTER EGG PANEL (Ctrl+Shift+E) ===
-// To remove: delete everything from this line to "END DEBUG EASTER EGG PANEL" below.
-(function() {
-    'use strict';
-    var panel = null;
-
-    // Tab definitions — each tab has a label, icon, and sections
-    var TABS = [
-        {
-            id: 'themes',
-            label: 'Themes',
-            icon: '\uD83C\uDFA8',
-            sections: [
-                {
-                    label: '\uD83D\uDC1D Bee Theme',
-                    note: 'Requires bee theme active',
-                    color: '#FFB300',
-                    buttons: [
-                        { text: 'Bee Landing', key: 'beeLanding', icon: '\uD83D\uDC1D\u2B07' },
-                        { text: 'Honey Drip', key: 'honeyDrip', icon: '\uD83C\uDF6F' },
-                        { text: 'Queen Procession', key: 'queenProcession', icon: '\uD83D\uDC51' },
-                        { text: 'Bear Peek', key: 'bearPeek', icon: '\uD83D\uDC3B' },
-                        { text: 'Rainbow Bee', key: 'rainbowBee', icon: '\uD83C\uDF08' },
-                        { text: 'Bee Swarm', key: 'beeSwarm', icon: '\uD83D\uDC1D\uD83D\uDC1D' },
-                        { text: 'Butterfly', key: 'spawnButterfly', icon: '\uD83E\uDD8B' },
-                        { text: 'Ladybug', key: 'spawnLadybug', icon: '\uD83D\uDC1E' },
-                    ]
-                },
-                {
-                    label: '\uD83D\uDFE2 Matrix Theme',
-                    note: 'Requires matrix theme active',
-                    color: '#00ff41',
-                    buttons: [
-                        { text: 'White Rabbit', key: 'whiteRabbit', icon: '\uD83D\uDC07' },
-                        { text: 'Matrix Quote', key: 'matrixQuote', icon: '\uD83D\uDCAC' },
-                        { text: 'No Spoon', key: 'matrixSpoon', icon: '\uD83E\uDD44' },
-                        { text: 'Invert Gravity', key: 'matrixGravity', icon: '\u2B06\uFE0F' },
-                    ]
-                },
-                {
-                    label: '\uD83C\uDF38 Japan Theme',
-                    note: 'Requires japan theme active',
-                    color: '#E91E8D',
-                    buttons: [
-                        { text: 'Sakura Burst', key: 'sakuraBurst', icon: '\uD83C\uDF38' },
-                        { text: 'Lucky Cat', key: 'luckyCat', icon: '\uD83D\uDC31' },
-                        { text: 'Zen Mode', key: 'zenMode', icon: '\u26E9\uFE0F' },
-                    ]
-                }
-            ]
-        },
-        {
-            id: 'events',
-            label: 'Events',
-            icon: '\uD83C\uDF1F',
-            sections: [
-                {
-                    label: '\uD83C\uDF1F Cross-Theme',
-                    note: 'Works on any theme',
-                    color: '#818cf8',
-                    buttons: [
-                        { text: '4:04 Overlay', key: 'event404', icon: '\u2753' },
-                        { text: '4:20 Leaf Rain', key: 'event420', icon: '\uD83C\uDF3F' },
-                        { text: '5:00 Beer', key: 'eventBeer', icon: '\uD83C\uDF7A' },
-                    ]
-                },
-                {
-                    label: '\uD83D\uDEA6 Threshold States',
-                    note: 'Preview count styles',
-                    color: '#6ee7b7',
-                    buttons: [
-                        { text: 'Ghost Town', key: 'stateGhostTown', icon: '\uD83C\uDFDA\uFE0F' },
-                        { text: 'Zen Garden', key: 'stateZen', icon: '\uD83E\uDDD8' },
-                        { text: 'Calm', key: 'stateCalm', icon: '\uD83D\uDFE2' },
-                        { text: 'Normal', key: 'stateNormal', icon: '\u26AA' },
-                        { text: 'Sweating', key: 'stateSweating', icon: '\uD83D\uDE13' },
-                        { text: 'SOS', key: 'stateSOS', icon: '\uD83D\uDEA8' },
-                        { text: 'This is Fine', key: 'stateThisIsFine', icon: '\uD83D\uDC36' },
-                    ]
-                },
-                {
-                    label: '\uD83C\uDFB2 Other',
-                    note: 'Always available',
-                    color: '#f472b6',
-                    buttons: [
-                        { text: 'BSOD', key: 'bsod', icon: '\uD83D\uDCBB' },
-                        { text: 'Retro CRT', key: 'retroCRT', icon: '\uD83D\uDCFA' },
-                        { text: 'Nyan Cat', key: 'nyanCat', icon: '\uD83D\uDC31' },
-                        { text: 'Alert Cascade', key: 'alertCascade', icon: '\u26A0\uFE0F' },
-                    ]
-                }
-            ]
-        },
-        {
-            id: 'notifications',
-            label: 'Alerts',
-            icon: '\uD83D\uDD14',
-            sections: [
-                {
-                    label: '\uD83D\uDCE8 Toasts',
-                    note: 'Test notification popups',
-                    color: '#f97316',
-                    buttons: [
-                        { text: 'New Ticket', key: 'testToastNew', icon: '\uD83D\uDCE8' },
-                        { text: 'Closed', key: 'testToastClosed', icon: '\u2705' },
-                        { text: 'SLA Violation', key: 'testToastSLA', icon: '\uD83D\uDEA8' },
-                        { text: 'Info', key: 'testToastInfo', icon: '\u2139\uFE0F' },
-                    ]
-                },
-                {
-                    label: '\uD83D\uDD0A Sounds',
-                    note: 'Click page first to enable audio',
-                    color: '#38bdf8',
-                    buttons: [
-                        { text: 'New Ticket', key: 'soundNewTicket', icon: '\uD83D\uDD14' },
-                        { text: 'SLA Escalation', key: 'soundSLA', icon: '\uD83D\uDEA8' },
-                    ]
-                }
-            ]
-        },
-        {
-            id: 'settings',
-            label: 'Settings',
-            icon: '\uD83D\uDD27',
-            sections: [
-                {
-                    label: '\uD83D\uDD27 Settings',
-                    note: 'Theme management',
-                    color: '#888',
-                    buttons: [
-                        { text: 'Lock Hidden Themes', key: 'lockThemes', icon: '\uD83D\uDD12' },
-                        { text: 'Reset to Default', key: 'resetToDefault', icon: '\u21BA' },
-                    ]
-                },
-                {
-                    label: '\uD83C\uDF19 Auto-Dim',
-                    note: 'TV/kiosk mode',
-                    color: '#64748b',
-                    buttons: [
-                        { text: 'Dim On', key: 'dimOn', icon: '\uD83C\uDF11' },
-                        { text: 'Dim Off', key: 'dimOff', icon: '\u2600\uFE0F' },
-                    ]
-                }
-            ]
-        }
-    ];
-
-    var activeTabId = TABS[0].id;
-
-    function buildSections(container, sections) {
-        sections.forEach(function(section) {
-            var heading = document.createElement('div');
-            heading.style.cssText = 'font-size:11px;font-weight:bold;color:' + section.color + ';margin:10px 0 2px;';
-            heading.textContent = section.label;
-            container.appendChild(heading);
-
-            if (section.note) {
-                var note = document.createElement('div');
-                note.style.cssText = 'font-size:9px;color:#666;margin-bottom:4px;';
-                note.textContent = section.note;
-                container.appendChild(note);
-            }
-
-            var grid = document.createElement('div');
-            grid.style.cssText = 'display:flex;flex-wrap:wrap;gap:4px;';
-
-            section.buttons.forEach(function(btn) {
-                var b = document.createElement('button');
-                b.innerHTML = btn.icon + ' ' + btn.text;
-                b.style.cssText = 'background:#2a2a3e;color:#e0e0e0;border:1px solid #444;border-radius:5px;' +
-                    'padding:4px 8px;font-size:11px;font-family:monospace;cursor:pointer;transition:all 0.15s;white-space:nowrap;';
-                b.addEventListener('mouseenter', function() { b.style.background = '#3a3a5e'; b.style.borderColor = section.color; });
-                b.addEventListener('mouseleave', function() { b.style.background = '#2a2a3e'; b.style.borderColor = '#444'; });
-                b.addEventListener('click', function() {
-                    var debug = window._debugEasterEggs || {};
-                    if (debug[btn.key]) {
-                        debug[btn.key]();
-                        b.style.background = '#1a3a1a'; b.style.borderColor = '#4CAF50';
-                        setTimeout(function() { b.style.background = '#2a2a3e'; b.style.borderColor = '#444'; }, 400);
-                    } else {
-                        b.style.background = '#3a1a1a'; b.style.borderColor = '#f44';
-                        setTimeout(function() { b.style.background = '#2a2a3e'; b.style.borderColor = '#444'; }, 600);
-                    }
-                });
-                grid.appendChild(b);
-            });
-            container.appendChild(grid);
-        });
+// Debug easter egg panel (Ctrl+Shift+E), loaded on first use from effects/debug-panel.js
+document.addEventListener('keydown', function(e) {
+    if (e.ctrlKey && e.shiftKey && e.key === 'E') {
+        e.preventDefault();
+        BeaconEffects.call('debug-panel', 'toggle');
     }
-
-    function buildPanel() {
-        var el = document.createElement('div');
-        el.id = 'easter-egg-debug';
-
-        var s = el.style;
-        s.position = 'fixed'; s.bottom = '20px'; s.right = '20px'; s.zIndex = '999999';
-        s.background = '#1a1a2e'; s.color = '#e0e0e0';
-        s.border = '1px solid #333'; s.borderRadius = '10px';
-        s.padding = '0'; s.fontFamily = 'monospace'; s.fontSize = '12px';
-        s.boxShadow = '0 8px 32px rgba(0,0,0,0.5)'; s.width = '320px';
-        s.display = 'none'; s.userSelect = 'none';
-
-        // --- Draggable title bar ---
-        var titleBar = document.createElement('div');
-        titleBar.style.cssText = 'display:flex;justify-content:space-between;align-items:center;padding:10px 14px 8px;border-bottom:1px solid #333;cursor:grab;';
-
-        var titleLeft = document.createElement('div');
-        titleLeft.style.cssText = 'display:flex;align-items:center;gap:6px;';
-        var titleText = document.createElement('span');
-        titleText.style.cssText = 'font-weight:bold;font-size:13px;color:#FFD54F;';
-        titleText.textContent = 'Debug Panel';
-        titleLeft.appendChild(titleText);
-        var hint = document.createElement('span');
-        hint.style.cssText = 'font-size:10px;color:#666;';
-        hint.textContent = 'Ctrl+Shift+E';
-        titleLeft.appendChild(hint);
-        titleBar.appendChild(titleLeft);
-
-        var closeBtn = document.createElement('button');
-        closeBtn.textContent = '\u2715';
-        closeBtn.title = 'Close';
-        closeBtn.style.cssText = 'background:none;border:none;color:#888;font-size:16px;cursor:pointer;padding:0 4px;';
-        closeBtn.addEventListener('click', function() { togglePanel(); });
-        titleBar.appendChild(closeBtn);
-        el.appendChild(titleBar);
-
-        // Drag logic
-        var isDragging = false, dragOffsetX = 0, dragOffsetY = 0;
-        titleBar.addEventListener('mousedown', function(e) {
-            if (e.target === closeBtn) return;
-            isDragging = true;
-            titleBar.style.cursor = 'grabbing';
-            var rect = el.getBoundingClientRect();
-            dragOffsetX = e.clientX - rect.left;
-            dragOffsetY = e.clientY - rect.top;
-            e.preventDefault();
-        });
-        document.addEventListener('mousemove', function(e) {
-            if (!isDragging) return;
-            var x = e.clientX - dragOffsetX;
-            var y = e.clientY - dragOffsetY;
-            // Clamp to viewport
-            x = Math.max(0, Math.min(x, window.innerWidth - el.offsetWidth));
-            y = Math.max(0, Math.min(y, window.innerHeight - el.offsetHeight));
-            el.style.left = x + 'px';
-            el.style.top = y + 'px';
-            el.style.right = 'auto';
-            el.style.bottom = 'auto';
-        });
-        document.addEventListener('mouseup', function() {
-            if (isDragging) {
-                isDragging = false;
-                titleBar.style.cursor = 'grab';
-            }
-        });
-
-        // --- Tab bar ---
-        var tabBar = document.createElement('div');
-        tabBar.style.cssText = 'display:flex;border-bottom:1px solid #333;padding:0 4px;';
-
-        // Tab content container
-        var contentArea = document.createElement('div');
-        contentArea.style.cssText = 'padding:8px 14px 14px;max-height:60vh;overflow-y:auto;';
-
-        var tabPanels = {};
-        var tabButtons = {};
-
-        TABS.forEach(function(tab) {
-            // Tab button
-            var btn = document.createElement('button');
-            btn.innerHTML = tab.icon + ' ' + tab.label;
-            btn.style.cssText = 'flex:1;background:none;border:none;border-bottom:2px solid transparent;color:#888;' +
-                'font-size:11px;font-family:monospace;padding:8px 4px;cursor:pointer;transition:all 0.15s;white-space:nowrap;';
-            tabButtons[tab.id] = btn;
-
-            btn.addEventListener('click', function() { switchTab(tab.id); });
-            tabBar.appendChild(btn);
-
-            // Tab panel
-            var panelDiv = document.createElement('div');
-            panelDiv.style.display = 'none';
-            buildSections(panelDiv, tab.sections);
-            tabPanels[tab.id] = panelDiv;
-            contentArea.appendChild(panelDiv);
-        });
-
-        el.appendChild(tabBar);
-        el.appendChild(contentArea);
-
-        function switchTab(tabId) {
-            activeTabId = tabId;
-            TABS.forEach(function(t) {
-                var isActive = t.id === tabId;
-                tabPanels[t.id].style.display = isActive ? 'block' : 'none';
-                tabButtons[t.id].style.color = isActive ? '#FFD54F' : '#888';
-                tabButtons[t.id].style.borderBottomColor = isActive ? '#FFD54F' : 'transparent';
-            });
-        }
-
-        // Show first tab
-        switchTab(activeTabId);
-
-        document.body.appendChild(el);
-        return el;
-    }
-
-    function togglePanel() {
-        if (!panel) panel = buildPanel();
-        panel.style.display = panel.style.display === 'none' ? 'block' : 'none';
-    }
-
-    document.addEventListener('keydown', function(e) {
-        if (e.ctrlKey && e.shiftKey && e.key === 'E') {
-            e.preventDefault();
-            togglePanel();
-        }
-    });
-})();
-// === END DEBUG EASTER EGG PANEL ===
+});
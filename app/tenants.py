@@ -0,0 +1,72 @@
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.cache_manager import CacheBudget
+
+# Per-tenant files: a base path not overridden by the tenant gets a tenant suffix
+_TENANT_FILE_KEYS = (('shared_snapshot', 'path'), ('history', 'persist_path'))
+
+
+class SharedResources:
+    """HTTP connection pool, thread pools and cache budget shared by every
+    SuperOps client in the process.
+
+    A single-tenant app gets its own; in multi-tenant mode one instance is
+    shared by all tenants, so idle tenants cost little more than their data.
+    Sizes come from the `shared_resources` config section, falling back to
+    the per-client settings.
+    """
+
+    def __init__(self, config):
+        shared_cfg = config.get('shared_resources', {})
+        pool_size = shared_cfg.get('http_pool_size', 20)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.conversation_executor = ThreadPoolExecutor(
+            max_workers=shared_cfg.get(
+                'conversation_workers', config.get('superops', {}).get('conversation_workers', 10),
+            ),
+            thread_name_prefix='conversations',
+        )
+        self.stage_executor = ThreadPoolExecutor(
+            max_workers=shared_cfg.get('stage_workers', config.get('dashboard', {}).get('stage_workers', 16)),
+            thread_name_prefix='build-views',
+        )
+        cache_mb = shared_cfg.get('cache_max_mb')
+        self.cache_budget = CacheBudget(cache_mb * 1024 * 1024) if cache_mb else None
+
+
+def tenant_configs(config):
+    """Resolve each entry under `tenants` into a full config.
+
+    Every top-level section of the base config is inherited; a tenant's
+    section is merged over it one level deep (e.g. tenant superops keys
+    override base superops keys), except `views`, which the tenant replaces.
+    Safe to call again on its own output.
+
+    Returns:
+        dict: {tenant_slug: config}, in config order.
+    """
+    base = {key: value for key, value in config.items() if key not in ('tenants', 'shared_resources')}
+    resolved = {}
+    for slug, overrides in (config.get('tenants') or {}).items():
+        overrides = overrides or {}
+        merged = copy.deepcopy(base)
+        for key, value in overrides.items():
+            if key != 'views' and isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key].update(copy.deepcopy(value))
+            else:
+                merged[key] = copy.deepcopy(value)
+        for section, key in _TENANT_FILE_KEYS:
+            path = merged.get(section, {}).get(key)
+            if path and key not in (overrides.get(section) or {}):
+                stem, ext = os.path.splitext(path)
+                merged[section][key] = f"{stem}-{slug}{ext}"
+        resolved[slug] = merged
+    return resolved
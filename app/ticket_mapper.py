@@ -1,5 +1,9 @@
+import bisect
 import datetime
+import functools
 import logging
+import math
+import time
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
@@ -9,19 +13,226 @@ _api_timezone = datetime.timezone.utc
 
 
 def set_api_timezone(tz_name):
-    """Set the timezone used to interpret naive datetimes from the API."""
+    """Set the timezone used to interpret naive datetimes from the API.
+
+    Clears the parsing and local-date caches if the timezone changes (e.g.
+    on a config reload).
+    """
     global _api_timezone
+    previous = _api_timezone
     try:
         _api_timezone = ZoneInfo(tz_name)
     except Exception:
         logger.warning(f"Invalid timezone '{tz_name}', falling back to UTC")
         _api_timezone = datetime.timezone.utc
+    if _api_timezone != previous:
+        for cached in (_parse_datetime, _local_date, _local_day, _sla_timeline):
+            cached.cache_clear()
+
+
+# Section keys in status_mapping, in output order (s1..s4)
+SECTION_KEYS = ('open', 'customer_replied', 'needs_agent', 'other_active')
+
+# Rule predicate -> (local variable it reads, source template). Config values
+# are bound as constants in the compiled function's namespace, never pasted
+# into the source.
+_RULE_PREDICATES = {
+    'status': ('status', 'status in {c}'),
+    'sla_violated': ('violated', 'violated is {c}'),
+    'assigned': ('assigned', 'assigned is {c}'),
+    'first_responded': ('responded', 'responded is {c}'),
+    'requester_reply': ('replied', 'replied is {c}'),
+    'priority': ('priority', 'priority in {c}'),
+    'group_ids': ('group_id', 'group_id in {c}'),
+    'exclude_group_ids': ('group_id', 'group_id not in {c}'),
+    'min_age_hours': ('age_hours', 'age_hours is not None and age_hours >= {c}'),
+    'max_age_hours': ('age_hours', 'age_hours is not None and age_hours < {c}'),
+}
+
+# How each local variable is read from the ticket dict
+_RULE_LOCALS = {
+    'status': "status = (ticket.get('status_text') or '').lower()",
+    'violated': "violated = bool(ticket.get('first_response_violated') or ticket.get('resolution_violated'))",
+    'assigned': "assigned = bool(ticket.get('agent_name'))",
+    'responded': "responded = bool(ticket.get('first_responded_at_iso'))",
+    'replied': "replied = bool(ticket.get('has_requester_reply'))",
+    'priority': "priority = (ticket.get('priority_text') or '').lower()",
+    'group_id': "group_id = ticket.get('group_id')",
+    'age_hours': "age_hours = _age_hours(ticket.get('created_at_str'), now_ts)",
+}
+
+# Ticket fields each local variable reads
+_RULE_LOCAL_FIELDS = {
+    'status': ('status_text',),
+    'violated': ('first_response_violated', 'resolution_violated'),
+    'assigned': ('agent_name',),
+    'responded': ('first_responded_at_iso',),
+    'replied': ('has_requester_reply',),
+    'priority': ('priority_text',),
+    'group_id': ('group_id',),
+    'age_hours': ('created_at_str',),
+}
+
+
+class SectionRouter:
+    """status_mapping compiled into a single routing function.
+
+    The mapping is turned into an ordered rule program once at load time:
+    custom `status_mapping.rules` first, then the built-in priority chain
+    (S3 SLA-violated/statuses, S1, S2, S4 catch-all). The program is emitted
+    as one Python function so routing a ticket does no config lookups or set
+    construction.
+
+    Custom rules look like:
+
+        rules:
+          - section: needs_agent
+            priority: ["Critical"]
+            assigned: false
+
+    Predicates: status, priority, group_ids, exclude_group_ids (lists);
+    sla_violated, assigned, first_responded, requester_reply (booleans);
+    min_age_hours, max_age_hours (numbers). All predicates in a rule must
+    match, and a rule needs at least one.
+    """
 
+    def __init__(self, status_mapping):
+        self.status_mapping = status_mapping or {}
+        self.reply_skip_statuses = frozenset(self._statuses('customer_replied'))
+        self.rules = self._build_rules()
+        self.route = self._compile(self.rules)
+        self.fields_used = frozenset(
+            field
+            for conditions, _ in self.rules
+            for name, _ in conditions
+            for field in _RULE_LOCAL_FIELDS['status' if name == 'status_not' else _RULE_PREDICATES[name][0]]
+        )
+        # Ticket ages (seconds) at which a rule's outcome can flip
+        self.age_thresholds = tuple(sorted(set(
+            value * 3600
+            for conditions, _ in self.rules
+            for name, value in conditions
+            if name in ('min_age_hours', 'max_age_hours')
+        )))
+
+    def next_change(self, ticket, now_ts):
+        """Epoch time at which this ticket's section can next change by age alone, or inf."""
+        if not self.age_thresholds:
+            return math.inf
+        try:
+            created_ts = _parse_datetime(ticket.get('created_at_str')).timestamp()
+        except (ValueError, TypeError):
+            return math.inf
+        index = bisect.bisect_right(self.age_thresholds, now_ts - created_ts)
+        if index == len(self.age_thresholds):
+            return math.inf
+        return created_ts + self.age_thresholds[index]
+
+    def _statuses(self, section_key):
+        return [s.lower() for s in self.status_mapping.get(section_key, {}).get('statuses', [])]
+
+    def _build_rules(self):
+        """Return the ordered rule program as [(conditions, section_index)]."""
+        rules = []
+        for i, rule in enumerate(self.status_mapping.get('rules') or []):
+            section = rule.get('section')
+            if section not in SECTION_KEYS:
+                raise ValueError(f"status_mapping.rules[{i}]: unknown section '{section}'")
+            conditions = []
+            for name, value in rule.items():
+                if name == 'section':
+                    continue
+                if name not in _RULE_PREDICATES:
+                    raise ValueError(f"status_mapping.rules[{i}]: unknown predicate '{name}'")
+                conditions.append((name, _normalize_rule_value(name, value)))
+            if not conditions:
+                raise ValueError(f"status_mapping.rules[{i}]: a rule needs at least one predicate")
+            rules.append((conditions, SECTION_KEYS.index(section)))
+
+        s1_cfg = self.status_mapping.get('open', {})
+        s3_cfg = self.status_mapping.get('needs_agent', {})
+        s1_statuses = frozenset(self._statuses('open'))
+        s2_statuses = frozenset(self._statuses('customer_replied'))
+        s3_statuses = frozenset(self._statuses('needs_agent'))
+        s4_statuses = frozenset(self._statuses('other_active'))
+        # Statuses explicitly mapped to other sections (used for catch-all logic)
+        other_statuses = s2_statuses | s3_statuses | s4_statuses
 
-def map_tickets_to_sections(tickets, config):
+        # Section 3: Check first - SLA violated or specific statuses
+        if s3_cfg.get('include_sla_violated'):
+            rules.append(([('sla_violated', True)], 2))
+        if s3_statuses:
+            rules.append(([('status', s3_statuses)], 2))
+        # Section 1: Open / no first response / unassigned
+        if s1_statuses:
+            rules.append(([('status', s1_statuses)], 0))
+        if s1_cfg.get('include_no_first_response'):
+            rules.append(([('first_responded', False), ('status_not', other_statuses)], 0))
+        if s1_cfg.get('include_unassigned'):
+            rules.append(([('assigned', False), ('status_not', other_statuses)], 0))
+        # Section 2: Customer replied (by status or detected requester reply)
+        if s2_statuses:
+            rules.append(([('status', s2_statuses)], 1))
+        rules.append(([('requester_reply', True)], 1))
+        # Section 4: everything else, including unmapped statuses
+        return rules
+
+    @staticmethod
+    def _compile(rules):
+        namespace = {'_age_hours': _age_hours}
+        used_locals = []
+        body = []
+        for r, (conditions, section_index) in enumerate(rules):
+            exprs = []
+            for c, (name, value) in enumerate(conditions):
+                const = f'_c{r}_{c}'
+                namespace[const] = value
+                if name == 'status_not':
+                    local, template = 'status', 'status not in {c}'
+                else:
+                    local, template = _RULE_PREDICATES[name]
+                if local not in used_locals:
+                    used_locals.append(local)
+                exprs.append(template.format(c=const))
+            body.append(f"    if {' and '.join(exprs)}:\n        return {section_index}")
+
+        source = 'def route(ticket, now_ts):\n'
+        source += ''.join(f'    {_RULE_LOCALS[local]}\n' for local in used_locals)
+        source += '\n'.join(body) + '\n    return 3\n'
+        exec(compile(source, '<status_mapping>', 'exec'), namespace)
+        return namespace['route']
+
+
+def _normalize_rule_value(name, value):
+    """Convert a rule predicate value from config to its compiled constant."""
+    if name in ('status', 'priority'):
+        return frozenset(str(v).lower() for v in _as_list(value))
+    if name in ('group_ids', 'exclude_group_ids'):
+        return frozenset(str(v) for v in _as_list(value))
+    if name in ('min_age_hours', 'max_age_hours'):
+        return float(value)
+    return bool(value)
+
+
+def _as_list(value):
+    return value if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _age_hours(created_str, now_ts):
+    """Hours since a ticket's creation time string, or None if unparseable."""
+    if not created_str:
+        return None
+    try:
+        return (now_ts - _parse_datetime(created_str).timestamp()) / 3600
+    except (ValueError, TypeError):
+        return None
+
+
+def map_tickets_to_sections(tickets, config, router=None):
     """Assign tickets to 4 dashboard sections based on status mapping.
 
     Priority order:
+    - Custom status_mapping.rules, in order
     - Section 3 (Needs Agent / Overdue): SLA violated tickets checked first
     - Section 1 (Open): New/unresponded tickets
     - Section 2 (Customer Replied): Awaiting agent response
@@ -30,60 +241,61 @@ def map_tickets_to_sections(tickets, config):
     Args:
         tickets: List of normalized ticket dicts.
         config: Full config dict with status_mapping.
+        router: Optional precompiled SectionRouter. Compiled from config if
+            omitted; callers on the request path should pass one.
 
     Returns:
         tuple: (section1, section2, section3, section4) lists.
     """
-    mapping = config.get('status_mapping', {})
-    s1_cfg = mapping.get('open', {})
-    s2_cfg = mapping.get('customer_replied', {})
-    s3_cfg = mapping.get('needs_agent', {})
-    s4_cfg = mapping.get('other_active', {})
-
-    s1_statuses = set(s.lower() for s in s1_cfg.get('statuses', []))
-    s2_statuses = set(s.lower() for s in s2_cfg.get('statuses', []))
-    s3_statuses = set(s.lower() for s in s3_cfg.get('statuses', []))
-    s4_statuses = set(s.lower() for s in s4_cfg.get('statuses', []))
+    if router is None:
+        router = SectionRouter(config.get('status_mapping', {}))
+    route = router.route
+    now_ts = time.time()
 
-    # Statuses explicitly mapped to other sections (used for catch-all logic)
-    other_statuses = s2_statuses | s3_statuses | s4_statuses
-
-    s1, s2, s3, s4 = [], [], [], []
+    sections = ([], [], [], [])
 
     for ticket in tickets:
         # Shallow copy to avoid mutating cached objects
         ticket = dict(ticket)
         # Compute SLA and time fields for every ticket
-        compute_sla_fields(ticket)
+        next_change = min(compute_sla_fields(ticket, now_ts), router.next_change(ticket, now_ts))
+        ticket['next_change_ts'] = None if next_change == math.inf else next_change
+        sections[route(ticket, now_ts)].append(ticket)
 
-        status = (ticket.get('status_text') or '').lower()
-        has_first_response = bool(ticket.get('first_responded_at_iso'))
-        is_sla_violated = ticket.get('first_response_violated') or ticket.get('resolution_violated')
-        is_unassigned = not ticket.get('agent_name')
+    return sections
 
-        # Section 3: Check first - SLA violated or specific statuses
-        if s3_cfg.get('include_sla_violated') and is_sla_violated:
-            s3.append(ticket)
-        elif status in s3_statuses:
-            s3.append(ticket)
-        # Section 1: Open / no first response / unassigned
-        elif status in s1_statuses:
-            s1.append(ticket)
-        elif s1_cfg.get('include_no_first_response') and not has_first_response and status not in other_statuses:
-            s1.append(ticket)
-        elif s1_cfg.get('include_unassigned') and is_unassigned and status not in other_statuses:
-            s1.append(ticket)
-        # Section 2: Customer replied (by status or detected requester reply)
-        elif status in s2_statuses or ticket.get('has_requester_reply'):
-            s2.append(ticket)
-        # Section 4: Catch-all for remaining active tickets
-        elif status in s4_statuses:
-            s4.append(ticket)
-        else:
-            # True catch-all for statuses not in any mapping
-            s4.append(ticket)
 
-    return s1, s2, s3, s4
+def section_views(tickets, memberships, view_slugs, config, router=None):
+    """Section tickets once and distribute their keys to every view they are in.
+
+    Args:
+        tickets: Tickets matched to views (see partition_by_views()).
+        memberships: ticket_key() -> view slugs, from partition_by_views().
+        view_slugs: Slugs to return sections for.
+        config: Full config dict with status_mapping.
+        router: Optional precompiled SectionRouter.
+
+    Returns:
+        tuple: (tickets_by_key, view_sections) - tickets_by_key maps
+        ticket_key() to the sectioned ticket copy; view_sections maps each
+        slug to (s1_keys, s2_keys, s3_keys, s4_keys).
+    """
+    sections = map_tickets_to_sections(tickets, config, router=router)
+    view_sections = {slug: ([], [], [], []) for slug in view_slugs}
+    tickets_by_key = {}
+    for index, section in enumerate(sections):
+        for ticket in section:
+            key = ticket_key(ticket)
+            tickets_by_key[key] = ticket
+            for slug in memberships[key]:
+                if slug in view_sections:
+                    view_sections[slug][index].append(key)
+    return tickets_by_key, view_sections
+
+
+def earliest_change(tickets):
+    """Earliest next_change_ts across tickets (None if nothing will change by time alone)."""
+    return min((t['next_change_ts'] for t in tickets if t.get('next_change_ts') is not None), default=None)
 
 
 def filter_by_view(tickets, view_config):
@@ -114,6 +326,53 @@ def filter_by_view(tickets, view_config):
     return [t for t in tickets if t.get('group_id') in target_set]
 
 
+def ticket_key(ticket):
+    """Stable key for a ticket across views and responses."""
+    return ticket.get('ticket_id') or ticket.get('id')
+
+
+def partition_by_views(tickets, views):
+    """Match tickets against several views in a single pass.
+
+    Uses the same rules as filter_by_view() for each view.
+
+    Args:
+        tickets: List of ticket dicts.
+        views: {view_slug: view_config}
+
+    Returns:
+        tuple: (matched, memberships) - matched is the list of tickets that
+        belong to at least one view (input order); memberships maps
+        ticket_key() to the tuple of view slugs the ticket belongs to.
+    """
+    # Precompute each view's matcher: (slug, exclude_set, target_set)
+    matchers = []
+    for slug, view_config in views.items():
+        exclude_group_ids = view_config.get('exclude_tech_group_ids', [])
+        target_group_ids = view_config.get('tech_group_ids', [])
+        if exclude_group_ids:
+            matchers.append((slug, set(exclude_group_ids), None))
+        elif target_group_ids:
+            matchers.append((slug, None, set(target_group_ids)))
+        else:
+            matchers.append((slug, None, None))
+
+    matched = []
+    memberships = {}
+    for ticket in tickets:
+        group_id = ticket.get('group_id')
+        slugs = tuple(
+            slug for slug, exclude_set, target_set in matchers
+            if (exclude_set is not None and group_id not in exclude_set)
+            or (target_set is not None and group_id in target_set)
+            or (exclude_set is None and target_set is None)
+        )
+        if slugs:
+            matched.append(ticket)
+            memberships[ticket_key(ticket)] = slugs
+    return matched, memberships
+
+
 def filter_by_agent(tickets, agent_id):
     """Filter tickets to only those assigned to a specific agent.
 
@@ -132,7 +391,11 @@ def filter_by_agent(tickets, agent_id):
     return [t for t in tickets if str(t.get('responder_id', '')) == agent_id_str]
 
 
-def compute_sla_fields(ticket):
+# Fields compute_sla_fields() and map_tickets_to_sections() add to a ticket
+SECTIONING_FIELDS = ('sla_text', 'sla_class', 'updated_friendly', 'created_days_old', 'next_change_ts')
+
+
+def compute_sla_fields(ticket, now_ts=None):
     """Compute SLA display text, CSS class, and friendly time fields.
 
     Mutates the ticket dict in place, adding:
@@ -140,27 +403,42 @@ def compute_sla_fields(ticket):
     - sla_class: CSS class for styling
     - updated_friendly: "2 hours ago" style text
     - created_days_old: "5 days" style text
+
+    The SLA state only changes at known times (FR Warning 120 min before the
+    first response is due, Critical at 30 min, Overdue at the due time), so
+    each ticket's timeline is computed once per distinct SLA input and
+    looked up here.
+
+    Args:
+        ticket: Normalized ticket dict.
+        now_ts: Epoch time to evaluate at (default: now).
+
+    Returns:
+        float: Epoch time at which the SLA text and class or created_days_old
+        next change (inf if never). updated_friendly is left out: it changes
+        every minute, and pages compute relative times in the browser.
     """
-    now = datetime.datetime.now(datetime.timezone.utc)
+    if now_ts is None:
+        now_ts = time.time()
+    next_change = math.inf
 
     # Compute updated_friendly
     updated_str = ticket.get('updated_at_str')
+    ticket['updated_friendly'] = 'N/A'
     if updated_str:
         try:
-            updated_dt = _parse_datetime(updated_str)
-            ticket['updated_friendly'] = _friendly_timedelta(now - updated_dt)
+            updated_ts = _parse_datetime(updated_str).timestamp()
+            ticket['updated_friendly'] = _friendly_timedelta(datetime.timedelta(seconds=now_ts - updated_ts))
         except (ValueError, TypeError):
-            ticket['updated_friendly'] = 'N/A'
-    else:
-        ticket['updated_friendly'] = 'N/A'
+            pass
 
     # Compute created_days_old (compare dates in API timezone)
     created_str = ticket.get('created_at_str')
+    ticket['created_days_old'] = 'N/A'
     if created_str:
         try:
-            created_dt = _parse_datetime(created_str)
-            today = now.astimezone(_api_timezone).date()
-            created_date = created_dt.astimezone(_api_timezone).date()
+            created_date = _local_date(created_str)
+            today, next_midnight_ts = _local_day(int(now_ts // 60))
             days = (today - created_date).days
             if days <= 0:
                 ticket['created_days_old'] = 'Today'
@@ -168,60 +446,81 @@ def compute_sla_fields(ticket):
                 ticket['created_days_old'] = '1 day'
             else:
                 ticket['created_days_old'] = f'{days} days'
+            next_change = min(next_change, next_midnight_ts)
         except (ValueError, TypeError):
-            ticket['created_days_old'] = 'N/A'
-    else:
-        ticket['created_days_old'] = 'N/A'
+            pass
 
     # Compute SLA status
-    has_first_response = bool(ticket.get('first_responded_at_iso'))
-    fr_violated = ticket.get('first_response_violated', False)
-    res_violated = ticket.get('resolution_violated', False)
-    fr_due_str = ticket.get('fr_due_by_str')
-    status_text = ticket.get('status_text', '')
-
+    starts, states = _sla_timeline(
+        bool(ticket.get('first_responded_at_iso')),
+        bool(ticket.get('first_response_violated', False)),
+        bool(ticket.get('resolution_violated', False)),
+        ticket.get('fr_due_by_str'),
+        ticket.get('status_text', ''),
+    )
+    index = bisect.bisect_left(starts, now_ts)
+    ticket['sla_text'], ticket['sla_class'] = states[index - 1]
+    if index < len(starts):
+        next_change = min(next_change, starts[index])
+    return next_change
+
+
+@functools.lru_cache(maxsize=16384)
+def _sla_timeline(has_first_response, fr_violated, res_violated, fr_due_str, status_text):
+    """Return (starts, states) for a ticket's SLA inputs.
+
+    states[i] is the (sla_text, sla_class) shown once the current time is
+    past starts[i]; starts[0] is -inf.
+    """
     # If already responded and not violated
     if has_first_response and not res_violated:
-        ticket['sla_text'] = status_text
-        ticket['sla_class'] = 'sla-responded'
-        return
+        return (-math.inf,), ((status_text, 'sla-responded'),)
 
     # If SLA violated
     if fr_violated or res_violated:
-        ticket['sla_text'] = 'SLA Violated'
-        ticket['sla_class'] = 'sla-overdue'
-        return
+        return (-math.inf,), (('SLA Violated', 'sla-overdue'),)
 
-    # Check first response due time
+    # First response due time: Warning under 120 min, Critical under 30, then Overdue
     if not has_first_response and fr_due_str:
         try:
-            fr_due_dt = _parse_datetime(fr_due_str)
-            remaining = fr_due_dt - now
-            total_minutes = remaining.total_seconds() / 60
-
-            if total_minutes < 0:
-                ticket['sla_text'] = 'FR Overdue'
-                ticket['sla_class'] = 'sla-overdue'
-            elif total_minutes < 30:
-                ticket['sla_text'] = 'FR Critical'
-                ticket['sla_class'] = 'sla-critical'
-            elif total_minutes < 120:
-                ticket['sla_text'] = 'FR Warning'
-                ticket['sla_class'] = 'sla-warning'
-            else:
-                ticket['sla_text'] = 'FR OK'
-                ticket['sla_class'] = 'sla-normal'
-            return
+            due_ts = _parse_datetime(fr_due_str).timestamp()
+            return (
+                (-math.inf, due_ts - 120 * 60, due_ts - 30 * 60, due_ts),
+                (
+                    ('FR OK', 'sla-normal'),
+                    ('FR Warning', 'sla-warning'),
+                    ('FR Critical', 'sla-critical'),
+                    ('FR Overdue', 'sla-overdue'),
+                ),
+            )
         except (ValueError, TypeError):
             pass
 
     # Default: show status
-    ticket['sla_text'] = status_text
-    ticket['sla_class'] = 'sla-none'
+    return (-math.inf,), ((status_text, 'sla-none'),)
+
+
+@functools.lru_cache(maxsize=16384)
+def _local_date(dt_str):
+    """Date of a timestamp string in the API timezone."""
+    return _parse_datetime(dt_str).astimezone(_api_timezone).date()
+
 
+@functools.lru_cache(maxsize=4)
+def _local_day(now_minute):
+    """(today, next local midnight epoch) in the API timezone for an epoch minute."""
+    now = datetime.datetime.fromtimestamp(now_minute * 60, _api_timezone)
+    tomorrow = now.date() + datetime.timedelta(days=1)
+    midnight = datetime.datetime.combine(tomorrow, datetime.time(), tzinfo=_api_timezone)
+    return now.date(), midnight.timestamp()
 
+
+@functools.lru_cache(maxsize=16384)
 def _parse_datetime(dt_str):
-    """Parse an ISO datetime string to a timezone-aware datetime."""
+    """Parse an ISO datetime string to a timezone-aware datetime.
+
+    Cached: the same ticket timestamps are parsed on every refresh.
+    """
     if not dt_str:
         raise ValueError("Empty datetime string")
 
@@ -0,0 +1,263 @@
+import contextvars
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Span that new spans in this context become children of
+_current_span = contextvars.ContextVar('beacon_current_span', default=None)
+
+# Process-wide tracer; None while tracing is disabled (spans are then no-ops)
+_tracer = None
+_configure_lock = threading.Lock()
+
+
+class Span:
+    """One timed operation in a trace. Children share the root span's trace_id."""
+
+    __slots__ = ('trace_id', 'span_id', 'parent_id', 'name', 'attributes', 'start', 'duration', 'error', 'thread', '_t0')
+
+    def __init__(self, name, parent, attributes):
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(8).hex()
+        self.span_id = os.urandom(4).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.name = name
+        self.attributes = attributes
+        self.start = time.time()
+        self.duration = None
+        self.error = None
+        self.thread = threading.current_thread().name
+        self._t0 = time.perf_counter()
+
+    def set(self, **attributes):
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+
+    def to_dict(self):
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start': self.start,
+            'duration_ms': round(self.duration * 1000, 3) if self.duration is not None else None,
+            'thread': self.thread,
+            'error': self.error,
+            'attributes': self.attributes,
+        }
+
+
+class Tracer:
+    """Keeps the most recent finished spans in a ring buffer.
+
+    Optionally also appends every finished span to a JSON-lines file, for
+    keeping traces beyond the buffer or loading them into other tools.
+    """
+
+    def __init__(self, max_spans=5000, export_path=None):
+        self.max_spans = max_spans
+        self.export_path = export_path or None
+        self._lock = threading.Lock()
+        self._spans = deque(maxlen=max_spans)
+        self._export = open(self.export_path, 'a', buffering=1) if self.export_path else None
+        self.recorded = 0
+
+    def record(self, span):
+        with self._lock:
+            self._spans.append(span)
+            self.recorded += 1
+            if self._export is not None:
+                try:
+                    self._export.write(json.dumps(span.to_dict(), default=str) + '\n')
+                except (OSError, TypeError, ValueError) as e:
+                    logger.warning(f"Trace export to {self.export_path} failed: {e}")
+
+    def _by_trace(self):
+        with self._lock:
+            spans = list(self._spans)
+        traces = {}
+        for span in spans:
+            traces.setdefault(span.trace_id, []).append(span)
+        return traces
+
+    def traces(self, limit=50, min_ms=0, name=None):
+        """Summaries of the most recent traces, newest first.
+
+        A trace's root is its span without a parent (or whose parent has
+        already left the buffer). Background work started by a request, such
+        as conversation lookups still running when it returned, can outlast it.
+
+        Args:
+            limit: Max traces to return.
+            min_ms: Only traces whose root took at least this long.
+            name: Only traces whose root span name contains this string.
+        """
+        summaries = []
+        for trace_id, spans in self._by_trace().items():
+            ids = {span.span_id for span in spans}
+            roots = [span for span in spans if span.parent_id not in ids]
+            root = min(roots, key=lambda span: span.start)
+            duration_ms = root.duration * 1000
+            if duration_ms < min_ms or (name and name not in root.name):
+                continue
+            summaries.append({
+                'trace_id': trace_id,
+                'name': root.name,
+                'start': root.start,
+                'duration_ms': round(duration_ms, 3),
+                'spans': len(spans),
+                'errors': sum(1 for span in spans if span.error),
+                'attributes': root.attributes,
+            })
+        summaries.sort(key=lambda summary: summary['start'], reverse=True)
+        return summaries[:limit]
+
+    def trace(self, trace_id):
+        """Every buffered span of a trace as a tree, or None if none are buffered."""
+        spans = self._by_trace().get(trace_id)
+        if not spans:
+            return None
+        nodes = {span.span_id: dict(span.to_dict(), children=[]) for span in sorted(spans, key=lambda s: s.start)}
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node['parent_id'])
+            (parent['children'] if parent is not None else roots).append(node)
+        return roots
+
+    def stats(self):
+        with self._lock:
+            return {
+                'buffered_spans': len(self._spans),
+                'max_spans': self.max_spans,
+                'recorded_spans': self.recorded,
+                'export_path': self.export_path,
+            }
+
+
+def configure(config):
+    """Enable tracing if `debug.tracing.enabled` is set (once per process).
+
+    Returns:
+        The process Tracer, or None if tracing is disabled.
+    """
+    global _tracer
+    tracing_cfg = (config.get('debug', {}) or {}).get('tracing', {}) or {}
+    if not tracing_cfg.get('enabled', False):
+        return _tracer
+    with _configure_lock:
+        if _tracer is None:
+            _tracer = Tracer(
+                max_spans=tracing_cfg.get('max_spans', 5000),
+                export_path=tracing_cfg.get('export_path'),
+            )
+            logger.info(f"Tracing enabled (buffer {_tracer.max_spans} spans)")
+    return _tracer
+
+
+def get_tracer():
+    return _tracer
+
+
+@contextmanager
+def span(name, activate=True, **attributes):
+    """Time the enclosed block as a span, a child of the current span.
+
+    Yields the Span (None while tracing is disabled). With activate=False
+    the span does not become the current span, for code that yields control
+    mid-span (generators), where the context variable can't be reset safely.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    current = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(current) if activate else None
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        if token is not None:
+            _current_span.reset(token)
+        current.duration = time.perf_counter() - current._t0
+        tracer.record(current)
+
+
+def start_span(name, **attributes):
+    """Start a span ended later by end_span (e.g. across Flask request hooks).
+
+    Returns:
+        A handle for end_span, or None while tracing is disabled.
+    """
+    if _tracer is None:
+        return None
+    current = Span(name, _current_span.get(), attributes)
+    return current, _current_span.set(current)
+
+
+def end_span(handle, error=None):
+    if handle is None:
+        return
+    current, token = handle
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # Ended from another context (e.g. after a streamed response)
+        pass
+    if error is not None:
+        current.error = f"{type(error).__name__}: {error}"
+    current.duration = time.perf_counter() - current._t0
+    _tracer.record(current)
+
+
+def annotate(**attributes):
+    """Add attributes to the current span, if any."""
+    current = _current_span.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+
+def traced(name):
+    """Decorator running the function inside a span."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def submit(executor, fn, *args, **kwargs):
+    """executor.submit() that runs fn in a copy of the caller's context.
+
+    Pool threads don't inherit context variables, so without this, spans
+    started by the task would begin new traces instead of joining the caller's.
+    """
+    if _tracer is None:
+        return executor.submit(fn, *args, **kwargs)
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def bind(fn):
+    """Return fn bound to a copy of the current context (for threading.Thread targets)."""
+    if _tracer is None:
+        return fn
+    context = contextvars.copy_context()
+    return functools.partial(context.run, fn)
+
+
+def variables_hash(variables):
+    """Short stable hash of GraphQL variables, to tell calls apart without logging them."""
+    encoded = json.dumps(variables or {}, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()[:12]
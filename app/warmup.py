@@ -0,0 +1,90 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app import tracing
+
+logger = logging.getLogger(__name__)
+
+
+class WarmUp:
+    """Runs named warm-up tasks in parallel once per process and tracks progress.
+
+    Tasks are (name, callable) pairs; a task that raises is recorded as
+    failed and does not stop the others. Like SnapshotPoller, it restarts
+    itself in a forked worker, since threads don't survive fork.
+    """
+
+    def __init__(self, tasks, max_workers=4):
+        self.tasks = tasks
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pid = None
+        self._reset()
+
+    def _reset(self):
+        self.state = 'pending'
+        self.started_at = None
+        self.finished_at = None
+        self._progress = {name: {'state': 'pending', 'seconds': None, 'error': None} for name, _ in self.tasks}
+
+    def ensure_started(self):
+        """Start warm-up in this process if it hasn't run here yet."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            self._pid = pid
+            self._reset()
+            self.state = 'running'
+            self.started_at = time.time()
+        threading.Thread(target=self._run, name='warm-up', daemon=True).start()
+
+    def _run(self):
+        logger.info(f"Warming up: {', '.join(name for name, _ in self.tasks)}")
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='warm-up') as executor:
+            for name, task in self.tasks:
+                executor.submit(self._run_task, name, task)
+        with self._lock:
+            self.finished_at = time.time()
+            failed = [name for name, p in self._progress.items() if p['state'] == 'failed']
+            self.state = 'failed' if failed else 'done'
+        logger.info(
+            f"Warm-up finished in {self.finished_at - self.started_at:.1f}s"
+            + (f" ({len(failed)} failed: {', '.join(failed)})" if failed else "")
+        )
+
+    def _run_task(self, name, task):
+        started = time.time()
+        with self._lock:
+            self._progress[name]['state'] = 'running'
+        try:
+            with tracing.span('warm_up', task=name):
+                task()
+            state, error = 'done', None
+        except Exception as e:
+            logger.warning(f"Warm-up task {name} failed: {e}")
+            state, error = 'failed', str(e)
+        with self._lock:
+            self._progress[name].update(state=state, seconds=round(time.time() - started, 3), error=error)
+
+    @property
+    def finished(self):
+        return self.state in ('done', 'failed')
+
+    def status(self):
+        """Progress snapshot for the /ready endpoint."""
+        with self._lock:
+            tasks = {name: dict(p) for name, p in self._progress.items()}
+            end = self.finished_at or time.time()
+            return {
+                'state': self.state,
+                'completed': sum(1 for p in tasks.values() if p['state'] in ('done', 'failed')),
+                'total': len(tasks),
+                'elapsed_seconds': round(end - self.started_at, 3) if self.started_at else None,
+                'tasks': tasks,
+            }
@@ -0,0 +1,81 @@
+import hashlib
+import hmac
+
+EVENT_CREATED = 'created'
+EVENT_UPDATED = 'updated'
+EVENT_CLOSED = 'closed'
+EVENT_DELETED = 'deleted'
+
+# Substrings of SuperOps event names ("TICKET_CREATED", "ticket.resolved", ...)
+_EVENT_KEYWORDS = (
+    ('creat', EVENT_CREATED),
+    ('delet', EVENT_DELETED),
+    ('clos', EVENT_CLOSED),
+    ('resolv', EVENT_CLOSED),
+)
+
+_EVENT_NAME_KEYS = ('event', 'eventType', 'event_type', 'type')
+_TICKET_KEYS = ('ticket', 'data', 'payload')
+
+
+class WebhookAuth:
+    """Checks that a webhook request comes from SuperOps.
+
+    A request is accepted if it carries the shared secret in token_header,
+    or an HMAC-SHA256 of the raw body (hex, optionally prefixed "sha256=")
+    in signature_header.
+    """
+
+    def __init__(self, secret, token_header='X-Webhook-Token', signature_header='X-Webhook-Signature'):
+        if not secret:
+            raise ValueError("webhooks.secret is required when webhooks are enabled")
+        self.secret = secret.encode()
+        self.token_header = token_header
+        self.signature_header = signature_header
+
+    def verify(self, headers, body):
+        token = headers.get(self.token_header)
+        if token and hmac.compare_digest(token.encode(), self.secret):
+            return True
+        signature = headers.get(self.signature_header)
+        if signature:
+            if signature.startswith('sha256='):
+                signature = signature[len('sha256='):]
+            expected = hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+            return hmac.compare_digest(signature.strip().lower(), expected)
+        return False
+
+
+def parse_events(payload):
+    """Turn a webhook body into (event, ticket) pairs.
+
+    Accepts one event object or a list of them. Each carries its event name
+    under 'event' (or 'eventType'/'type') and the ticket's SuperOps fields,
+    named as in getTicketList, under 'ticket' or 'data' (or at the top level).
+
+    Returns:
+        list: [(event, raw_ticket)] with event one of the EVENT_* names.
+
+    Raises:
+        ValueError: If an event has no ticketId.
+    """
+    items = payload if isinstance(payload, list) else [payload]
+    events = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError("Webhook events must be JSON objects")
+        name = next((str(item[k]) for k in _EVENT_NAME_KEYS if item.get(k)), '')
+        ticket = next((item[k] for k in _TICKET_KEYS if isinstance(item.get(k), dict)), item)
+        if not ticket.get('ticketId'):
+            raise ValueError("Webhook event is missing ticketId")
+        events.append((event_kind(name), ticket))
+    return events
+
+
+def event_kind(name):
+    """Map a SuperOps event name to EVENT_CREATED/UPDATED/CLOSED/DELETED."""
+    lowered = name.lower()
+    for keyword, kind in _EVENT_KEYWORDS:
+        if keyword in lowered:
+            return kind
+    return EVENT_UPDATED
@@ -5,9 +5,12 @@ load_dotenv('.flaskenv')
 
 from app import create_app
 from app.config_loader import load_config
+from app.config_reload import install_config_reload
 
 config = load_config()
 app = create_app(config)
+# Apply config.yaml edits without a restart (file watch or SIGHUP)
+install_config_reload(app, config)
 
 if __name__ == "__main__":
     port = config.get('dashboard', {}).get('port', 5050)
@@ -0,0 +1,110 @@
+import gc
+import time
+
+from app.cache_manager import CacheBudget, CacheManager, NamedCache, approx_size
+
+VALUE = 'x' * 1000
+SIZE = approx_size(VALUE)
+
+
+def test_entries_are_fresh_then_stale_then_gone():
+    cache = NamedCache('test', ttl_seconds=10, stale_seconds=10)
+    cache.put('k', 1, stored_at=time.time() - 15)
+
+    assert cache.get('k') is None
+    assert not cache.is_fresh('k')
+    assert cache.peek('k')[0] == 1
+
+    cache.put('k', 2, stored_at=time.time() - 25)
+    assert cache.peek('k') == (None, None)
+
+
+def test_stale_entries_count_as_hits_only_when_served():
+    cache = NamedCache('test', ttl_seconds=10, stale_seconds=60)
+    cache.put('k', 1, stored_at=time.time() - 15)
+
+    assert cache.get('k') is None
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['hit_rate'] == 0
+
+    assert cache.get_or_load('k', lambda: None, background=True) == 1
+    assert cache.stats()['stale_hits'] == 1
+
+
+def test_failed_load_serves_last_value():
+    cache = NamedCache('test', ttl_seconds=10)
+    cache.put('k', 'old', stored_at=time.time() - 60)
+
+    assert cache.get_or_load('k', lambda: None, force=True) == 'old'
+    assert cache.stats()['load_failures'] == 1
+
+
+def test_max_entries_evicts_least_recently_used():
+    cache = NamedCache('test', max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.keys() == ['a', 'c']
+
+
+def test_budget_evicts_across_caches_in_lru_order():
+    budget = CacheBudget(max_bytes=SIZE * 3)
+    first = NamedCache('first', budget=budget)
+    second = NamedCache('second', budget=budget)
+    first.put('a', VALUE)
+    second.put('b', VALUE)
+    first.put('c', VALUE)
+    second.get('b')  # b is now used more recently than a and c
+
+    second.put('d', VALUE)
+
+    assert first.keys() == ['c']
+    assert second.keys() == ['b', 'd']
+    assert budget.used <= budget.max_bytes
+    assert budget.stats()['evictions'] == 1
+
+
+def test_budget_reclaims_single_entry_caches_of_other_tenants():
+    budget = CacheBudget(max_bytes=SIZE * 2)
+    tenants = [CacheManager(budget=budget) for _ in range(3)]
+    caches = [manager.register('tickets', max_entries=1) for manager in tenants]
+
+    for cache in caches:
+        cache.put('snapshot', VALUE)
+
+    assert caches[0].keys() == []
+    assert caches[1].keys() == ['snapshot']
+    assert caches[2].keys() == ['snapshot']
+
+
+def test_budget_keeps_the_entry_just_stored():
+    budget = CacheBudget(max_bytes=SIZE // 2)
+    cache = NamedCache('tickets', budget=budget)
+
+    cache.put('snapshot', VALUE)
+
+    assert cache.keys() == ['snapshot']
+
+
+def test_discarded_caches_stop_counting():
+    budget = CacheBudget(max_bytes=SIZE * 10)
+    cache = NamedCache('test', budget=budget)
+    cache.put('a', VALUE)
+    assert budget.used == SIZE
+
+    del cache
+    gc.collect()
+
+    assert budget.used == 0
+
+
+def test_clear_releases_budget():
+    budget = CacheBudget(max_bytes=SIZE * 10)
+    manager = CacheManager(budget=budget)
+    manager.register('a').put('k', VALUE)
+
+    manager.clear()
+
+    assert budget.used == 0
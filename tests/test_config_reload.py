@@ -0,0 +1,52 @@
+import time
+
+from app import config_reload
+from app.config_reload import ConfigReloader
+
+
+def test_load_errors_count_as_failures(monkeypatch, tmp_path):
+    def load_config(path):
+        raise SyntaxError("bad rule")
+
+    monkeypatch.setattr(config_reload, 'load_config', load_config)
+    reloader = ConfigReloader(str(tmp_path / 'config.yaml'), lambda config: None, poll_interval_seconds=0)
+
+    assert not reloader.reload()
+    assert reloader.failures == 1
+
+
+def test_apply_errors_count_as_failures(monkeypatch, tmp_path):
+    monkeypatch.setattr(config_reload, 'load_config', lambda path: {})
+
+    def apply(config):
+        raise RuntimeError("no")
+
+    reloader = ConfigReloader(str(tmp_path / 'config.yaml'), apply, poll_interval_seconds=0)
+
+    assert not reloader.reload()
+    assert reloader.failures == 1
+
+
+def test_watcher_survives_a_failed_reload(monkeypatch, tmp_path):
+    path = tmp_path / 'config.yaml'
+    path.write_text('a: 1\n')
+    applied = []
+    results = iter([SyntaxError("bad rule")])
+
+    def load_config(config_path):
+        result = next(results, {'ok': True})
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(config_reload, 'load_config', load_config)
+    reloader = ConfigReloader(str(path), applied.append, poll_interval_seconds=0.01)
+    reloader.ensure_started()
+
+    deadline = time.time() + 2
+    while not applied and time.time() < deadline:
+        reloader._wake.set()
+        time.sleep(0.01)
+
+    assert reloader.failures == 1
+    assert applied[0] == {'ok': True}
@@ -0,0 +1,72 @@
+import datetime
+
+from app import export
+from app.superops_client import SuperOpsClient
+
+CONFIG = {'superops': {'api_url': 'http://superops.invalid', 'api_key': 'key', 'customer_subdomain': 'acme'}}
+UTC = datetime.timezone.utc
+
+
+def closed(ticket_id, days_ago):
+    updated = datetime.datetime.now(UTC) - datetime.timedelta(days=days_ago)
+    return {'ticketId': ticket_id, 'status': 'Closed', 'updatedTime': updated.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+def paged_client(pages):
+    client = SuperOpsClient(CONFIG)
+    client.requested_pages = []
+
+    def page(query, variables):
+        number = variables['input']['page']
+        client.requested_pages.append(number)
+        yield from pages[number - 1]
+        return {'listInfo': {'hasMore': number < len(pages)}}
+
+    client._iter_ticket_list_page = page
+    return client
+
+
+def test_csv_escapes_formulas():
+    lines = list(export.iter_csv([{'a': '=HYPERLINK("x")', 'b': None}, {'a': '-1', 'b': 'plain'}], ('a', 'b')))
+
+    assert lines == ['a,b\r\n', '"\'=HYPERLINK(""x"")",\r\n', "'-1,plain\r\n"]
+
+
+def test_ndjson_keeps_only_the_columns():
+    assert list(export.iter_ndjson([{'a': 1, 'secret': 2}], ('a',))) == ['{"a":1}\n']
+
+
+def test_filter_bounds_updated_time():
+    parse = datetime.datetime.fromisoformat
+    since = parse('2026-10-01T00:00:00+00:00')
+    until = parse('2026-10-02T00:00:00+00:00')
+    matches = export.ticket_filter(parse, view_config={'tech_group_ids': ['1']}, since=since, until=until)
+
+    assert matches({'group_id': '1', 'updated_at_str': '2026-10-01T00:00:00+00:00'})
+    assert not matches({'group_id': '1', 'updated_at_str': '2026-10-02T00:00:00+00:00'})
+    assert not matches({'group_id': '2', 'updated_at_str': '2026-10-01T12:00:00+00:00'})
+    assert not matches({'group_id': '1', 'updated_at_str': None})
+
+
+def test_closed_export_stops_paging_at_since():
+    client = paged_client([
+        [closed('1', 1), closed('2', 2)],
+        [closed('3', 3), closed('4', 6)],
+        [closed('5', 7), closed('6', 8)],
+    ])
+
+    since = datetime.datetime.now(UTC) - datetime.timedelta(days=5)
+    tickets = list(client.iter_closed_tickets(since=since))
+
+    assert [t['ticket_id'] for t in tickets] == ['1', '2', '3']
+    assert client.requested_pages == [1, 2]
+
+
+def test_closed_tickets_stop_at_the_32_day_cutoff():
+    client = paged_client([
+        [closed('1', 1), closed('2', 40)],
+        [closed('3', 41)],
+    ])
+
+    assert [t['ticket_id'] for t in client.iter_closed_tickets()] == ['1']
+    assert client.requested_pages == [1]
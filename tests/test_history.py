@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from app.history import SERIES, HistorySampler, QueueHistory, section_counts
+
+T0 = 1_700_000_000 - 1_700_000_000 % 86400  # midnight UTC
+
+
+def counts(total, **extra):
+    return dict({'s1': total, 'total': total}, **extra)
+
+
+def test_samples_in_a_bucket_are_averaged():
+    history = QueueHistory()
+    history.record('helpdesk', counts(10), ts=T0)
+    history.record('helpdesk', counts(20), ts=T0 + 30)
+    history.record('helpdesk', counts(40), ts=T0 + 60)
+
+    result = history.query('helpdesk', T0, T0 + 120, resolution='minute')
+
+    assert result['series'] == list(SERIES)
+    assert [point[0] for point in result['points']] == [T0, T0 + 60]
+    assert result['points'][0][1 + SERIES.index('total')] == 15
+    assert result['points'][1][1 + SERIES.index('total')] == 40
+
+
+def test_every_tier_is_updated_at_once():
+    history = QueueHistory()
+    for minute in range(120):
+        history.record('helpdesk', counts(minute), ts=T0 + minute * 60)
+
+    hours = history.query('helpdesk', T0, T0 + 7200, resolution='hour')
+    days = history.query('helpdesk', T0, T0 + 7200, resolution='day')
+
+    assert [point[1] for point in hours['points']] == [29.5, 89.5]
+    assert days['points'] == [[T0] + [59.5, 0, 0, 0, 59.5, 0]]
+
+
+def test_resolution_defaults_to_finest_tier_covering_the_range():
+    history = QueueHistory()
+    now = T0 + 10 * 86400
+
+    assert history.query('helpdesk', now - 3600, now)['resolution'] == 'minute'
+    assert history.query('helpdesk', now - 30 * 86400, now)['resolution'] == 'hour'
+    assert history.query('helpdesk', now - 365 * 86400, now)['resolution'] == 'day'
+
+
+def test_wrapped_buckets_are_not_returned():
+    history = QueueHistory()
+    history.record('helpdesk', counts(1), ts=T0)
+    # Same minute-ring slot, one week later
+    history.record('helpdesk', counts(2), ts=T0 + 7 * 86400)
+
+    result = history.query('helpdesk', T0 - 60, T0 + 60, resolution='minute')
+
+    assert result['points'] == []
+
+
+def test_unknown_view_has_no_points():
+    assert QueueHistory().query('nope', T0, T0 + 60)['points'] == []
+
+
+def test_dump_round_trips():
+    history = QueueHistory()
+    history.record('helpdesk', counts(7, sla_violated=2), ts=T0)
+    copy = QueueHistory()
+
+    copy.load_dump(json.loads(json.dumps(history.dump())))
+
+    assert copy.query('helpdesk', T0, T0 + 60) == history.query('helpdesk', T0, T0 + 60)
+
+
+def test_load_dump_rejects_other_versions():
+    with pytest.raises(ValueError):
+        QueueHistory().load_dump({'version': 999, 'views': {}})
+
+
+def test_persisted_history_survives_restart(tmp_path):
+    path = str(tmp_path / 'history.json')
+    history = QueueHistory(persist_path=path)
+    history.record('helpdesk', counts(3), ts=T0)
+    history.save()
+
+    reloaded = QueueHistory(persist_path=path)
+
+    assert reloaded.query('helpdesk', T0, T0 + 60)['points'][0][1] == 3
+
+
+def test_unreadable_persist_file_is_ignored(tmp_path):
+    path = tmp_path / 'history.json'
+    path.write_text('{not json')
+
+    assert QueueHistory(persist_path=str(path)).query('helpdesk', T0, T0 + 60)['points'] == []
+
+
+def test_section_counts():
+    tickets = {
+        1: {'first_response_violated': True},
+        2: {},
+        3: {'resolution_violated': True},
+        4: {},
+    }
+
+    assert section_counts(([1], [2, 3], [], [4]), tickets) == {
+        's1': 1, 's2': 2, 's3': 0, 's4': 1, 'total': 4, 'sla_violated': 2,
+    }
+
+
+def test_sampler_records_every_view_it_returns():
+    history = QueueHistory()
+    sampler = HistorySampler(history, lambda: {'a': counts(1), 'b': counts(2)})
+
+    assert sampler.sample_once()
+    assert history.query('a', 0)['points'][0][1] == 1
+    assert history.query('b', 0)['points'][0][1] == 2
+
+
+def test_sampler_skips_failed_and_empty_samples():
+    history = QueueHistory()
+
+    def fail():
+        raise RuntimeError("upstream down")
+
+    assert not HistorySampler(history, fail).sample_once()
+    assert not HistorySampler(history, lambda: None).sample_once()
+    assert history.dump()['views'] == {}
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from app.json_stream import JSONArrayStream
+
+DOCUMENT = {
+    'data': {
+        'getTicketList': {
+            'tickets': [{'ticketId': '1', 'subject': 'café [draft]'}, 12.5, 'text', None, [1, 2]],
+            'listInfo': {'page': 1, 'hasMore': True},
+        },
+    },
+}
+
+
+def chunked(document, size):
+    body = json.dumps(document, ensure_ascii=False).encode()
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize('size', [1, 3, 7, 4096])
+def test_items_and_envelope_for_any_chunking(size):
+    stream = JSONArrayStream(chunked(DOCUMENT, size), 'tickets')
+
+    assert list(stream) == DOCUMENT['data']['getTicketList']['tickets']
+    assert stream.count == 5
+    assert stream.envelope['data']['getTicketList'] == {'tickets': [], 'listInfo': {'page': 1, 'hasMore': True}}
+
+
+def test_document_without_the_key_is_decoded_whole():
+    stream = JSONArrayStream(chunked({'errors': [{'message': 'nope'}]}, 5), 'tickets')
+
+    assert list(stream) == []
+    assert stream.envelope == {'errors': [{'message': 'nope'}]}
+
+
+def test_truncated_array_raises():
+    with pytest.raises(ValueError):
+        list(JSONArrayStream([b'{"tickets": [{"a": 1}, {"b"'], 'tickets'))
@@ -0,0 +1,102 @@
+from app.search import TicketSearchIndex, tokenize
+
+
+def ticket(key, subject, priority=0, updated='2026-01-01T00:00:00', **fields):
+    return dict(
+        {'ticket_id': key, 'id': key, 'subject': subject, 'priority_raw': priority, 'updated_at_str': updated},
+        **fields,
+    )
+
+
+def build(tickets, view_sections, version=1):
+    index = TicketSearchIndex()
+    index.sync({t['ticket_id']: t for t in tickets}, view_sections, version)
+    return index
+
+
+def keys(hits):
+    return [hit[0]['ticket_id'] for hit in hits]
+
+
+def test_tokenize():
+    assert tokenize('VPN drops #1234, Acme-Corp') == ['vpn', 'drops', '1234', 'acme', 'corp']
+    assert tokenize(None) == []
+
+
+def test_every_word_must_match_as_a_prefix():
+    index = build(
+        [
+            ticket('1', 'VPN drops', client_name='Acme Corp'),
+            ticket('2', 'VPN setup', client_name='Globex'),
+            ticket('3', 'Printer jam', client_name='Acme Corp'),
+        ],
+        {'all': (['1', '2', '3'], [], [], [])},
+    )
+
+    total, hits = index.search('acme vp')
+
+    assert total == 1
+    assert keys(hits) == ['1']
+    assert index.search('nothing')[0] == 0
+
+
+def test_exact_matches_then_priority_then_recency():
+    index = build(
+        [
+            ticket('1', 'vpnclient broken', priority=3),
+            ticket('2', 'vpn broken', priority=1, updated='2026-01-01T00:00:00'),
+            ticket('3', 'vpn broken', priority=1, updated='2026-02-01T00:00:00'),
+            ticket('4', 'vpn broken', priority=2),
+        ],
+        {'all': (['1', '2', '3', '4'], [], [], [])},
+    )
+
+    assert keys(index.search('vpn')[1]) == ['4', '3', '2', '1']
+
+
+def test_view_and_section_filters():
+    index = build(
+        [ticket('1', 'vpn'), ticket('2', 'vpn'), ticket('3', 'vpn')],
+        {'a': (['1'], ['2'], [], []), 'b': ([], [], ['2', '3'], [])},
+    )
+
+    assert sorted(keys(index.search('vpn', view='a')[1])) == ['1', '2']
+    assert keys(index.search('vpn', view='a', section='s2')[1]) == ['2']
+    assert sorted(keys(index.search('vpn', section='s3')[1])) == ['2', '3']
+    hits = index.search('vpn', view='b', section='s3')[1]
+    assert {hit[0]['ticket_id']: hit[1] for hit in hits}['2'] == {'a': 's2', 'b': 's3'}
+
+
+def test_limit_caps_results_not_total():
+    index = build([ticket(str(i), 'vpn') for i in range(10)], {'all': ([str(i) for i in range(10)], [], [], [])})
+
+    total, hits = index.search('vpn', limit=3)
+
+    assert total == 10
+    assert len(hits) == 3
+
+
+def test_resync_updates_changed_and_removed_tickets():
+    index = build(
+        [ticket('1', 'vpn drops'), ticket('2', 'printer jam')],
+        {'all': (['1', '2'], [], [], [])},
+    )
+
+    index.sync({'1': ticket('1', 'email bounce')}, {'all': (['1'], [], [], [])}, 2)
+
+    assert index.version == 2
+    assert index.search('vpn')[0] == 0
+    assert index.search('printer')[0] == 0
+    assert keys(index.search('email')[1]) == ['1']
+    assert index.stats() == {'version': 2, 'tickets': 1, 'terms': 3}
+
+
+def test_large_resync_rebuilds_the_term_list():
+    tickets = [ticket(str(i), f'word{i}') for i in range(300)]
+    index = build(tickets, {'all': ([str(i) for i in range(300)], [], [], [])})
+
+    index.sync({'0': ticket('0', 'other')}, {'all': (['0'], [], [], [])}, 2)
+
+    assert index.stats()['terms'] == 2
+    assert keys(index.search('word')[1]) == []
+    assert keys(index.search('oth')[1]) == ['0']
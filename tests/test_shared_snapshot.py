@@ -0,0 +1,185 @@
+import pytest
+
+from app.history import SERIES, QueueHistory
+from app.shared_snapshot import SharedSnapshotReader, SnapshotPoller, SnapshotStore
+from app.ticket_mapper import SectionRouter
+
+
+class FakeClient:
+    timezone = None
+
+    def __init__(self, tickets):
+        self.tickets = tickets
+        self.fail = False
+        self.version = 0
+
+    def fetch_tickets(self, force=False):
+        if not self.fail:
+            self.version += 1
+        return self.tickets
+
+    def snapshot_version(self):
+        return self.version
+
+    def check_requester_replies(self, tickets, s2_statuses, budget_seconds=None):
+        return set(), set()
+
+    def upstream_status(self):
+        return {'state': 'open' if self.fail else 'closed'}
+
+    def _fetch_closed_tickets_recent(self):
+        raise RuntimeError("not needed here")
+
+    def fetch_monthly_averages(self, view_slug='', tech_group_ids=None, force=False):
+        return {}
+
+    def apply_event_to_snapshot(self, tickets, event, ticket):
+        updated = [t for t in tickets if t['ticket_id'] != ticket['ticket_id']]
+        if event != 'deleted':
+            updated.append(ticket)
+        return updated, False
+
+
+CONFIG = {
+    'agents': {'auto_fetch': False},
+    'views': {'all': {}, 'g1': {'tech_group_ids': ['1']}},
+}
+
+
+def make_poller(store, tickets, history):
+    return SnapshotPoller(store, FakeClient(tickets), CONFIG, 30, SectionRouter({}), history=history)
+
+
+def ticket(ticket_id, group_id, **fields):
+    return dict({'ticket_id': ticket_id, 'group_id': group_id, 'status_text': 'Open'}, **fields)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / 'snapshot.db'))
+
+
+def test_poller_records_and_publishes_history(store):
+    poller = make_poller(store, [ticket('1', '1'), ticket('2', '2')], QueueHistory())
+    reader = SharedSnapshotReader(store, None, 30)
+
+    assert reader.history() is None
+    poller.poll_once()
+
+    published = reader.history()
+    assert published.query('all', 0)['points'][0][1 + SERIES.index('total')] == 2
+    assert published.query('g1', 0)['points'][0][1 + SERIES.index('total')] == 1
+
+
+def test_new_leader_adopts_published_history(store):
+    make_poller(store, [ticket('1', '1')], QueueHistory()).poll_once()
+    successor = make_poller(store, [ticket('1', '1')], QueueHistory())
+
+    successor._adopt_history()
+
+    assert successor.history.query('g1', 0)['points']
+
+
+def test_only_the_leader_saves_history(store, tmp_path):
+    path = tmp_path / 'history.json'
+    poller = make_poller(store, [], QueueHistory(persist_path=str(path)))
+
+    poller.save_history()
+    assert not path.exists()
+
+    poller.leading = True
+    poller.save_history()
+    assert path.exists()
+
+
+def test_read_many_returns_values_and_versions(store):
+    store.write({'a': [1], 'b': {'x': 2}})
+    store.write({'a': [3]})
+
+    assert store.read_many(('a', 'b', 'missing')) == {'a': ([3], 2), 'b': ({'x': 2}, 1), 'missing': (None, 0)}
+
+
+def test_workers_use_published_sections(store):
+    make_poller(store, [ticket('1', '1'), ticket('2', '2')], None).poll_once()
+    reader = SharedSnapshotReader(store, None, 30)
+
+    tickets, sections = reader.sections()
+
+    assert sorted(tickets) == ['1', '2']
+    assert sorted(key for keys in sections['all'] for key in keys) == ['1', '2']
+    assert [key for keys in sections['g1'] for key in keys] == ['1']
+    assert tickets['1']['sla_text'] == 'Open'
+    assert tickets['1']['reply_pending'] is False
+    # Built once per published snapshot
+    assert reader.sections()[0] is tickets
+
+
+def test_published_sections_expire_at_the_next_sla_change(store):
+    make_poller(store, [ticket('1', '1')], None).poll_once()
+    sections, _ = store.read('sections')
+    sections['valid_until'] = 1
+    store.write({'sections': sections})
+
+    assert SharedSnapshotReader(store, None, 30).sections() is None
+
+
+def test_webhook_patch_drops_published_sections(store):
+    poller = make_poller(store, [ticket('1', '1')], None)
+    poller.poll_once()
+    reader = SharedSnapshotReader(store, None, 30, client=poller.client)
+
+    reader.apply_ticket_event('updated', ticket('2', '1'))
+
+    assert reader.sections() is None
+    assert sorted(t['ticket_id'] for t in reader.fetch_tickets()) == ['1', '2']
+
+
+def test_poll_replays_webhook_events_received_during_its_fetch(store):
+    poller = make_poller(store, [ticket('1', '1')], None)
+    poller.poll_once()
+    reader = SharedSnapshotReader(store, None, 30, client=poller.client)
+
+    client_fetch = poller.client.fetch_tickets
+
+    def fetch_tickets(force=False):
+        reader.apply_ticket_event('updated', ticket('2', '1'))
+        return client_fetch(force)
+
+    poller.client.fetch_tickets = fetch_tickets
+    poller.poll_once()
+
+    assert sorted(t['ticket_id'] for t in reader.fetch_tickets()) == ['1', '2']
+    # Sectioned before the replay, so workers section locally
+    assert reader.sections() is None
+    assert store.read('events')[0] == {'seq': 1, 'events': []}
+
+    poller.client.fetch_tickets = client_fetch
+    poller.poll_once()
+
+    assert [t['ticket_id'] for t in reader.fetch_tickets()] == ['1']
+
+
+def test_reader_reports_the_leaders_fallbacks(store):
+    reader = SharedSnapshotReader(store, None, 30)
+    store.write({'tickets': [], 'upstream': {'state': 'closed', 'stale': False, 'stale_parts': ['technicians']}})
+
+    assert reader.stale_parts() == ['technicians']
+
+    store._conn().execute("UPDATE snapshot SET updated_at = 0, version = version + 1 WHERE key = 'tickets'")
+
+    assert reader.stale_parts() == ['technicians', 'tickets']
+
+
+def test_failed_fetch_keeps_the_published_snapshot_and_its_age(store):
+    poller = make_poller(store, [ticket('1', '1')], QueueHistory())
+    poller.poll_once()
+    _, polled_at = store.read('tickets')
+    tickets_version = store.version('tickets')
+
+    poller.client.fail = True
+    poller.client.tickets = []
+    poller.poll_once()
+
+    assert store.version('tickets') == tickets_version
+    assert store.read('tickets')[1] == polled_at
+    assert store.read('upstream')[0] == {'state': 'open'}
@@ -0,0 +1,54 @@
+from app.superops_client import SuperOpsClient
+
+CONFIG = {'superops': {'api_url': 'http://superops.invalid', 'api_key': 'key', 'customer_subdomain': 'acme'}}
+
+
+def failing(*args, **kwargs):
+    raise RuntimeError("upstream down")
+
+
+def test_failed_fetches_report_their_fallbacks():
+    client = SuperOpsClient(CONFIG)
+    client._iter_all_ticket_pages = lambda: iter([{'ticketId': '1', 'subject': 'VPN', 'status': 'Open'}])
+    client._post_graphql = lambda query, variables: {'getTechnicianList': {'userList': [{'userId': 7, 'name': 'Sam'}]}}
+    client.fetch_tickets(force=True)
+    client.fetch_technicians(force=True)
+    assert client.stale_parts() == []
+
+    client._iter_all_ticket_pages = failing
+    client._post_graphql = failing
+
+    assert [t['ticket_id'] for t in client.fetch_tickets(force=True)] == ['1']
+    assert client.fetch_technicians(force=True) == {'7': 'Sam'}
+    assert client.stale_parts() == ['tickets', 'technicians']
+    assert client.upstream_status()['stale']
+
+
+def test_cached_tickets_never_fetches():
+    client = SuperOpsClient(CONFIG)
+    client._iter_all_ticket_pages = failing
+
+    assert client.cached_tickets() is None
+
+    client._ticket_cache.put('active', [{'ticket_id': '1'}])
+    assert client.cached_tickets() == [{'ticket_id': '1'}]
+
+    client._ticket_cache.expire()
+    assert client.cached_tickets() is None
+
+
+def test_reply_check_without_lookups_uses_the_cache_only():
+    client = SuperOpsClient(CONFIG)
+    client._queue_conversation_lookup = failing
+    client._conversation_cache.put('1', {'updated_time': 't1', 'has_req_reply': True})
+    client._conversation_cache.put('2', {'updated_time': 'old', 'has_req_reply': True})
+    tickets = [
+        {'ticket_id': '1', 'updated_at_str': 't1'},
+        {'ticket_id': '2', 'updated_at_str': 't2'},
+        {'ticket_id': '3', 'updated_at_str': 't3'},
+    ]
+
+    reply_ids, pending_ids = client.check_requester_replies(tickets, set(), lookup=False)
+
+    assert reply_ids == {'1', '2'}
+    assert pending_ids == {'2', '3'}
@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+from app.ticket_mapper import SectionRouter
+
+MAPPING = {
+    'open': {'statuses': ['Open'], 'include_unassigned': True},
+    'customer_replied': {'statuses': ['Customer Replied']},
+    'needs_agent': {'statuses': ['Escalated'], 'include_sla_violated': True},
+    'other_active': {'statuses': ['On Hold']},
+}
+
+
+def ticket(status, **fields):
+    return dict({'status_text': status, 'agent_name': 'Sam'}, **fields)
+
+
+def test_built_in_priority_chain():
+    route = SectionRouter(MAPPING).route
+
+    assert route(ticket('Open'), 0) == 0
+    assert route(ticket('Customer Replied'), 0) == 1
+    assert route(ticket('Escalated'), 0) == 2
+    assert route(ticket('Open', resolution_violated=True), 0) == 2
+    assert route(ticket('In Progress', agent_name=None), 0) == 0
+    assert route(ticket('On Hold', agent_name=None), 0) == 3
+    assert route(ticket('In Progress', has_requester_reply=True), 0) == 1
+    assert route(ticket('Something Else'), 0) == 3
+
+
+def test_custom_rules_run_first():
+    mapping = dict(MAPPING, rules=[{'section': 'needs_agent', 'priority': ['Critical'], 'assigned': False}])
+    route = SectionRouter(mapping).route
+
+    assert route(ticket('Open', priority_text='Critical', agent_name=None), 0) == 2
+    assert route(ticket('Open', priority_text='Critical'), 0) == 0
+
+
+def test_unknown_rule_section_or_predicate_is_rejected():
+    with pytest.raises(ValueError):
+        SectionRouter({'rules': [{'section': 'nowhere'}]})
+    with pytest.raises(ValueError):
+        SectionRouter({'rules': [{'section': 'open', 'colour': 'red'}]})
+
+
+def test_rule_without_predicates_is_rejected():
+    with pytest.raises(ValueError):
+        SectionRouter({'rules': [{'section': 'needs_agent'}]})
+
+
+def test_next_change_follows_age_thresholds():
+    router = SectionRouter({'rules': [{'section': 'needs_agent', 'min_age_hours': 2}]})
+    created = '2026-01-01T00:00:00+00:00'
+    created_ts = 1767225600
+
+    assert router.route({'created_at_str': created}, created_ts + 3600) == 3
+    assert router.route({'created_at_str': created}, created_ts + 3 * 3600) == 2
+    assert router.next_change({'created_at_str': created}, created_ts + 3600) == created_ts + 2 * 3600
+    assert router.next_change({'created_at_str': created}, created_ts + 3 * 3600) == math.inf
+    assert SectionRouter(MAPPING).next_change({'created_at_str': created}, created_ts) == math.inf
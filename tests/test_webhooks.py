@@ -0,0 +1,124 @@
+import hashlib
+import hmac
+import io
+
+import pytest
+
+from app.superops_client import SuperOpsClient
+from app.webhooks import EVENT_CLOSED, EVENT_UPDATED, WebhookAuth, event_kind, parse_events
+
+CONFIG = {'superops': {'api_url': 'http://superops.invalid', 'api_key': 'key', 'customer_subdomain': 'acme'}}
+
+
+def raw(ticket_id, subject='Printer jam', status='Open'):
+    return {'ticketId': ticket_id, 'subject': subject, 'status': status}
+
+
+def test_token_or_signature_is_accepted():
+    auth = WebhookAuth('s3cret')
+    body = b'{"event": "ticket.updated"}'
+    signature = hmac.new(b's3cret', body, hashlib.sha256).hexdigest()
+
+    assert auth.verify({'X-Webhook-Token': 's3cret'}, body)
+    assert auth.verify({'X-Webhook-Signature': signature}, body)
+    assert auth.verify({'X-Webhook-Signature': 'sha256=' + signature.upper()}, body)
+    assert not auth.verify({'X-Webhook-Signature': signature}, body + b' ')
+    assert not auth.verify({'X-Webhook-Token': 'wrong'}, body)
+    assert not auth.verify({}, body)
+
+
+def test_secret_is_required():
+    with pytest.raises(ValueError):
+        WebhookAuth('')
+
+
+def test_parse_events():
+    assert parse_events([
+        {'eventType': 'TICKET_RESOLVED', 'data': raw('1')},
+        dict(raw('2'), event='ticket.updated'),
+    ]) == [(EVENT_CLOSED, raw('1')), (EVENT_UPDATED, dict(raw('2'), event='ticket.updated'))]
+    assert event_kind('TICKET_CREATED') == 'created'
+    with pytest.raises(ValueError):
+        parse_events({'event': 'ticket.updated', 'ticket': {}})
+
+
+def test_event_during_fetch_is_replayed_onto_its_result():
+    client = SuperOpsClient(CONFIG)
+
+    def pages():
+        yield raw('1')
+        # Lands after ticket 2 was read, before the fetch stores its result
+        client.apply_ticket_event(EVENT_UPDATED, {'ticketId': '2', 'subject': 'Printer on fire'})
+        client.apply_ticket_event(EVENT_CLOSED, raw('1', status='Resolved'))
+        yield raw('2')
+
+    client._iter_all_ticket_pages = lambda: iter([raw('1'), raw('2')])
+    client.fetch_tickets(force=True)
+    client._iter_all_ticket_pages = pages
+
+    tickets = client.fetch_tickets(force=True)
+
+    assert [(t['ticket_id'], t['subject']) for t in tickets] == [('2', 'Printer on fire')]
+    assert client._events_during_fetch == []
+
+
+def test_events_before_the_fetch_started_are_not_replayed():
+    client = SuperOpsClient(CONFIG)
+    client._iter_all_ticket_pages = lambda: iter([raw('1')])
+    client.fetch_tickets(force=True)
+    client.apply_ticket_event(EVENT_UPDATED, {'ticketId': '1', 'subject': 'Old news'})
+
+    tickets = client.fetch_tickets(force=True)
+
+    assert tickets[0]['subject'] == 'Printer jam'
+
+
+def test_partial_update_for_an_unknown_ticket_is_ignored():
+    client = SuperOpsClient(CONFIG)
+    client._iter_all_ticket_pages = lambda: iter([raw('1')])
+    client.fetch_tickets(force=True)
+    version = client.snapshot_version()
+
+    client.apply_ticket_event(EVENT_UPDATED, {'ticketId': '2', 'subject': 'Printer on fire'})
+
+    assert [t['ticket_id'] for t in client.fetch_tickets()] == ['1']
+    assert client.snapshot_version() == version
+
+    client.apply_ticket_event('created', {'ticketId': '3', 'subject': 'New laptop', 'status': 'Open'})
+
+    assert [t['ticket_id'] for t in client.fetch_tickets()] == ['1', '3']
+
+
+@pytest.fixture
+def webhook_client():
+    from app import create_app
+
+    config = dict(
+        CONFIG,
+        views={'helpdesk': {'display_name': 'Helpdesk', 'tech_group_ids': []}},
+        history={'enabled': False},
+        webhooks={'enabled': True, 'secret': 's3cret', 'max_body_bytes': 64},
+    )
+    return create_app(config).test_client()
+
+
+def test_webhook_body_over_the_limit_is_rejected_without_content_length(webhook_client):
+    body = b'{"event": "ticket.updated", "ticketId": "1", "subject": "' + b'x' * 100 + b'"}'
+
+    # A chunked request: no Content-Length, the server marks the input as terminated
+    response = webhook_client.post(
+        '/webhooks/superops', input_stream=io.BytesIO(body), content_type='application/json',
+        headers={'X-Webhook-Token': 's3cret'}, environ_overrides={'wsgi.input_terminated': True, 'CONTENT_LENGTH': ''},
+    )
+
+    assert response.status_code == 413
+
+
+def test_webhook_within_the_limit_is_accepted(webhook_client):
+    response = webhook_client.post(
+        '/webhooks/superops', data=b'{"event": "ticket.updated", "ticketId": "1"}', content_type='application/json',
+        headers={'X-Webhook-Token': 's3cret'},
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == {'received': 1, 'applied': 0}